@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 import re
 from datetime import datetime
+from decimal import Decimal
 
 from .models import (
     AuditorInput,
@@ -244,7 +245,7 @@ class Auditor:
         passed.append(f"Plan has {len(plan.steps)} enforcement step(s)")
 
         # Check cost/benefit
-        if plan.total_estimated_cost > j.judgment_amount * 0.5:
+        if plan.total_estimated_cost > j.judgment_amount * Decimal("0.5"):
             issues.append(
                 ComplianceIssue(
                     severity=RiskLevel.MEDIUM,
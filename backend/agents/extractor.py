@@ -7,6 +7,7 @@ First stage in the enforcement pipeline.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 from decimal import Decimal
@@ -76,54 +77,90 @@ class Extractor:
     # DATA FETCHING
     # =========================================================================
 
-    async def _fetch_judgment(self, judgment_id: str) -> Optional[dict[str, Any]]:
-        """Fetch core judgment record."""
-        _client = await self._ensure_client()  # noqa: F841 - Will be used when TODO is implemented
-
-        # TODO: Replace with actual Supabase query
-        # response = client.table("judgments").select("*").eq("id", judgment_id).single().execute()
-        # return response.data
-
-        # Stub implementation
-        logger.debug(f"[Extractor] Fetching judgment {judgment_id}")
+    async def _select_in(
+        self, table: str, column: str, values: list[str], order: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """SELECT * FROM table WHERE column IN (values), off the event loop."""
+        client = await self._ensure_client()
+        query = client.table(table).select("*").in_(column, values)
+        if order:
+            query = query.order(order, desc=True)
+        response = await asyncio.to_thread(query.execute)
+        return response.data or []
+
+    async def _fetch_judgments_bulk(self, judgment_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch core judgment records for many judgments in one query."""
+        logger.debug(f"[Extractor] Bulk fetching {len(judgment_ids)} judgments")
+        rows = await self._select_in("judgments", "id", judgment_ids)
+        return {str(row["id"]): row for row in rows}
+
+    async def _fetch_debtor_intel_bulk(self, judgment_ids: list[str]) -> dict[str, DebtorIntel]:
+        """
+        Fetch debtor intelligence for many judgments in one query.
 
-        # TODO: Implement actual Supabase fetch
-        # This is a placeholder that returns None
-        return None
+        A judgment with several intel rows gets the most recently updated.
+        """
+        logger.debug(f"[Extractor] Bulk fetching debtor intel for {len(judgment_ids)} judgments")
+        rows = await self._select_in(
+            "debtor_intelligence", "judgment_id", judgment_ids, order="last_updated"
+        )
+        intel: dict[str, DebtorIntel] = {}
+        for row in rows:
+            judgment_id = str(row["judgment_id"])
+            if judgment_id not in intel:
+                intel[judgment_id] = DebtorIntel.model_validate(row)
+        return intel
+
+    async def _fetch_assets_bulk(self, judgment_ids: list[str]) -> dict[str, list[AssetInfo]]:
+        """Fetch assets for many judgments in one query, grouped by judgment."""
+        logger.debug(f"[Extractor] Bulk fetching assets for {len(judgment_ids)} judgments")
+        rows = await self._select_in("assets", "judgment_id", judgment_ids)
+        grouped: dict[str, list[AssetInfo]] = {}
+        for row in rows:
+            grouped.setdefault(str(row["judgment_id"]), []).append(AssetInfo.model_validate(row))
+        return grouped
 
-    async def _fetch_debtor_intel(self, judgment_id: str) -> Optional[DebtorIntel]:
-        """Fetch debtor intelligence data."""
-        _client = await self._ensure_client()  # noqa: F841 - Will be used when TODO is implemented
+    # =========================================================================
+    # OUTPUT ASSEMBLY
+    # =========================================================================
 
-        # TODO: Replace with actual Supabase query
-        # response = (
-        #     client.table("debtor_intelligence")
-        #     .select("*")
-        #     .eq("judgment_id", judgment_id)
-        #     .single()
-        #     .execute()
-        # )
-        # if response.data:
-        #     return DebtorIntel(**response.data)
-
-        logger.debug(f"[Extractor] Fetching debtor intel for {judgment_id}")
-        return None
-
-    async def _fetch_assets(self, judgment_id: str) -> list[AssetInfo]:
-        """Fetch asset information from enrichment."""
-        _client = await self._ensure_client()  # noqa: F841 - Will be used when TODO is implemented
-
-        # TODO: Replace with actual Supabase query
-        # response = (
-        #     client.table("assets")
-        #     .select("*")
-        #     .eq("judgment_id", judgment_id)
-        #     .execute()
-        # )
-        # return [AssetInfo(**row) for row in response.data or []]
+    def _build_output(
+        self,
+        judgment_id: str,
+        judgment: Optional[dict[str, Any]],
+        debtor_intel: Optional[DebtorIntel],
+        assets: list[AssetInfo],
+    ) -> ExtractorOutput:
+        """
+        Assemble an ExtractorOutput from fetched records.
 
-        logger.debug(f"[Extractor] Fetching assets for {judgment_id}")
-        return []
+        Raises:
+            ValueError: If the judgment record was not found
+        """
+        if judgment is None:
+            raise ValueError(f"Judgment {judgment_id} not found")
+
+        return ExtractorOutput(
+            judgment_id=judgment_id,
+            plaintiff_id=judgment.get("plaintiff_id"),
+            plaintiff_name=judgment.get("plaintiff_name"),
+            debtor_name=judgment.get("debtor_name"),
+            case_number=judgment.get("case_number"),
+            judgment_amount=(
+                Decimal(str(judgment["judgment_amount"]))
+                if judgment.get("judgment_amount")
+                else None
+            ),
+            judgment_date=judgment.get("judgment_date"),
+            county=judgment.get("county"),
+            status=judgment.get("status"),
+            enforcement_stage=judgment.get("enforcement_stage"),
+            collectability_score=judgment.get("collectability_score"),
+            debtor_intel=debtor_intel,
+            assets=assets,
+            raw_judgment=judgment,
+            extracted_at=datetime.utcnow(),
+        )
 
     # =========================================================================
     # MAIN RUN METHOD
@@ -133,6 +170,8 @@ class Extractor:
         """
         Execute the extraction pipeline.
 
+        Runs the bulk fetches of run_many() for a batch of one.
+
         Args:
             input_data: ExtractorInput with judgment_id and options
 
@@ -147,60 +186,69 @@ class Extractor:
         self._log_start(input_data)
 
         try:
-            # Fetch core judgment
-            judgment = await self._fetch_judgment(input_data.judgment_id)
-
-            if judgment is None:
-                # TODO: In production, raise or return error state
-                logger.warning(
-                    f"[Extractor] Judgment {input_data.judgment_id} not found - "
-                    "returning stub output"
-                )
-                judgment = {}
-
-            # Fetch optional data
-            debtor_intel = None
-            assets: list[AssetInfo] = []
-
-            if input_data.include_debtor_intel:
-                debtor_intel = await self._fetch_debtor_intel(input_data.judgment_id)
-
-            if input_data.include_assets:
-                assets = await self._fetch_assets(input_data.judgment_id)
-
-            # Build output
-            output = ExtractorOutput(
-                judgment_id=input_data.judgment_id,
-                plaintiff_id=judgment.get("plaintiff_id"),
-                plaintiff_name=judgment.get("plaintiff_name"),
-                debtor_name=judgment.get("debtor_name"),
-                case_number=judgment.get("case_number"),
-                judgment_amount=(
-                    Decimal(str(judgment["judgment_amount"]))
-                    if judgment.get("judgment_amount")
-                    else None
-                ),
-                judgment_date=judgment.get("judgment_date"),
-                county=judgment.get("county"),
-                status=judgment.get("status"),
-                enforcement_stage=judgment.get("enforcement_stage"),
-                collectability_score=judgment.get("collectability_score"),
-                debtor_intel=debtor_intel,
-                assets=assets,
-                raw_judgment=judgment,
-                extracted_at=datetime.utcnow(),
-            )
-
-            # Log completion
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-            self._log_complete(output, duration_ms)
-
-            return output
-
+            (output,) = await self.run_many([input_data])
         except Exception as e:
             self._log_error(input_data, e)
             raise
 
+        duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+        self._log_complete(output, duration_ms)
+        return output
+
+    async def run_many(
+        self, inputs: list[ExtractorInput], return_exceptions: bool = False
+    ) -> list[Any]:
+        """
+        Extract many judgments with one query per entity type.
+
+        The judgment, debtor intel and asset queries run concurrently.
+        Optional fetches are skipped only if no input requests them.
+
+        Args:
+            inputs: ExtractorInputs to process
+            return_exceptions: Like asyncio.gather(): put the ValueError for a
+                judgment that was not found in its slot instead of raising
+
+        Returns:
+            ExtractorOutputs (or, with return_exceptions, ValueErrors) in the
+            same order as inputs
+
+        Raises:
+            ValueError: If a judgment is not found and return_exceptions is False
+        """
+        if not inputs:
+            return []
+
+        judgment_ids = list(dict.fromkeys(i.judgment_id for i in inputs))
+        want_intel = any(i.include_debtor_intel for i in inputs)
+        want_assets = any(i.include_assets for i in inputs)
+
+        async def _none() -> dict[str, Any]:
+            return {}
+
+        judgments, intel_by_id, assets_by_id = await asyncio.gather(
+            self._fetch_judgments_bulk(judgment_ids),
+            self._fetch_debtor_intel_bulk(judgment_ids) if want_intel else _none(),
+            self._fetch_assets_bulk(judgment_ids) if want_assets else _none(),
+        )
+
+        outputs: list[Any] = []
+        for i in inputs:
+            try:
+                output = self._build_output(
+                    i.judgment_id,
+                    judgments.get(i.judgment_id),
+                    intel_by_id.get(i.judgment_id) if i.include_debtor_intel else None,
+                    assets_by_id.get(i.judgment_id, []) if i.include_assets else [],
+                )
+            except ValueError as e:
+                if not return_exceptions:
+                    raise
+                outputs.append(e)
+            else:
+                outputs.append(output)
+        return outputs
+
     # =========================================================================
     # LLM INTEGRATION HOOKS
     # =========================================================================
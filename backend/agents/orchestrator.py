@@ -3,14 +3,23 @@ Dragonfly Engine - Orchestrator
 
 Top-level pipeline coordinator that runs all agents in sequence
 and persists results to Supabase.
+
+run() processes a single judgment. run_many() processes a batch: the
+extractor bulk-fetches inputs, analysis stages run for up to
+`concurrency` judgments at once, and results are persisted in bulk.
+Stages hand work to each other through bounded queues so extraction
+never races far ahead of analysis or persistence.
 """
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import logging
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from .auditor import Auditor
 from .drafter import Drafter
@@ -32,6 +41,67 @@ from .strategist import Strategist
 
 logger = logging.getLogger(__name__)
 
+# Judgments per bulk extractor fetch in run_many()
+EXTRACT_BATCH_SIZE = 100
+
+# Outputs per bulk persistence write in run_many()
+PERSIST_BATCH_SIZE = 50
+
+# Agent output tables (20261120_agent_pipeline_outputs.sql)
+OUTPUT_SCHEMA = "enforcement"
+PLANS_TABLE = "agent_plans"
+PACKETS_TABLE = "agent_draft_packets"
+AUDITS_TABLE = "agent_audit_results"
+
+# Stage duration histogram bucket upper bounds (milliseconds)
+STAGE_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class StageHistogram:
+    """
+    Fixed-bucket latency histogram for one pipeline stage.
+
+    Buckets are cumulative-friendly upper bounds in milliseconds; samples
+    above the last bound land in the overflow (+Inf) bucket.
+    """
+
+    def __init__(self, buckets: Sequence[float] = STAGE_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, duration_ms)] += 1
+        self.count += 1
+        self.sum_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th sample (None if empty)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return self.max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        labels = [f"le_{b:g}" for b in self.buckets] + ["le_inf"]
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 2),
+            "avg_ms": round(self.sum_ms / self.count, 2) if self.count else None,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
 
 class Orchestrator:
     """
@@ -46,9 +116,9 @@ class Orchestrator:
     6. Auditor     → Validate outputs
 
     Results are persisted to Supabase tables:
-    - enforcement_plans
-    - draft_packets
-    - audit_results
+    - enforcement.agent_plans
+    - enforcement.agent_draft_packets
+    - enforcement.agent_audit_results
     """
 
     def __init__(self, supabase_client: Any = None):
@@ -69,6 +139,9 @@ class Orchestrator:
         self.drafter = Drafter()
         self.auditor = Auditor()
 
+        # Per-stage timing across all runs of this orchestrator
+        self._stage_histograms: dict[PipelineStage, StageHistogram] = {}
+
     async def _ensure_client(self) -> Any:
         """Lazily initialize Supabase client."""
         if self._client is None:
@@ -95,6 +168,7 @@ class Orchestrator:
 
     def _log_stage_complete(self, stage: PipelineStage, run_id: str, duration_ms: float) -> None:
         """Hook: Called when a stage completes."""
+        self._observe_stage(stage, duration_ms)
         logger.debug(
             f"[Orchestrator] run_id={run_id} ← Stage: {stage.value} "
             f"completed in {duration_ms:.2f}ms"
@@ -117,123 +191,290 @@ class Orchestrator:
             f"error={type(error).__name__}: {error}"
         )
 
+    # =========================================================================
+    # STAGE TIMING
+    # =========================================================================
+
+    def _observe_stage(self, stage: PipelineStage, duration_ms: float) -> None:
+        """Record a stage duration in its histogram."""
+        histogram = self._stage_histograms.get(stage)
+        if histogram is None:
+            histogram = self._stage_histograms[stage] = StageHistogram()
+        histogram.observe(duration_ms)
+
+    def stage_histograms(self) -> dict[str, dict[str, Any]]:
+        """
+        Per-stage duration histograms for every run of this orchestrator.
+
+        In run_many() the extractor runs once per bulk fetch; its samples
+        are the fetch duration divided across the judgments in the batch.
+        """
+        return {stage.value: h.snapshot() for stage, h in self._stage_histograms.items()}
+
     # =========================================================================
     # PERSISTENCE
     # =========================================================================
 
-    async def _persist_enforcement_plan(self, output: OrchestratorOutput) -> Optional[str]:
+    async def _execute(self, query: Any) -> Any:
+        """Run a (blocking) Supabase query off the event loop."""
+        return await asyncio.to_thread(query.execute)
+
+    async def _output_table(self, table: str) -> Any:
+        """Query builder for an agent output table (enforcement schema)."""
+        client = await self._ensure_client()
+        return client.schema(OUTPUT_SCHEMA).table(table)
+
+    async def _persist_enforcement_plans_bulk(
+        self, outputs: list[OrchestratorOutput]
+    ) -> dict[str, str]:
         """
-        Persist enforcement plan to Supabase.
+        Persist enforcement plans for many outputs in one upsert.
 
         Returns:
-            Plan ID if persisted, None otherwise
+            Mapping of judgment_id to persisted plan ID
         """
-        if not output.strategist_output:
-            return None
-
-        _client = await self._ensure_client()  # noqa: F841 - Will be used when TODO is implemented
-        plan = output.strategist_output.plan
-
-        # TODO: Replace with actual Supabase upsert
-        # data = {
-        #     "id": plan.plan_id,
-        #     "judgment_id": plan.judgment_id,
-        #     "strategy_name": plan.strategy_name,
-        #     "strategy_rationale": plan.strategy_rationale,
-        #     "steps": [s.model_dump() for s in plan.steps],
-        #     "total_estimated_cost": float(plan.total_estimated_cost),
-        #     "total_estimated_duration_days": plan.total_estimated_duration_days,
-        #     "expected_recovery_rate": plan.expected_recovery_rate,
-        #     "risk_assessment": plan.risk_assessment,
-        #     "fallback_strategies": plan.fallback_strategies,
-        #     "created_at": datetime.utcnow().isoformat(),
-        # }
-        # response = client.table("enforcement_plans").upsert(data).execute()
-
-        logger.debug(f"[Orchestrator] Would persist enforcement_plan: {plan.plan_id}")
-        return plan.plan_id
-
-    async def _persist_draft_packet(self, output: OrchestratorOutput) -> Optional[str]:
+        plans = [o.strategist_output.plan for o in outputs if o.strategist_output]
+        if not plans:
+            return {}
+
+        created_at = datetime.utcnow().isoformat()
+        rows = [
+            {
+                "id": plan.plan_id,
+                "judgment_id": plan.judgment_id,
+                "strategy_name": plan.strategy_name,
+                "strategy_rationale": plan.strategy_rationale,
+                "steps": [s.model_dump(mode="json") for s in plan.steps],
+                "total_estimated_cost": float(plan.total_estimated_cost),
+                "total_estimated_duration_days": plan.total_estimated_duration_days,
+                "expected_recovery_rate": plan.expected_recovery_rate,
+                "risk_assessment": plan.risk_assessment,
+                "fallback_strategies": plan.fallback_strategies,
+                "created_at": created_at,
+            }
+            for plan in plans
+        ]
+        await self._execute((await self._output_table(PLANS_TABLE)).upsert(rows))
+
+        logger.debug(f"[Orchestrator] Persisted {len(plans)} {PLANS_TABLE}")
+        return {plan.judgment_id: plan.plan_id for plan in plans}
+
+    async def _persist_draft_packets_bulk(
+        self, outputs: list[OrchestratorOutput]
+    ) -> dict[str, str]:
         """
-        Persist draft packet to Supabase.
+        Persist draft packets for many outputs in one upsert.
 
         Returns:
-            Packet ID if persisted, None otherwise
+            Mapping of judgment_id to persisted packet ID
         """
-        if not output.drafter_output:
-            return None
+        packets = [o.drafter_output.packet for o in outputs if o.drafter_output]
+        if not packets:
+            return {}
+
+        created_at = datetime.utcnow().isoformat()
+        rows = [
+            {
+                "id": packet.packet_id,
+                "judgment_id": packet.judgment_id,
+                "plan_id": packet.plan_id,
+                "documents": [
+                    {
+                        "type": d.document_type.value,
+                        "title": d.title,
+                        "content": d.content,
+                        "placeholders": d.placeholders,
+                        "is_complete": d.is_complete,
+                    }
+                    for d in packet.documents
+                ],
+                "cover_letter": packet.cover_letter,
+                "filing_checklist": packet.filing_checklist,
+                "total_filing_fees": float(packet.total_filing_fees),
+                "created_at": created_at,
+            }
+            for packet in packets
+        ]
+        await self._execute((await self._output_table(PACKETS_TABLE)).upsert(rows))
+
+        logger.debug(f"[Orchestrator] Persisted {len(packets)} {PACKETS_TABLE}")
+        return {packet.judgment_id: packet.packet_id for packet in packets}
+
+    async def _persist_audit_results_bulk(self, outputs: list[OrchestratorOutput]) -> None:
+        """Persist audit results for many outputs in one upsert."""
+        audits = [o.auditor_output for o in outputs if o.auditor_output]
+        if not audits:
+            return
+
+        rows = [
+            {
+                "judgment_id": audit.judgment_id,
+                "packet_id": audit.packet_id,
+                "is_approved": audit.audit.is_approved,
+                "score": audit.audit.score,
+                "issues": [i.model_dump(mode="json") for i in audit.audit.issues],
+                "warnings": audit.audit.warnings,
+                "passed_checks": audit.audit.passed_checks,
+                "recommendations": audit.audit.recommendations,
+                "audited_at": audit.audited_at.isoformat(),
+            }
+            for audit in audits
+        ]
+        await self._execute((await self._output_table(AUDITS_TABLE)).upsert(rows))
+
+        logger.debug(f"[Orchestrator] Persisted {len(audits)} {AUDITS_TABLE}")
+
+    async def _update_judgment_statuses_bulk(self, outputs: list[OrchestratorOutput]) -> None:
+        """
+        Mark many judgments plan_generated in one ``.in_("id", ...)`` update.
+
+        Only analyzed outputs reach persistence, so they share one status;
+        the plan link lives on agent_plans.judgment_id.
+        """
+        if not outputs:
+            return
+
+        client = await self._ensure_client()
+        await self._execute(
+            client.table("judgments")
+            .update(
+                {
+                    "enforcement_stage": "plan_generated",
+                    "enforcement_stage_updated_at": datetime.utcnow().isoformat(),
+                }
+            )
+            .in_("id", [o.judgment_id for o in outputs])
+        )
+
+        logger.debug(f"[Orchestrator] Updated {len(outputs)} judgment statuses")
+
+    async def _persist_batch(self, outputs: list[OrchestratorOutput]) -> None:
+        """Bulk-persist a batch of analyzed outputs and finalize them."""
+        try:
+            plan_ids = await self._persist_enforcement_plans_bulk(outputs)
+            packet_ids = await self._persist_draft_packets_bulk(outputs)
+            for output in outputs:
+                output.persisted_plan_id = plan_ids.get(output.judgment_id)
+                output.persisted_packet_id = packet_ids.get(output.judgment_id)
+            await self._persist_audit_results_bulk(outputs)
+            await self._update_judgment_statuses_bulk(outputs)
+        except Exception as e:
+            for output in outputs:
+                self._mark_failed(output, output.final_stage, e)
+        else:
+            for output in outputs:
+                self._mark_success(output)
+        finally:
+            for output in outputs:
+                self._finalize(output)
+
+    # =========================================================================
+    # STAGE EXECUTION
+    # =========================================================================
+
+    async def _run_stage(
+        self,
+        output: OrchestratorOutput,
+        stage: PipelineStage,
+        agent: Any,
+        agent_input: Any,
+    ) -> Any:
+        """Run one agent stage with logging and timing."""
+        output.final_stage = stage
+        self._log_stage_start(stage, output.run_id)
+        stage_start = time.perf_counter()
+
+        result = await agent.run(agent_input)
+        output.stages_completed.append(stage)
+
+        stage_ms = (time.perf_counter() - stage_start) * 1000
+        self._log_stage_complete(stage, output.run_id, stage_ms)
+        return result
+
+    async def _run_analysis_stages(
+        self,
+        output: OrchestratorOutput,
+        skip_draft: bool,
+        skip_audit: bool,
+    ) -> None:
+        """Run Normalizer through Auditor on an extracted judgment."""
+        output.normalizer_output = await self._run_stage(
+            output,
+            PipelineStage.NORMALIZER,
+            self.normalizer,
+            NormalizerInput(extractor_output=output.extractor_output),
+        )
+
+        output.reasoner_output = await self._run_stage(
+            output,
+            PipelineStage.REASONER,
+            self.reasoner,
+            ReasonerInput(normalizer_output=output.normalizer_output),
+        )
+
+        output.strategist_output = await self._run_stage(
+            output,
+            PipelineStage.STRATEGIST,
+            self.strategist,
+            StrategistInput(
+                reasoner_output=output.reasoner_output,
+                normalizer_output=output.normalizer_output,
+            ),
+        )
 
-        _client = await self._ensure_client()  # noqa: F841 - Will be used when TODO is implemented
-        packet = output.drafter_output.packet
-
-        # TODO: Replace with actual Supabase upsert
-        # data = {
-        #     "id": packet.packet_id,
-        #     "judgment_id": packet.judgment_id,
-        #     "plan_id": packet.plan_id,
-        #     "documents": [
-        #         {
-        #             "type": d.document_type.value,
-        #             "title": d.title,
-        #             "content": d.content,
-        #             "placeholders": d.placeholders,
-        #             "is_complete": d.is_complete,
-        #         }
-        #         for d in packet.documents
-        #     ],
-        #     "cover_letter": packet.cover_letter,
-        #     "filing_checklist": packet.filing_checklist,
-        #     "total_filing_fees": float(packet.total_filing_fees),
-        #     "created_at": datetime.utcnow().isoformat(),
-        # }
-        # response = client.table("draft_packets").upsert(data).execute()
-
-        logger.debug(f"[Orchestrator] Would persist draft_packet: {packet.packet_id}")
-        return packet.packet_id
-
-    async def _persist_audit_result(self, output: OrchestratorOutput) -> None:
-        """Persist audit result to Supabase."""
-        if not output.auditor_output:
+        if skip_draft:
             return
 
-        _client = await self._ensure_client()  # noqa: F841 - Will be used when TODO is implemented
-        audit = output.auditor_output
-
-        # TODO: Replace with actual Supabase upsert
-        # data = {
-        #     "judgment_id": audit.judgment_id,
-        #     "packet_id": audit.packet_id,
-        #     "is_approved": audit.audit.is_approved,
-        #     "score": audit.audit.score,
-        #     "issues": [i.model_dump() for i in audit.audit.issues],
-        #     "warnings": audit.audit.warnings,
-        #     "passed_checks": audit.audit.passed_checks,
-        #     "recommendations": audit.audit.recommendations,
-        #     "audited_at": audit.audited_at.isoformat(),
-        # }
-        # response = client.table("audit_results").upsert(data).execute()
-
-        logger.debug(f"[Orchestrator] Would persist audit_result for packet: {audit.packet_id}")
-
-    async def _update_judgment_status(self, judgment_id: str, output: OrchestratorOutput) -> None:
-        """Update judgment with pipeline results."""
-        _client = await self._ensure_client()  # noqa: F841 - Will be used when TODO is implemented
-
-        # TODO: Replace with actual Supabase update
-        # new_stage = "plan_generated" if output.success else "pipeline_error"
-        # data = {
-        #     "enforcement_stage": new_stage,
-        #     "last_pipeline_run": datetime.utcnow().isoformat(),
-        #     "current_plan_id": output.persisted_plan_id,
-        # }
-        # response = (
-        #     client.table("judgments")
-        #     .update(data)
-        #     .eq("id", judgment_id)
-        #     .execute()
-        # )
-
-        logger.debug(f"[Orchestrator] Would update judgment status: {judgment_id}")
+        output.drafter_output = await self._run_stage(
+            output,
+            PipelineStage.DRAFTER,
+            self.drafter,
+            DrafterInput(
+                strategist_output=output.strategist_output,
+                normalizer_output=output.normalizer_output,
+            ),
+        )
+
+        if skip_audit:
+            return
+
+        output.auditor_output = await self._run_stage(
+            output,
+            PipelineStage.AUDITOR,
+            self.auditor,
+            AuditorInput(
+                drafter_output=output.drafter_output,
+                strategist_output=output.strategist_output,
+                normalizer_output=output.normalizer_output,
+            ),
+        )
+
+    def _new_output(self, judgment_id: str) -> OrchestratorOutput:
+        return OrchestratorOutput(
+            judgment_id=judgment_id,
+            run_id=f"run_{uuid.uuid4().hex[:12]}",
+            final_stage=PipelineStage.EXTRACTOR,
+            success=False,
+            started_at=datetime.utcnow(),
+        )
+
+    def _mark_success(self, output: OrchestratorOutput) -> None:
+        output.success = True
+        output.final_stage = PipelineStage.COMPLETE
+
+    def _mark_failed(
+        self, output: OrchestratorOutput, stage: PipelineStage, error: Exception
+    ) -> None:
+        self._log_pipeline_error(output.run_id, stage, error)
+        output.error_stage = stage
+        output.error_message = str(error)
+        output.final_stage = PipelineStage.FAILED
+
+    def _finalize(self, output: OrchestratorOutput) -> None:
+        completed_at = datetime.utcnow()
+        output.completed_at = completed_at
+        output.duration_seconds = (completed_at - output.started_at).total_seconds()
+        self._log_pipeline_complete(output, output.duration_seconds)
 
     # =========================================================================
     # MAIN RUN METHOD
@@ -257,151 +498,170 @@ class Orchestrator:
             5. Drafter - Create documents (optional)
             6. Auditor - Validate outputs (optional)
 
-        Results are persisted to Supabase unless dry_run=True.
+        Results are persisted to Supabase unless dry_run=True, through the
+        same bulk fetch and persistence helpers as run_many() (a batch of one).
         """
-        run_id = f"run_{uuid.uuid4().hex[:12]}"
-        started_at = datetime.utcnow()
-        current_stage = PipelineStage.EXTRACTOR
-
-        self._log_pipeline_start(input_data, run_id)
-
-        # Initialize output
-        output = OrchestratorOutput(
-            judgment_id=input_data.judgment_id,
-            run_id=run_id,
-            final_stage=PipelineStage.EXTRACTOR,
-            success=False,
-            started_at=started_at,
-        )
+        output = self._new_output(input_data.judgment_id)
+        self._log_pipeline_start(input_data, output.run_id)
 
         try:
-            # -----------------------------------------------------------------
-            # STAGE 1: EXTRACTOR
-            # -----------------------------------------------------------------
-            current_stage = PipelineStage.EXTRACTOR
-            self._log_stage_start(current_stage, run_id)
-            stage_start = datetime.utcnow()
-
-            extractor_input = ExtractorInput(
-                judgment_id=input_data.judgment_id,
-                include_debtor_intel=True,
-                include_assets=True,
-            )
-            output.extractor_output = await self.extractor.run(extractor_input)
-            output.stages_completed.append(current_stage)
-
-            stage_ms = (datetime.utcnow() - stage_start).total_seconds() * 1000
-            self._log_stage_complete(current_stage, run_id, stage_ms)
-
-            # -----------------------------------------------------------------
-            # STAGE 2: NORMALIZER
-            # -----------------------------------------------------------------
-            current_stage = PipelineStage.NORMALIZER
-            self._log_stage_start(current_stage, run_id)
-            stage_start = datetime.utcnow()
-
-            normalizer_input = NormalizerInput(extractor_output=output.extractor_output)
-            output.normalizer_output = await self.normalizer.run(normalizer_input)
-            output.stages_completed.append(current_stage)
-
-            stage_ms = (datetime.utcnow() - stage_start).total_seconds() * 1000
-            self._log_stage_complete(current_stage, run_id, stage_ms)
-
-            # -----------------------------------------------------------------
-            # STAGE 3: REASONER
-            # -----------------------------------------------------------------
-            current_stage = PipelineStage.REASONER
-            self._log_stage_start(current_stage, run_id)
-            stage_start = datetime.utcnow()
-
-            reasoner_input = ReasonerInput(normalizer_output=output.normalizer_output)
-            output.reasoner_output = await self.reasoner.run(reasoner_input)
-            output.stages_completed.append(current_stage)
-
-            stage_ms = (datetime.utcnow() - stage_start).total_seconds() * 1000
-            self._log_stage_complete(current_stage, run_id, stage_ms)
-
-            # -----------------------------------------------------------------
-            # STAGE 4: STRATEGIST
-            # -----------------------------------------------------------------
-            current_stage = PipelineStage.STRATEGIST
-            self._log_stage_start(current_stage, run_id)
-            stage_start = datetime.utcnow()
-
-            strategist_input = StrategistInput(
-                reasoner_output=output.reasoner_output,
-                normalizer_output=output.normalizer_output,
+            output.extractor_output = await self._run_stage(
+                output,
+                PipelineStage.EXTRACTOR,
+                self.extractor,
+                ExtractorInput(
+                    judgment_id=input_data.judgment_id,
+                    include_debtor_intel=True,
+                    include_assets=True,
+                ),
             )
-            output.strategist_output = await self.strategist.run(strategist_input)
-            output.stages_completed.append(current_stage)
-
-            stage_ms = (datetime.utcnow() - stage_start).total_seconds() * 1000
-            self._log_stage_complete(current_stage, run_id, stage_ms)
-
-            # -----------------------------------------------------------------
-            # STAGE 5: DRAFTER (optional)
-            # -----------------------------------------------------------------
-            if not input_data.skip_draft:
-                current_stage = PipelineStage.DRAFTER
-                self._log_stage_start(current_stage, run_id)
-                stage_start = datetime.utcnow()
-
-                drafter_input = DrafterInput(
-                    strategist_output=output.strategist_output,
-                    normalizer_output=output.normalizer_output,
-                )
-                output.drafter_output = await self.drafter.run(drafter_input)
-                output.stages_completed.append(current_stage)
-
-                stage_ms = (datetime.utcnow() - stage_start).total_seconds() * 1000
-                self._log_stage_complete(current_stage, run_id, stage_ms)
-
-                # ---------------------------------------------------------
-                # STAGE 6: AUDITOR (optional)
-                # ---------------------------------------------------------
-                if not input_data.skip_audit:
-                    current_stage = PipelineStage.AUDITOR
-                    self._log_stage_start(current_stage, run_id)
-                    stage_start = datetime.utcnow()
-
-                    auditor_input = AuditorInput(
-                        drafter_output=output.drafter_output,
-                        strategist_output=output.strategist_output,
-                        normalizer_output=output.normalizer_output,
-                    )
-                    output.auditor_output = await self.auditor.run(auditor_input)
-                    output.stages_completed.append(current_stage)
 
-                    stage_ms = (datetime.utcnow() - stage_start).total_seconds() * 1000
-                    self._log_stage_complete(current_stage, run_id, stage_ms)
+            await self._run_analysis_stages(output, input_data.skip_draft, input_data.skip_audit)
+        except Exception as e:
+            self._mark_failed(output, output.final_stage, e)
+            self._finalize(output)
+            return output
+
+        if input_data.dry_run:
+            self._mark_success(output)
+            self._finalize(output)
+        else:
+            await self._persist_batch([output])
+        return output
 
-            # -----------------------------------------------------------------
-            # PERSISTENCE
-            # -----------------------------------------------------------------
-            if not input_data.dry_run:
-                output.persisted_plan_id = await self._persist_enforcement_plan(output)
-                output.persisted_packet_id = await self._persist_draft_packet(output)
-                await self._persist_audit_result(output)
-                await self._update_judgment_status(input_data.judgment_id, output)
+    # =========================================================================
+    # BATCH RUN METHOD
+    # =========================================================================
 
-            # Mark success
-            output.success = True
-            output.final_stage = PipelineStage.COMPLETE
+    async def run_many(
+        self,
+        judgment_ids: Sequence[str],
+        concurrency: int = 4,
+        skip_draft: bool = False,
+        skip_audit: bool = False,
+        dry_run: bool = False,
+        extract_batch_size: int = EXTRACT_BATCH_SIZE,
+        persist_batch_size: int = PERSIST_BATCH_SIZE,
+    ) -> list[OrchestratorOutput]:
+        """
+        Execute the pipeline for many judgments.
 
-        except Exception as e:
-            self._log_pipeline_error(run_id, current_stage, e)
-            output.error_stage = current_stage
-            output.error_message = str(e)
-            output.final_stage = PipelineStage.FAILED
+        Three stages run concurrently, connected by bounded queues:
+            1. Extraction - bulk fetch `extract_batch_size` judgments at a time
+            2. Analysis   - Normalizer through Auditor, `concurrency` judgments at once
+            3. Persistence - bulk upserts of up to `persist_batch_size` outputs
 
-        # Finalize timing
-        completed_at = datetime.utcnow()
-        output.completed_at = completed_at
-        output.duration_seconds = (completed_at - started_at).total_seconds()
+        A failure affects only the judgment (or, for bulk fetch/persist, the
+        batch) it occurred in; the rest of the run continues.
 
-        self._log_pipeline_complete(output, output.duration_seconds)
+        Args:
+            judgment_ids: Judgments to process
+            concurrency: Judgments in the analysis stages at once
+            skip_draft: Stop after strategist
+            skip_audit: Skip auditor stage
+            dry_run: Don't persist to Supabase
 
-        return output
+        Returns:
+            OrchestratorOutputs in the same order as judgment_ids
+        """
+        concurrency = max(1, concurrency)
+        extract_batch_size = max(1, extract_batch_size)
+        persist_batch_size = max(1, persist_batch_size)
+
+        outputs = [self._new_output(judgment_id) for judgment_id in judgment_ids]
+        if not outputs:
+            return []
+
+        batch_start = time.perf_counter()
+        logger.info(
+            f"[Orchestrator] Starting batch of {len(outputs)} judgments "
+            f"concurrency={concurrency} dry_run={dry_run}"
+        )
+
+        analysis_queue: asyncio.Queue[Optional[OrchestratorOutput]] = asyncio.Queue(
+            maxsize=concurrency * 2
+        )
+        persist_queue: asyncio.Queue[Optional[OrchestratorOutput]] = asyncio.Queue(
+            maxsize=persist_batch_size * 2
+        )
+
+        async def extract() -> None:
+            for start in range(0, len(outputs), extract_batch_size):
+                batch = outputs[start : start + extract_batch_size]
+                inputs = [
+                    ExtractorInput(
+                        judgment_id=o.judgment_id,
+                        include_debtor_intel=True,
+                        include_assets=True,
+                    )
+                    for o in batch
+                ]
+
+                fetch_start = time.perf_counter()
+                try:
+                    extracted = await self.extractor.run_many(inputs, return_exceptions=True)
+                except Exception as e:
+                    for output in batch:
+                        self._mark_failed(output, PipelineStage.EXTRACTOR, e)
+                        self._finalize(output)
+                    continue
+
+                per_judgment_ms = (time.perf_counter() - fetch_start) * 1000 / len(batch)
+                for output, extractor_output in zip(batch, extracted):
+                    if isinstance(extractor_output, Exception):
+                        self._mark_failed(output, PipelineStage.EXTRACTOR, extractor_output)
+                        self._finalize(output)
+                        continue
+                    output.extractor_output = extractor_output
+                    output.stages_completed.append(PipelineStage.EXTRACTOR)
+                    self._observe_stage(PipelineStage.EXTRACTOR, per_judgment_ms)
+                    await analysis_queue.put(output)
+
+            for _ in range(concurrency):
+                await analysis_queue.put(None)
+
+        async def analyze() -> None:
+            while (output := await analysis_queue.get()) is not None:
+                try:
+                    await self._run_analysis_stages(output, skip_draft, skip_audit)
+                except Exception as e:
+                    self._mark_failed(output, output.final_stage, e)
+                    self._finalize(output)
+                    continue
+
+                if dry_run:
+                    self._mark_success(output)
+                    self._finalize(output)
+                else:
+                    await persist_queue.put(output)
+
+        async def analyze_all() -> None:
+            await asyncio.gather(*(analyze() for _ in range(concurrency)))
+            await persist_queue.put(None)
+
+        async def persist() -> None:
+            pending: list[OrchestratorOutput] = []
+            while True:
+                output = await persist_queue.get()
+                if output is not None:
+                    pending.append(output)
+                if pending and (output is None or len(pending) >= persist_batch_size):
+                    await self._persist_batch(pending)
+                    pending = []
+                if output is None:
+                    return
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(extract())
+            tg.create_task(analyze_all())
+            tg.create_task(persist())
+
+        succeeded = sum(1 for o in outputs if o.success)
+        logger.info(
+            f"[Orchestrator] Batch complete: {succeeded}/{len(outputs)} succeeded "
+            f"in {time.perf_counter() - batch_start:.2f}s"
+        )
+        return outputs
 
     # =========================================================================
     # CONVENIENCE METHODS
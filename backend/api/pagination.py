@@ -0,0 +1,297 @@
+"""
+Dragonfly Engine - Keyset Pagination
+
+Shared cursor pagination for list endpoints. Instead of LIMIT/OFFSET
+(which reads and discards every skipped row, so deep pages degrade
+linearly) a page continues strictly after the last row of the previous
+one, using the sort key plus a unique tiebreaker. With a matching
+composite index every page costs the same.
+
+Cursors are opaque to clients: URL-safe base64 of the sort key values of
+the last row, tagged with the key names so a cursor from one endpoint is
+rejected by another.
+
+Totals no longer need a COUNT(*) on every page. ``count_rows`` supports:
+- ``exact``:    COUNT(*) every time
+- ``cached``:   COUNT(*) cached per query/params for PAGINATION_COUNT_TTL_SECONDS
+- ``estimate``: pg_class.reltuples for unfiltered listings (falls back to cached)
+
+Usage:
+    from backend.api.pagination import Keyset, SortKey, count_rows
+
+    keyset = Keyset(SortKey("created_at", descending=True), SortKey("id", descending=True))
+    where, params = keyset.after(cursor)
+    sql = f"SELECT ... WHERE status = %s {'AND ' + where if where else ''} "
+    sql += f"{keyset.order_by()} LIMIT %s"
+    rows, next_cursor = keyset.page(await fetch(sql, [status, *params, limit + 1]), limit)
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Literal, Mapping, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException
+
+# Seconds a cached COUNT(*) is reused for ``count="cached"``
+PAGINATION_COUNT_TTL_SECONDS = float(os.getenv("PAGINATION_COUNT_TTL_SECONDS", "30"))
+
+CountMode = Literal["exact", "cached", "estimate"]
+
+
+class CursorError(HTTPException):
+    """Raised (as HTTP 400) for a malformed or foreign cursor."""
+
+    def __init__(self, detail: str = "Invalid pagination cursor") -> None:
+        super().__init__(status_code=400, detail=detail)
+
+
+# ---------------------------------------------------------------------------
+# Cursor encoding
+# ---------------------------------------------------------------------------
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _load_value(value: Any) -> Any:
+    if isinstance(value, dict) and len(value) == 1:
+        tag, raw = next(iter(value.items()))
+        if tag == "dt":
+            return datetime.fromisoformat(raw)
+        if tag == "d":
+            return date.fromisoformat(raw)
+        if tag == "dec":
+            return Decimal(raw)
+        if tag == "uuid":
+            return UUID(raw)
+    return value
+
+
+def encode_cursor(names: Sequence[str], values: Sequence[Any]) -> str:
+    """Encode sort key values into an opaque cursor string."""
+    payload = json.dumps({"k": list(names), "v": [_dump_value(v) for v in values]})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, names: Sequence[str]) -> list[Any]:
+    """Decode a cursor produced by encode_cursor() for the same sort keys."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        keys, values = payload["k"], payload["v"]
+        if keys != list(names) or len(values) != len(names):
+            raise CursorError("Cursor does not belong to this listing")
+        return [_load_value(v) for v in values]
+    except CursorError:
+        raise
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise CursorError() from e
+
+
+# ---------------------------------------------------------------------------
+# Keyset
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    One sort column.
+
+    ``expr`` is the SQL expression ordered and compared on (it should match
+    the backing index); ``field`` is the row key holding its value (defaults
+    to ``expr``). Nullable columns should be ordered on a COALESCE
+    expression with ``null_as`` set to the same fallback.
+    """
+
+    expr: str
+    descending: bool = False
+    field: Optional[str] = None
+    null_as: Any = None
+
+    @property
+    def name(self) -> str:
+        return self.field or self.expr
+
+    def value(self, row: Mapping[str, Any]) -> Any:
+        value = row[self.name]
+        return self.null_as if value is None else value
+
+
+class Keyset:
+    """An ordering over unique sort keys (the last key must be unique)."""
+
+    def __init__(self, *keys: SortKey) -> None:
+        if not keys:
+            raise ValueError("Keyset needs at least one sort key")
+        self.keys = keys
+        self.names = [k.name for k in keys]
+
+    def order_by(self) -> str:
+        """ORDER BY clause matching the cursor predicate."""
+        return "ORDER BY " + ", ".join(
+            f"{k.expr} {'DESC' if k.descending else 'ASC'}" for k in self.keys
+        )
+
+    def after(self, cursor: Optional[str]) -> tuple[str, list[Any]]:
+        """
+        SQL predicate (psycopg %s placeholders) selecting rows after cursor.
+
+        Returns ("", []) without a cursor. Uniform directions compile to a
+        row comparison, which Postgres serves from a composite index.
+        """
+        if not cursor:
+            return "", []
+        values = decode_cursor(cursor, self.names)
+
+        directions = {k.descending for k in self.keys}
+        if len(directions) == 1:
+            op = "<" if self.keys[0].descending else ">"
+            exprs = ", ".join(k.expr for k in self.keys)
+            marks = ", ".join(["%s"] * len(self.keys))
+            return f"({exprs}) {op} ({marks})", values
+
+        # Mixed directions: (a > x) OR (a = x AND b < y) OR ...
+        clauses, params = [], []
+        for i, key in enumerate(self.keys):
+            terms = [f"{k.expr} = %s" for k in self.keys[:i]]
+            terms.append(f"{key.expr} {'<' if key.descending else '>'} %s")
+            clauses.append("(" + " AND ".join(terms) + ")")
+            params.extend(values[: i + 1])
+        return "(" + " OR ".join(clauses) + ")", params
+
+    def postgrest_filter(self, cursor: Optional[str]) -> Optional[str]:
+        """
+        The same predicate as a PostgREST ``or`` filter body.
+
+        For endpoints using the Supabase query builder:
+        ``query.or_(keyset.postgrest_filter(cursor))``.
+        """
+        if not cursor:
+            return None
+        values = decode_cursor(cursor, self.names)
+        clauses = []
+        for i, key in enumerate(self.keys):
+            terms = [f"{k.expr}.eq.{_pgrst(v)}" for k, v in zip(self.keys[:i], values)]
+            terms.append(f"{key.expr}.{'lt' if key.descending else 'gt'}.{_pgrst(values[i])}")
+            clauses.append(terms[0] if len(terms) == 1 else f"and({','.join(terms)})")
+        return ",".join(clauses)
+
+    def cursor_for(self, row: Mapping[str, Any]) -> str:
+        """Cursor continuing after ``row``."""
+        return encode_cursor(self.names, [k.value(row) for k in self.keys])
+
+    def page(self, rows: Sequence[Any], limit: int) -> tuple[list[Any], Optional[str]]:
+        """
+        Trim a ``LIMIT limit + 1`` result to one page.
+
+        Returns the page rows and the cursor for the next page (None on the
+        last page).
+        """
+        items = list(rows[:limit])
+        if len(rows) > limit and items:
+            return items, self.cursor_for(items[-1])
+        return items, None
+
+
+def _pgrst(value: Any) -> str:
+    raw = _dump_value(value)
+    text = next(iter(raw.values())) if isinstance(raw, dict) else raw
+    text = str(text).lower() if isinstance(text, bool) else str(text)
+    # Quote values PostgREST would otherwise split on
+    if any(ch in text for ch in ',.:()"'):
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Totals
+# ---------------------------------------------------------------------------
+
+
+class CountCache:
+    """Short-lived cache of COUNT(*) results keyed by query and params."""
+
+    def __init__(self, ttl_seconds: float = PAGINATION_COUNT_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple[str, tuple], tuple[float, int]] = {}
+
+    def get(self, sql: str, params: Sequence[Any]) -> Optional[int]:
+        entry = self._entries.get((sql, tuple(params)))
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def put(self, sql: str, params: Sequence[Any], value: int) -> None:
+        if len(self._entries) > 1024:
+            now = time.monotonic()
+            self._entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+        self._entries[(sql, tuple(params))] = (time.monotonic() + self.ttl_seconds, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+count_cache = CountCache()
+
+
+async def count_rows(
+    conn: Any,
+    count_sql: str,
+    params: Sequence[Any] = (),
+    *,
+    mode: CountMode = "cached",
+    table: Optional[str] = None,
+) -> int:
+    """
+    Total rows for a listing.
+
+    Args:
+        conn: psycopg async connection
+        count_sql: ``SELECT COUNT(*) ...`` for the listing's filters
+        params: Parameters for count_sql
+        mode: exact, cached or estimate (see module docstring)
+        table: Table for ``estimate``; pass only when the listing is
+            unfiltered, since reltuples is a whole-table estimate
+    """
+    if mode == "estimate" and table:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                (table,),
+            )
+            row = await cur.fetchone()
+        # reltuples is -1 for a table that was never vacuumed/analyzed
+        if row and row[0] is not None and row[0] >= 0:
+            return int(row[0])
+        mode = "cached"
+
+    if mode != "exact":
+        cached = count_cache.get(count_sql, params)
+        if cached is not None:
+            return cached
+
+    async with conn.cursor() as cur:
+        await cur.execute(count_sql, list(params) if params else None)
+        row = await cur.fetchone()
+    total = int(row[0]) if row else 0
+    count_cache.put(count_sql, params, total)
+    return total
@@ -12,6 +12,7 @@ from pydantic import BaseModel
 
 from ...core.security import AuthContext, get_current_user
 from ...db import get_supabase_client
+from ...services.portfolio_rollups import DIMENSIONS, fetch_portfolio_rollups
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,25 @@ class PipelineMetrics(BaseModel):
     timestamp: str
 
 
+class PortfolioBucket(BaseModel):
+    """Aggregates for one bucket of a portfolio dimension."""
+
+    judgment_count: int
+    amount_sum: float
+    active_count: int
+
+
+class PortfolioRollupMetrics(BaseModel):
+    """Portfolio counts and sums by status, tier, enforcement stage and pool."""
+
+    total_count: int
+    total_amount: float
+    active_count: int
+    dimensions: dict[str, dict[str, PortfolioBucket]]
+    updated_at: str | None
+    timestamp: str
+
+
 class TrendData(BaseModel):
     """Time-series data point."""
 
@@ -184,27 +204,12 @@ async def get_overview_metrics(
     logger.info(f"Analytics overview requested by {auth.via}")
 
     try:
-        client = get_supabase_client()
-
-        # Try to get real data from judgments table
+        # Real data from the trigger-maintained rollups (O(1) rows, no table scan)
         try:
-            # Count total cases
-            result = client.table("judgments").select("id", count="exact").execute()
-            total_cases = result.count or 0
-
-            # Get judgment amounts
-            result = client.table("judgments").select("judgment_amount").execute()
-            rows = result.data or []
-            total_judgment_amount = sum(float(r.get("judgment_amount") or 0) for r in rows)
-
-            # Count active cases (non-closed)
-            result = (
-                client.table("judgments")
-                .select("id", count="exact")
-                .neq("status", "closed")
-                .execute()
-            )
-            active_cases = result.count or 0
+            rollups = await fetch_portfolio_rollups()
+            total_cases = rollups.total_count
+            total_judgment_amount = rollups.total_amount
+            active_cases = rollups.active_count
 
             # For now, mock recovered amount (would need enforcement_actions table)
             recovered_amount = total_judgment_amount * 0.15  # Mock 15% recovery
@@ -226,7 +231,7 @@ async def get_overview_metrics(
             )
 
         except Exception as e:
-            logger.warning(f"Failed to query judgments table, using mock data: {e}")
+            logger.warning(f"Failed to read portfolio rollups, using mock data: {e}")
             # Fall through to mock data
 
         # Return mock data if real query fails
@@ -263,26 +268,11 @@ async def get_pipeline_metrics(
     logger.info(f"Analytics pipeline requested by {auth.via}")
 
     try:
-        client = get_supabase_client()
-
-        # Try to get real tier data
+        # Real data from the trigger-maintained rollups (O(1) rows, no table scan)
         try:
-            result = client.table("judgments").select("tier").execute()
-            rows = result.data or []
-
-            tier_counts: dict[str, int] = {}
-            for row in rows:
-                tier = row.get("tier") or "unassigned"
-                tier_counts[tier] = tier_counts.get(tier, 0) + 1
-
-            # Get stage counts if available
-            result = client.table("judgments").select("status").execute()
-            rows = result.data or []
-
-            stage_counts: dict[str, int] = {}
-            for row in rows:
-                status = row.get("status") or "intake"
-                stage_counts[status] = stage_counts.get(status, 0) + 1
+            rollups = await fetch_portfolio_rollups()
+            tier_counts = rollups.counts("tier")
+            stage_counts = rollups.counts("status")
 
             return PipelineMetrics(
                 stage_counts=stage_counts or {"intake": 0},
@@ -317,6 +307,50 @@ async def get_pipeline_metrics(
         raise HTTPException(status_code=500, detail="Failed to retrieve pipeline data")
 
 
+@router.get(
+    "/portfolio",
+    response_model=PortfolioRollupMetrics,
+    summary="Get portfolio rollups",
+    description="Returns judgment counts and amounts by status, tier, stage and pool.",
+)
+async def get_portfolio_rollups(
+    auth: AuthContext = Depends(get_current_user),
+) -> PortfolioRollupMetrics:
+    """
+    Get portfolio aggregates from analytics.portfolio_rollups.
+
+    The rollups are maintained by statement-level triggers on public.judgments
+    and reconciled nightly, so this reads a few dozen rows at any portfolio size.
+    Requires authentication.
+    """
+    logger.info(f"Analytics portfolio requested by {auth.via}")
+
+    try:
+        rollups = await fetch_portfolio_rollups()
+        return PortfolioRollupMetrics(
+            total_count=rollups.total_count,
+            total_amount=rollups.total_amount,
+            active_count=rollups.active_count,
+            dimensions={
+                dimension: {
+                    bucket: PortfolioBucket(
+                        judgment_count=b.judgment_count,
+                        amount_sum=b.amount_sum,
+                        active_count=b.active_count,
+                    )
+                    for bucket, b in rollups.buckets.get(dimension, {}).items()
+                }
+                for dimension in DIMENSIONS
+            },
+            updated_at=rollups.updated_at.isoformat() if rollups.updated_at else None,
+            timestamp=datetime.utcnow().isoformat() + "Z",
+        )
+
+    except Exception as e:
+        logger.error(f"Analytics portfolio failed: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve portfolio rollups")
+
+
 @router.get(
     "/trends/recovery",
     response_model=TrendMetrics,
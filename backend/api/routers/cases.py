@@ -13,13 +13,14 @@ Endpoints:
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from ...core.security import AuthContext, get_current_user
 from ...db import get_pool
+from ..pagination import CountMode, Keyset, SortKey, count_rows
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +77,21 @@ class CaseListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page")
+    has_more: bool = False
+
+
+# Backed by idx_judgments_cases_keyset (20261116_keyset_pagination_indexes.sql)
+CASES_KEYSET = Keyset(
+    SortKey(
+        "COALESCE(collectability_score, -1)",
+        descending=True,
+        field="collectability_score",
+        null_as=-1,
+    ),
+    SortKey("COALESCE(judgment_amount, 0)", descending=True, field="judgment_amount", null_as=0),
+    SortKey("id", descending=True),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -172,9 +188,18 @@ async def list_cases(
     page_size: int = Query(50, ge=1, le=200, description="Results per page"),
     stage: Optional[str] = Query(None, description="Filter by enforcement stage"),
     offer_strategy: Optional[str] = Query(None, description="Filter by offer strategy"),
+    cursor: Annotated[
+        Optional[str], Query(description="Cursor from next_cursor; takes precedence over page")
+    ] = None,
+    count: Annotated[CountMode, Query(description="How total is computed")] = "cached",
     auth: AuthContext = Depends(get_current_user),
 ) -> CaseListResponse:
-    """List all cases with pagination and optional filters."""
+    """
+    List all cases with pagination and optional filters.
+
+    Pages are keyset-paginated when a cursor is given; page numbers remain
+    supported (OFFSET) for existing clients. Both return next_cursor.
+    """
 
     pool = await get_pool()
 
@@ -192,14 +217,18 @@ async def list_cases(
         where_clause = " AND ".join(conditions)
 
         # Get total count
-        count_query = f"SELECT COUNT(*) FROM public.judgments WHERE {where_clause}"
-        async with conn.cursor() as cur:
-            await cur.execute(count_query, params if params else None)
-            row = await cur.fetchone()
-            total = row[0] if row else 0
+        total = await count_rows(
+            conn,
+            f"SELECT COUNT(*) FROM public.judgments WHERE {where_clause}",
+            params,
+            mode=count,
+        )
 
-        # Get paginated data
-        offset = (page - 1) * page_size
+        # Get page: after the cursor, or at the page offset
+        after, after_params = CASES_KEYSET.after(cursor)
+        if after:
+            where_clause = f"{where_clause} AND {after}"
+        offset = 0 if cursor else (page - 1) * page_size
 
         data_query = f"""
         SELECT
@@ -223,16 +252,16 @@ async def list_cases(
             END AS offer_strategy
         FROM public.judgments
         WHERE {where_clause}
-        ORDER BY collectability_score DESC NULLS LAST, judgment_amount DESC
+        {CASES_KEYSET.order_by()}
         LIMIT %s OFFSET %s
         """
 
-        # Build params list with pagination at the end
-        data_params = params + [page_size, offset]
+        # Build params list with pagination at the end (one extra row to detect more)
+        data_params = params + after_params + [page_size + 1, offset]
 
         async with conn.cursor(row_factory=dict_row) as cur:
             await cur.execute(data_query, data_params)
-            rows = await cur.fetchall()
+            rows, next_cursor = CASES_KEYSET.page(await cur.fetchall(), page_size)
 
         cases = [
             CaseSummary(
@@ -258,6 +287,8 @@ async def list_cases(
             total=total,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None,
         )
 
 
@@ -6,13 +6,14 @@ Provides endpoints for enforcement workflow management including the Radar.
 
 import logging
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from ...core.security import AuthContext, get_current_user
 from ...db import get_supabase_client
+from ..pagination import Keyset, SortKey
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +84,15 @@ class WageGarnishmentCandidatesResponse(BaseModel):
     page: int = Field(..., description="Current page (1-indexed)")
     page_size: int = Field(..., description="Number of items per page")
     has_more: bool = Field(..., description="Whether more pages exist")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page")
+
+
+# Highest priority first; judgment_id breaks ties so the cursor is unique
+WAGE_CANDIDATES_KEYSET = Keyset(
+    SortKey("priority_score", descending=True),
+    SortKey("balance", descending=True),
+    SortKey("judgment_id"),
+)
 
 
 # =============================================================================
@@ -439,6 +449,9 @@ async def get_wage_candidates(
     min_priority: Optional[float] = Query(None, ge=0, description="Minimum priority score"),
     jurisdiction: Optional[str] = Query(None, description="Filter by county/jurisdiction"),
     verified_only: bool = Query(False, description="Only include verified employer intel"),
+    cursor: Annotated[
+        Optional[str], Query(description="Cursor from next_cursor; takes precedence over page")
+    ] = None,
     auth: AuthContext = Depends(get_current_user),
 ) -> WageGarnishmentCandidatesResponse:
     """
@@ -456,8 +469,14 @@ async def get_wage_candidates(
     - High balance (>$10k): +10
     - Recent judgment (<2 years): +5
 
+    With a cursor the page continues after the previous page's last row
+    (no OFFSET) and ``total`` is PostgREST's planner estimate.
+
     Requires authentication.
     """
+    # Malformed cursors are a 400, not a query failure
+    after_filter = WAGE_CANDIDATES_KEYSET.postgrest_filter(cursor)
+
     logger.info(
         f"Wage candidates requested by {auth.via}: "
         f"page={page}, page_size={page_size}, min_balance={min_balance}, "
@@ -475,7 +494,7 @@ async def get_wage_candidates(
             .from_("v_candidate_wage_garnishments")
             .select(
                 "*",
-                count="exact",  # type: ignore[arg-type]
+                count="estimated" if cursor else "exact",  # type: ignore[arg-type]
             )
         )
 
@@ -492,13 +511,27 @@ async def get_wage_candidates(
         if verified_only:
             query = query.eq("intel_verified", True)
 
-        # Pagination (0-indexed for PostgREST)
-        offset = (page - 1) * page_size
-        query = query.range(offset, offset + page_size - 1)
+        # Stable ordering shared by page and cursor pagination
+        query = (
+            query.order("priority_score", desc=True)
+            .order("balance", desc=True)
+            .order("judgment_id")
+        )
+
+        # One extra row tells us whether another page exists
+        offset = 0
+        if after_filter:
+            query = query.or_(after_filter).limit(page_size + 1)
+        else:
+            # Pagination (0-indexed for PostgREST)
+            offset = (page - 1) * page_size
+            query = query.range(offset, offset + page_size)
 
         # Execute
         result = query.execute()
-        rows: list[dict] = result.data or []  # type: ignore[assignment]
+        rows, next_cursor = WAGE_CANDIDATES_KEYSET.page(
+            result.data or [], page_size  # type: ignore[arg-type]
+        )
         total: int = result.count or 0
 
         # Map to response models
@@ -537,7 +570,10 @@ async def get_wage_candidates(
                 )
             )
 
-        has_more = (offset + len(candidates)) < total
+        # Estimated totals (cursor mode) are too coarse to infer more pages from
+        has_more = next_cursor is not None or (
+            not after_filter and (offset + len(candidates)) < total
+        )
 
         logger.info(f"Wage candidates returning {len(candidates)} of {total} total")
 
@@ -547,6 +583,7 @@ async def get_wage_candidates(
             page=page,
             page_size=page_size,
             has_more=has_more,
+            next_cursor=next_cursor,
         )
 
     except Exception as e:
@@ -3,16 +3,31 @@ Dragonfly Engine - Events Router
 
 Endpoints for querying the event timeline for entities and judgments.
 Part of the Intelligence Graph.
+
+Timelines are newest first and cursor-paginated in both directions:
+pass ``older_cursor`` as ``before`` to page back, ``newer_cursor`` as
+``after`` to catch up. The judgment stream endpoint pushes new events over
+Server-Sent Events so the console does not have to poll.
 """
 
 import logging
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from ...services.event_service import EventDTO, get_timeline_for_entity, get_timeline_for_judgment
+from ...services.event_service import (
+    EventDTO,
+    TimelineKey,
+    get_timeline_for_entity,
+    get_timeline_for_judgment,
+    timeline_key,
+    watch_timeline_for_judgment,
+)
+from ..pagination import CursorError, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -39,9 +54,18 @@ class TimelineResponse(BaseModel):
     """Timeline response with list of events."""
 
     events: list[TimelineEventResponse] = Field(
-        default_factory=list, description="List of events in chronological order"
+        default_factory=list, description="List of events, newest first"
     )
     total: int = Field(..., description="Total number of events returned")
+    older_cursor: Optional[str] = Field(
+        None, description="Pass as `before` for older events (None when exhausted)"
+    )
+    newer_cursor: Optional[str] = Field(
+        None, description="Pass as `after` for events newer than this page"
+    )
+
+
+TIMELINE_CURSOR_KEYS = ("created_at", "id")
 
 
 # =============================================================================
@@ -107,6 +131,52 @@ def event_dto_to_response(event: EventDTO) -> TimelineEventResponse:
     )
 
 
+def encode_timeline_cursor(event: EventDTO) -> str:
+    """Opaque cursor for an event's timeline position."""
+    return encode_cursor(TIMELINE_CURSOR_KEYS, list(timeline_key(event)))
+
+
+def decode_timeline_cursor(cursor: Optional[str]) -> Optional[TimelineKey]:
+    """Timeline position from a cursor (400 if malformed)."""
+    if not cursor:
+        return None
+    created_at, event_id = decode_cursor(cursor, TIMELINE_CURSOR_KEYS)
+    return created_at, event_id
+
+
+def build_timeline_response(
+    events: list[EventDTO],
+    limit: int,
+    before: Optional[TimelineKey],
+    after: Optional[TimelineKey],
+) -> TimelineResponse:
+    """Timeline page with cursors for both directions."""
+    older_cursor = newer_cursor = None
+    if events:
+        newer_cursor = encode_timeline_cursor(events[0])
+        # A short page means the older end was reached (unless paging forward)
+        if len(events) == limit or after is not None:
+            older_cursor = encode_timeline_cursor(events[-1])
+    elif after is not None:
+        # Nothing newer yet: poll again from the same position
+        newer_cursor = encode_cursor(TIMELINE_CURSOR_KEYS, list(after))
+
+    return TimelineResponse(
+        events=[event_dto_to_response(e) for e in events],
+        total=len(events),
+        older_cursor=older_cursor,
+        newer_cursor=newer_cursor,
+    )
+
+
+def _timeline_positions(
+    before: Optional[str], after: Optional[str]
+) -> tuple[Optional[TimelineKey], Optional[TimelineKey]]:
+    if before and after:
+        raise CursorError("Pass either before or after, not both")
+    return decode_timeline_cursor(before), decode_timeline_cursor(after)
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -118,7 +188,7 @@ def event_dto_to_response(event: EventDTO) -> TimelineEventResponse:
     summary="Get entity timeline",
     description=(
         "Retrieve the event timeline for a specific entity. "
-        "Returns events in chronological order (oldest first)."
+        "Returns events newest first; use before/after cursors to page."
     ),
 )
 async def get_entity_timeline(
@@ -129,28 +199,32 @@ async def get_entity_timeline(
         le=500,
         description="Maximum number of events to return (1-500)",
     ),
+    before: Optional[str] = Query(None, description="older_cursor from a previous page"),
+    after: Optional[str] = Query(None, description="newer_cursor from a previous page"),
 ) -> TimelineResponse:
     """
     Get the event timeline for an entity.
 
-    Returns events ordered chronologically (oldest first), which is
-    natural for timeline display where you scroll down to see recent events.
+    Returns the most recent events first, so long-lived entities show
+    current activity without fetching their whole history.
 
     Args:
         entity_id: UUID of the entity to get timeline for
         limit: Maximum number of events to return (default 100, max 500)
+        before: Cursor; return events older than it
+        after: Cursor; return events newer than it
 
     Returns:
-        TimelineResponse with list of events
+        TimelineResponse with list of events and paging cursors
     """
+    before_key, after_key = _timeline_positions(before, after)
     try:
-        events = await get_timeline_for_entity(entity_id, limit=limit)
-
-        return TimelineResponse(
-            events=[event_dto_to_response(e) for e in events],
-            total=len(events),
+        events = await get_timeline_for_entity(
+            entity_id, limit=limit, before=before_key, after=after_key
         )
 
+        return build_timeline_response(events, limit, before_key, after_key)
+
     except Exception as e:
         logger.error("Failed to get timeline for entity %s: %s", entity_id, e)
         raise HTTPException(
@@ -165,7 +239,7 @@ async def get_entity_timeline(
     summary="Get judgment timeline",
     description=(
         "Retrieve the event timeline for a judgment by looking up its defendant entity. "
-        "Returns events in chronological order (oldest first). "
+        "Returns events newest first; use before/after cursors to page. "
         "Returns empty list if no entity is found for the judgment."
     ),
 )
@@ -177,6 +251,8 @@ async def get_judgment_timeline(
         le=500,
         description="Maximum number of events to return (1-500)",
     ),
+    before: Optional[str] = Query(None, description="older_cursor from a previous page"),
+    after: Optional[str] = Query(None, description="newer_cursor from a previous page"),
 ) -> TimelineResponse:
     """
     Get the event timeline for a judgment.
@@ -190,21 +266,72 @@ async def get_judgment_timeline(
     Args:
         judgment_id: ID of the judgment to get timeline for
         limit: Maximum number of events to return (default 100, max 500)
+        before: Cursor; return events older than it
+        after: Cursor; return events newer than it
 
     Returns:
         TimelineResponse with list of events (may be empty)
     """
+    before_key, after_key = _timeline_positions(before, after)
     try:
-        events = await get_timeline_for_judgment(judgment_id, limit=limit)
-
-        return TimelineResponse(
-            events=[event_dto_to_response(e) for e in events],
-            total=len(events),
+        events = await get_timeline_for_judgment(
+            judgment_id, limit=limit, before=before_key, after=after_key
         )
 
+        return build_timeline_response(events, limit, before_key, after_key)
+
     except Exception as e:
         logger.error("Failed to get timeline for judgment %s: %s", judgment_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve judgment timeline: {str(e)}",
         )
+
+
+@router.get(
+    "/judgment/{judgment_id}/timeline/stream",
+    summary="Stream judgment timeline",
+    description=(
+        "Server-Sent Events stream of new timeline events for a judgment. "
+        "Each event's SSE id is a timeline cursor; reconnecting clients resume "
+        "from Last-Event-ID (or the `after` cursor) without missing events."
+    ),
+    response_class=StreamingResponse,
+)
+async def stream_judgment_timeline(
+    judgment_id: int,
+    request: Request,
+    after: Optional[str] = Query(None, description="Start after this cursor (default: now)"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """
+    Push new events for a judgment as they are emitted.
+
+    Fed by LISTEN/NOTIFY from emit_event() (polling if LISTEN is
+    unavailable). Sends an SSE comment as keepalive while idle.
+    """
+    start = decode_timeline_cursor(last_event_id or after)
+
+    async def _sse() -> AsyncIterator[str]:
+        # SSE ids carry the newest position sent: a late-committing event can
+        # follow newer ones, and resuming from its own position would resend them
+        newest = start
+        async with aclosing(watch_timeline_for_judgment(judgment_id, after=start)) as batches:
+            async for events in batches:
+                if await request.is_disconnected():
+                    break
+                if not events:
+                    yield ": keepalive\n\n"
+                    continue
+                for event in events:
+                    if newest is None or timeline_key(event) > newest:
+                        newest = timeline_key(event)
+                    cursor = encode_cursor(TIMELINE_CURSOR_KEYS, list(newest))
+                    data = event_dto_to_response(event).model_dump_json()
+                    yield f"id: {cursor}\nevent: timeline\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        _sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -4,7 +4,7 @@ Dragonfly Engine - Finance Router
 API endpoints for the Securitization Engine:
 - Pool management (create, list, assign judgments)
 - Performance tracking
-- NAV calculations
+- NAV calculations (single pool, all pools, history)
 
 All endpoints are prefixed with /v1/finance when mounted.
 """
@@ -19,9 +19,12 @@ from pydantic import BaseModel, Field
 
 from ...services.finance_service import (
     FinanceServiceError,
+    NAVResult,
     assign_pool,
     calculate_nav,
+    calculate_nav_all,
     create_pool,
+    get_nav_history,
     get_pool_performance,
     list_pools,
     record_transaction,
@@ -117,6 +120,19 @@ class NAVResponse(BaseModel):
     projected_future_value: float
     total_expenses: float
     as_of_date: date
+    judgment_count: int = 0
+    aum: float = 0.0
+    collected_ytd: float = 0.0
+
+
+class NAVHistoryPoint(BaseModel):
+    """One NAV snapshot for time-series charts."""
+
+    pool_id: str
+    snapshot_date: date
+    nav: float
+    aum: float
+    collected_ytd: float
 
 
 class TransactionRequest(BaseModel):
@@ -151,6 +167,22 @@ def _decimal_to_float(val: Decimal | None) -> float:
     return float(val)
 
 
+def _nav_response(result: NAVResult) -> NAVResponse:
+    """Convert a service NAVResult to the API response."""
+    return NAVResponse(
+        pool_id=result.pool_id,
+        pool_name=result.pool_name,
+        nav=_decimal_to_float(result.nav),
+        total_collected=_decimal_to_float(result.total_collected),
+        projected_future_value=_decimal_to_float(result.projected_future_value),
+        total_expenses=_decimal_to_float(result.total_expenses),
+        as_of_date=result.as_of_date,
+        judgment_count=result.judgment_count,
+        aum=_decimal_to_float(result.aum),
+        collected_ytd=_decimal_to_float(result.collected_ytd),
+    )
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -317,15 +349,58 @@ async def get_pool_nav(pool_id: str) -> NAVResponse:
         logger.error(f"Failed to calculate NAV: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-    return NAVResponse(
-        pool_id=result.pool_id,
-        pool_name=result.pool_name,
-        nav=_decimal_to_float(result.nav),
-        total_collected=_decimal_to_float(result.total_collected),
-        projected_future_value=_decimal_to_float(result.projected_future_value),
-        total_expenses=_decimal_to_float(result.total_expenses),
-        as_of_date=result.as_of_date,
-    )
+    return _nav_response(result)
+
+
+@router.get("/pools/nav", response_model=list[NAVResponse])
+async def get_all_pools_nav() -> list[NAVResponse]:
+    """
+    Calculate Net Asset Value for every pool.
+
+    One grouped pass over judgments and transactions for all pools.
+
+    Returns:
+        NAV per pool, ordered by pool name
+    """
+    try:
+        results = await calculate_nav_all()
+    except FinanceServiceError as e:
+        logger.error(f"Failed to calculate NAV for all pools: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    return [_nav_response(r) for r in results]
+
+
+@router.get("/pools/nav/history", response_model=list[NAVHistoryPoint])
+async def get_pools_nav_history(
+    pool_id: Optional[str] = Query(None, description="Restrict to one pool"),
+    days: int = Query(90, ge=1, le=3650, description="Days of history"),
+) -> list[NAVHistoryPoint]:
+    """
+    Get daily NAV snapshots for time-series charts.
+
+    Snapshots are written by the daily budget snapshot job (all pools) and
+    the NAV refresh job (pools that changed since their last snapshot).
+
+    Returns:
+        NAV points ordered by pool, then date
+    """
+    try:
+        history = await get_nav_history(pool_id=pool_id, days=days)
+    except FinanceServiceError as e:
+        logger.error(f"Failed to get NAV history: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    return [
+        NAVHistoryPoint(
+            pool_id=h.pool_id,
+            snapshot_date=h.snapshot_date,
+            nav=_decimal_to_float(h.nav),
+            aum=_decimal_to_float(h.aum),
+            collected_ytd=_decimal_to_float(h.collected_ytd),
+        )
+        for h in history
+    ]
 
 
 @router.post("/transactions", response_model=TransactionResponse, status_code=201)
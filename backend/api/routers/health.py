@@ -7,6 +7,7 @@ All external checks have configurable timeouts to prevent hanging probes.
 Key endpoints:
 - GET /health (or /api/health) - Liveness probe: returns 200 if process is up
 - GET /readyz - Readiness probe: returns 200 only if DB is reachable
+- GET /health/ops, /health/system - Served from the background health snapshot
 
 Security Posture:
 - Error details are LOGGED but never exposed in responses
@@ -31,6 +32,7 @@ from ...core import db_state as db_state_module
 from ...core.db_state import db_state
 from ...db import check_db_ready, fetch_val, get_pool, get_pool_health, get_supabase_client
 from ...middleware.version import get_version_info
+from ...services.health_snapshot import HealthSnapshot, health_collector
 
 # Default timeouts for health checks (seconds)
 HEALTH_DB_TIMEOUT = 5.0
@@ -141,6 +143,8 @@ class SystemHealthResponse(BaseModel):
     worker_health: dict | None = None
     reaper_health: dict | None = None
     intake_health: IntakeHealthMetrics | None = None
+    snapshot_at: str | None = None
+    snapshot_age_seconds: float | None = None
 
 
 # ==========================================================================
@@ -742,6 +746,8 @@ class OperationalHealthResponse(BaseModel):
     failed_jobs_24h: int
     last_event_at: str | None
     events_24h: int
+    snapshot_at: str | None = None
+    snapshot_age_seconds: float | None = None
 
 
 @router.get(
@@ -761,91 +767,101 @@ async def health_ops() -> OperationalHealthResponse:
     - Last event timestamp
     - Events in the last 24 hours
 
+    Served from the background health snapshot; snapshot_at and
+    snapshot_age_seconds say how fresh the numbers are.
+
     Use this endpoint for alerting and dashboards.
     """
-    from ...db import get_pool
-
     timestamp = datetime.utcnow().isoformat() + "Z"
+    snapshot = await health_collector.get()
 
-    try:
-        pool = await get_pool()
-        if pool is None:
-            return OperationalHealthResponse(
-                status="degraded",
-                timestamp=timestamp,
-                database_ok=False,
-                pending_jobs=0,
-                failed_jobs_24h=0,
-                last_event_at=None,
-                events_24h=0,
-            )
-
-        async with pool.connection() as conn:
-            async with conn.cursor() as cur:
-                # Count pending jobs
-                await cur.execute("SELECT COUNT(*) FROM ops.job_queue WHERE status = 'pending'")
-                row = await cur.fetchone()
-                pending_jobs = row[0] if row else 0
-
-                # Count failed jobs in last 24h
-                await cur.execute(
-                    """
-                    SELECT COUNT(*) FROM ops.job_queue
-                    WHERE status = 'failed'
-                    AND updated_at > now() - interval '24 hours'
-                """
-                )
-                row = await cur.fetchone()
-                failed_jobs = row[0] if row else 0
-
-                # Get last event timestamp and 24h count
-                await cur.execute(
-                    """
-                    SELECT
-                        MAX(created_at) as last_event,
-                        COUNT(*) FILTER (WHERE created_at > now() - interval '24 hours') as events_24h
-                    FROM intelligence.events
-                """
-                )
-                row = await cur.fetchone()
-                last_event_at = row[0].isoformat() + "Z" if row and row[0] else None
-                events_24h = row[1] if row else 0
-
-        # Determine status
-        status = "ok"
-        if failed_jobs > 10:
-            status = "degraded"
-        elif pending_jobs > 100:
-            status = "warning"
-
-        return OperationalHealthResponse(
-            status=status,
-            timestamp=timestamp,
-            database_ok=True,
-            pending_jobs=pending_jobs,
-            failed_jobs_24h=failed_jobs,
-            last_event_at=last_event_at,
-            events_24h=events_24h,
-        )
-
-    except Exception as e:
-        logger.error(f"Ops health check failed: {e}")
+    if not snapshot.database_ok:
         return OperationalHealthResponse(
-            status="error",
+            status="degraded" if snapshot.error == "Database pool not initialized" else "error",
             timestamp=timestamp,
             database_ok=False,
             pending_jobs=0,
             failed_jobs_24h=0,
             last_event_at=None,
             events_24h=0,
+            snapshot_at=snapshot.collected_at_iso,
+            snapshot_age_seconds=round(snapshot.age_seconds, 1),
         )
 
+    pending_jobs = snapshot.queue["pending"]
+    failed_jobs = snapshot.queue["failed_24h"]
+
+    # Determine status
+    status = "ok"
+    if failed_jobs > 10:
+        status = "degraded"
+    elif pending_jobs > 100:
+        status = "warning"
+
+    return OperationalHealthResponse(
+        status=status,
+        timestamp=timestamp,
+        database_ok=True,
+        pending_jobs=pending_jobs,
+        failed_jobs_24h=failed_jobs,
+        last_event_at=snapshot.events["last_event_at"],
+        events_24h=snapshot.events["events_24h"],
+        snapshot_at=snapshot.collected_at_iso,
+        snapshot_age_seconds=round(snapshot.age_seconds, 1),
+    )
+
 
 # ==========================================================================
 # SYSTEM HEALTH - /health/system (CEO Dashboard SLO metrics)
 # ==========================================================================
 
 
+def _reaper_metric(snapshot: HealthSnapshot) -> SystemHealthMetric:
+    """SLO metric for the pg_cron reaper."""
+    reaper = snapshot.reaper
+    if "error" in reaper:
+        # pg_cron might not be accessible
+        return SystemHealthMetric(
+            name="reaper",
+            status="warning",
+            message=f"Cannot check reaper: {reaper.get('error_type', 'Error')}",
+        )
+
+    if reaper.get("configured") is False:
+        return SystemHealthMetric(
+            name="reaper",
+            status="warning",
+            message="Reaper schedule not found in pg_cron",
+        )
+
+    if snapshot.reaper_last_run is None:
+        return SystemHealthMetric(
+            name="reaper",
+            status="warning",
+            message="Reaper has no execution history",
+        )
+
+    # Check if reaper ran recently
+    minutes_since = (
+        datetime.utcnow() - snapshot.reaper_last_run.replace(tzinfo=None)
+    ).total_seconds() / 60
+    if minutes_since > 15:
+        return SystemHealthMetric(
+            name="reaper",
+            status="warning",
+            value=int(minutes_since),
+            threshold="15",
+            message=f"Reaper last ran {int(minutes_since)} min ago",
+        )
+    return SystemHealthMetric(
+        name="reaper",
+        status="healthy",
+        value=int(minutes_since),
+        threshold="15",
+        message=f"Reaper ran {int(minutes_since)} min ago",
+    )
+
+
 @router.get(
     "/system",
     response_model=SystemHealthResponse,
@@ -862,380 +878,174 @@ async def health_check_system() -> SystemHealthResponse:
     - Reaper health (last run, stuck job count)
     - Overall status: healthy/degraded/critical
 
+    Served from the background health snapshot; snapshot_at and
+    snapshot_age_seconds say how fresh the numbers are.
+
     Thresholds (configurable):
     - CRITICAL: stuck_jobs > 0 OR no worker heartbeat in 10 min
     - WARNING: pending_jobs > 50 OR failed_jobs_24h > 20
     - HEALTHY: All metrics within thresholds
     """
-    from ...db import get_pool
-
     timestamp = datetime.utcnow().isoformat() + "Z"
     settings = get_settings()
     metrics: list[SystemHealthMetric] = []
-    queue_health: dict = {}
-    worker_health: dict = {}
-    reaper_health: dict = {}
-
-    try:
-        pool = await get_pool()
-        if pool is None:
-            return SystemHealthResponse(
-                overall_status="critical",
-                timestamp=timestamp,
-                environment=settings.environment,
-                metrics=[
-                    SystemHealthMetric(
-                        name="database",
-                        status="critical",
-                        message="Database pool not initialized",
-                    )
-                ],
-            )
+    snapshot = await health_collector.get()
+    snapshot_at = snapshot.collected_at_iso
+    snapshot_age = round(snapshot.age_seconds, 1)
 
-        async with pool.connection() as conn:
-            async with conn.cursor() as cur:
-                # ----------------------------------------------------------
-                # QUEUE HEALTH
-                # ----------------------------------------------------------
-                await cur.execute(
-                    """
-                    SELECT
-                        COUNT(*) FILTER (WHERE status = 'pending') AS pending,
-                        COUNT(*) FILTER (WHERE status = 'processing') AS processing,
-                        COUNT(*) FILTER (WHERE status = 'failed') AS failed,
-                        COUNT(*) FILTER (
-                            WHERE status = 'processing'
-                            AND started_at < NOW() - INTERVAL '15 minutes'
-                        ) AS stuck,
-                        COUNT(*) FILTER (
-                            WHERE status = 'failed'
-                            AND updated_at > NOW() - INTERVAL '24 hours'
-                        ) AS failed_24h
-                    FROM ops.job_queue
-                    """
-                )
-                row = await cur.fetchone()
-                queue_health = {
-                    "pending": row[0] or 0,
-                    "processing": row[1] or 0,
-                    "failed": row[2] or 0,
-                    "stuck": row[3] or 0,
-                    "failed_24h": row[4] or 0,
-                }
-
-                # Stuck jobs metric
-                stuck_count = queue_health["stuck"]
-                if stuck_count > 0:
-                    metrics.append(
-                        SystemHealthMetric(
-                            name="stuck_jobs",
-                            status="critical",
-                            value=stuck_count,
-                            threshold="0",
-                            message=f"{stuck_count} jobs stuck in processing > 15 min",
-                        )
-                    )
-                else:
-                    metrics.append(
-                        SystemHealthMetric(
-                            name="stuck_jobs",
-                            status="healthy",
-                            value=0,
-                            threshold="0",
-                            message="No stuck jobs",
-                        )
-                    )
-
-                # Pending jobs metric
-                pending_count = queue_health["pending"]
-                if pending_count > 100:
-                    metrics.append(
-                        SystemHealthMetric(
-                            name="pending_jobs",
-                            status="warning",
-                            value=pending_count,
-                            threshold="100",
-                            message=f"{pending_count} jobs pending (queue backlog)",
-                        )
-                    )
-                else:
-                    metrics.append(
-                        SystemHealthMetric(
-                            name="pending_jobs",
-                            status="healthy",
-                            value=pending_count,
-                            threshold="100",
-                            message=f"{pending_count} pending jobs",
-                        )
-                    )
-
-                # ----------------------------------------------------------
-                # WORKER HEALTH
-                # ----------------------------------------------------------
-                await cur.execute(
-                    """
-                    SELECT
-                        COUNT(*) AS total_workers,
-                        COUNT(*) FILTER (
-                            WHERE last_seen > NOW() - INTERVAL '5 minutes'
-                        ) AS active_workers,
-                        MAX(last_seen) AS last_heartbeat
-                    FROM ops.worker_heartbeats
-                    """
-                )
-                row = await cur.fetchone()
-                worker_health = {
-                    "total_workers": row[0] or 0,
-                    "active_workers": row[1] or 0,
-                    "last_heartbeat": row[2].isoformat() + "Z" if row[2] else None,
-                }
-
-                active_workers = worker_health["active_workers"]
-                if active_workers == 0:
-                    metrics.append(
-                        SystemHealthMetric(
-                            name="active_workers",
-                            status="critical",
-                            value=0,
-                            threshold="1",
-                            message="No active workers (no heartbeat in 5 min)",
-                        )
-                    )
-                else:
-                    metrics.append(
-                        SystemHealthMetric(
-                            name="active_workers",
-                            status="healthy",
-                            value=active_workers,
-                            threshold="1",
-                            message=f"{active_workers} active worker(s)",
-                        )
-                    )
-
-                # ----------------------------------------------------------
-                # REAPER HEALTH (check cron.job_run_details if available)
-                # ----------------------------------------------------------
-                try:
-                    await cur.execute(
-                        """
-                        SELECT
-                            jrd.status,
-                            jrd.start_time,
-                            jrd.return_message
-                        FROM cron.job_run_details jrd
-                        JOIN cron.job j ON j.jobid = jrd.jobid
-                        WHERE j.jobname IN ('dragonfly_reaper', 'reap_stuck_jobs')
-                        ORDER BY jrd.start_time DESC
-                        LIMIT 1
-                        """
-                    )
-                    row = await cur.fetchone()
-                    if row:
-                        reaper_health = {
-                            "last_status": row[0],
-                            "last_run": row[1].isoformat() + "Z" if row[1] else None,
-                            "return_message": row[2],
-                        }
-
-                        # Check if reaper ran recently
-                        if row[1]:
-                            minutes_since = (
-                                datetime.utcnow() - row[1].replace(tzinfo=None)
-                            ).total_seconds() / 60
-                            if minutes_since > 15:
-                                metrics.append(
-                                    SystemHealthMetric(
-                                        name="reaper",
-                                        status="warning",
-                                        value=int(minutes_since),
-                                        threshold="15",
-                                        message=f"Reaper last ran {int(minutes_since)} min ago",
-                                    )
-                                )
-                            else:
-                                metrics.append(
-                                    SystemHealthMetric(
-                                        name="reaper",
-                                        status="healthy",
-                                        value=int(minutes_since),
-                                        threshold="15",
-                                        message=f"Reaper ran {int(minutes_since)} min ago",
-                                    )
-                                )
-                        else:
-                            metrics.append(
-                                SystemHealthMetric(
-                                    name="reaper",
-                                    status="warning",
-                                    message="Reaper has no execution history",
-                                )
-                            )
-                    else:
-                        reaper_health = {"configured": False}
-                        metrics.append(
-                            SystemHealthMetric(
-                                name="reaper",
-                                status="warning",
-                                message="Reaper schedule not found in pg_cron",
-                            )
-                        )
-                except Exception as e:
-                    # pg_cron might not be accessible
-                    reaper_health = {"error": str(e)}
-                    metrics.append(
-                        SystemHealthMetric(
-                            name="reaper",
-                            status="warning",
-                            message=f"Cannot check reaper: {type(e).__name__}",
-                        )
-                    )
-
-                # ----------------------------------------------------------
-                # INTAKE HEALTH
-                # ----------------------------------------------------------
-                intake_health_data = IntakeHealthMetrics()
-                try:
-                    # Last successful intake
-                    await cur.execute(
-                        """
-                        SELECT MAX(completed_at)
-                        FROM intake.simplicity_batches
-                        WHERE status = 'completed'
-                        """
-                    )
-                    row = await cur.fetchone()
-                    if row and row[0]:
-                        intake_health_data.last_intake_success = row[0].isoformat() + "Z"
-
-                    # Pending validation (raw rows not yet validated)
-                    await cur.execute(
-                        """
-                        SELECT COUNT(*)
-                        FROM intake.simplicity_raw_rows r
-                        WHERE NOT EXISTS (
-                            SELECT 1 FROM intake.simplicity_validated_rows v
-                            WHERE v.raw_row_id = r.id
-                        )
-                        AND NOT EXISTS (
-                            SELECT 1 FROM intake.simplicity_failed_rows f
-                            WHERE f.raw_row_id = r.id AND f.resolved_at IS NULL
-                        )
-                        """
-                    )
-                    row = await cur.fetchone()
-                    intake_health_data.pending_validation = row[0] or 0
-
-                    # Failed rows in last 24h
-                    await cur.execute(
-                        """
-                        SELECT COUNT(*)
-                        FROM intake.simplicity_failed_rows
-                        WHERE created_at > NOW() - INTERVAL '24 hours'
-                        AND resolved_at IS NULL
-                        """
-                    )
-                    row = await cur.fetchone()
-                    intake_health_data.failed_rows_24h = row[0] or 0
-
-                    # Enrichment backlog (pending enrichment jobs)
-                    await cur.execute(
-                        """
-                        SELECT COUNT(*)
-                        FROM ops.job_queue
-                        WHERE job_type IN ('enrich_tlo', 'enrich_idicore')
-                        AND status = 'pending'
-                        """
-                    )
-                    row = await cur.fetchone()
-                    intake_health_data.enrichment_backlog = row[0] or 0
-
-                    # Active workers (from earlier query)
-                    intake_health_data.active_workers = worker_health.get("active_workers", 0)
-
-                    # Batches in last 24h with success rate
-                    await cur.execute(
-                        """
-                        SELECT
-                            COUNT(*) AS batch_count,
-                            AVG(
-                                CASE WHEN row_count_total > 0
-                                THEN (row_count_valid::float / row_count_total) * 100
-                                ELSE 0 END
-                            ) AS avg_success_rate
-                        FROM intake.simplicity_batches
-                        WHERE created_at > NOW() - INTERVAL '24 hours'
-                        """
-                    )
-                    row = await cur.fetchone()
-                    intake_health_data.batches_24h = row[0] or 0
-                    if row[1] is not None:
-                        intake_health_data.success_rate_24h = round(float(row[1]), 2)
-
-                    # Add intake metrics to SLO checks
-                    if intake_health_data.pending_validation > 100:
-                        metrics.append(
-                            SystemHealthMetric(
-                                name="intake_pending",
-                                status="warning",
-                                value=intake_health_data.pending_validation,
-                                threshold="100",
-                                message=f"{intake_health_data.pending_validation} rows pending validation",
-                            )
-                        )
-
-                    if intake_health_data.failed_rows_24h > 50:
-                        metrics.append(
-                            SystemHealthMetric(
-                                name="intake_failures",
-                                status="warning",
-                                value=intake_health_data.failed_rows_24h,
-                                threshold="50",
-                                message=f"{intake_health_data.failed_rows_24h} failed rows in 24h",
-                            )
-                        )
-
-                except Exception as e:
-                    logger.warning(f"Failed to collect intake health: {e}")
-                    # Don't fail the whole health check
-
-        # ----------------------------------------------------------
-        # DETERMINE OVERALL STATUS
-        # ----------------------------------------------------------
-        has_critical = any(m.status == "critical" for m in metrics)
-        has_warning = any(m.status == "warning" for m in metrics)
-
-        if has_critical:
-            overall_status = "critical"
-        elif has_warning:
-            overall_status = "degraded"
+    if not snapshot.database_ok:
+        if snapshot.error == "Database pool not initialized":
+            message = "Database pool not initialized"
         else:
-            overall_status = "healthy"
-
+            message = f"Database error: {snapshot.error}"
         return SystemHealthResponse(
-            overall_status=overall_status,
+            overall_status="critical",
             timestamp=timestamp,
             environment=settings.environment,
-            metrics=metrics,
-            queue_health=queue_health,
-            worker_health=worker_health,
-            reaper_health=reaper_health,
-            intake_health=intake_health_data,
+            metrics=[SystemHealthMetric(name="database", status="critical", message=message)],
+            snapshot_at=snapshot_at,
+            snapshot_age_seconds=snapshot_age,
         )
 
-    except Exception as e:
-        logger.error(f"System health check failed: {e}")
-        return SystemHealthResponse(
-            overall_status="critical",
-            timestamp=timestamp,
-            environment=settings.environment,
-            metrics=[
+    # ----------------------------------------------------------
+    # QUEUE HEALTH
+    # ----------------------------------------------------------
+    queue_health = dict(snapshot.queue)
+
+    # Stuck jobs metric
+    stuck_count = queue_health["stuck"]
+    if stuck_count > 0:
+        metrics.append(
+            SystemHealthMetric(
+                name="stuck_jobs",
+                status="critical",
+                value=stuck_count,
+                threshold="0",
+                message=f"{stuck_count} jobs stuck in processing > 15 min",
+            )
+        )
+    else:
+        metrics.append(
+            SystemHealthMetric(
+                name="stuck_jobs",
+                status="healthy",
+                value=0,
+                threshold="0",
+                message="No stuck jobs",
+            )
+        )
+
+    # Pending jobs metric
+    pending_count = queue_health["pending"]
+    if pending_count > 100:
+        metrics.append(
+            SystemHealthMetric(
+                name="pending_jobs",
+                status="warning",
+                value=pending_count,
+                threshold="100",
+                message=f"{pending_count} jobs pending (queue backlog)",
+            )
+        )
+    else:
+        metrics.append(
+            SystemHealthMetric(
+                name="pending_jobs",
+                status="healthy",
+                value=pending_count,
+                threshold="100",
+                message=f"{pending_count} pending jobs",
+            )
+        )
+
+    # ----------------------------------------------------------
+    # WORKER HEALTH
+    # ----------------------------------------------------------
+    worker_health = dict(snapshot.workers)
+
+    active_workers = worker_health["active_workers"]
+    if active_workers == 0:
+        metrics.append(
+            SystemHealthMetric(
+                name="active_workers",
+                status="critical",
+                value=0,
+                threshold="1",
+                message="No active workers (no heartbeat in 5 min)",
+            )
+        )
+    else:
+        metrics.append(
+            SystemHealthMetric(
+                name="active_workers",
+                status="healthy",
+                value=active_workers,
+                threshold="1",
+                message=f"{active_workers} active worker(s)",
+            )
+        )
+
+    # ----------------------------------------------------------
+    # REAPER HEALTH (pg_cron, if accessible)
+    # ----------------------------------------------------------
+    reaper_health = dict(snapshot.reaper)
+    metrics.append(_reaper_metric(snapshot))
+
+    # ----------------------------------------------------------
+    # INTAKE HEALTH
+    # ----------------------------------------------------------
+    intake_health_data = IntakeHealthMetrics()
+    if snapshot.intake is not None:
+        intake_health_data = IntakeHealthMetrics(**snapshot.intake)
+
+        # Add intake metrics to SLO checks
+        if intake_health_data.pending_validation > 100:
+            metrics.append(
                 SystemHealthMetric(
-                    name="database",
-                    status="critical",
-                    message=f"Database error: {type(e).__name__}",
+                    name="intake_pending",
+                    status="warning",
+                    value=intake_health_data.pending_validation,
+                    threshold="100",
+                    message=f"{intake_health_data.pending_validation} rows pending validation",
                 )
-            ],
-        )
+            )
+
+        if intake_health_data.failed_rows_24h > 50:
+            metrics.append(
+                SystemHealthMetric(
+                    name="intake_failures",
+                    status="warning",
+                    value=intake_health_data.failed_rows_24h,
+                    threshold="50",
+                    message=f"{intake_health_data.failed_rows_24h} failed rows in 24h",
+                )
+            )
+
+    # ----------------------------------------------------------
+    # DETERMINE OVERALL STATUS
+    # ----------------------------------------------------------
+    has_critical = any(m.status == "critical" for m in metrics)
+    has_warning = any(m.status == "warning" for m in metrics)
+
+    if has_critical:
+        overall_status = "critical"
+    elif has_warning:
+        overall_status = "degraded"
+    else:
+        overall_status = "healthy"
+
+    return SystemHealthResponse(
+        overall_status=overall_status,
+        timestamp=timestamp,
+        environment=settings.environment,
+        metrics=metrics,
+        queue_health=queue_health,
+        worker_health=worker_health,
+        reaper_health=reaper_health,
+        intake_health=intake_health_data,
+        snapshot_at=snapshot_at,
+        snapshot_age_seconds=snapshot_age,
+    )
 
 
 @router.get(
@@ -27,7 +27,9 @@ from ...api import ApiResponse, api_response, degraded_response
 from ...config import get_settings
 from ...core.security import AuthContext, get_current_user
 from ...db import get_pool
+from ...services.intake_executor import get_intake_executor
 from ...services.intake_service import IntakeService
+from ..pagination import CountMode, Keyset, SortKey, count_rows
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +102,8 @@ class BatchListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
 class BatchDetailResponse(BaseModel):
@@ -148,6 +152,8 @@ class ErrorLogResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
 class ErrorResponse(BaseModel):
@@ -235,19 +241,25 @@ async def process_upload_background(
     """
     Background task to process an uploaded file.
 
-    This runs asynchronously after the HTTP response is sent.
+    This runs asynchronously after the HTTP response is sent. Parsing and
+    normalization run in the intake executor's process pool; only the DB
+    writes happen on the event loop. Uploads beyond the executor's
+    concurrency limit wait for a slot.
     """
     try:
         pool = await get_pool()
         service = IntakeService(pool)
+        executor = get_intake_executor()
 
-        result = await service.process_simplicity_upload(
-            file_path=file_path,
-            batch_id=batch_id,
-            source=source,
-            created_by=created_by,
-            worker_id=f"api-background-{batch_id}",
-        )
+        async with executor.slot():
+            result = await service.process_simplicity_upload(
+                file_path=file_path,
+                batch_id=batch_id,
+                source=source,
+                created_by=created_by,
+                worker_id=f"api-background-{batch_id}",
+                executor=executor,
+            )
 
         logger.info(
             f"Background processing complete for batch {batch_id}: "
@@ -498,6 +510,16 @@ class BatchListData(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+# Keyset orderings for list endpoints (indexes: 20261116_keyset_pagination_indexes.sql)
+BATCHES_KEYSET = Keyset(SortKey("created_at", descending=True), SortKey("id", descending=True))
+INTAKE_LOG_ERRORS_KEYSET = Keyset(SortKey("row_index"))
+SIMPLICITY_ERRORS_KEYSET = Keyset(SortKey("row_index"), SortKey("id"))
+
+CURSOR_QUERY_DESCRIPTION = "Cursor from next_cursor; takes precedence over page"
 
 
 @router.get(
@@ -510,6 +532,8 @@ async def list_batches(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Results per page"),
     status: Optional[str] = Query(None, description="Filter by status"),
+    cursor: Annotated[Optional[str], Query(description=CURSOR_QUERY_DESCRIPTION)] = None,
+    count: Annotated[CountMode, Query(description="How total is computed")] = "cached",
     auth: AuthContext = Depends(get_current_user),
 ) -> ApiResponse[BatchListData]:
     """
@@ -518,11 +542,17 @@ async def list_batches(
     PR-3: Hardened to query ONLY ops.ingest_batches base table.
     No complex view dependencies - computes derived fields in Python.
 
+    Keyset-paginated (created_at, id) when a cursor is given; page numbers
+    remain supported for existing clients.
+
     Degrade Guard: On any error, returns 200 OK with degraded envelope.
     The UI must NEVER crash.
     """
     from ...core.trace_middleware import get_trace_id
 
+    # Malformed cursors are a client error (400), not a degraded response
+    after, after_params = BATCHES_KEYSET.after(cursor)
+
     try:
         pool = await get_pool()
 
@@ -531,21 +561,29 @@ async def list_batches(
 
             # Build query with explicit parameter ordering
             params: list[Any] = []
-            where_clause = ""
+            conditions: list[str] = []
 
             if status:
-                where_clause = "WHERE status = %s"
+                conditions.append("status = %s")
                 params.append(status)
 
-            # Get total count from base table
-            count_query = f"SELECT COUNT(*) FROM ops.ingest_batches {where_clause}"
-            async with conn.cursor() as cur:
-                await cur.execute(count_query, params if params else None)
-                row = await cur.fetchone()
-                total = row[0] if row else 0
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-            # Get paginated results from BASE TABLE ONLY (PR-3)
-            offset = (page - 1) * page_size
+            # Total from base table (estimated from pg_class when unfiltered)
+            total = await count_rows(
+                conn,
+                f"SELECT COUNT(*) FROM ops.ingest_batches {where_clause}",
+                params,
+                mode=count,
+                table=None if status else "ops.ingest_batches",
+            )
+
+            # Page after the cursor, or at the page offset
+            if after:
+                conditions.append(after)
+                params.extend(after_params)
+                where_clause = f"WHERE {' AND '.join(conditions)}"
+            offset = 0 if cursor else (page - 1) * page_size
 
             # Query only required columns from ops.ingest_batches
             # No joins, no views - maximum reliability
@@ -566,16 +604,16 @@ async def list_batches(
                     started_at
                 FROM ops.ingest_batches
                 {where_clause}
-                ORDER BY created_at DESC
+                {BATCHES_KEYSET.order_by()}
             """
 
-            # Append LIMIT/OFFSET with params in strict order
+            # Append LIMIT/OFFSET with params in strict order (one extra row to detect more)
             data_query = base_query + " LIMIT %s OFFSET %s"
-            data_params = params + [page_size, offset]
+            data_params = params + [page_size + 1, offset]
 
             async with conn.cursor(row_factory=dict_row) as cur:
                 await cur.execute(data_query, data_params)
-                rows = await cur.fetchall()
+                rows, next_cursor = BATCHES_KEYSET.page(await cur.fetchall(), page_size)
 
             # Compute derived fields in Python (previously in view)
             batches = []
@@ -631,6 +669,8 @@ async def list_batches(
                 total=total,
                 page=page,
                 page_size=page_size,
+                next_cursor=next_cursor,
+                has_more=next_cursor is not None,
             )
             return api_response(data=data)
 
@@ -736,10 +776,13 @@ async def get_batch_errors(
     batch_id: UUID,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Results per page"),
+    cursor: Annotated[Optional[str], Query(description=CURSOR_QUERY_DESCRIPTION)] = None,
+    count: Annotated[CountMode, Query(description="How total is computed")] = "cached",
     auth: AuthContext = Depends(get_current_user),
 ) -> ErrorLogResponse:
-    """Get error log entries for a batch."""
+    """Get error log entries for a batch (keyset-paginated by row_index)."""
 
+    after, after_params = INTAKE_LOG_ERRORS_KEYSET.after(cursor)
     pool = await get_pool()
 
     async with pool.connection() as conn:
@@ -753,24 +796,23 @@ async def get_batch_errors(
                 raise HTTPException(status_code=404, detail="Batch not found")
 
         # Get total count
-        async with conn.cursor() as cur:
-            await cur.execute(
-                """
-                SELECT COUNT(*) FROM ops.intake_logs
-                WHERE batch_id = %s AND status IN ('error', 'skipped')
-                """,
-                (str(batch_id),),
-            )
-            row = await cur.fetchone()
-            total = row[0] if row else 0
+        total = await count_rows(
+            conn,
+            """
+            SELECT COUNT(*) FROM ops.intake_logs
+            WHERE batch_id = %s AND status IN ('error', 'skipped')
+            """,
+            [str(batch_id)],
+            mode=count,
+        )
 
-        # Get paginated errors
-        offset = (page - 1) * page_size
+        # Get errors after the cursor, or at the page offset
+        offset = 0 if cursor else (page - 1) * page_size
         from psycopg.rows import dict_row
 
         async with conn.cursor(row_factory=dict_row) as cur:
             await cur.execute(
-                """
+                f"""
                 SELECT
                     row_index,
                     status,
@@ -780,12 +822,13 @@ async def get_batch_errors(
                     created_at
                 FROM ops.intake_logs
                 WHERE batch_id = %s AND status IN ('error', 'skipped')
-                ORDER BY row_index
+                {"AND " + after if after else ""}
+                {INTAKE_LOG_ERRORS_KEYSET.order_by()}
                 LIMIT %s OFFSET %s
                 """,
-                (str(batch_id), page_size, offset),
+                (str(batch_id), *after_params, page_size + 1, offset),
             )
-            rows = await cur.fetchall()
+            rows, next_cursor = INTAKE_LOG_ERRORS_KEYSET.page(await cur.fetchall(), page_size)
 
         errors = [
             ErrorLogEntry(
@@ -805,6 +848,8 @@ async def get_batch_errors(
             total=total,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None,
         )
 
 
@@ -852,6 +897,8 @@ class SimplicityBatchErrorsResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
 @router.get(
@@ -936,10 +983,13 @@ async def get_simplicity_batch_errors(
     batch_id: UUID,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Results per page"),
+    cursor: Annotated[Optional[str], Query(description=CURSOR_QUERY_DESCRIPTION)] = None,
+    count: Annotated[CountMode, Query(description="How total is computed")] = "cached",
     auth: AuthContext = Depends(get_current_user),
 ) -> ApiResponse[SimplicityBatchErrorsResponse]:
-    """Get error log entries for a Simplicity batch."""
+    """Get error log entries for a Simplicity batch (keyset-paginated)."""
 
+    after, after_params = SIMPLICITY_ERRORS_KEYSET.after(cursor)
     pool = await get_pool()
 
     async with pool.connection() as conn:
@@ -955,24 +1005,24 @@ async def get_simplicity_batch_errors(
                 raise HTTPException(status_code=404, detail="Batch not found")
 
         # Get total count of unresolved errors
-        async with conn.cursor() as cur:
-            await cur.execute(
-                """
-                SELECT COUNT(*) FROM intake.simplicity_failed_rows
-                WHERE batch_id = %s AND resolved_at IS NULL
-                """,
-                (batch_id,),
-            )
-            row = await cur.fetchone()
-            total = row[0] if row else 0
+        total = await count_rows(
+            conn,
+            """
+            SELECT COUNT(*) FROM intake.simplicity_failed_rows
+            WHERE batch_id = %s AND resolved_at IS NULL
+            """,
+            [batch_id],
+            mode=count,
+        )
 
-        # Get paginated errors
-        offset = (page - 1) * page_size
+        # Get errors after the cursor, or at the page offset
+        offset = 0 if cursor else (page - 1) * page_size
 
         async with conn.cursor(row_factory=dict_row) as cur:
             await cur.execute(
-                """
+                f"""
                 SELECT
+                    id,
                     row_index,
                     error_stage,
                     error_code,
@@ -982,12 +1032,13 @@ async def get_simplicity_batch_errors(
                     created_at
                 FROM intake.simplicity_failed_rows
                 WHERE batch_id = %s AND resolved_at IS NULL
-                ORDER BY row_index
+                {"AND " + after if after else ""}
+                {SIMPLICITY_ERRORS_KEYSET.order_by()}
                 LIMIT %s OFFSET %s
                 """,
-                (batch_id, page_size, offset),
+                (batch_id, *after_params, page_size + 1, offset),
             )
-            rows = await cur.fetchall()
+            rows, next_cursor = SIMPLICITY_ERRORS_KEYSET.page(await cur.fetchall(), page_size)
 
         import json
 
@@ -1024,6 +1075,8 @@ async def get_simplicity_batch_errors(
             total=total,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None,
         )
         return api_response(data=data)
 
@@ -6,6 +6,8 @@ Exposes application vital signs without the complexity of Prometheus:
 - Database connectivity
 - Queue health (PGMQ depths and ages)
 - Worker heartbeats
+- Intake executor concurrency and queue depth
+- Queue forecasts (arrival/drain rates, backlog ETA, recommended replicas)
 
 Requires API key authentication.
 """
@@ -16,12 +18,18 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
 from backend.core import metrics
 from backend.core.security import AuthContext, get_current_user
 from backend.db import get_pool
+from backend.services.intake_executor import get_intake_executor_metrics
+from backend.services.queue_telemetry import (
+    QUEUE_TELEMETRY_WINDOW_MINUTES,
+    QueueForecast,
+    load_queue_forecasts,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +75,22 @@ class IngestStats(BaseModel):
     last_failed_at: Optional[str] = None
 
 
+class IntakeExecutorStats(BaseModel):
+    """Intake process pool limits and streaming queue depth."""
+
+    started: bool
+    max_workers: int
+    max_active_files: int
+    queue_maxsize: int
+    active_files: int
+    waiting_files: int
+    queued_chunks: int
+    max_queue_depth: int
+    chunks_streamed: int
+    rows_streamed: int
+    parse_failures: int
+
+
 class MetricsResponse(BaseModel):
     """Full metrics response."""
 
@@ -76,6 +100,32 @@ class MetricsResponse(BaseModel):
     queues: Dict[str, QueueStats]
     workers: List[WorkerHeartbeat]
     ingest: IngestStats
+    intake_executor: Optional[IntakeExecutorStats] = None
+
+
+class QueueForecastStats(BaseModel):
+    """Scaling signals for one queue, derived from workers.queue_samples."""
+
+    queue_name: str
+    window_seconds: float
+    samples: int
+    queue_length: int
+    oldest_msg_age_sec: Optional[int] = None
+    active_workers: int
+    arrival_per_min: float
+    drain_per_min: float
+    per_worker_per_min: Optional[float] = None
+    backlog_eta_seconds: Optional[float] = None
+    trend: str
+    recommended_replicas: int
+
+
+class QueueForecastResponse(BaseModel):
+    """Per-queue forecasts over a trailing sample window."""
+
+    ts: str
+    window_minutes: int
+    queues: List[QueueForecastStats]
 
 
 # -----------------------------------------------------------------------------
@@ -154,6 +204,19 @@ async def _get_queue_stats() -> Dict[str, QueueStats]:
     return result
 
 
+async def _get_queue_forecasts(window_minutes: int) -> List[QueueForecast]:
+    """Forecast each queue from telemetry samples in the trailing window."""
+    try:
+        pool = await get_pool()
+        if pool is None:
+            return []
+        async with pool.connection() as conn:
+            return await load_queue_forecasts(conn, window_minutes)
+    except Exception as e:
+        logger.debug(f"Queue telemetry not available: {e}")
+        return []
+
+
 async def _get_worker_heartbeats() -> List[WorkerHeartbeat]:
     """Query worker heartbeat status."""
     result: List[WorkerHeartbeat] = []
@@ -308,6 +371,7 @@ async def get_metrics(
     queues = await _get_queue_stats()
     workers = await _get_worker_heartbeats()
     ingest = await _get_ingest_stats()
+    executor_metrics = get_intake_executor_metrics()
 
     return MetricsResponse(
         ts=datetime.now(timezone.utc).isoformat(),
@@ -316,4 +380,24 @@ async def get_metrics(
         queues=queues,
         workers=workers,
         ingest=ingest,
+        intake_executor=IntakeExecutorStats(**executor_metrics) if executor_metrics else None,
+    )
+
+
+@router.get("/queues/forecast", response_model=QueueForecastResponse)
+async def get_queue_forecast(
+    window_minutes: int = Query(QUEUE_TELEMETRY_WINDOW_MINUTES, ge=2, le=1440),
+    auth: AuthContext = Depends(get_current_user),
+) -> QueueForecastResponse:
+    """
+    Get per-queue arrival rate, drain rate, backlog ETA and recommended replicas.
+
+    Requires API key authentication. Queues need at least two samples in the
+    window (the platform watchdog records one per iteration) to appear.
+    """
+    forecasts = await _get_queue_forecasts(window_minutes)
+    return QueueForecastResponse(
+        ts=datetime.now(timezone.utc).isoformat(),
+        window_minutes=window_minutes,
+        queues=[QueueForecastStats(**f.to_dict()) for f in forecasts],
     )
@@ -11,7 +11,7 @@ from typing import Literal
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
-from ...services.packet_service import PacketError, generate_packet
+from ...services.packet_service import PacketError, generate_packet, generate_packets
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +41,34 @@ class PacketGenerateResponse(BaseModel):
     judgment_id: int = Field(..., description="ID of the judgment")
 
 
+class PacketBatchRequest(BaseModel):
+    """Request body for generating one packet type for many judgments."""
+
+    judgment_ids: list[int] = Field(
+        ..., min_length=1, max_length=500, description="IDs of the judgments to generate for"
+    )
+    type: Literal["income_execution_ny", "info_subpoena_ny"] = Field(
+        ..., description="Type of packet to generate for every judgment"
+    )
+
+
+class PacketBatchItem(BaseModel):
+    """Outcome for one judgment in a batch."""
+
+    judgment_id: int
+    packet_url: str | None = None
+    error: str | None = None
+
+
+class PacketBatchResponse(BaseModel):
+    """Response model for a packet batch."""
+
+    packet_type: str
+    generated: int = Field(..., description="Packets generated successfully")
+    failed: int = Field(..., description="Packets that could not be generated")
+    results: list[PacketBatchItem]
+
+
 class ErrorResponse(BaseModel):
     """Standard error response."""
 
@@ -123,6 +151,47 @@ async def generate_legal_packet(
         )
 
 
+@router.post(
+    "/generate-batch",
+    response_model=PacketBatchResponse,
+    responses={400: {"model": ErrorResponse, "description": "Invalid request"}},
+    summary="Generate legal packets for many judgments",
+    description=(
+        "Generate the same packet type for up to 500 judgments. Judgment data "
+        "is loaded in one query and documents are rendered and uploaded "
+        "concurrently. Per-judgment failures are reported in the results."
+    ),
+)
+async def generate_legal_packet_batch(request: PacketBatchRequest) -> PacketBatchResponse:
+    """Generate a batch of legal packets."""
+    logger.info(
+        f"Generating packet batch: type={request.type}, count={len(request.judgment_ids)}",
+        extra={"packet_type": request.type, "count": len(request.judgment_ids)},
+    )
+
+    try:
+        results = await generate_packets(request.judgment_ids, request.type)
+    except PacketError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Unexpected error in packet batch: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="An unexpected error occurred. Please try again later.",
+        )
+
+    generated = sum(1 for r in results if r.ok)
+    return PacketBatchResponse(
+        packet_type=request.type,
+        generated=generated,
+        failed=len(results) - generated,
+        results=[
+            PacketBatchItem(judgment_id=r.judgment_id, packet_url=r.packet_url, error=r.error)
+            for r in results
+        ],
+    )
+
+
 @router.get(
     "/types",
     summary="List available packet types",
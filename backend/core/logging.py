@@ -14,6 +14,8 @@ Features:
 - Correlation IDs for request/job tracing
 - Performance timing utilities
 - Sensitive data redaction
+- Optional queued mode: handlers run on a background thread
+  (DRAGONFLY_LOG_QUEUE=1 or queued=True)
 
 Usage:
     from backend.core.logging import get_logger, LogContext
@@ -27,20 +29,35 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
+import os
+import queue
+import re
 import sys
+import threading
 import time
 import traceback
 from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import datetime, timezone
-from functools import wraps
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Callable, Dict, Generator, Literal, Optional, TypeVar
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel
 
+# Optional fast JSON encoder
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # =============================================================================
 # Context Variables for Correlation
 # =============================================================================
@@ -104,6 +121,18 @@ REDACT_PATTERNS = frozenset(
 )
 
 
+# One alternation instead of a substring scan per pattern; longest first
+_REDACT_KEY_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(REDACT_PATTERNS, key=len, reverse=True))
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    """Whether a field name matches a redaction pattern (memoized per name)."""
+    return _REDACT_KEY_RE.search(key.lower()) is not None
+
+
 def redact_sensitive(data: Any, max_depth: int = 10) -> Any:
     """
     Recursively redact sensitive fields from data structures.
@@ -121,8 +150,7 @@ def redact_sensitive(data: Any, max_depth: int = 10) -> Any:
     if isinstance(data, dict):
         result = {}
         for key, value in data.items():
-            key_lower = str(key).lower()
-            if any(pattern in key_lower for pattern in REDACT_PATTERNS):
+            if _is_sensitive_key(key if isinstance(key, str) else str(key)):
                 result[key] = "[REDACTED]"
             else:
                 result[key] = redact_sensitive(value, max_depth - 1)
@@ -141,6 +169,36 @@ def redact_sensitive(data: Any, max_depth: int = 10) -> Any:
 # JSON Formatter
 # =============================================================================
 
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if HAS_ORJSON else 0
+
+
+def _dumps(log_dict: Dict[str, Any]) -> str:
+    """Serialize a log entry, using orjson when installed."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(log_dict, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(log_dict, default=str, ensure_ascii=False)
+
+
+def _record_context(
+    record: logging.LogRecord,
+) -> tuple[Optional[str], Optional[str], Dict[str, Any]]:
+    """
+    (request_id, run_id, context) for a record.
+
+    Queued records carry a snapshot taken on the logging thread, since the
+    listener thread does not see the caller's context variables.
+    """
+    snapshot = getattr(record, "_log_snapshot", None)
+    if snapshot is not None:
+        return snapshot
+    from backend.utils.context import get_request_id
+
+    request_id = get_request_id() or getattr(record, "request_id", None)
+    return request_id, _run_id.get(), _log_context.get()
+
 
 class StructuredJsonFormatter(logging.Formatter):
     """
@@ -183,11 +241,7 @@ class StructuredJsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON with required fields."""
-        # Import here to avoid circular imports
-        from backend.utils.context import get_request_id
-
-        # Resolve request_id from contextvar
-        request_id = get_request_id() or getattr(record, "request_id", None)
+        request_id, run_id, context = _record_context(record)
 
         # Base log structure - REQUIRED fields first
         log_dict: Dict[str, Any] = {
@@ -206,18 +260,15 @@ class StructuredJsonFormatter(logging.Formatter):
 
         # Add timestamp
         if self.include_timestamp:
-            log_dict["timestamp"] = datetime.now(timezone.utc).isoformat()
+            # Creation time, not format time: queued records are formatted later
+            log_dict["timestamp"] = datetime.fromtimestamp(record.created, timezone.utc).isoformat()
 
         # Add run_id from context
-        run_id = _run_id.get()
         if run_id:
             log_dict["run_id"] = run_id
 
-        # Merge context variables
-        context = get_current_context()
+        # Merge context variables (redacted with the whole entry below)
         if context:
-            if self.redact_sensitive_data:
-                context = redact_sensitive(context)
             log_dict.update(context)
 
         # Add extra fields from record
@@ -251,7 +302,7 @@ class StructuredJsonFormatter(logging.Formatter):
         if self.redact_sensitive_data:
             log_dict = redact_sensitive(log_dict)
 
-        return json.dumps(log_dict, default=str, ensure_ascii=False)
+        return _dumps(log_dict)
 
 
 # =============================================================================
@@ -276,18 +327,17 @@ class ColoredConsoleFormatter(logging.Formatter):
 
         # Build context string
         context_parts = []
-        run_id = _run_id.get()
+        _, run_id, context = _record_context(record)
         if run_id:
             context_parts.append(f"run={run_id[:8]}")
 
-        context = get_current_context()
         for key in ("judgment_id", "case_number", "job_id"):
             if key in context:
                 context_parts.append(f"{key}={context[key]}")
 
         context_str = f" [{', '.join(context_parts)}]" if context_parts else ""
 
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S.%f")[:-3]
 
         return (
             f"{color}[{timestamp}] {record.levelname:8}{self.RESET} "
@@ -337,6 +387,101 @@ def _create_split_handlers(
     return [stdout_handler, stderr_handler]
 
 
+# =============================================================================
+# Queued Logging (handlers run on a background thread)
+# =============================================================================
+
+# Records buffered before new ones are dropped (and counted)
+LOG_QUEUE_SIZE = int(os.getenv("DRAGONFLY_LOG_QUEUE_SIZE", "10000"))
+
+_queue_listener: Optional["_BoundedQueueListener"] = None
+_dropped_records = 0
+_dropped_lock = threading.Lock()
+
+
+def _queue_enabled_from_env() -> bool:
+    return os.getenv("DRAGONFLY_LOG_QUEUE", "").lower() in ("1", "true", "yes", "on")
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue.
+
+    The caller only snapshots the record (message, log context, request id)
+    and enqueues it; formatting and stream writes happen on the listener
+    thread. When the queue is full the record is dropped and counted rather
+    than blocking the event loop or worker.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        from backend.utils.context import get_request_id
+
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record._log_snapshot = (  # type: ignore[attr-defined]
+            get_request_id() or getattr(record, "request_id", None),
+            _run_id.get(),
+            _log_context.get(),
+        )
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        global _dropped_records
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with _dropped_lock:
+                _dropped_records += 1
+
+
+class _BoundedQueueListener(QueueListener):
+    """QueueListener whose stop() waits for room when the queue is full."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+
+def get_dropped_log_count() -> int:
+    """Records dropped because the log queue was full."""
+    return _dropped_records
+
+
+def stop_queued_logging() -> None:
+    """Flush the log queue and stop its listener thread (no-op if not queued)."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_queued_logging)
+
+
+def _install_handlers(
+    root_logger: logging.Logger,
+    handlers: list[logging.Handler],
+    queued: Optional[bool],
+    queue_size: Optional[int] = None,
+) -> None:
+    """Attach handlers to the root logger, behind a queue if requested."""
+    global _queue_listener
+    stop_queued_logging()
+    if queued is None:
+        queued = _queue_enabled_from_env()
+    if not queued:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        return
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(
+        maxsize=LOG_QUEUE_SIZE if queue_size is None else queue_size
+    )
+    _queue_listener = _BoundedQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    root_logger.addHandler(_DroppingQueueHandler(log_queue))
+
+
 # =============================================================================
 # Logger Configuration
 # =============================================================================
@@ -346,6 +491,7 @@ def configure_structured_logging(
     level: str = "INFO",
     json_output: bool = True,
     service_name: str = "dragonfly",
+    queued: Optional[bool] = None,
 ) -> None:
     """
     Configure structured logging for the application.
@@ -358,6 +504,8 @@ def configure_structured_logging(
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_output: If True, use JSON format; else use colored console
         service_name: Service name for log tagging
+        queued: Format and write on a background thread via a bounded
+            queue (None = DRAGONFLY_LOG_QUEUE)
     """
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
@@ -374,8 +522,7 @@ def configure_structured_logging(
 
     # Create split handlers (stdout for INFO-, stderr for WARNING+)
     handlers = _create_split_handlers(formatter, getattr(logging, level.upper()))
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    _install_handlers(root_logger, handlers, queued)
 
     # Set context
     set_context(service=service_name)
@@ -955,6 +1102,7 @@ def configure_logging(
     level: str = "INFO",
     json_output: bool = True,
     service_name: str = "dragonfly",
+    queued: Optional[bool] = None,
 ) -> None:
     """
     Configure logging for the application (convenience alias).
@@ -966,11 +1114,13 @@ def configure_logging(
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_output: If True, use JSON format; else use colored console
         service_name: Service name for log tagging
+        queued: Write logs from a background thread (None = DRAGONFLY_LOG_QUEUE)
     """
     configure_structured_logging(
         level=level,
         json_output=json_output,
         service_name=service_name,
+        queued=queued,
     )
 
 
@@ -988,8 +1138,6 @@ class _SimpleFormatter(logging.Formatter):
 # Redacting Formatter (Security: masks secrets in log output)
 # =============================================================================
 
-import re
-
 # Patterns that should be redacted from log messages
 _REDACT_PATTERNS = [
     # JWTs (eyJ... format)
@@ -1071,6 +1219,7 @@ class _RedactingSimpleFormatter(RedactingFormatter):
 def configure_worker_logging(
     worker_name: str,
     level: str = "INFO",
+    queued: Optional[bool] = None,
 ) -> logging.Logger:
     """
     Configure logging for a worker process with split stdout/stderr streams.
@@ -1083,6 +1232,8 @@ def configure_worker_logging(
     Args:
         worker_name: Name of the worker (used as logger name).
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
+        queued: Write logs from a background thread so log calls do not
+            block the job loop (None = DRAGONFLY_LOG_QUEUE).
 
     Returns:
         Configured logger instance for the worker.
@@ -1097,7 +1248,6 @@ def configure_worker_logging(
     # Create split handlers with REDACTING format (security: masks secrets)
     formatter = _RedactingSimpleFormatter()
     handlers = _create_split_handlers(formatter, getattr(logging, level.upper()))
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    _install_handlers(root_logger, handlers, queued)
 
     return logging.getLogger(worker_name)
@@ -9,6 +9,9 @@ Usage:
 
     # In an endpoint or service
     trace_id = get_trace_id()  # Returns current request's trace ID
+
+Log records pick the trace ID up through TraceContextFilter, installed once
+on the root handlers, rather than a per-request log record factory.
 """
 
 from __future__ import annotations
@@ -55,6 +58,33 @@ def set_trace_id(trace_id: str) -> None:
     _trace_id_var.set(trace_id)
 
 
+class TraceContextFilter(logging.Filter):
+    """
+    Stamp ``trace_id`` on log records from the current context.
+
+    Reads the context variable at emit time, so it is safe under concurrent
+    requests (unlike swapping the process-global log record factory).
+    Records logged outside a request, or with an explicit ``trace_id`` extra,
+    are left untouched.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        trace_id = _trace_id_var.get()
+        if trace_id != "no-trace" and not hasattr(record, "trace_id"):
+            record.trace_id = trace_id
+        return True
+
+
+_trace_log_filter = TraceContextFilter()
+
+
+def install_trace_log_filter(target: logging.Logger | None = None) -> None:
+    """Attach TraceContextFilter to the handlers of ``target`` (default: root); idempotent."""
+    for handler in (target or logging.getLogger()).handlers:
+        if _trace_log_filter not in handler.filters:
+            handler.addFilter(_trace_log_filter)
+
+
 class TraceMiddleware(BaseHTTPMiddleware):
     """
     Middleware that generates and manages trace IDs for every request.
@@ -67,12 +97,13 @@ class TraceMiddleware(BaseHTTPMiddleware):
 
     def __init__(self, app: ASGIApp):
         super().__init__(app)
+        install_trace_log_filter()
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Generate unique trace ID or use one from header (for distributed tracing)
         trace_id = request.headers.get("X-Trace-ID", str(uuid.uuid4()))
 
-        # Set in context variable for get_trace_id() access
+        # Set in context variable for get_trace_id() access (and log records)
         _trace_id_var.set(trace_id)
 
         # Bind to structlog context for structured logging (if available)
@@ -84,24 +115,10 @@ class TraceMiddleware(BaseHTTPMiddleware):
                 # structlog may not be configured - graceful fallback
                 pass
 
-        # Also set in standard logging extra for compatibility
-        old_factory = logging.getLogRecordFactory()
-
-        def record_factory(*args, **kwargs):
-            record = old_factory(*args, **kwargs)
-            record.trace_id = trace_id
-            return record
-
-        logging.setLogRecordFactory(record_factory)
-
-        try:
-            # Process request
-            response = await call_next(request)
+        # Process request
+        response = await call_next(request)
 
-            # Add trace ID to response headers
-            response.headers["X-Trace-ID"] = trace_id
+        # Add trace ID to response headers
+        response.headers["X-Trace-ID"] = trace_id
 
-            return response
-        finally:
-            # Restore log factory
-            logging.setLogRecordFactory(old_factory)
+        return response
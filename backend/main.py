@@ -112,14 +112,8 @@ from .api.routers.system import router as system_router  # noqa: E402
 from .api.routers.telemetry import router as telemetry_router  # noqa: E402
 from .api.routers.webhooks import router as webhooks_router  # noqa: E402
 from .config import get_settings, log_startup_diagnostics, validate_required_env  # noqa: E402
-from .core.middleware import PerformanceLoggingMiddleware  # noqa: E402
-from .core.middleware import (
-    RateLimitMiddleware,
-    RequestLoggingMiddleware,
-    ResponseSanitizationMiddleware,
-    get_request_id,
-)
-from .core.trace_middleware import TraceMiddleware, get_trace_id  # noqa: E402
+from .core.middleware import RATE_LIMITS, get_request_id  # noqa: E402
+from .core.trace_middleware import get_trace_id  # noqa: E402
 from .db import close_db_pool, database, init_db_pool  # noqa: E402
 
 # Optional: Correlation Middleware - graceful degradation if missing
@@ -135,9 +129,13 @@ except ModuleNotFoundError as _correlation_err:
         _correlation_err,
     )
 
-from .middleware.metrics import MetricsMiddleware  # noqa: E402
-from .middleware.version import VersionMiddleware, get_version_info  # noqa: E402
+from .middleware.pipeline import RequestPipelineMiddleware  # noqa: E402
+from .middleware.version import get_version_info  # noqa: E402
 from .scheduler import init_scheduler  # noqa: E402
+from .services.event_service import close_event_listener  # noqa: E402
+from .services.health_snapshot import health_collector  # noqa: E402
+from .services.intake_executor import shutdown_intake_executor  # noqa: E402
+from .services.packet_renderer import shutdown_packet_renderer  # noqa: E402
 from .utils.logging import get_log_metadata, setup_logging  # noqa: E402
 
 # Configure logging before anything else
@@ -178,7 +176,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Handles startup and shutdown events:
     - Startup: Verify safe environment, generate boot report, initialize database pool
-    - Shutdown: Close database pool, stop DB supervisor
+    - Shutdown: Close database pool, stop DB supervisor and health collector
 
     Uses explicit database.start()/stop() to avoid psycopg_pool deprecation warning:
     "AsyncConnectionPool constructor open is deprecated"
@@ -262,6 +260,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await db_supervisor.start()
         logger.info("[DB Supervisor] Background reconnection supervisor started")
 
+    # 6. Start background health snapshot collector (serves /health/ops, /health/system)
+    await health_collector.start()
+
     yield
 
     # Shutdown - stop supervisor first, then close DB
@@ -270,6 +271,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if db_supervisor:
         await db_supervisor.stop()
 
+    await health_collector.stop()
+    shutdown_intake_executor()
+    shutdown_packet_renderer()
+    await close_event_listener()
+
     await database.stop()
     logger.info("Shutdown complete")
 
@@ -316,10 +322,9 @@ def create_app() -> FastAPI:
     Application factory.
 
     Creates and configures the FastAPI application with:
-    - CORS middleware FIRST (critical for preflight handling)
-    - Request logging middleware
-    - Rate limiting middleware
-    - Response sanitization middleware
+    - Request pipeline middleware (request/trace IDs, rate limiting,
+      version headers, timing logs, metrics)
+    - CORS middleware (critical for preflight handling)
     - Global exception handlers with CORS headers
     - All routers wired with explicit prefixes
 
@@ -344,20 +349,13 @@ def create_app() -> FastAPI:
     # ==========================================================================
     # MIDDLEWARE ORDER IS CRITICAL
     # FastAPI adds middleware in REVERSE order (last added = outermost)
-    # Execution order: CorrelationMiddleware -> TraceMiddleware -> RateLimitMiddleware -> CORSMiddleware -> VersionMiddleware
+    # Execution order: RequestPipelineMiddleware -> CORSMiddleware
+    # Both are pure ASGI: one pass per request, streaming bodies untouched
     # ==========================================================================
 
     # --- Add in REVERSE order (last added = first to execute) ---
 
-    # 4. VersionMiddleware (innermost - adds X-Dragonfly-SHA headers to every response)
-    app.add_middleware(VersionMiddleware)
-    version_info = get_version_info()
-    logger.info(
-        f"[Middleware] VersionMiddleware added: SHA={version_info['sha_short']} "
-        f"Env={version_info['env']}"
-    )
-
-    # 3. CORSMiddleware (handles cross-origin requests)
+    # 2. CORSMiddleware (inner - handles cross-origin requests and preflight)
     cors_origins = settings.cors_allowed_origins
     cors_regex = settings.cors_origin_regex
     if not cors_origins and not cors_regex:
@@ -389,42 +387,23 @@ def create_app() -> FastAPI:
         ],
     )
 
-    # 2. SecurityMiddleware: Rate limiting for abuse detection (always active in prod)
-    if settings.is_production:
-        app.add_middleware(RateLimitMiddleware)
-        logger.info("[Middleware] RateLimitMiddleware enabled for production")
-    else:
-        logger.info("[Middleware] RateLimitMiddleware DISABLED (non-production)")
-
-    # 1. TraceMiddleware (outermost before correlation - generates trace IDs for every request)
-    app.add_middleware(TraceMiddleware)
-    logger.info("[Middleware] TraceMiddleware added (trace IDs)")
-
-    # 0. CorrelationMiddleware (true outermost - ensures X-Request-ID is present)
-    if _CORRELATION_MIDDLEWARE_AVAILABLE and CorrelationMiddleware is not None:
-        app.add_middleware(CorrelationMiddleware)
-        logger.info("[Middleware] CorrelationMiddleware added (request IDs)")
-    else:
+    # 1. RequestPipelineMiddleware (outermost - request/trace IDs, rate limiting,
+    #    X-Dragonfly-* headers, access/slow-request logs, /api/metrics counters)
+    app.add_middleware(
+        RequestPipelineMiddleware,
+        rate_limits=RATE_LIMITS if settings.is_production else None,
+        slow_request_threshold_s=1.0,
+    )
+    version_info = get_version_info()
+    logger.info(
+        f"[Middleware] RequestPipelineMiddleware added: SHA={version_info['sha_short']} "
+        f"Env={version_info['env']} rate_limits={'on' if settings.is_production else 'off'}"
+    )
+    if not _CORRELATION_MIDDLEWARE_AVAILABLE:
         logger.critical(
             "[BOOT] CorrelationMiddleware missing; proceeding WITHOUT request-id correlation."
         )
 
-    # --- Additional middleware (after core security stack) ---
-
-    # Response sanitization (safety net for credential leaks)
-    app.add_middleware(ResponseSanitizationMiddleware, strict_mode=settings.is_production)
-    logger.info(f"[Middleware] ResponseSanitizationMiddleware (strict={settings.is_production})")
-
-    # Performance logging (slow query detection)
-    app.add_middleware(PerformanceLoggingMiddleware, threshold_s=1.0)
-
-    # Request logging (logs after CORS/rate limit decisions)
-    app.add_middleware(RequestLoggingMiddleware)
-
-    # Metrics collection (counts requests and errors for /api/metrics)
-    app.add_middleware(MetricsMiddleware)
-    logger.info("[Middleware] MetricsMiddleware added (request/error counting)")
-
     # ==========================================================================
     # GLOBAL EXCEPTION HANDLERS WITH REQUIRED HEADERS
     # All responses include CORS + Dragonfly version headers for traceability
@@ -10,6 +10,7 @@ from backend.middleware.correlation import (
     reset_request_id,
     set_request_id,
 )
+from backend.middleware.pipeline import RequestPipelineMiddleware, SlidingWindowRateLimiter
 from backend.middleware.security import (
     SecurityMiddleware,
     add_security_middleware,
@@ -32,6 +33,9 @@ __all__ = [
     "get_request_id",
     "set_request_id",
     "reset_request_id",
+    # Pipeline
+    "RequestPipelineMiddleware",
+    "SlidingWindowRateLimiter",
     # Security
     "SecurityMiddleware",
     "add_security_middleware",
@@ -0,0 +1,299 @@
+"""
+Dragonfly Engine - Request Pipeline Middleware
+
+One pure-ASGI middleware doing, in a single pass, what the API used to stack
+as separate BaseHTTPMiddleware layers (Correlation, Trace, RateLimit,
+Version, ResponseSanitization, PerformanceLogging, RequestLogging, Metrics):
+
+- Request ID: X-Request-ID from the client or a new UUID, bound to the
+  request-id context variables and echoed on the response
+- Trace ID: X-Trace-ID from the client or a new UUID, bound to the trace
+  context variable (log records get it via TraceContextFilter)
+- Rate limiting: per-client sliding windows for sensitive path prefixes
+- Headers: X-Request-ID, X-Trace-ID, X-Dragonfly-*, X-Response-Time,
+  X-RateLimit-*
+- Timing and access logs, slow request warnings
+- Metrics: request and 5xx/unhandled-error counters for /api/metrics
+
+Each BaseHTTPMiddleware layer costs a task hop plus response re-wrapping per
+request; this rewrites the http.response.start message once and passes the
+body through untouched, so streaming responses are unaffected.
+
+Usage:
+    from backend.middleware.pipeline import RequestPipelineMiddleware
+    app.add_middleware(RequestPipelineMiddleware, rate_limits=RATE_LIMITS)
+
+Benchmark against the previous stack: python -m tools.bench_middleware_pipeline
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from collections import deque
+from typing import Optional, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core import metrics
+from backend.core.middleware import SLOW_REQUEST_THRESHOLD_S, RateLimitConfig
+from backend.core.trace_middleware import install_trace_log_filter, set_trace_id
+from backend.middleware.version import GIT_SHA_SHORT, VERSION
+from backend.utils import context
+
+# Optional: correlation module (request-id context var and header values)
+try:
+    from backend.middleware import correlation as _correlation
+except ModuleNotFoundError:  # pragma: no cover - mirrors backend.main degradation
+    _correlation = None  # type: ignore[assignment]
+
+# Optional structlog support
+try:
+    import structlog
+
+    HAS_STRUCTLOG = True
+except ImportError:
+    HAS_STRUCTLOG = False
+
+# Same logger the separate middlewares used, so log routing/alerts still match
+logger = logging.getLogger("backend.core.middleware")
+
+_RATE_LIMITED_BODY = (
+    b'{"error": "rate_limit_exceeded", "message": "Too many requests. Please slow down."}'
+)
+
+
+def _static_headers() -> list[tuple[bytes, bytes]]:
+    """Version headers added to every response (values fixed at import)."""
+    if _correlation is not None:
+        # The correlation values are what clients saw from the old stack
+        sha, env = _correlation._CACHED_SHA, _correlation._CACHED_ENV
+    else:
+        from backend.middleware.version import ENV_NAME, GIT_SHA
+
+        sha, env = GIT_SHA, ENV_NAME
+    return [
+        (b"x-dragonfly-sha", sha.encode("latin-1")),
+        (b"x-dragonfly-sha-short", GIT_SHA_SHORT.encode("latin-1")),
+        (b"x-dragonfly-env", env.encode("latin-1")),
+        (b"x-dragonfly-version", VERSION.encode("latin-1")),
+    ]
+
+
+class SlidingWindowRateLimiter:
+    """
+    In-memory per-client sliding window, one window per configured prefix.
+
+    Same limits and semantics as RateLimitMiddleware, with monotonic
+    timestamps in deques so expiring old entries is O(expired).
+    """
+
+    def __init__(self, configs: Sequence[RateLimitConfig]) -> None:
+        self.configs = list(configs)
+        self._windows: dict[tuple[str, str], deque[float]] = {}
+
+    def find_config(self, path: str) -> Optional[RateLimitConfig]:
+        for config in self.configs:
+            if path.startswith(config.path_prefix):
+                return config
+        return None
+
+    def hit(self, config: RateLimitConfig, client_ip: str) -> Optional[int]:
+        """
+        Record a request; returns the remaining allowance, or None if limited.
+        """
+        key = (config.path_prefix, client_ip)
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = deque()
+
+        now = time.monotonic()
+        cutoff = now - config.window_seconds
+        while window and window[0] <= cutoff:
+            window.popleft()
+
+        if len(window) >= config.requests_per_minute:
+            return None
+        window.append(now)
+        return config.requests_per_minute - len(window)
+
+
+class RequestPipelineMiddleware:
+    """
+    Pure-ASGI request pipeline (ids, tracing, rate limits, headers, timing,
+    metrics). Non-HTTP scopes (lifespan, websockets) pass straight through.
+
+    Args:
+        app: Downstream ASGI app
+        rate_limits: Rate limit configs; None disables rate limiting
+        slow_request_threshold_s: Log a WARNING for slower requests
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rate_limits: Optional[Sequence[RateLimitConfig]] = None,
+        slow_request_threshold_s: float = SLOW_REQUEST_THRESHOLD_S,
+    ) -> None:
+        self.app = app
+        self.rate_limiter = SlidingWindowRateLimiter(rate_limits) if rate_limits else None
+        self.slow_request_threshold_s = slow_request_threshold_s
+        self._static_headers = _static_headers()
+        install_trace_log_filter()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        metrics.increment_requests()
+
+        request_id = trace_id = forwarded_for = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+            elif name == b"x-trace-id":
+                trace_id = value.decode("latin-1")
+            elif name == b"x-forwarded-for":
+                forwarded_for = value.decode("latin-1")
+        request_id = request_id or str(uuid.uuid4())
+        trace_id = trace_id or str(uuid.uuid4())
+
+        # Bound for the rest of this request's task (and the error handlers
+        # outside this middleware); each request runs in its own context
+        context.set_request_id(request_id)
+        if _correlation is not None:
+            _correlation.set_request_id(request_id)
+        set_trace_id(trace_id)
+        if HAS_STRUCTLOG:
+            try:
+                structlog.contextvars.clear_contextvars()
+                structlog.contextvars.bind_contextvars(trace_id=trace_id)
+            except Exception:
+                pass
+
+        method, path = scope["method"], scope["path"]
+        client = scope.get("client")
+        client_ip = forwarded_for or (client[0] if client else "unknown")
+        if "," in client_ip:
+            client_ip = client_ip.split(",")[0].strip()
+
+        headers = [
+            (b"x-request-id", request_id.encode("latin-1")),
+            (b"x-trace-id", trace_id.encode("latin-1")),
+            *self._static_headers,
+        ]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                status = message["status"]
+                ours = {name for name, _ in headers}
+                raw = [h for h in message.get("headers", ()) if h[0].lower() not in ours]
+                message["headers"] = [
+                    *raw,
+                    *headers,
+                    (b"x-response-time", f"{duration_ms:.1f}ms".encode()),
+                ]
+                self._log_response(request_id, method, path, status, duration_ms, client_ip)
+                if status >= 500:
+                    metrics.increment_errors()
+                    if any(n.lower() == b"content-type" and b"json" in v for n, v in raw):
+                        # Safety net kept from ResponseSanitizationMiddleware
+                        logger.warning(
+                            f"{status} response on {path} - verify no credentials leaked",
+                            extra={"request_id": request_id, "path": path, "status_code": status},
+                        )
+            await send(message)
+
+        if self.rate_limiter is not None:
+            config = self.rate_limiter.find_config(path)
+            if config is not None:
+                remaining = self.rate_limiter.hit(config, client_ip)
+                limit = str(config.requests_per_minute).encode()
+                if remaining is None:
+                    logger.warning(
+                        f"Rate limit exceeded for {client_ip} on {config.path_prefix}",
+                        extra={
+                            "client_ip": client_ip,
+                            "path_prefix": config.path_prefix,
+                            "limit": config.requests_per_minute,
+                        },
+                    )
+                    await send_wrapper(
+                        {
+                            "type": "http.response.start",
+                            "status": 429,
+                            "headers": [
+                                (b"content-type", b"application/json"),
+                                (b"content-length", str(len(_RATE_LIMITED_BODY)).encode()),
+                                (b"retry-after", str(config.window_seconds).encode()),
+                                (b"x-ratelimit-limit", limit),
+                                (b"x-ratelimit-remaining", b"0"),
+                            ],
+                        }
+                    )
+                    await send_wrapper({"type": "http.response.body", "body": _RATE_LIMITED_BODY})
+                    return
+                headers.append((b"x-ratelimit-limit", limit))
+                headers.append((b"x-ratelimit-remaining", str(remaining).encode()))
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            metrics.increment_errors()
+            logger.error(
+                f"[{request_id}] Unhandled exception: {type(e).__name__}: {e}",
+                extra={
+                    "request_id": request_id,
+                    "path": path,
+                    "method": method,
+                    "client_ip": client_ip,
+                },
+            )
+            raise
+
+    def _log_response(
+        self,
+        request_id: str,
+        method: str,
+        path: str,
+        status: int,
+        duration_ms: float,
+        client_ip: str,
+    ) -> None:
+        """Access log line plus slow-request warning (time to response start)."""
+        log_level = logging.INFO if status < 400 else logging.WARNING
+        if status >= 500:
+            log_level = logging.ERROR
+
+        if logger.isEnabledFor(log_level):
+            logger.log(
+                log_level,
+                f"[{request_id}] {method} {path} -> {status} ({duration_ms:.1f}ms)",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "status_code": status,
+                    "duration_ms": round(duration_ms, 2),
+                    "client_ip": client_ip,
+                },
+            )
+
+        if duration_ms > self.slow_request_threshold_s * 1000:
+            logger.warning(
+                f"⚠️ SLOW REQUEST DETECTED: {method} {path} "
+                f"took {duration_ms:.0f}ms "
+                f"(threshold: {self.slow_request_threshold_s * 1000:.0f}ms)",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "duration_ms": round(duration_ms, 2),
+                    "threshold_ms": self.slow_request_threshold_s * 1000,
+                    "slow_request": True,
+                },
+            )
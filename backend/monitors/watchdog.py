@@ -46,6 +46,8 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from dotenv import load_dotenv
 
+from backend.services.queue_telemetry import queue_sampler
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURATION - Hard SLOs
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -890,6 +892,10 @@ def run_watchdog_iteration(env: str, iteration: int) -> WatchdogReport:
         for alert in result.alerts:
             log.warning(f"  {alert}")
 
+        # Queue telemetry sample (feeds /api/v1/metrics/queues/forecast)
+        sampled = queue_sampler.sample(conn)
+        log.info(f"[Telemetry] Recorded {sampled} queue samples")
+
     finally:
         conn.close()
 
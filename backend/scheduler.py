@@ -58,7 +58,7 @@ async def heartbeat_job() -> None:
 
 async def daily_budget_snapshot_job() -> None:
     """
-    Daily job to snapshot litigation budget.
+    Daily job to snapshot litigation budget and pool NAV.
     Runs at 6 AM to prepare budget for CEO review.
 
     TODO: Implement actual budget calculation
@@ -90,6 +90,39 @@ async def daily_budget_snapshot_job() -> None:
     except Exception as e:
         logger.error(f"Failed to compute daily budget: {e}")
 
+    # Daily NAV point for every pool (one grouped pass, upserted into history)
+    try:
+        from .services.finance_service import calculate_nav_all
+
+        navs = await calculate_nav_all(persist=True)
+        total_nav = sum(float(n.nav) for n in navs)
+        logger.info(
+            "Daily NAV snapshot saved",
+            extra={"job": "budget_snapshot", "pools": len(navs), "total_nav": total_nav},
+        )
+    except Exception as e:
+        logger.error(f"Failed to snapshot pool NAV: {e}")
+
+
+async def nav_refresh_job() -> None:
+    """
+    Incremental NAV snapshot refresh.
+    Runs every 15 minutes and recomputes only pools whose judgments or
+    transactions changed since their last snapshot.
+    """
+    try:
+        from .services.finance_service import calculate_nav_all
+
+        navs = await calculate_nav_all(changed_only=True, persist=True)
+        if navs:
+            logger.info(f"💰 NAV refreshed for {len(navs)} changed pools")
+        else:
+            logger.debug("💰 NAV refresh: no pool changes")
+
+    except Exception as e:
+        logger.exception(f"💰 NAV refresh job failed: {e}")
+        # Don't re-raise - we don't want to crash the scheduler
+
 
 async def enforcement_check_job() -> None:
     """
@@ -334,6 +367,53 @@ async def daily_recap_job() -> None:
         # Don't re-raise - we don't want to crash the scheduler
 
 
+async def embedding_refresh_job() -> None:
+    """
+    Nightly incremental embedding refresh.
+    Runs at 2 AM Eastern to embed new judgments and re-embed any whose
+    context changed since their stored embedding was generated.
+    """
+    logger.info("🧠 Running embedding refresh job...")
+
+    try:
+        from .services.ai_service import _get_openai_api_key
+        from .services.embedding_pipeline import OpenAIEmbedder, run_embedding_backfill
+
+        if not _get_openai_api_key():
+            logger.debug("🧠 OPENAI_API_KEY not configured, skipping embedding refresh")
+            return
+
+        async with OpenAIEmbedder() as embedder:
+            result = await run_embedding_backfill(embedder)
+
+        if result.failed:
+            logger.warning(f"🧠 Embedding refresh finished with failures: {result.to_dict()}")
+
+    except Exception as e:
+        logger.exception(f"🧠 Embedding refresh job failed: {e}")
+        # Don't re-raise - we don't want to crash the scheduler
+
+
+async def portfolio_rollup_reconcile_job() -> None:
+    """
+    Nightly portfolio rollup reconciliation.
+    Runs at 3 AM Eastern to verify analytics.portfolio_rollups against a full
+    scan of public.judgments and correct them if they drifted.
+    """
+    logger.info("📊 Running portfolio rollup reconciliation...")
+
+    try:
+        from .services.portfolio_rollups import run_rollup_reconciliation
+
+        drifted = await run_rollup_reconciliation()
+        if drifted:
+            logger.warning(f"📊 Portfolio rollups drifted in {drifted} buckets")
+
+    except Exception as e:
+        logger.exception(f"📊 Portfolio rollup reconciliation failed: {e}")
+        # Don't re-raise - we don't want to crash the scheduler
+
+
 # =============================================================================
 # Scheduler Initialization
 # =============================================================================
@@ -492,6 +572,33 @@ def _register_jobs(scheduler: AsyncIOScheduler, settings: Any) -> None:
         replace_existing=True,
     )
 
+    # Embedding refresh - 2 AM Eastern every day (incremental, hash-skipped)
+    scheduler.add_job(
+        embedding_refresh_job,
+        trigger=CronTrigger(hour=2, minute=0),
+        id="embedding_refresh",
+        name="Embedding Refresh",
+        replace_existing=True,
+    )
+
+    # NAV refresh - every 15 minutes (changed pools only)
+    scheduler.add_job(
+        nav_refresh_job,
+        trigger=IntervalTrigger(minutes=15),
+        id="nav_refresh",
+        name="NAV Refresh",
+        replace_existing=True,
+    )
+
+    # Portfolio rollup reconciliation - 3 AM Eastern every day (full scan, off-peak)
+    scheduler.add_job(
+        portfolio_rollup_reconcile_job,
+        trigger=CronTrigger(hour=3, minute=0),
+        id="portfolio_rollup_reconcile",
+        name="Portfolio Rollup Reconcile",
+        replace_existing=True,
+    )
+
     logger.info("Registered scheduled jobs")
 
 
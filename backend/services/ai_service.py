@@ -7,6 +7,7 @@ Handles vectorization of judgment data for semantic search.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from typing import Optional
 
@@ -169,6 +170,23 @@ def build_judgment_context(
     return "; ".join(parts) if parts else ""
 
 
+def context_hash(context: str) -> str:
+    """
+    Fingerprint a judgment context for the embedding it would produce.
+
+    The model and dimensions are part of the hash so switching either
+    invalidates stored embeddings just like a context template change.
+
+    Args:
+        context: Output of build_judgment_context
+
+    Returns:
+        Hex sha256 digest
+    """
+    payload = f"{EMBED_MODEL}:{EMBED_DIMENSIONS}:{context}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 async def generate_judgment_embedding(
     plaintiff_name: Optional[str] = None,
     defendant_name: Optional[str] = None,
@@ -9,13 +9,18 @@ Pool allocation rules:
 - Score 50-79: Standard 2025-A (moderate collectability)
 - Score < 50:  Distressed Inventory (workout/recovery pool)
 
+Batches (e.g. re-tranching after a scoring run) should use
+auto_tranche_many(), which allocates any number of judgments with a
+handful of statements.
+
 Depends on:
 - enforcement.v_score_card view
 - finance_service for pool management
 """
 
+import json
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
 
 from backend.core.logging import get_logger
 from backend.db import get_pool
@@ -56,6 +61,40 @@ POOL_CONFIGS = {
 }
 
 
+# Pool name -> id, cached for the process lifetime (pools are never renamed)
+_pool_id_cache: dict[str, str] = {}
+
+# Scores and current pools in one pass (reads judgments directly rather than
+# the ordered enforcement.v_score_card view; total_score = collectability_score)
+_SCORES_AND_POOLS_SQL = """
+    SELECT j.id, j.collectability_score, j.pool_id::text, p.name
+    FROM public.judgments j
+    LEFT JOIN finance.pools p ON p.id = j.pool_id
+    WHERE j.id = ANY(%s)
+"""
+
+_POOL_IDS_BY_NAME_SQL = """
+    SELECT name, id::text
+    FROM finance.pools
+    WHERE name = ANY(%s)
+"""
+
+_BULK_ASSIGN_SQL = """
+    UPDATE public.judgments j
+    SET pool_id = u.pool_id, updated_at = NOW()
+    FROM unnest(%s::bigint[], %s::uuid[]) AS u(id, pool_id)
+    WHERE j.id = u.id
+      AND j.pool_id IS DISTINCT FROM u.pool_id
+"""
+
+_BULK_TRANCHED_EVENTS_SQL = """
+    INSERT INTO public.events (judgment_id, event_type, payload)
+    SELECT u.judgment_id, 'judgment_tranched', u.payload
+    FROM unnest(%s::bigint[], %s::jsonb[]) AS u(judgment_id, payload)
+    ON CONFLICT DO NOTHING
+"""
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -173,6 +212,50 @@ async def ensure_pool_exists(pool_name: str) -> str:
     return new_pool.id
 
 
+async def resolve_pool_ids(pool_names: Iterable[str]) -> dict[str, str]:
+    """
+    Map pool names to ids, creating missing pools.
+
+    Ids are cached for the process lifetime; uncached names are looked up in
+    one query and only pools that still don't exist go through
+    ensure_pool_exists().
+
+    Args:
+        pool_names: Pool names to resolve
+
+    Returns:
+        Dict of pool name -> pool ID (UUID string)
+    """
+    names = set(pool_names)
+    missing = [name for name in names if name not in _pool_id_cache]
+
+    if missing:
+        conn = await get_pool()
+        if conn is None:
+            raise AllocationError("Database connection not available")
+
+        try:
+            async with conn.connection() as db:
+                async with db.cursor() as cur:
+                    await cur.execute(_POOL_IDS_BY_NAME_SQL, (missing,))
+                    rows = await cur.fetchall()
+        except Exception as e:
+            logger.error(f"Failed to look up pools {missing}: {e}")
+            raise AllocationError(f"Failed to look up pools: {e}") from e
+
+        _pool_id_cache.update({name: pool_id for name, pool_id in rows})
+        for name in missing:
+            if name not in _pool_id_cache:
+                _pool_id_cache[name] = await ensure_pool_exists(name)
+
+    return {name: _pool_id_cache[name] for name in names}
+
+
+def clear_pool_id_cache() -> None:
+    """Forget cached pool ids (e.g. after pools are deleted or recreated)."""
+    _pool_id_cache.clear()
+
+
 async def get_current_pool_for_judgment(judgment_id: int) -> Optional[str]:
     """
     Get the current pool assignment for a judgment.
@@ -241,7 +324,7 @@ async def auto_tranche_judgment(judgment_id: int) -> Optional[AllocationResult]:
     was_reassigned = current_pool_name is not None and current_pool_name != target_pool_name
 
     # Step 4: Ensure pool exists
-    pool_id = await ensure_pool_exists(target_pool_name)
+    pool_id = (await resolve_pool_ids([target_pool_name]))[target_pool_name]
 
     # Step 5: Assign judgment to pool
     conn = await get_pool()
@@ -354,3 +437,148 @@ async def auto_tranche_and_emit(judgment_id: int) -> Optional[AllocationResult]:
         )
 
     return result
+
+
+async def auto_tranche_many(
+    judgment_ids: Iterable[int],
+    *,
+    emit_events: bool = True,
+) -> list[AllocationResult]:
+    """
+    Auto-tranche many judgments with a handful of statements.
+
+    Batch counterpart of auto_tranche_and_emit():
+    1. Scores and current pools for all judgments in one query
+    2. Pool ids from the process-lifetime cache (one lookup for misses)
+    3. All reassignments in one UPDATE ... FROM unnest (rows already in
+       their target pool are not rewritten)
+    4. judgment_tranched events in one INSERT (best-effort)
+
+    Args:
+        judgment_ids: Judgment IDs to allocate
+        emit_events: Insert judgment_tranched events for allocated judgments
+
+    Returns:
+        AllocationResult for each scored judgment, in input order.
+        Unscored or unknown judgments are skipped.
+
+    Raises:
+        AllocationError: If allocation fails due to database error
+    """
+    ids = list(dict.fromkeys(int(jid) for jid in judgment_ids))
+    if not ids:
+        return []
+
+    conn = await get_pool()
+    if conn is None:
+        raise AllocationError("Database connection not available")
+
+    # Step 1: Scores and current pools
+    try:
+        async with conn.connection() as db:
+            async with db.cursor() as cur:
+                await cur.execute(_SCORES_AND_POOLS_SQL, (ids,))
+                rows = await cur.fetchall()
+    except Exception as e:
+        logger.error(f"Failed to fetch scores for {len(ids)} judgments: {e}")
+        raise AllocationError(f"Failed to fetch scores: {e}") from e
+
+    current = {int(row[0]): row for row in rows}
+    scored = [jid for jid in ids if jid in current and current[jid][1] is not None]
+    skipped = len(ids) - len(scored)
+    if skipped:
+        logger.info(f"{skipped} judgments have no collectability score - skipping allocation")
+    if not scored:
+        return []
+
+    # Step 2: Target pools
+    targets = {jid: determine_pool_for_score(int(current[jid][1])) for jid in scored}
+    pool_ids = await resolve_pool_ids(targets.values())
+
+    results = []
+    for jid in scored:
+        _, score, _, current_pool_name = current[jid]
+        target_pool_name = targets[jid]
+        results.append(
+            AllocationResult(
+                judgment_id=jid,
+                pool_name=target_pool_name,
+                pool_id=pool_ids[target_pool_name],
+                score=int(score),
+                previous_pool=current_pool_name,
+                was_reassigned=(
+                    current_pool_name is not None and current_pool_name != target_pool_name
+                ),
+            )
+        )
+
+    # Step 3: Assign all judgments in one statement
+    changed = [r for r in results if current[r.judgment_id][2] != r.pool_id]
+    if changed:
+        try:
+            async with conn.connection() as db:
+                async with db.cursor() as cur:
+                    await cur.execute(
+                        _BULK_ASSIGN_SQL,
+                        ([r.judgment_id for r in changed], [r.pool_id for r in changed]),
+                    )
+        except Exception as e:
+            logger.error(f"Failed to assign {len(changed)} judgments to pools: {e}")
+            # A cached pool id may be stale if pools were recreated
+            clear_pool_id_cache()
+            raise AllocationError(f"Failed to assign judgments to pools: {e}") from e
+
+    logger.info(
+        f"Allocated {len(results)} judgments ({len(changed)} moved, "
+        f"{sum(r.was_reassigned for r in results)} reassigned)"
+    )
+
+    # Step 4: Events (best-effort)
+    if emit_events:
+        await emit_tranched_events(results)
+
+    return results
+
+
+async def emit_tranched_events(results: list[AllocationResult]) -> None:
+    """
+    Bulk-insert judgment_tranched events (best-effort).
+
+    Failures are logged but don't raise.
+
+    Args:
+        results: Allocation results to emit events for
+    """
+    if not results:
+        return
+
+    try:
+        conn = await get_pool()
+        if conn is None:
+            logger.warning(
+                f"Database unavailable - skipping {len(results)} judgment_tranched events"
+            )
+            return
+
+        payloads = [
+            json.dumps(
+                {
+                    "pool_name": r.pool_name,
+                    "score": r.score,
+                    "was_reassigned": r.was_reassigned,
+                }
+            )
+            for r in results
+        ]
+        async with conn.connection() as db:
+            async with db.cursor() as cur:
+                await cur.execute(
+                    _BULK_TRANCHED_EVENTS_SQL,
+                    ([r.judgment_id for r in results], payloads),
+                )
+
+        logger.debug(f"Emitted {len(results)} judgment_tranched events")
+
+    except Exception as e:
+        # Best-effort: log and continue
+        logger.warning(f"Failed to emit {len(results)} judgment_tranched events: {e}")
@@ -0,0 +1,392 @@
+"""
+Dragonfly Engine - Embedding Pipeline
+
+Batched backfill and incremental refresh of judgment description
+embeddings.
+
+Each judgment's context string (see ai_service.build_judgment_context) is
+fingerprinted with context_hash(). Rows whose stored hash already matches
+are skipped, so a nightly incremental run only embeds new or edited
+judgments, while a context template change re-embeds the whole portfolio
+in large batched requests instead of one HTTP call per row.
+
+Usage:
+    from backend.services.embedding_pipeline import (
+        OpenAIEmbedder,
+        run_embedding_backfill,
+    )
+
+    async with OpenAIEmbedder() as embedder:
+        result = await run_embedding_backfill(embedder)
+        print(result.to_dict())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import struct
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, Protocol, Sequence
+
+import httpx
+
+from .ai_service import (
+    EMBED_DIMENSIONS,
+    EMBED_MODEL,
+    EMBED_TIMEOUT,
+    OPENAI_API_URL,
+    _get_openai_api_key,
+    build_judgment_context,
+    context_hash,
+)
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Inputs per embeddings request (OpenAI accepts up to 2048)
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "128"))
+
+# Embeddings requests in flight at once
+EMBED_MAX_CONCURRENCY = int(os.getenv("EMBED_MAX_CONCURRENCY", "4"))
+
+# Embeddings requests started per minute (0 disables the limiter)
+EMBED_REQUESTS_PER_MINUTE = int(os.getenv("EMBED_REQUESTS_PER_MINUTE", "300"))
+
+# Judgments read per keyset page
+EMBED_PAGE_SIZE = int(os.getenv("EMBED_PAGE_SIZE", "1000"))
+
+# Retries for 429 / 5xx responses
+EMBED_MAX_RETRIES = 4
+
+
+class EmbeddingError(Exception):
+    """An embeddings batch could not be generated."""
+
+
+# ---------------------------------------------------------------------------
+# Embedders
+# ---------------------------------------------------------------------------
+
+
+class Embedder(Protocol):
+    """Anything that turns a batch of texts into vectors, in order."""
+
+    batch_size: int
+    model: str
+
+    async def embed_batch(self, texts: Sequence[str]) -> list[list[float]]: ...
+
+
+class OpenAIEmbedder:
+    """
+    OpenAI embeddings over one pooled HTTP client.
+
+    Concurrency is capped by a semaphore and request starts are spaced to
+    stay under `requests_per_minute`. Rate-limit and server errors are
+    retried with exponential backoff, honouring Retry-After when present.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        batch_size: int = EMBED_BATCH_SIZE,
+        max_concurrency: int = EMBED_MAX_CONCURRENCY,
+        requests_per_minute: int = EMBED_REQUESTS_PER_MINUTE,
+        max_retries: int = EMBED_MAX_RETRIES,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.model = EMBED_MODEL
+        self.batch_size = max(1, min(batch_size, 2048))
+        self.max_retries = max_retries
+        self._api_key = api_key or _get_openai_api_key()
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._min_interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_start = 0.0
+        self._rate_lock = asyncio.Lock()
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=EMBED_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=max(1, max_concurrency),
+                max_keepalive_connections=max(1, max_concurrency),
+            ),
+        )
+
+    async def __aenter__(self) -> "OpenAIEmbedder":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled client if this embedder created it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _wait_for_rate_limit(self) -> None:
+        if not self._min_interval:
+            return
+        async with self._rate_lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def embed_batch(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed up to `batch_size` texts in a single request."""
+        if not self._api_key:
+            raise EmbeddingError("OPENAI_API_KEY not configured")
+        if len(texts) > self.batch_size:
+            raise ValueError(f"Batch of {len(texts)} exceeds batch_size {self.batch_size}")
+
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self._wait_for_rate_limit()
+                try:
+                    response = await self._client.post(
+                        OPENAI_API_URL,
+                        headers={
+                            "Authorization": f"Bearer {self._api_key}",
+                            "Content-Type": "application/json",
+                        },
+                        json={
+                            "model": self.model,
+                            "input": list(texts),
+                            "dimensions": EMBED_DIMENSIONS,
+                        },
+                    )
+                except httpx.RequestError as e:
+                    if attempt == self.max_retries:
+                        raise EmbeddingError(f"Embeddings request failed: {e}") from e
+                    await asyncio.sleep(2**attempt)
+                    continue
+
+                if response.status_code == 200:
+                    data = sorted(response.json().get("data", []), key=lambda d: d["index"])
+                    if len(data) != len(texts):
+                        raise EmbeddingError(f"Expected {len(texts)} embeddings, got {len(data)}")
+                    return [d["embedding"] for d in data]
+
+                retryable = response.status_code == 429 or response.status_code >= 500
+                if not retryable or attempt == self.max_retries:
+                    raise EmbeddingError(
+                        f"OpenAI embedding API error: {response.status_code} - {response.text}"
+                    )
+
+                retry_after = response.headers.get("retry-after")
+                try:
+                    backoff = float(retry_after) if retry_after else 2**attempt
+                except ValueError:
+                    backoff = 2**attempt
+                logger.warning(
+                    f"Embeddings request throttled ({response.status_code}), "
+                    f"retrying in {backoff:.1f}s"
+                )
+                await asyncio.sleep(backoff)
+
+        raise EmbeddingError("Embeddings request retries exhausted")
+
+
+class DeterministicEmbedder:
+    """
+    Local stand-in embedder for tests and dry runs.
+
+    Produces a unit vector seeded from the sha256 of each text, so equal
+    texts always embed identically and no network is touched.
+    """
+
+    def __init__(self, dimensions: int = EMBED_DIMENSIONS, batch_size: int = EMBED_BATCH_SIZE):
+        self.model = "deterministic"
+        self.dimensions = dimensions
+        self.batch_size = max(1, batch_size)
+        self.calls = 0
+
+    async def embed_batch(self, texts: Sequence[str]) -> list[list[float]]:
+        self.calls += 1
+        return [self._embed(text) for text in texts]
+
+    def _embed(self, text: str) -> list[float]:
+        values: list[float] = []
+        counter = 0
+        while len(values) < self.dimensions:
+            digest = hashlib.sha256(f"{counter}:{text}".encode("utf-8")).digest()
+            values.extend(v / 2**31 for v in struct.unpack(">8i", digest))
+            counter += 1
+        values = values[: self.dimensions]
+        norm = math.sqrt(sum(v * v for v in values)) or 1.0
+        return [v / norm for v in values]
+
+
+# ---------------------------------------------------------------------------
+# Backfill
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of an embedding backfill run."""
+
+    scanned: int = 0
+    embedded: int = 0
+    skipped_unchanged: int = 0
+    skipped_empty: int = 0
+    failed: int = 0
+    requests: int = 0
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+_SELECT_PAGE_SQL = """
+    SELECT id, case_number, plaintiff_name, defendant_name,
+           judgment_amount, entry_date, source_file, embedding_context_hash
+    FROM public.judgments
+    WHERE id > %s
+    ORDER BY id
+    LIMIT %s
+"""
+
+_BULK_UPDATE_SQL = """
+    UPDATE public.judgments AS j
+    SET description_embedding = v.embedding::vector,
+        embedding_context_hash = v.context_hash,
+        embedded_at = now()
+    FROM unnest(%s::bigint[], %s::text[], %s::text[]) AS v(id, embedding, context_hash)
+    WHERE j.id = v.id
+"""
+
+
+def judgment_context(row: dict[str, Any]) -> str:
+    """
+    Build the embedding context for a stored judgment row.
+
+    Mirrors ingest_service: the court is the first segment of a
+    pipe-delimited source_file.
+    """
+    source_parts = str(row.get("source_file") or "").split("|")
+    court_name = source_parts[0] if len(source_parts) > 1 else None
+    amount = row.get("judgment_amount")
+    entry_date = row.get("entry_date")
+
+    return build_judgment_context(
+        plaintiff_name=row.get("plaintiff_name"),
+        defendant_name=row.get("defendant_name"),
+        court_name=court_name,
+        judgment_amount=float(amount) if amount is not None else None,
+        case_number=row.get("case_number"),
+        judgment_date=str(entry_date) if entry_date else None,
+    )
+
+
+def _vector_literal(embedding: Sequence[float]) -> str:
+    return "[" + ",".join(repr(float(v)) for v in embedding) + "]"
+
+
+async def _embed_chunk(
+    embedder: Embedder,
+    items: list[tuple[int, str, str]],
+) -> Optional[list[tuple[int, str, str]]]:
+    """Embed one batch; returns (id, vector literal, hash) or None on failure."""
+    try:
+        vectors = await embedder.embed_batch([context for _, context, _ in items])
+    except Exception as e:
+        logger.error(f"Embedding batch of {len(items)} failed: {e}")
+        return None
+    return [
+        (judgment_id, _vector_literal(vector), digest)
+        for (judgment_id, _, digest), vector in zip(items, vectors)
+    ]
+
+
+async def run_embedding_backfill(
+    embedder: Embedder,
+    page_size: int = EMBED_PAGE_SIZE,
+    force: bool = False,
+    max_rows: Optional[int] = None,
+) -> BackfillResult:
+    """
+    Embed every judgment whose context hash differs from the stored one.
+
+    Judgments are read in keyset pages by id. Within a page, stale rows are
+    split into `embedder.batch_size` requests that run concurrently (the
+    embedder enforces its own concurrency and rate limits), then written
+    back in one unnest() UPDATE per page.
+
+    Args:
+        embedder: OpenAIEmbedder in production, DeterministicEmbedder in tests
+        page_size: Judgments read per page
+        force: Re-embed even when the stored hash matches
+        max_rows: Stop after scanning this many judgments
+
+    Returns:
+        BackfillResult with counts for the run
+    """
+    from ..db import get_connection
+
+    result = BackfillResult()
+    started = time.monotonic()
+    last_id = 0
+
+    while max_rows is None or result.scanned < max_rows:
+        limit = page_size if max_rows is None else min(page_size, max_rows - result.scanned)
+
+        async with get_connection() as conn:
+            rows = await conn.fetch(_SELECT_PAGE_SQL, last_id, limit)
+        if not rows:
+            break
+
+        last_id = rows[-1]["id"]
+        result.scanned += len(rows)
+
+        pending: list[tuple[int, str, str]] = []
+        for row in rows:
+            context = judgment_context(row)
+            if not context:
+                result.skipped_empty += 1
+                continue
+            digest = context_hash(context)
+            if not force and row.get("embedding_context_hash") == digest:
+                result.skipped_unchanged += 1
+                continue
+            pending.append((row["id"], context, digest))
+
+        if pending:
+            size = embedder.batch_size
+            chunks = [pending[i : i + size] for i in range(0, len(pending), size)]
+            result.requests += len(chunks)
+            embedded = await asyncio.gather(*(_embed_chunk(embedder, c) for c in chunks))
+
+            updates: list[tuple[int, str, str]] = []
+            for chunk, chunk_result in zip(chunks, embedded):
+                if chunk_result is None:
+                    result.failed += len(chunk)
+                else:
+                    updates.extend(chunk_result)
+
+            if updates:
+                ids, vectors, hashes = (list(col) for col in zip(*updates))
+                async with get_connection() as conn:
+                    await conn.execute(_BULK_UPDATE_SQL, ids, vectors, hashes)
+                result.embedded += len(updates)
+
+        if len(rows) < limit:
+            break
+
+    result.duration_seconds = round(time.monotonic() - started, 3)
+    logger.info(
+        f"Embedding backfill ({embedder.model}): scanned={result.scanned} "
+        f"embedded={result.embedded} unchanged={result.skipped_unchanged} "
+        f"empty={result.skipped_empty} failed={result.failed} "
+        f"requests={result.requests} in {result.duration_seconds}s"
+    )
+    return result
@@ -9,11 +9,20 @@ All event emission is best-effort: if the DB call fails, we log and continue.
 Events should NEVER break the main enforcement workflow.
 """
 
+import asyncio
+import json
 import logging
-from datetime import datetime
+import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
 from typing import Any, Literal, Optional
 from uuid import UUID
 
+import psycopg
+from psycopg.types.json import Jsonb
 from pydantic import BaseModel, Field
 
 from ..db import get_pool
@@ -45,6 +54,34 @@ EventType = Literal[
     "packet_sent",
 ]
 
+# NOTIFY channel emit_event() signals on; the payload only identifies the
+# event (NOTIFY payloads are capped at 8000 bytes), listeners re-read rows
+EVENTS_CHANNEL = "intelligence_events"
+
+# Judgment -> defendant entity lookups kept in memory (LRU)
+ENTITY_CACHE_SIZE = int(os.getenv("EVENT_ENTITY_CACHE_SIZE", "10000"))
+
+# Timeline position: (created_at, id) of an event, newest-first ordering
+TimelineKey = tuple[datetime, str]
+
+# Position before any event, for streams that start from the beginning
+TIMELINE_START: TimelineKey = (
+    datetime(1970, 1, 1, tzinfo=timezone.utc),
+    "00000000-0000-0000-0000-000000000000",
+)
+
+# Live streams: idle heartbeat, polling interval without LISTEN, and how
+# long to wait before retrying a failed LISTEN connection
+EVENT_STREAM_HEARTBEAT_SECONDS = float(os.getenv("EVENT_STREAM_HEARTBEAT_SECONDS", "15"))
+EVENT_STREAM_POLL_SECONDS = float(os.getenv("EVENT_STREAM_POLL_SECONDS", "5"))
+EVENT_LISTEN_RETRY_SECONDS = 60.0
+EVENT_STREAM_BATCH_SIZE = 100
+
+# created_at is the inserting transaction's start time, so an event can
+# commit after events stamped later than it. Streams re-read this far behind
+# their cursor and skip event ids they have already sent.
+EVENT_STREAM_LOOKBACK_SECONDS = float(os.getenv("EVENT_STREAM_LOOKBACK_SECONDS", "30"))
+
 
 # =============================================================================
 # DTOs
@@ -113,14 +150,29 @@ async def emit_event(
             )
             return
 
-        async with conn.cursor() as cur:
-            await cur.execute(
-                """
-                INSERT INTO intelligence.events (entity_id, event_type, payload)
-                VALUES (%s::uuid, %s::intelligence.event_type, %s::jsonb)
-                """,
-                (entity_id_str, event_type, payload),
-            )
+        # Insert and notify in one statement; the NOTIFY is delivered on commit
+        async with conn.connection() as db:
+            async with db.cursor() as cur:
+                await cur.execute(
+                    """
+                    WITH inserted AS (
+                        INSERT INTO intelligence.events (entity_id, event_type, payload)
+                        VALUES (%s::uuid, %s::intelligence.event_type, %s::jsonb)
+                        RETURNING id, entity_id, event_type, created_at
+                    )
+                    SELECT pg_notify(
+                        %s,
+                        json_build_object(
+                            'id', id,
+                            'entity_id', entity_id,
+                            'event_type', event_type,
+                            'created_at', created_at
+                        )::text
+                    )
+                    FROM inserted
+                    """,
+                    (entity_id_str, event_type, Jsonb(payload), EVENTS_CHANNEL),
+                )
 
         logger.debug(
             "Emitted event: type=%s, entity_id=%s, payload_keys=%s",
@@ -142,43 +194,66 @@ async def emit_event(
 async def get_timeline_for_entity(
     entity_id: UUID | str,
     limit: int = 100,
+    *,
+    before: Optional[TimelineKey] = None,
+    after: Optional[TimelineKey] = None,
 ) -> list[EventDTO]:
     """
-    Get the event timeline for an entity.
+    Get a page of the event timeline for an entity.
 
-    Returns events ordered by created_at ascending (oldest first),
-    which is natural for timeline display.
+    Returns events newest first. Without a position this is the most recent
+    ``limit`` events; ``before`` pages back to older events and ``after``
+    returns the events that arrived since (the ``limit`` closest to it).
+    Both seek on idx_events_entity_timeline instead of scanning from the
+    oldest event.
 
     Args:
         entity_id: UUID of the entity to get timeline for
         limit: Maximum number of events to return (default 100)
+        before: (created_at, id) of an event; return events older than it
+        after: (created_at, id) of an event; return events newer than it
 
     Returns:
-        List of EventDTO objects, ordered by created_at ascending
+        List of EventDTO objects, ordered by (created_at, id) descending
 
     Raises:
         Nothing - returns empty list on error
     """
     entity_id_str = str(entity_id)
 
+    if after is not None:
+        position, key = "AND (created_at, id) > (%s, %s::uuid)", [*after]
+        order = "created_at ASC, id ASC"
+    elif before is not None:
+        position, key = "AND (created_at, id) < (%s, %s::uuid)", [*before]
+        order = "created_at DESC, id DESC"
+    else:
+        position, key = "", []
+        order = "created_at DESC, id DESC"
+
     try:
         conn = await get_pool()
         if conn is None:
             logger.warning("Database connection not available - returning empty timeline")
             return []
 
-        async with conn.cursor() as cur:
-            await cur.execute(
-                """
-                SELECT id, event_type, created_at, payload
-                FROM intelligence.events
-                WHERE entity_id = %s::uuid
-                ORDER BY created_at ASC
-                LIMIT %s
-                """,
-                (entity_id_str, limit),
-            )
-            rows = await cur.fetchall()
+        async with conn.connection() as db:
+            async with db.cursor() as cur:
+                await cur.execute(
+                    f"""
+                    SELECT id, event_type, created_at, payload
+                    FROM intelligence.events
+                    WHERE entity_id = %s::uuid
+                    {position}
+                    ORDER BY {order}
+                    LIMIT %s
+                    """,
+                    (entity_id_str, *key, limit),
+                )
+                rows = await cur.fetchall()
+
+        if after is not None:
+            rows = list(reversed(rows))
 
         events = []
         for row in rows:
@@ -203,11 +278,22 @@ async def get_timeline_for_entity(
         return []
 
 
+def timeline_key(event: EventDTO) -> TimelineKey:
+    """Timeline position of an event, for ``before``/``after``."""
+    return event.created_at, event.id
+
+
+# Judgment -> defendant entity (hits only: a judgment whose graph has not
+# been built yet is looked up again next time)
+_entity_id_cache: OrderedDict[int, UUID] = OrderedDict()
+
+
 async def get_entity_id_for_judgment(judgment_id: int) -> Optional[UUID]:
     """
     Get the defendant entity ID for a judgment.
 
     Looks up the defendant entity via the intelligence graph relationships.
+    Found mappings are cached (LRU of ENTITY_CACHE_SIZE judgments).
 
     Args:
         judgment_id: The judgment ID to look up
@@ -215,25 +301,35 @@ async def get_entity_id_for_judgment(judgment_id: int) -> Optional[UUID]:
     Returns:
         UUID of the defendant entity, or None if not found
     """
+    cached = _entity_id_cache.get(judgment_id)
+    if cached is not None:
+        _entity_id_cache.move_to_end(judgment_id)
+        return cached
+
     try:
         conn = await get_pool()
         if conn is None:
             return None
 
-        async with conn.cursor() as cur:
-            # Use the helper function we created in the migration
-            await cur.execute(
-                """
-                SELECT intelligence.get_defendant_entity_for_judgment(%s)
-                """,
-                (judgment_id,),
-            )
-            row = await cur.fetchone()
+        async with conn.connection() as db:
+            async with db.cursor() as cur:
+                # Use the helper function we created in the migration
+                await cur.execute(
+                    """
+                    SELECT intelligence.get_defendant_entity_for_judgment(%s)
+                    """,
+                    (judgment_id,),
+                )
+                row = await cur.fetchone()
 
-            if row and row[0]:
-                return UUID(str(row[0]))
+        if row and row[0]:
+            entity_id = UUID(str(row[0]))
+            _entity_id_cache[judgment_id] = entity_id
+            if len(_entity_id_cache) > ENTITY_CACHE_SIZE:
+                _entity_id_cache.popitem(last=False)
+            return entity_id
 
-            return None
+        return None
 
     except Exception as e:
         logger.warning(
@@ -244,9 +340,17 @@ async def get_entity_id_for_judgment(judgment_id: int) -> Optional[UUID]:
         return None
 
 
+def clear_entity_id_cache() -> None:
+    """Forget cached judgment -> entity mappings (e.g. after a graph rebuild)."""
+    _entity_id_cache.clear()
+
+
 async def get_timeline_for_judgment(
     judgment_id: int,
     limit: int = 100,
+    *,
+    before: Optional[TimelineKey] = None,
+    after: Optional[TimelineKey] = None,
 ) -> list[EventDTO]:
     """
     Get the event timeline for a judgment.
@@ -257,9 +361,11 @@ async def get_timeline_for_judgment(
     Args:
         judgment_id: The judgment ID to get timeline for
         limit: Maximum number of events to return (default 100)
+        before: Return events older than this position
+        after: Return events newer than this position
 
     Returns:
-        List of EventDTO objects, or empty list if no entity found
+        List of EventDTO objects (newest first), or empty list if no entity found
     """
     entity_id = await get_entity_id_for_judgment(judgment_id)
 
@@ -270,7 +376,7 @@ async def get_timeline_for_judgment(
         )
         return []
 
-    return await get_timeline_for_entity(entity_id, limit=limit)
+    return await get_timeline_for_entity(entity_id, limit=limit, before=before, after=after)
 
 
 # =============================================================================
@@ -315,3 +421,191 @@ async def emit_event_for_judgment(
             judgment_id,
             str(e),
         )
+
+
+# =============================================================================
+# Live Timeline (LISTEN/NOTIFY)
+# =============================================================================
+
+
+class EventListener:
+    """
+    Fans EVENTS_CHANNEL notifications out to in-process subscribers.
+
+    One dedicated autocommit connection LISTENs while anyone is subscribed.
+    A notification only wakes the subscribers for its entity: they re-read
+    the timeline after their last seen event, so a coalesced or dropped
+    notification costs latency, never events. When LISTEN is unavailable
+    (e.g. a transaction-mode pooler) ``listening`` stays False and streams
+    poll instead.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[str, set[asyncio.Event]] = {}
+        self._conn: Optional[psycopg.AsyncConnection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._retry_at = 0.0
+
+    @property
+    def listening(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def subscribe(self, entity_id: UUID | str) -> asyncio.Event:
+        """Register interest in an entity; the returned event is set on news."""
+        wake = asyncio.Event()
+        self._subscribers.setdefault(str(entity_id), set()).add(wake)
+        await self.start()
+        return wake
+
+    async def unsubscribe(self, entity_id: UUID | str, wake: asyncio.Event) -> None:
+        """Drop a subscription; the connection closes with the last one."""
+        waiters = self._subscribers.get(str(entity_id))
+        if waiters is not None:
+            waiters.discard(wake)
+            if not waiters:
+                del self._subscribers[str(entity_id)]
+        if not self._subscribers:
+            await self.close()
+
+    def dispatch(self, payload: str) -> None:
+        """Wake the subscribers of the entity named in a notification payload."""
+        try:
+            entity_id = str(json.loads(payload)["entity_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.debug("Ignoring malformed %s payload: %r", EVENTS_CHANNEL, payload)
+            return
+        for wake in self._subscribers.get(entity_id, ()):
+            wake.set()
+
+    async def start(self) -> None:
+        """Open the LISTEN connection if it is not open (rate-limited retries)."""
+        async with self._lock:
+            if self.listening or time.monotonic() < self._retry_at:
+                return
+            pool = await get_pool()
+            if pool is None:
+                return
+            try:
+                conn = await psycopg.AsyncConnection.connect(pool.conninfo, autocommit=True)
+                await conn.execute(f"LISTEN {EVENTS_CHANNEL}")
+            except psycopg.Error as e:
+                self._retry_at = time.monotonic() + EVENT_LISTEN_RETRY_SECONDS
+                logger.warning("LISTEN %s unavailable, timelines will poll: %s", EVENTS_CHANNEL, e)
+                return
+            self._conn = conn
+            self._task = asyncio.create_task(self._run(conn))
+
+    async def _run(self, conn: psycopg.AsyncConnection) -> None:
+        try:
+            async for notify in conn.notifies():
+                self.dispatch(notify.payload)
+        except psycopg.Error as e:
+            logger.warning("LISTEN %s connection lost: %s", EVENTS_CHANNEL, e)
+        finally:
+            # Wake everyone so streams notice and fall back to polling
+            for waiters in self._subscribers.values():
+                for wake in waiters:
+                    wake.set()
+
+    async def close(self) -> None:
+        """Stop listening and close the connection."""
+        async with self._lock:
+            task, self._task = self._task, None
+            conn, self._conn = self._conn, None
+            if task is not None:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+            if conn is not None:
+                with suppress(psycopg.Error):
+                    await conn.close()
+
+
+event_listener = EventListener()
+
+
+async def close_event_listener() -> None:
+    """Close the shared LISTEN connection (application shutdown)."""
+    await event_listener.close()
+
+
+async def _read_timeline_since(entity_id: UUID, since: TimelineKey) -> list[EventDTO]:
+    """Every event newer than ``since``, oldest first, in batched seeks."""
+    found: list[EventDTO] = []
+    while True:
+        events = await get_timeline_for_entity(
+            entity_id, limit=EVENT_STREAM_BATCH_SIZE, after=since
+        )
+        found.extend(reversed(events))
+        if len(events) < EVENT_STREAM_BATCH_SIZE:
+            return found
+        since = timeline_key(events[0])
+
+
+async def watch_timeline_for_judgment(
+    judgment_id: int,
+    after: Optional[TimelineKey] = None,
+) -> AsyncIterator[list[EventDTO]]:
+    """
+    Follow a judgment's timeline as events are emitted.
+
+    Yields each batch of new events oldest first, and an empty list when
+    idle (at most every EVENT_STREAM_HEARTBEAT_SECONDS) so callers can send
+    keepalives and notice disconnected clients. Without ``after`` the
+    stream starts from the current newest event.
+
+    Each poll re-reads EVENT_STREAM_LOOKBACK_SECONDS behind the newest
+    position seen and drops event ids already sent, so an event that
+    commits late (behind newer ones) is still delivered, after them.
+
+    Close the generator (``contextlib.aclosing``) to release its
+    subscription promptly.
+    """
+    entity_id: Optional[UUID] = None
+    wake: Optional[asyncio.Event] = None
+    lookback = timedelta(seconds=EVENT_STREAM_LOOKBACK_SECONDS)
+    # Ids sent (or already before ``after``) that the lookback can re-read
+    seen: dict[str, datetime] = {}
+
+    def window_start(cursor: TimelineKey) -> TimelineKey:
+        return cursor[0] - lookback, TIMELINE_START[1]
+
+    try:
+        while True:
+            if entity_id is None:
+                # The graph may not be built yet; keep looking until it is
+                entity_id = await get_entity_id_for_judgment(judgment_id)
+                if entity_id is not None:
+                    wake = await event_listener.subscribe(entity_id)
+                    if after is None:
+                        latest = await get_timeline_for_entity(entity_id, limit=1)
+                        after = timeline_key(latest[0]) if latest else TIMELINE_START
+                    for event in await _read_timeline_since(entity_id, window_start(after)):
+                        if timeline_key(event) <= after:
+                            seen[event.id] = event.created_at
+
+            new_events: list[EventDTO] = []
+            if entity_id is not None and after is not None:
+                if wake is not None:
+                    wake.clear()
+                for event in await _read_timeline_since(entity_id, window_start(after)):
+                    if event.id in seen:
+                        continue
+                    seen[event.id] = event.created_at
+                    new_events.append(event)
+                    after = max(after, timeline_key(event))
+                horizon = window_start(after)[0]
+                seen = {event_id: at for event_id, at in seen.items() if at >= horizon}
+            yield new_events
+
+            if wake is not None and not event_listener.listening:
+                await event_listener.start()
+            if wake is not None and event_listener.listening:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(wake.wait(), EVENT_STREAM_HEARTBEAT_SECONDS)
+            else:
+                await asyncio.sleep(EVENT_STREAM_POLL_SECONDS)
+    finally:
+        if entity_id is not None and wake is not None:
+            await event_listener.unsubscribe(entity_id, wake)
@@ -12,13 +12,15 @@ Depends on:
 - finance.pools table
 - finance.pool_transactions table
 - finance.v_pool_performance view
+- finance.pool_nav_history / finance.pool_nav_dirty (NAV snapshots)
 """
 
+import json
 import logging
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Sequence
 
 from backend.db import get_pool
 
@@ -89,6 +91,20 @@ class NAVResult:
     projected_future_value: Decimal
     total_expenses: Decimal
     as_of_date: date
+    judgment_count: int = 0
+    aum: Decimal = Decimal("0")
+    collected_ytd: Decimal = Decimal("0")
+
+
+@dataclass
+class NAVSnapshot:
+    """Point-in-time NAV from finance.pool_nav_history."""
+
+    pool_id: str
+    snapshot_date: date
+    nav: Decimal
+    aum: Decimal
+    collected_ytd: Decimal
 
 
 # =============================================================================
@@ -429,6 +445,202 @@ async def get_pool_performance() -> list[PoolPerformance]:
 # =============================================================================
 
 
+# Every pool's NAV inputs in one grouped pass over judgments and transactions.
+# %(pool_ids)s NULL means all pools.
+_NAV_ALL_SQL = """
+    WITH target AS (
+        SELECT id, name
+        FROM finance.pools
+        WHERE %(pool_ids)s::uuid[] IS NULL OR id = ANY(%(pool_ids)s::uuid[])
+    ),
+    judgment_totals AS (
+        SELECT
+            pool_id,
+            COUNT(*) AS judgment_count,
+            COALESCE(SUM(judgment_amount), 0) AS aum,
+            COALESCE(SUM(
+                CASE
+                    WHEN enforcement_stage = 'collecting' THEN judgment_amount * 0.5
+                    WHEN enforcement_stage = 'enforcement' THEN judgment_amount * 0.3
+                    WHEN enforcement_stage = 'discovery' THEN judgment_amount * 0.2
+                    ELSE judgment_amount * 0.15
+                END
+            ), 0) AS projected_value
+        FROM public.judgments
+        WHERE pool_id IN (SELECT id FROM target)
+          AND enforcement_stage != 'closed'
+        GROUP BY pool_id
+    ),
+    txn_totals AS (
+        SELECT
+            pool_id,
+            COALESCE(SUM(amount) FILTER (WHERE txn_type = 'collection'), 0) AS total_collected,
+            COALESCE(SUM(amount) FILTER (
+                WHERE txn_type = 'collection' AND txn_date >= date_trunc('year', CURRENT_DATE)
+            ), 0) AS collected_ytd,
+            COALESCE(SUM(amount) FILTER (WHERE txn_type = 'expense'), 0) AS total_expenses,
+            COALESCE(SUM(amount) FILTER (WHERE txn_type = 'management_fee'), 0) AS total_fees
+        FROM finance.pool_transactions
+        WHERE pool_id IN (SELECT id FROM target)
+        GROUP BY pool_id
+    )
+    SELECT
+        t.id,
+        t.name,
+        COALESCE(j.judgment_count, 0),
+        COALESCE(j.aum, 0),
+        COALESCE(j.projected_value, 0),
+        COALESCE(x.total_collected, 0),
+        COALESCE(x.collected_ytd, 0),
+        COALESCE(x.total_expenses, 0),
+        COALESCE(x.total_fees, 0)
+    FROM target t
+    LEFT JOIN judgment_totals j ON j.pool_id = t.id
+    LEFT JOIN txn_totals x ON x.pool_id = t.id
+    ORDER BY t.name
+"""
+
+# Pools changed since their last snapshot, plus pools never snapshotted.
+# With persist the DELETE claims the dirty rows inside the snapshot
+# transaction; a change committed after the claim re-marks its pool.
+_CHANGED_POOLS_SQL = """
+    WITH claimed AS ({claim})
+    SELECT pool_id FROM claimed
+    WHERE %(pool_ids)s::uuid[] IS NULL OR pool_id = ANY(%(pool_ids)s::uuid[])
+    UNION
+    SELECT p.id FROM finance.pools p
+    WHERE (%(pool_ids)s::uuid[] IS NULL OR p.id = ANY(%(pool_ids)s::uuid[]))
+      AND NOT EXISTS (SELECT 1 FROM finance.pool_nav_history h WHERE h.pool_id = p.id)
+"""
+_CLAIM_CHANGED_POOLS_SQL = _CHANGED_POOLS_SQL.format(
+    claim="""
+        DELETE FROM finance.pool_nav_dirty
+        WHERE %(pool_ids)s::uuid[] IS NULL OR pool_id = ANY(%(pool_ids)s::uuid[])
+        RETURNING pool_id
+    """
+)
+_PEEK_CHANGED_POOLS_SQL = _CHANGED_POOLS_SQL.format(
+    claim="SELECT pool_id FROM finance.pool_nav_dirty"
+)
+
+# One row per pool per day; re-running the same day replaces the point.
+_UPSERT_NAV_HISTORY_SQL = """
+    INSERT INTO finance.pool_nav_history
+        (pool_id, snapshot_date, nav, aum, collected_ytd, metadata)
+    SELECT *
+    FROM unnest(
+        %s::uuid[], %s::date[], %s::numeric[], %s::numeric[], %s::numeric[], %s::jsonb[]
+    )
+    ON CONFLICT (pool_id, snapshot_date) DO UPDATE
+    SET nav = EXCLUDED.nav,
+        aum = EXCLUDED.aum,
+        collected_ytd = EXCLUDED.collected_ytd,
+        metadata = EXCLUDED.metadata,
+        created_at = NOW()
+"""
+
+
+def _nav_from_row(row: Sequence, as_of: date) -> NAVResult:
+    """Build a NAVResult from a _NAV_ALL_SQL row. NAV = collected + projected - costs."""
+    (pool_id, pool_name, judgment_count, aum, projected, collected, ytd, expenses, fees) = row
+    total_expenses = expenses + fees
+    return NAVResult(
+        pool_id=str(pool_id),
+        pool_name=pool_name,
+        nav=collected + projected - total_expenses,
+        total_collected=collected,
+        projected_future_value=projected,
+        total_expenses=total_expenses,
+        as_of_date=as_of,
+        judgment_count=judgment_count,
+        aum=aum,
+        collected_ytd=ytd,
+    )
+
+
+def _snapshot_params(results: Sequence[NAVResult]) -> tuple[list, ...]:
+    """Column arrays for _UPSERT_NAV_HISTORY_SQL."""
+    return (
+        [r.pool_id for r in results],
+        [r.as_of_date for r in results],
+        [r.nav for r in results],
+        [r.aum for r in results],
+        [r.collected_ytd for r in results],
+        [
+            json.dumps(
+                {
+                    "total_collected": str(r.total_collected),
+                    "projected_future_value": str(r.projected_future_value),
+                    "total_expenses": str(r.total_expenses),
+                    "judgment_count": r.judgment_count,
+                }
+            )
+            for r in results
+        ],
+    )
+
+
+async def calculate_nav_all(
+    pool_ids: Optional[Sequence[str]] = None,
+    *,
+    changed_only: bool = False,
+    persist: bool = False,
+) -> list[NAVResult]:
+    """
+    Calculate NAV for many pools in one grouped pass.
+
+    Uses the same valuation as calculate_nav(); judgments and transactions are
+    each scanned once for the whole pool set instead of once per pool.
+
+    Args:
+        pool_ids: Restrict to these pools (default: all pools)
+        changed_only: Only pools whose judgments or transactions changed since
+            their last snapshot (or that were never snapshotted)
+        persist: Upsert today's point into finance.pool_nav_history
+
+    Returns:
+        NAVResult per computed pool, ordered by pool name
+
+    Raises:
+        FinanceServiceError: If calculation fails
+    """
+    pool = await get_pool()
+    if pool is None:
+        raise FinanceServiceError("Database connection not available")
+
+    as_of = date.today()
+    try:
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                async with conn.cursor() as cur:
+                    ids = list(pool_ids) if pool_ids is not None else None
+                    if changed_only or persist:
+                        # A persisted snapshot covers the claimed changes either way
+                        claim = _CLAIM_CHANGED_POOLS_SQL if persist else _PEEK_CHANGED_POOLS_SQL
+                        await cur.execute(claim, {"pool_ids": ids})
+                        changed = sorted(str(r[0]) for r in await cur.fetchall())
+                        if changed_only:
+                            if not changed:
+                                return []
+                            ids = changed
+
+                    await cur.execute(_NAV_ALL_SQL, {"pool_ids": ids})
+                    results = [_nav_from_row(r, as_of) for r in await cur.fetchall()]
+
+                    if persist and results:
+                        await cur.execute(_UPSERT_NAV_HISTORY_SQL, _snapshot_params(results))
+    except Exception as e:
+        logger.error(f"Failed to calculate NAV for pools: {e}")
+        raise FinanceServiceError(f"Failed to calculate NAV: {e}") from e
+
+    logger.info(
+        f"Calculated NAV for {len(results)} pools"
+        + (" (changed only)" if changed_only else "")
+        + (", snapshot saved" if persist else "")
+    )
+    return results
+
+
 async def calculate_nav(pool_id: str) -> NAVResult:
     """
     Calculate Net Asset Value for a pool.
@@ -450,81 +662,57 @@ async def calculate_nav(pool_id: str) -> NAVResult:
     Raises:
         FinanceServiceError: If calculation fails
     """
-    conn = await get_pool()
-    if conn is None:
-        raise FinanceServiceError("Database connection not available")
+    results = await calculate_nav_all([pool_id])
+    if not results:
+        raise FinanceServiceError(f"Pool {pool_id} not found")
 
-    # Get pool name
-    pool_query = "SELECT name FROM finance.pools WHERE id = %s::uuid"
+    result = results[0]
+    logger.info(f"Calculated NAV for {result.pool_name}: ${result.nav:,.2f}")
+    return result
 
-    # Get financials from transactions
-    txn_query = """
-        SELECT
-            COALESCE(SUM(CASE WHEN txn_type = 'collection' THEN amount ELSE 0 END), 0) AS total_collected,
-            COALESCE(SUM(CASE WHEN txn_type = 'expense' THEN amount ELSE 0 END), 0) AS total_expenses,
-            COALESCE(SUM(CASE WHEN txn_type = 'management_fee' THEN amount ELSE 0 END), 0) AS total_fees
-        FROM finance.pool_transactions
-        WHERE pool_id = %s::uuid
-    """
 
-    # Get projected value from judgments
-    projected_query = """
-        SELECT
-            COALESCE(SUM(
-                CASE
-                    WHEN enforcement_stage = 'collecting' THEN judgment_amount * 0.5
-                    WHEN enforcement_stage = 'enforcement' THEN judgment_amount * 0.3
-                    WHEN enforcement_stage = 'discovery' THEN judgment_amount * 0.2
-                    ELSE judgment_amount * 0.15
-                END
-            ), 0) AS projected_value
-        FROM public.judgments
-        WHERE pool_id = %s::uuid
-          AND enforcement_stage != 'closed'
+async def get_nav_history(pool_id: Optional[str] = None, days: int = 90) -> list[NAVSnapshot]:
     """
+    Get NAV snapshots for time-series charts.
 
-    try:
-        async with conn.cursor() as cur:
-            # Get pool name
-            await cur.execute(pool_query, (pool_id,))
-            pool_row = await cur.fetchone()
-            if pool_row is None:
-                raise FinanceServiceError(f"Pool {pool_id} not found")
-            pool_name = pool_row[0]
-
-            # Get financials
-            await cur.execute(txn_query, (pool_id,))
-            txn_row = await cur.fetchone()
-            total_collected = txn_row[0] if txn_row else Decimal("0")
-            total_expenses = (txn_row[1] if txn_row else Decimal("0")) + (
-                txn_row[2] if txn_row else Decimal("0")
-            )
-
-            # Get projected value
-            await cur.execute(projected_query, (pool_id,))
-            proj_row = await cur.fetchone()
-            projected_future_value = proj_row[0] if proj_row else Decimal("0")
-
-    except FinanceServiceError:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to calculate NAV for pool {pool_id}: {e}")
-        raise FinanceServiceError(f"Failed to calculate NAV: {e}") from e
+    Args:
+        pool_id: Restrict to one pool (default: all pools)
+        days: How far back to read
 
-    # NAV = collected + projected - expenses
-    nav = total_collected + projected_future_value - total_expenses
+    Returns:
+        NAVSnapshot list ordered by pool, then date
+    """
+    pool = await get_pool()
+    if pool is None:
+        raise FinanceServiceError("Database connection not available")
 
-    logger.info(f"Calculated NAV for {pool_name}: ${nav:,.2f}")
+    query = """
+        SELECT pool_id, snapshot_date, nav, aum, collected_ytd
+        FROM finance.pool_nav_history
+        WHERE (%(pool_id)s::uuid IS NULL OR pool_id = %(pool_id)s::uuid)
+          AND snapshot_date >= CURRENT_DATE - %(days)s::int
+        ORDER BY pool_id, snapshot_date
+    """
 
-    return NAVResult(
-        pool_id=pool_id,
-        pool_name=pool_name,
-        nav=nav,
-        total_collected=total_collected,
-        projected_future_value=projected_future_value,
-        total_expenses=total_expenses,
-        as_of_date=date.today(),
-    )
+    try:
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(query, {"pool_id": pool_id, "days": days})
+                rows = await cur.fetchall()
+    except Exception as e:
+        logger.error(f"Failed to get NAV history: {e}")
+        raise FinanceServiceError(f"Failed to get NAV history: {e}") from e
+
+    return [
+        NAVSnapshot(
+            pool_id=str(row[0]),
+            snapshot_date=row[1],
+            nav=row[2],
+            aum=row[3] or Decimal("0"),
+            collected_ytd=row[4] or Decimal("0"),
+        )
+        for row in rows
+    ]
 
 
 # =============================================================================
@@ -6,6 +6,7 @@ targeted subpoenas to registered agents for earnings garnishment.
 
 Workflow:
 1. detect_gig_activity() - Scans employer_name, enrichment data for keywords
+   (detect_gig_activity_many() for portfolio-wide sweeps)
 2. generate_gig_subpoena() - Creates subpoena document via packet_service
 3. dispatch_gig_subpoena() - Sends via physical_service (Proof.com)
 
@@ -16,15 +17,28 @@ Depends on:
 - physical_service for process server dispatch
 """
 
+import asyncio
 import logging
+import os
 import re
+import time
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 
 from backend.db import get_pool
 
 logger = logging.getLogger(__name__)
 
+# How often the cached matcher re-checks intelligence.gig_platforms_version
+GIG_PLATFORM_VERSION_CHECK_SECONDS = float(os.getenv("GIG_PLATFORM_VERSION_CHECK_SECONDS", "30"))
+
+# Judgments fetched per query page in detect_gig_activity_many()
+GIG_SWEEP_PAGE_SIZE = int(os.getenv("GIG_SWEEP_PAGE_SIZE", "5000"))
+
+# Judgment columns scanned for gig keywords, in detection-source order
+JUDGMENT_SCAN_FIELDS = ("employer_name", "employer_address", "notes", "bank_name")
+
 
 # =============================================================================
 # Data Classes
@@ -140,6 +154,161 @@ async def load_gig_platforms() -> list[GigPlatform]:
     return platforms
 
 
+# =============================================================================
+# Matcher Engine
+# =============================================================================
+
+
+@lru_cache(maxsize=1024)
+def _keyword_pattern(keyword: str) -> re.Pattern[str]:
+    """Case-insensitive word boundary pattern for one (lowercased) keyword."""
+    return re.compile(rf"\b{re.escape(keyword)}\b")
+
+
+class GigMatcher:
+    """
+    All active platform keywords compiled into one alternation.
+
+    A text is scanned once with the combined pattern. Only platforms whose
+    keywords (or keywords contained in them, which the alternation can
+    shadow) were found are then confirmed keyword by keyword, so results
+    are identical to checking every keyword of every platform in order.
+    """
+
+    def __init__(self, platforms: list[GigPlatform], version: Optional[int] = None) -> None:
+        self.platforms = platforms
+        self.version = version
+        self._by_name = {p.platform_name: p for p in platforms}
+
+        owners: dict[str, set[int]] = {}
+        for index, platform in enumerate(platforms):
+            for keyword in platform.detection_keywords:
+                if keyword and keyword.strip():
+                    owners.setdefault(keyword.lower(), set()).add(index)
+
+        # Longest first so the alternation prefers "uber eats" over "uber"
+        keywords = sorted(owners, key=len, reverse=True)
+        self._pattern: Optional[re.Pattern[str]] = (
+            re.compile(r"\b(?:" + "|".join(re.escape(k) for k in keywords) + r")\b")
+            if keywords
+            else None
+        )
+
+        # A hit on a keyword may hide keywords contained in it
+        self._candidates: dict[str, tuple[int, ...]] = {
+            keyword: tuple(
+                sorted(set().union(*(owners[other] for other in keywords if other in keyword)))
+            )
+            for keyword in keywords
+        }
+
+    def platform(self, platform_name: str) -> Optional[GigPlatform]:
+        """Look up a platform by name."""
+        return self._by_name.get(platform_name)
+
+    def match(self, text: Optional[str], source: str) -> list[GigDetection]:
+        """
+        Check text against all platform keywords.
+
+        Returns one detection per matching platform (first matching keyword
+        in the platform's list), in platform order.
+        """
+        if not text or self._pattern is None:
+            return []
+
+        text_lower = text.lower()
+        candidates: set[int] = set()
+        pos = 0
+        # Restart one character past each hit so overlapping keywords are seen
+        while (hit := self._pattern.search(text_lower, pos)) is not None:
+            candidates.update(self._candidates[hit.group(0)])
+            pos = hit.start() + 1
+
+        detections = []
+        for index in sorted(candidates):
+            platform = self.platforms[index]
+            for keyword in platform.detection_keywords:
+                if keyword and _keyword_pattern(keyword.lower()).search(text_lower):
+                    detections.append(
+                        GigDetection(
+                            platform=platform,
+                            matched_keyword=keyword,
+                            detection_source=source,
+                            confidence_score=1.0,
+                        )
+                    )
+                    break  # One match per platform is enough
+        return detections
+
+    def match_fields(self, fields: Iterable[tuple[str, Optional[str]]]) -> list[GigDetection]:
+        """Match several (source, text) fields, keeping the first detection per platform."""
+        seen_platforms: set[int] = set()
+        unique_detections: list[GigDetection] = []
+        for source, text in fields:
+            for detection in self.match(text, source):
+                if detection.platform.id not in seen_platforms:
+                    seen_platforms.add(detection.platform.id)
+                    unique_detections.append(detection)
+        return unique_detections
+
+
+_matcher: Optional[GigMatcher] = None
+_matcher_checked_at = 0.0
+_matcher_lock = asyncio.Lock()
+
+
+async def _load_platforms_version() -> Optional[int]:
+    """Current intelligence.gig_platforms_version, or None if unavailable."""
+    pool = await get_pool()
+    if pool is None:
+        raise GigServiceError("Database connection not available")
+
+    try:
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("SELECT version FROM intelligence.gig_platforms_version")
+                row = await cur.fetchone()
+    except Exception as e:
+        logger.warning(f"Gig platform version unavailable, reloading platforms: {e}")
+        return None
+    return int(row[0]) if row else None
+
+
+async def get_gig_matcher() -> GigMatcher:
+    """
+    Get the cached keyword matcher for active gig platforms.
+
+    The platforms version is checked at most every
+    GIG_PLATFORM_VERSION_CHECK_SECONDS; platforms are reloaded and the
+    matcher rebuilt only when it changed (or when the version is unknown).
+
+    Raises:
+        GigServiceError: If platforms cannot be loaded
+    """
+    global _matcher, _matcher_checked_at
+
+    async with _matcher_lock:
+        now = time.monotonic()
+        if _matcher is not None and now - _matcher_checked_at < GIG_PLATFORM_VERSION_CHECK_SECONDS:
+            return _matcher
+
+        version = await _load_platforms_version()
+        if _matcher is None or version is None or version != _matcher.version:
+            _matcher = GigMatcher(await load_gig_platforms(), version)
+            logger.info(
+                f"Built gig matcher for {len(_matcher.platforms)} platforms (version={version})"
+            )
+        _matcher_checked_at = now
+        return _matcher
+
+
+def clear_gig_matcher_cache() -> None:
+    """Drop the cached matcher; the next lookup reloads platforms."""
+    global _matcher, _matcher_checked_at
+    _matcher = None
+    _matcher_checked_at = 0.0
+
+
 # =============================================================================
 # Detection Logic
 # =============================================================================
@@ -168,8 +337,7 @@ def match_text_against_platforms(
     for platform in platforms:
         for keyword in platform.detection_keywords:
             # Case-insensitive word boundary match
-            pattern = rf"\b{re.escape(keyword.lower())}\b"
-            if re.search(pattern, text_lower):
+            if _keyword_pattern(keyword.lower()).search(text_lower):
                 detections.append(
                     GigDetection(
                         platform=platform,
@@ -206,9 +374,9 @@ async def detect_gig_activity(judgment_id: int) -> list[GigDetection]:
     if pool is None:
         raise GigServiceError("Database connection not available")
 
-    # Load platforms first
-    platforms = await load_gig_platforms()
-    if not platforms:
+    # Compiled matcher for active platforms (cached)
+    matcher = await get_gig_matcher()
+    if not matcher.platforms:
         logger.info("No active gig platforms configured")
         return []
 
@@ -234,28 +402,82 @@ async def detect_gig_activity(judgment_id: int) -> list[GigDetection]:
     if row is None:
         raise GigServiceError(f"Judgment {judgment_id} not found")
 
-    employer_name, employer_address, notes, bank_name = row
+    # Scan each field, deduplicated by platform
+    unique_detections = matcher.match_fields(zip(JUDGMENT_SCAN_FIELDS, row))
 
-    # Scan each field
-    all_detections: list[GigDetection] = []
+    logger.info(f"Judgment {judgment_id}: detected {len(unique_detections)} gig platforms")
+    return unique_detections
 
-    all_detections.extend(match_text_against_platforms(employer_name, platforms, "employer_name"))
-    all_detections.extend(
-        match_text_against_platforms(employer_address, platforms, "employer_address")
-    )
-    all_detections.extend(match_text_against_platforms(notes, platforms, "notes"))
-    all_detections.extend(match_text_against_platforms(bank_name, platforms, "bank_name"))
 
-    # Deduplicate by platform
-    seen_platforms: set[int] = set()
-    unique_detections: list[GigDetection] = []
-    for detection in all_detections:
-        if detection.platform.id not in seen_platforms:
-            seen_platforms.add(detection.platform.id)
-            unique_detections.append(detection)
+async def detect_gig_activity_many(
+    judgment_ids: Optional[list[int]] = None,
+    *,
+    page_size: int = GIG_SWEEP_PAGE_SIZE,
+) -> dict[int, list[GigDetection]]:
+    """
+    Scan many judgments (or the whole portfolio) for gig platform activity.
 
-    logger.info(f"Judgment {judgment_id}: detected {len(unique_detections)} gig platforms")
-    return unique_detections
+    Judgments are read in keyset-paginated pages of ``page_size`` rows
+    (employer, bank and notes columns only; rows with none of them set are
+    skipped in SQL) and matched with the cached compiled matcher.
+
+    Args:
+        judgment_ids: Judgments to scan; None sweeps every judgment
+        page_size: Judgments fetched per query
+
+    Returns:
+        Detections keyed by judgment ID (judgments without hits are omitted)
+
+    Raises:
+        GigServiceError: If database query fails
+    """
+    pool = await get_pool()
+    if pool is None:
+        raise GigServiceError("Database connection not available")
+
+    matcher = await get_gig_matcher()
+    if not matcher.platforms or judgment_ids == []:
+        return {}
+
+    id_filter = "AND id = ANY(%(ids)s)" if judgment_ids is not None else ""
+    query = f"""
+        SELECT id, employer_name, employer_address, notes, bank_name
+        FROM public.judgments
+        WHERE id > %(after)s
+          {id_filter}
+          AND (employer_name IS NOT NULL OR employer_address IS NOT NULL
+               OR notes IS NOT NULL OR bank_name IS NOT NULL)
+        ORDER BY id
+        LIMIT %(limit)s
+    """
+    params: dict = {"after": 0, "ids": judgment_ids, "limit": page_size}
+
+    results: dict[int, list[GigDetection]] = {}
+    scanned = 0
+    try:
+        async with pool.connection() as conn:
+            while True:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, params)
+                    rows = await cur.fetchall()
+                if not rows:
+                    break
+
+                for row in rows:
+                    detections = matcher.match_fields(zip(JUDGMENT_SCAN_FIELDS, row[1:]))
+                    if detections:
+                        results[int(row[0])] = detections
+
+                scanned += len(rows)
+                if len(rows) < page_size:
+                    break
+                params["after"] = rows[-1][0]
+    except Exception as e:
+        logger.error(f"Gig sweep failed after {scanned} judgments: {e}")
+        raise GigServiceError(f"Failed to scan judgments: {e}") from e
+
+    logger.info(f"Gig sweep: {len(results)} of {scanned} judgments matched gig platforms")
+    return results
 
 
 async def detect_gig_activity_for_plaintiff(
@@ -281,9 +503,9 @@ async def detect_gig_activity_for_plaintiff(
     if pool is None:
         raise GigServiceError("Database connection not available")
 
-    # Load platforms first
-    platforms = await load_gig_platforms()
-    if not platforms:
+    # Compiled matcher for active platforms (cached)
+    matcher = await get_gig_matcher()
+    if not matcher.platforms:
         logger.info("No active gig platforms configured")
         return []
 
@@ -309,19 +531,8 @@ async def detect_gig_activity_for_plaintiff(
 
     employer_name, notes = row
 
-    # Scan each field
-    all_detections: list[GigDetection] = []
-
-    all_detections.extend(match_text_against_platforms(employer_name, platforms, "employer_name"))
-    all_detections.extend(match_text_against_platforms(notes, platforms, "notes"))
-
-    # Deduplicate by platform
-    seen_platforms: set[int] = set()
-    unique_detections: list[GigDetection] = []
-    for detection in all_detections:
-        if detection.platform.id not in seen_platforms:
-            seen_platforms.add(detection.platform.id)
-            unique_detections.append(detection)
+    # Scan each field, deduplicated by platform
+    unique_detections = matcher.match_fields([("employer_name", employer_name), ("notes", notes)])
 
     logger.info(f"Plaintiff {plaintiff_id}: detected {len(unique_detections)} gig platforms")
     return unique_detections
@@ -416,8 +627,7 @@ async def generate_gig_subpoena(
     from backend.services.packet_service import PacketError, generate_packet, load_judgment_context
 
     # Find the platform
-    platforms = await load_gig_platforms()
-    platform = next((p for p in platforms if p.platform_name == platform_name), None)
+    platform = (await get_gig_matcher()).platform(platform_name)
 
     if platform is None:
         raise GigServiceError(f"Platform '{platform_name}' not found")
@@ -475,8 +685,7 @@ async def dispatch_gig_subpoena(
     from backend.services.physical_service import ProofClient, ProofServiceError
 
     # Find the platform
-    platforms = await load_gig_platforms()
-    platform = next((p for p in platforms if p.platform_name == platform_name), None)
+    platform = (await get_gig_matcher()).platform(platform_name)
 
     if platform is None:
         raise GigServiceError(f"Platform '{platform_name}' not found")
@@ -0,0 +1,403 @@
+"""
+Dragonfly Engine - Health Snapshot Collector
+
+Background task that refreshes a consolidated health snapshot (job queue,
+worker heartbeats, events, intake pipeline, reaper) on an interval.
+
+/health/ops and /health/system serve the snapshot from memory instead of
+running their own COUNT(*) queries, so monitoring probes and dashboards
+polling them cost no pool connections. Each refresh is one multi-CTE
+query plus an optional pg_cron lookup.
+
+Optional relations (intelligence.events, intake.simplicity_*) are probed
+once with to_regclass() and left out of the query when missing, so a
+partially-migrated database still gets queue and worker health.
+
+Usage:
+    from backend.services.health_snapshot import health_collector
+
+    await health_collector.start()          # lifespan startup
+    snapshot = await health_collector.get() # in an endpoint
+    await health_collector.stop()           # lifespan shutdown
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from psycopg.rows import dict_row
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+HEALTH_SNAPSHOT_INTERVAL_S = float(os.getenv("HEALTH_SNAPSHOT_INTERVAL_S", "15"))
+
+ENRICHMENT_JOB_TYPES = ("enrich_tlo", "enrich_idicore")
+
+_EVENTS_RELATIONS = ("intelligence.events",)
+_INTAKE_RELATIONS = (
+    "intake.simplicity_batches",
+    "intake.simplicity_raw_rows",
+    "intake.simplicity_validated_rows",
+    "intake.simplicity_failed_rows",
+)
+
+
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+
+_QUEUE_CTE = """
+    q AS (
+        SELECT
+            COUNT(*) FILTER (WHERE status = 'pending') AS pending,
+            COUNT(*) FILTER (WHERE status = 'processing') AS processing,
+            COUNT(*) FILTER (WHERE status = 'failed') AS failed,
+            COUNT(*) FILTER (
+                WHERE status = 'processing'
+                AND started_at < NOW() - INTERVAL '15 minutes'
+            ) AS stuck,
+            COUNT(*) FILTER (
+                WHERE status = 'failed'
+                AND updated_at > NOW() - INTERVAL '24 hours'
+            ) AS failed_24h,
+            COUNT(*) FILTER (
+                WHERE status = 'pending'
+                AND job_type::text = ANY(%(enrichment_job_types)s)
+            ) AS enrichment_backlog
+        FROM ops.job_queue
+    )"""
+
+_WORKERS_CTE = """
+    w AS (
+        SELECT
+            COUNT(*) AS total_workers,
+            COUNT(*) FILTER (
+                WHERE last_seen > NOW() - INTERVAL '5 minutes'
+            ) AS active_workers,
+            MAX(last_seen) AS last_heartbeat
+        FROM ops.worker_heartbeats
+    )"""
+
+_EVENTS_CTE = """
+    e AS (
+        SELECT
+            MAX(created_at) AS last_event_at,
+            COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours') AS events_24h
+        FROM intelligence.events
+    )"""
+
+_EVENTS_CTE_MISSING = """
+    e AS (
+        SELECT NULL::timestamptz AS last_event_at, NULL::bigint AS events_24h
+    )"""
+
+_INTAKE_CTE = """
+    ib AS (
+        SELECT
+            MAX(completed_at) FILTER (WHERE status = 'completed') AS last_intake_success,
+            COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours') AS batches_24h,
+            AVG(
+                CASE WHEN row_count_total > 0
+                THEN (row_count_valid::float / row_count_total) * 100
+                ELSE 0 END
+            ) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours') AS success_rate_24h
+        FROM intake.simplicity_batches
+    ),
+    ip AS (
+        SELECT COUNT(*) AS pending_validation
+        FROM intake.simplicity_raw_rows r
+        WHERE NOT EXISTS (
+            SELECT 1 FROM intake.simplicity_validated_rows v
+            WHERE v.raw_row_id = r.id
+        )
+        AND NOT EXISTS (
+            SELECT 1 FROM intake.simplicity_failed_rows f
+            WHERE f.raw_row_id = r.id AND f.resolved_at IS NULL
+        )
+    ),
+    ifr AS (
+        SELECT COUNT(*) AS failed_rows_24h
+        FROM intake.simplicity_failed_rows
+        WHERE created_at > NOW() - INTERVAL '24 hours'
+        AND resolved_at IS NULL
+    )"""
+
+_INTAKE_CTE_MISSING = """
+    ib AS (
+        SELECT
+            NULL::timestamptz AS last_intake_success,
+            NULL::bigint AS batches_24h,
+            NULL::float AS success_rate_24h
+    ),
+    ip AS (SELECT NULL::bigint AS pending_validation),
+    ifr AS (SELECT NULL::bigint AS failed_rows_24h)"""
+
+_REAPER_SQL = """
+    SELECT
+        jrd.status,
+        jrd.start_time,
+        jrd.return_message
+    FROM cron.job_run_details jrd
+    JOIN cron.job j ON j.jobid = jrd.jobid
+    WHERE j.jobname IN ('dragonfly_reaper', 'reap_stuck_jobs')
+    ORDER BY jrd.start_time DESC
+    LIMIT 1
+"""
+
+
+def build_snapshot_sql(has_events: bool, has_intake: bool) -> str:
+    """Assemble the consolidated snapshot query for the available relations."""
+    ctes = [
+        _QUEUE_CTE,
+        _WORKERS_CTE,
+        _EVENTS_CTE if has_events else _EVENTS_CTE_MISSING,
+        _INTAKE_CTE if has_intake else _INTAKE_CTE_MISSING,
+    ]
+    return "WITH" + ",".join(ctes) + "\nSELECT * FROM q, w, e, ib, ip, ifr"
+
+
+def _iso_z(value: Optional[datetime]) -> Optional[str]:
+    """Format a timestamp the way the health endpoints always have."""
+    return value.replace(tzinfo=None).isoformat() + "Z" if value else None
+
+
+# ---------------------------------------------------------------------------
+# Data Classes
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class HealthSnapshot:
+    """Point-in-time system health, collected in the background."""
+
+    collected_at: datetime
+    database_ok: bool
+    queue: dict[str, int] = field(default_factory=dict)
+    workers: dict[str, Any] = field(default_factory=dict)
+    events: dict[str, Any] = field(default_factory=dict)
+    intake: Optional[dict[str, Any]] = None
+    reaper: dict[str, Any] = field(default_factory=dict)
+    reaper_last_run: Optional[datetime] = None
+    error: Optional[str] = None
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the snapshot was collected."""
+        return (datetime.now(timezone.utc) - self.collected_at).total_seconds()
+
+    @property
+    def collected_at_iso(self) -> str:
+        """Collection timestamp in the endpoints' ISO-8601 'Z' format."""
+        return _iso_z(self.collected_at) or ""
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any], collected_at: datetime) -> "HealthSnapshot":
+        """Build a snapshot from the consolidated query's single row."""
+        intake = None
+        if row.get("pending_validation") is not None:
+            success_rate = row.get("success_rate_24h")
+            intake = {
+                "last_intake_success": _iso_z(row.get("last_intake_success")),
+                "pending_validation": row.get("pending_validation") or 0,
+                "failed_rows_24h": row.get("failed_rows_24h") or 0,
+                "enrichment_backlog": row.get("enrichment_backlog") or 0,
+                "active_workers": row.get("active_workers") or 0,
+                "batches_24h": row.get("batches_24h") or 0,
+                "success_rate_24h": (
+                    round(float(success_rate), 2) if success_rate is not None else None
+                ),
+            }
+
+        return cls(
+            collected_at=collected_at,
+            database_ok=True,
+            queue={
+                "pending": row.get("pending") or 0,
+                "processing": row.get("processing") or 0,
+                "failed": row.get("failed") or 0,
+                "stuck": row.get("stuck") or 0,
+                "failed_24h": row.get("failed_24h") or 0,
+            },
+            workers={
+                "total_workers": row.get("total_workers") or 0,
+                "active_workers": row.get("active_workers") or 0,
+                "last_heartbeat": _iso_z(row.get("last_heartbeat")),
+            },
+            events={
+                "last_event_at": _iso_z(row.get("last_event_at")),
+                "events_24h": row.get("events_24h") or 0,
+                "available": row.get("events_24h") is not None,
+            },
+            intake=intake,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Collector
+# ---------------------------------------------------------------------------
+
+
+class HealthSnapshotCollector:
+    """
+    Refreshes a HealthSnapshot on an interval and serves it from memory.
+
+    Lifecycle mirrors DBSupervisor: start() in lifespan startup, stop() on
+    shutdown. get() falls back to one inline refresh (shared by concurrent
+    callers) when no fresh snapshot exists, e.g. before the first tick.
+    """
+
+    def __init__(self, interval_s: float = HEALTH_SNAPSHOT_INTERVAL_S) -> None:
+        self.interval_s = interval_s
+        # Older than this means the collector stalled or never started
+        self.max_age_s = interval_s * 4
+        self._snapshot: Optional[HealthSnapshot] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._relations: Optional[tuple[bool, bool]] = None
+        self.refresh_count = 0
+
+    @property
+    def snapshot(self) -> Optional[HealthSnapshot]:
+        """Latest snapshot, however old."""
+        return self._snapshot
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the background refresh task."""
+        if self.running:
+            return
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"[Health Collector] Started (interval={self.interval_s}s)")
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._stop_event:
+            self._stop_event.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("[Health Collector] Stopped")
+
+    async def get(self) -> HealthSnapshot:
+        """Return the latest snapshot, refreshing inline only if it is stale."""
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.age_seconds <= self.max_age_s:
+            return snapshot
+
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.age_seconds <= self.max_age_s:
+                return snapshot
+            return await self.refresh()
+
+    async def refresh(self) -> HealthSnapshot:
+        """Collect a new snapshot now. Never raises."""
+        from ..db import get_pool
+
+        collected_at = datetime.now(timezone.utc)
+        try:
+            pool = await get_pool()
+            if pool is None:
+                snapshot = HealthSnapshot(
+                    collected_at=collected_at,
+                    database_ok=False,
+                    error="Database pool not initialized",
+                )
+            else:
+                async with pool.connection() as conn:
+                    snapshot = await self._collect(conn, collected_at)
+        except Exception as e:
+            logger.warning(f"[Health Collector] Snapshot refresh failed: {e}")
+            # Re-probe optional relations next time in case migrations changed
+            self._relations = None
+            snapshot = HealthSnapshot(
+                collected_at=collected_at,
+                database_ok=False,
+                error=type(e).__name__,
+            )
+
+        self._snapshot = snapshot
+        self.refresh_count += 1
+        return snapshot
+
+    async def _collect(self, conn: Any, collected_at: datetime) -> HealthSnapshot:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            if self._relations is None:
+                self._relations = await self._probe_relations(cur)
+            has_events, has_intake = self._relations
+
+            await cur.execute(
+                build_snapshot_sql(has_events, has_intake),
+                {"enrichment_job_types": list(ENRICHMENT_JOB_TYPES)},
+            )
+            row = await cur.fetchone()
+            snapshot = HealthSnapshot.from_row(row or {}, collected_at)
+
+            snapshot.reaper, snapshot.reaper_last_run = await self._collect_reaper(conn)
+            return snapshot
+
+    @staticmethod
+    async def _probe_relations(cur: Any) -> tuple[bool, bool]:
+        relations = _EVENTS_RELATIONS + _INTAKE_RELATIONS
+        await cur.execute(
+            "SELECT rel, to_regclass(rel) IS NOT NULL AS present FROM unnest(%s::text[]) AS rel",
+            (list(relations),),
+        )
+        present = {r["rel"]: r["present"] for r in await cur.fetchall()}
+        has_events = all(present.get(r) for r in _EVENTS_RELATIONS)
+        has_intake = all(present.get(r) for r in _INTAKE_RELATIONS)
+        return has_events, has_intake
+
+    @staticmethod
+    async def _collect_reaper(conn: Any) -> tuple[dict[str, Any], Optional[datetime]]:
+        """Latest reaper run from pg_cron (may be inaccessible)."""
+        try:
+            async with conn.cursor() as cur:
+                await cur.execute(_REAPER_SQL)
+                row = await cur.fetchone()
+        except Exception as e:
+            return {"error": str(e), "error_type": type(e).__name__}, None
+
+        if not row:
+            return {"configured": False}, None
+
+        reaper = {
+            "last_status": row[0],
+            "last_run": _iso_z(row[1]),
+            "return_message": row[2],
+        }
+        return reaper, row[1]
+
+    async def _run(self) -> None:
+        assert self._stop_event is not None
+        while not self._stop_event.is_set():
+            await self.refresh()
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.interval_s)
+            except asyncio.TimeoutError:
+                continue
+
+
+# Global collector for the API process
+health_collector = HealthSnapshotCollector()
@@ -14,7 +14,7 @@ from typing import Any, Optional
 import pandas as pd
 
 from ..db import get_connection
-from .ai_service import build_judgment_context, generate_embedding
+from .ai_service import build_judgment_context, context_hash, generate_embedding
 
 logger = logging.getLogger(__name__)
 
@@ -285,8 +285,10 @@ async def ingest_simplicity_csv(path: str) -> dict[str, int]:
                                 judgment_amount,
                                 entry_date,
                                 source_file,
-                                description_embedding
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s::vector)
+                                description_embedding,
+                                embedding_context_hash,
+                                embedded_at
+                            ) VALUES (%s, %s, %s, %s, %s, %s, %s::vector, %s, now())
                             ON CONFLICT (case_number) DO NOTHING
                             RETURNING id
                             """,
@@ -297,6 +299,7 @@ async def ingest_simplicity_csv(path: str) -> dict[str, int]:
                             row["entry_date"],
                             row["source_file"],
                             str(embedding),
+                            context_hash(context),
                         )
                     else:
                         # No embedding - insert without the vector column
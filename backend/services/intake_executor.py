@@ -0,0 +1,365 @@
+"""
+Dragonfly Engine - Intake Executor
+
+Runs the CPU-bound half of CSV intake (pandas parsing, column
+normalization and row mapping) in a bounded process pool so the API
+event loop keeps serving health checks and dashboards while a large
+upload is processed.
+
+Parsed chunks stream back to the async DB writer through a bounded
+queue. When the writer falls behind, the parser process blocks on put()
+instead of buffering the whole file in memory.
+
+Usage:
+    from backend.services.intake_executor import get_intake_executor
+
+    executor = get_intake_executor()
+    async with executor.slot():
+        async for chunk in executor.stream_chunks(path, source="simplicity"):
+            ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
+
+import pandas as pd
+
+from .intake_mapping import get_mapping_for_source, normalize_row
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Parser processes. Each active upload holds one process while it parses.
+INTAKE_EXECUTOR_WORKERS = int(os.getenv("INTAKE_EXECUTOR_WORKERS", "2"))
+
+# Uploads processed concurrently. Each also holds one DB connection for
+# writing, so keep this well below POOL_MAX_SIZE.
+INTAKE_MAX_ACTIVE_FILES = int(os.getenv("INTAKE_MAX_ACTIVE_FILES", "2"))
+
+# Parsed chunks buffered ahead of the writer, per upload.
+INTAKE_QUEUE_MAXSIZE = int(os.getenv("INTAKE_QUEUE_MAXSIZE", "4"))
+
+DEFAULT_CHUNK_SIZE = 500
+
+# How often a blocked producer/consumer re-checks for cancellation or death
+_POLL_SECONDS = 0.5
+
+_END_OF_STREAM = None
+
+
+# ---------------------------------------------------------------------------
+# Data Classes
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ParsedRow:
+    """A CSV row after normalization in the parser process."""
+
+    row_index: int
+    normalized: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    error_code: str = "VALIDATION_ERROR"
+
+
+@dataclass
+class ParsedChunk:
+    """A contiguous block of parsed rows, in file order."""
+
+    chunk_index: int
+    rows: list[ParsedRow] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Parser Process Functions (must be module-level to be picklable)
+# ---------------------------------------------------------------------------
+
+
+def parse_chunk(
+    chunk_df: pd.DataFrame,
+    chunk_index: int,
+    start_index: int,
+    source: str,
+) -> ParsedChunk:
+    """
+    Normalize one DataFrame chunk into ParsedRows.
+
+    Failures are captured per row rather than raised so a bad row never
+    aborts the rest of the chunk: ValueError is a VALIDATION_ERROR, anything
+    else a DB_ERROR (the codes the in-process path used).
+    """
+    from .intake_service import normalize_columns
+
+    chunk_df = normalize_columns(chunk_df)
+    # Empty cells arrive as NaN; normalize_row expects None
+    records = chunk_df.astype(object).where(chunk_df.notna(), None).to_dict("records")
+    parsed = ParsedChunk(chunk_index=chunk_index)
+
+    try:
+        mapping = get_mapping_for_source(source)
+    except ValueError as ve:
+        # Unknown source: every row fails the same way
+        parsed.rows = [
+            ParsedRow(row_index=start_index + offset, error=str(ve))
+            for offset in range(len(records))
+        ]
+        return parsed
+
+    for offset, record in enumerate(records):
+        row_index = start_index + offset
+        try:
+            normalized = normalize_row(record, mapping)
+            parsed.rows.append(ParsedRow(row_index=row_index, normalized=normalized))
+        except ValueError as ve:
+            parsed.rows.append(ParsedRow(row_index=row_index, error=str(ve)))
+        except Exception as e:
+            parsed.rows.append(
+                ParsedRow(row_index=row_index, error=str(e)[:500], error_code="DB_ERROR")
+            )
+
+    return parsed
+
+
+def _put_until_cancelled(out_queue: Any, item: Any, cancel_event: Any) -> bool:
+    """Blocking put that gives up once the consumer has gone away."""
+    while not cancel_event.is_set():
+        try:
+            out_queue.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _parse_file_into_queue(
+    file_path: str,
+    source: str,
+    chunk_size: int,
+    out_queue: Any,
+    cancel_event: Any,
+) -> int:
+    """
+    Parser process entry point: stream a CSV into out_queue chunk by chunk.
+
+    Returns the number of rows parsed. Ends the stream with a sentinel.
+    """
+    total = 0
+    for chunk_index, chunk_df in enumerate(pd.read_csv(file_path, chunksize=chunk_size, dtype=str)):
+        parsed = parse_chunk(chunk_df, chunk_index, chunk_index * chunk_size, source)
+        if not _put_until_cancelled(out_queue, parsed, cancel_event):
+            return total
+        total += len(parsed.rows)
+
+    _put_until_cancelled(out_queue, _END_OF_STREAM, cancel_event)
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+
+class IntakeExecutor:
+    """
+    Bounded process pool for intake parsing with streaming results.
+
+    Concurrency is limited twice: at most `max_active_files` uploads hold a
+    slot at once (callers beyond that wait), and each upload buffers at most
+    `queue_maxsize` parsed chunks ahead of its DB writer.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = INTAKE_EXECUTOR_WORKERS,
+        max_active_files: int = INTAKE_MAX_ACTIVE_FILES,
+        queue_maxsize: int = INTAKE_QUEUE_MAXSIZE,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_active_files = max(1, max_active_files)
+        self.queue_maxsize = max(1, queue_maxsize)
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._manager: Any = None
+        self._start_lock = threading.Lock()
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        # Metrics
+        self._active_files = 0
+        self._waiting_files = 0
+        self._chunks_streamed = 0
+        self._rows_streamed = 0
+        self._parse_failures = 0
+        self._max_queue_depth = 0
+        self._live_queues: set[Any] = set()
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        """Start the process pool and queue manager on first use."""
+        with self._start_lock:
+            if self._pool is not None:
+                return
+            # spawn, not fork: the API process has an event loop and pool threads
+            ctx = multiprocessing.get_context("spawn")
+            self._manager = ctx.Manager()
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=ctx)
+            logger.info(
+                f"Intake executor started: {self.max_workers} workers, "
+                f"{self.max_active_files} active files, queue depth {self.queue_maxsize}"
+            )
+
+    def shutdown(self) -> None:
+        """Stop the process pool and queue manager."""
+        with self._start_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
+
+    # -- concurrency -------------------------------------------------------
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the `max_active_files` processing slots."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_active_files)
+
+        self._waiting_files += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting_files -= 1
+
+        self._active_files += 1
+        try:
+            yield
+        finally:
+            self._active_files -= 1
+            self._slots.release()
+
+    # -- streaming ---------------------------------------------------------
+
+    async def stream_chunks(
+        self,
+        file_path: str | Path,
+        source: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncGenerator[ParsedChunk, None]:
+        """
+        Parse a CSV in a worker process and yield ParsedChunks in file order.
+
+        Parse errors in the worker (unreadable file, malformed CSV) are
+        re-raised here. Breaking out of the iteration cancels the parser.
+        """
+        self._ensure_started()
+        assert self._pool is not None
+
+        out_queue = self._manager.Queue(maxsize=self.queue_maxsize)
+        cancel_event = self._manager.Event()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._pool,
+            _parse_file_into_queue,
+            str(file_path),
+            source,
+            chunk_size,
+            out_queue,
+            cancel_event,
+        )
+        self._live_queues.add(out_queue)
+
+        try:
+            while True:
+                try:
+                    item = await asyncio.to_thread(out_queue.get, True, _POLL_SECONDS)
+                except queue.Empty:
+                    if future.done():
+                        # Worker exited without a sentinel: surface its error
+                        future.result()
+                        break
+                    continue
+
+                if item is _END_OF_STREAM:
+                    break
+
+                self._chunks_streamed += 1
+                self._rows_streamed += len(item.rows)
+                self._max_queue_depth = max(self._max_queue_depth, out_queue.qsize() + 1)
+                yield item
+
+            await future
+        except Exception:
+            self._parse_failures += 1
+            raise
+        finally:
+            cancel_event.set()
+            self._live_queues.discard(out_queue)
+
+    # -- metrics -----------------------------------------------------------
+
+    def metrics(self) -> dict[str, Any]:
+        """Concurrency limits and queue-depth metrics for observability."""
+        queued = 0
+        for live_queue in list(self._live_queues):
+            try:
+                queued += live_queue.qsize()
+            except Exception:
+                pass
+
+        return {
+            "started": self._pool is not None,
+            "max_workers": self.max_workers,
+            "max_active_files": self.max_active_files,
+            "queue_maxsize": self.queue_maxsize,
+            "active_files": self._active_files,
+            "waiting_files": self._waiting_files,
+            "queued_chunks": queued,
+            "max_queue_depth": self._max_queue_depth,
+            "chunks_streamed": self._chunks_streamed,
+            "rows_streamed": self._rows_streamed,
+            "parse_failures": self._parse_failures,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Singleton
+# ---------------------------------------------------------------------------
+
+_executor: Optional[IntakeExecutor] = None
+
+
+def get_intake_executor() -> IntakeExecutor:
+    """Get the process-wide intake executor (created lazily)."""
+    global _executor
+    if _executor is None:
+        _executor = IntakeExecutor()
+    return _executor
+
+
+def get_intake_executor_metrics() -> Optional[dict[str, Any]]:
+    """Metrics for the intake executor, or None if it was never created."""
+    return _executor.metrics() if _executor is not None else None
+
+
+def shutdown_intake_executor() -> None:
+    """Shut down the intake executor if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -25,7 +25,7 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional
 from uuid import UUID
 
 import pandas as pd
@@ -37,6 +37,8 @@ from .intake_mapping import get_mapping_for_source, normalize_row
 if TYPE_CHECKING:
     from psycopg_pool import AsyncConnectionPool
 
+    from .intake_executor import IntakeExecutor, ParsedChunk
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -166,6 +168,24 @@ def find_column(df: pd.DataFrame, canonical: str) -> Optional[str]:
     return None
 
 
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize DataFrame columns to canonical names.
+
+    Maps various column naming conventions to standard schema. Module-level
+    so intake executor processes can call it without an IntakeService.
+    """
+    column_map = {}
+
+    for canonical in COLUMN_ALIASES:
+        source_col = find_column(df, canonical)
+        if source_col:
+            column_map[source_col] = canonical
+
+    # Rename columns that we found
+    return df.rename(columns=column_map)
+
+
 def parse_amount(value: Any) -> Optional[float]:
     """Parse monetary amount, handling various formats."""
     if pd.isna(value) or value is None:
@@ -418,6 +438,42 @@ class IntakeService:
                     processing_time_ms=int((time.perf_counter() - start_time) * 1000),
                 )
 
+        except Exception as e:
+            logger.exception(f"Error processing row {row_index}")
+            return IntakeResult(
+                success=False,
+                row_index=row_index,
+                error_code="DB_ERROR",
+                error_details=str(e)[:500],
+                processing_time_ms=int((time.perf_counter() - start_time) * 1000),
+            )
+
+        return await self.process_normalized_row(
+            conn=conn,
+            normalized=normalized,
+            row_index=row_index,
+            source_batch=source_batch,
+            start_time=start_time,
+        )
+
+    async def process_normalized_row(
+        self,
+        conn: psycopg.AsyncConnection,
+        normalized: dict[str, Any],
+        row_index: int,
+        source_batch: str,
+        start_time: Optional[float] = None,
+    ) -> IntakeResult:
+        """
+        Insert an already-normalized row and trigger downstream services.
+
+        Used directly by the executor path, where normalization already ran
+        in a parser process.
+        """
+        if start_time is None:
+            start_time = time.perf_counter()
+
+        try:
             # Extract normalized fields
             case_number = normalized["case_number"]
             plaintiff_name = normalized.get("plaintiff_name")
@@ -507,7 +563,7 @@ class IntakeService:
                 success=False,
                 row_index=row_index,
                 error_code="DUPLICATE",
-                error_details=f"Duplicate case_number: {row.get('case_number')}",
+                error_details=f"Duplicate case_number: {normalized.get('case_number')}",
                 processing_time_ms=int((time.perf_counter() - start_time) * 1000),
             )
 
@@ -527,17 +583,83 @@ class IntakeService:
 
         Maps various column naming conventions to standard schema.
         """
-        column_map = {}
+        return normalize_columns(df)
+
+    def _tally_row_result(self, result: BatchResult, row_result: IntakeResult) -> bool:
+        """
+        Fold a row result into the batch counters.
+
+        Returns True if the row counts as a consecutive error.
+        """
+        result.total_rows += 1
+
+        if row_result.success:
+            result.valid_rows += 1
+        elif row_result.error_code == "DUPLICATE":
+            result.duplicate_rows += 1
+        elif row_result.error_code == "VALIDATION_SKIPPED":
+            result.skipped_rows += 1
+            return False
+        else:
+            result.error_rows += 1
+            result.errors.append(
+                {
+                    "row": row_result.row_index,
+                    "code": row_result.error_code,
+                    "message": row_result.error_details,
+                }
+            )
+            return True
 
-        for canonical, aliases in COLUMN_ALIASES.items():
-            source_col = find_column(df, canonical)
-            if source_col:
-                column_map[source_col] = canonical
+        return False
 
-        # Rename columns that we found
-        df = df.rename(columns=column_map)
+    async def _iter_inline_chunks(
+        self,
+        file_path: Path,
+        source: str,
+    ) -> AsyncGenerator["ParsedChunk", None]:
+        """Parse chunks on the calling thread (no executor)."""
+        from .intake_executor import parse_chunk
+
+        for chunk_idx, chunk_df in enumerate(
+            pd.read_csv(file_path, chunksize=CHUNK_SIZE, dtype=str)
+        ):
+            yield parse_chunk(chunk_df, chunk_idx, chunk_idx * CHUNK_SIZE, source)
+
+    async def _iter_row_results(
+        self,
+        chunks: AsyncGenerator["ParsedChunk", None],
+        batch_id: UUID,
+        source_batch: str,
+    ) -> AsyncGenerator[IntakeResult, None]:
+        """Write parsed chunks to the database, yielding a result per row."""
+        try:
+            async for chunk in chunks:
+                logger.info(
+                    f"Processing chunk {chunk.chunk_index + 1} ({len(chunk.rows)} rows) "
+                    f"for batch {batch_id}"
+                )
+
+                async with self.pool.connection() as conn:
+                    for parsed in chunk.rows:
+                        if parsed.error is not None:
+                            yield IntakeResult(
+                                success=False,
+                                row_index=parsed.row_index,
+                                error_code=parsed.error_code,
+                                error_details=parsed.error,
+                            )
+                            continue
 
-        return df
+                        yield await self.process_normalized_row(
+                            conn=conn,
+                            normalized=parsed.normalized or {},
+                            row_index=parsed.row_index,
+                            source_batch=source_batch,
+                        )
+        finally:
+            # Stops the parser process early if the caller aborted mid-file
+            await chunks.aclose()
 
     async def process_simplicity_upload(
         self,
@@ -546,6 +668,7 @@ class IntakeService:
         source: str = "simplicity",
         created_by: Optional[str] = None,
         worker_id: Optional[str] = None,
+        executor: Optional["IntakeExecutor"] = None,
     ) -> BatchResult:
         """
         Process a Simplicity CSV upload with streaming and error isolation.
@@ -556,6 +679,8 @@ class IntakeService:
             source: Source identifier (simplicity, jbi, manual, etc.)
             created_by: User/system that initiated the upload
             worker_id: ID of the processing worker
+            executor: Intake executor to parse in a process pool. When None,
+                parsing runs inline (fine for workers, blocking for the API).
 
         Returns:
             BatchResult with processing statistics
@@ -577,66 +702,31 @@ class IntakeService:
         result = BatchResult(batch_id=batch_id)
         consecutive_errors = 0
 
-        try:
-            # Stream CSV in chunks
-            for chunk_idx, chunk_df in enumerate(
-                pd.read_csv(file_path, chunksize=CHUNK_SIZE, dtype=str)
-            ):
-                logger.info(
-                    f"Processing chunk {chunk_idx + 1} ({len(chunk_df)} rows) for batch {batch_id}"
-                )
-
-                # Normalize column names
-                chunk_df = self.normalize_dataframe(chunk_df)
-
-                # Process each row in the chunk
-                async with self.pool.connection() as conn:
-                    for local_idx, row in chunk_df.iterrows():
-                        row_index = chunk_idx * CHUNK_SIZE + int(local_idx)
-                        result.total_rows += 1
-
-                        # Process the row
-                        row_result = await self.process_row(
-                            conn=conn,
-                            row=row.to_dict(),
-                            row_index=row_index,
-                            batch_id=batch_id,
-                            source_batch=source_batch,
-                            source=source,
-                        )
-
-                        # Log the result
-                        await self.log_row_result(batch_id, row_result)
-
-                        # Update counters
-                        if row_result.success:
-                            result.valid_rows += 1
-                            consecutive_errors = 0
-                        elif row_result.error_code == "DUPLICATE":
-                            result.duplicate_rows += 1
-                            consecutive_errors = 0
-                        elif row_result.error_code == "VALIDATION_SKIPPED":
-                            result.skipped_rows += 1
-                        else:
-                            result.error_rows += 1
-                            consecutive_errors += 1
-                            result.errors.append(
-                                {
-                                    "row": row_index,
-                                    "code": row_result.error_code,
-                                    "message": row_result.error_details,
-                                }
-                            )
+        if executor is not None:
+            chunks = executor.stream_chunks(file_path, source=source, chunk_size=CHUNK_SIZE)
+        else:
+            chunks = self._iter_inline_chunks(file_path, source)
+        row_results = self._iter_row_results(chunks, batch_id, source_batch)
 
-                        # Check for too many consecutive errors
-                        if consecutive_errors >= MAX_ERRORS_BEFORE_ABORT:
-                            logger.error(
-                                f"Aborting batch {batch_id}: "
-                                f"{consecutive_errors} consecutive errors"
-                            )
-                            result.duration_seconds = time.perf_counter() - start_time
-                            await self.finalize_batch(batch_id, result, status="failed")
-                            return result
+        try:
+            async for row_result in row_results:
+                # Log the result
+                await self.log_row_result(batch_id, row_result)
+
+                # Update counters
+                if self._tally_row_result(result, row_result):
+                    consecutive_errors += 1
+                elif row_result.error_code != "VALIDATION_SKIPPED":
+                    consecutive_errors = 0
+
+                # Check for too many consecutive errors
+                if consecutive_errors >= MAX_ERRORS_BEFORE_ABORT:
+                    logger.error(
+                        f"Aborting batch {batch_id}: " f"{consecutive_errors} consecutive errors"
+                    )
+                    result.duration_seconds = time.perf_counter() - start_time
+                    await self.finalize_batch(batch_id, result, status="failed")
+                    return result
 
             # Success
             result.duration_seconds = time.perf_counter() - start_time
@@ -665,6 +755,9 @@ class IntakeService:
             await self.finalize_batch(batch_id, result, status="failed")
             raise
 
+        finally:
+            await row_results.aclose()
+
 
 # ---------------------------------------------------------------------------
 # Convenience Functions
@@ -0,0 +1,217 @@
+"""
+Dragonfly Engine - Packet Renderer
+
+Renders DOCX legal packets off the API event loop.
+
+Templates are parsed once per process and cached: the pristine
+python-docx Document is deep-copied for each render instead of
+re-reading and re-parsing the .docx archive, and a per-template Jinja
+environment keeps the compiled template sources. A cached template is
+invalidated when its file's mtime changes, so editing a template takes
+effect without a restart.
+
+Rendering runs in a small spawn process pool (each worker keeps its own
+template cache) and returns the finished document as bytes, so nothing
+is written to local disk.
+
+Usage:
+    from backend.services.packet_renderer import get_packet_renderer
+
+    docx_bytes = await get_packet_renderer().render(template_path, context)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from docxtpl import DocxTemplate
+from jinja2 import Environment
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Render processes. 0 renders on a thread in the API process instead.
+PACKET_RENDER_WORKERS = int(os.getenv("PACKET_RENDER_WORKERS", "2"))
+
+
+# ---------------------------------------------------------------------------
+# Template Cache
+# ---------------------------------------------------------------------------
+
+
+class _CachingEnvironment(Environment):
+    """Jinja environment that compiles each template source only once."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._compiled: dict[str, Any] = {}
+
+    def from_string(self, source, globals=None, template_class=None):  # type: ignore[override]
+        if globals is not None or template_class is not None:
+            return super().from_string(source, globals, template_class)
+        compiled = self._compiled.get(source)
+        if compiled is None:
+            compiled = self._compiled[source] = super().from_string(source)
+        return compiled
+
+
+@dataclass
+class _CachedTemplate:
+    """A parsed template and the file version it was parsed from."""
+
+    mtime_ns: int
+    raw: bytes
+    document: Any
+    env: _CachingEnvironment
+
+
+class TemplateCache:
+    """Per-process cache of parsed DOCX templates, invalidated by mtime."""
+
+    def __init__(self) -> None:
+        self._templates: dict[str, _CachedTemplate] = {}
+        self._lock = threading.Lock()
+
+    def get(self, template_path: str) -> _CachedTemplate:
+        mtime_ns = os.stat(template_path).st_mtime_ns
+        with self._lock:
+            cached = self._templates.get(template_path)
+            if cached is not None and cached.mtime_ns == mtime_ns:
+                return cached
+
+            raw = Path(template_path).read_bytes()
+            template = DocxTemplate(io.BytesIO(raw))
+            template.init_docx()
+            cached = _CachedTemplate(
+                mtime_ns=mtime_ns,
+                raw=raw,
+                document=template.docx,
+                env=_CachingEnvironment(),
+            )
+            self._templates[template_path] = cached
+            logger.debug("Parsed packet template %s", template_path)
+            return cached
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
+_template_cache = TemplateCache()
+
+
+def render_docx(template_path: str, context: dict[str, Any]) -> bytes:
+    """
+    Render a template with context and return the .docx bytes.
+
+    Module-level so it can be submitted to the process pool; each process
+    uses its own template cache.
+    """
+    cached = _template_cache.get(template_path)
+    doc = DocxTemplate(io.BytesIO(cached.raw))
+    doc.docx = copy.deepcopy(cached.document)
+    doc.render(context, cached.env)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Renderer
+# ---------------------------------------------------------------------------
+
+
+class PacketRenderer:
+    """
+    Renders packets in a bounded spawn process pool.
+
+    The pool is started lazily on first render so importing this module
+    (and API startup) stays cheap.
+    """
+
+    def __init__(self, max_workers: int = PACKET_RENDER_WORKERS) -> None:
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._start_lock = threading.Lock()
+        self._rendered = 0
+        self._failed = 0
+
+    def _ensure_started(self) -> Optional[ProcessPoolExecutor]:
+        if self.max_workers <= 0:
+            return None
+        with self._start_lock:
+            if self._pool is None:
+                ctx = multiprocessing.get_context("spawn")
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=ctx)
+                logger.info("Packet renderer started with %d processes", self.max_workers)
+            return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the process pool. Safe to call when never started."""
+        with self._start_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+                logger.info("Packet renderer stopped")
+
+    async def render(self, template_path: Path | str, context: dict[str, Any]) -> bytes:
+        """Render one packet and return the .docx bytes."""
+        pool = self._ensure_started()
+        try:
+            if pool is None:
+                data = await asyncio.to_thread(render_docx, str(template_path), context)
+            else:
+                loop = asyncio.get_running_loop()
+                data = await loop.run_in_executor(pool, render_docx, str(template_path), context)
+        except Exception:
+            self._failed += 1
+            raise
+        self._rendered += 1
+        return data
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "started": self._pool is not None,
+            "rendered": self._rendered,
+            "failed": self._failed,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Module Singleton
+# ---------------------------------------------------------------------------
+
+_renderer: Optional[PacketRenderer] = None
+
+
+def get_packet_renderer() -> PacketRenderer:
+    """Get the shared packet renderer (created on first use)."""
+    global _renderer
+    if _renderer is None:
+        _renderer = PacketRenderer()
+    return _renderer
+
+
+def shutdown_packet_renderer() -> None:
+    """Stop the shared renderer's process pool (called on app shutdown)."""
+    global _renderer
+    if _renderer is not None:
+        _renderer.shutdown()
+        _renderer = None
@@ -5,20 +5,23 @@ Generates court-ready enforcement documents (DOCX) from judgment records.
 Supports Income Executions and Information Subpoenas for NY.
 
 Templates assumed at: backend/assets/templates/{packet_type}.docx
-Uses Jinja2-style tags via docxtpl.
+Uses Jinja2-style tags via docxtpl. Rendering happens in memory in the
+packet render pool (see packet_renderer.py); generate_packets() batches
+many judgments behind one context query.
 """
 
+import asyncio
 import logging
-import tempfile
+import os
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
 from typing import Any, Literal, Optional
 
-from docxtpl import DocxTemplate
-
 from ..config import get_settings
 from ..db import get_pool, get_supabase_client
+from .packet_renderer import get_packet_renderer
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,11 @@ PACKET_TYPES: dict[str, str] = {
 
 TEMPLATES_DIR = Path(__file__).parent.parent / "assets" / "templates"
 
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Packets rendering/uploading at once in generate_packets()
+PACKET_BATCH_CONCURRENCY = int(os.getenv("PACKET_BATCH_CONCURRENCY", "8"))
+
 
 # =============================================================================
 # Exceptions
@@ -45,6 +53,19 @@ class PacketError(Exception):
     pass
 
 
+@dataclass
+class PacketResult:
+    """Outcome of one packet in a generate_packets() batch."""
+
+    judgment_id: int
+    packet_url: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.packet_url is not None
+
+
 # =============================================================================
 # Helpers
 # =============================================================================
@@ -64,79 +85,37 @@ def format_date(d: Optional[date]) -> str:
     return d.strftime("%m/%d/%Y")
 
 
-async def load_judgment_context(judgment_id: int) -> dict[str, Any]:
-    """
-    Load judgment data and build a context dict for template rendering.
-
-    Fetches from public.judgments and joins enrichment data if available.
-
-    Args:
-        judgment_id: The judgment ID to load
-
-    Returns:
-        Context dict with all template fields
+_CONTEXT_COLUMNS = """
+    j.id,
+    j.case_number,
+    j.plaintiff_name,
+    j.defendant_name,
+    j.judgment_amount,
+    j.entry_date,
+    j.defendant_address,
+    j.defendant_phone,
+    j.defendant_email,
+    j.status,
+    j.notes
+"""
 
-    Raises:
-        PacketError: If judgment not found or query fails
-    """
-    pool = await get_pool()
-    if pool is None:
-        raise PacketError("Database connection not available")
+# Enrichment columns (may not exist on all deployments)
+_ENRICHMENT_COLUMNS = """,
+    COALESCE(j.employer_name, NULL) as employer_name,
+    COALESCE(j.employer_address, NULL) as employer_address,
+    COALESCE(j.bank_name, NULL) as bank_name,
+    COALESCE(j.bank_address, NULL) as bank_address
+"""
 
-    query = """
-        SELECT
-            j.id,
-            j.case_number,
-            j.plaintiff_name,
-            j.defendant_name,
-            j.judgment_amount,
-            j.entry_date,
-            j.defendant_address,
-            j.defendant_phone,
-            j.defendant_email,
-            j.status,
-            j.notes,
-            -- Check for enrichment columns (may not exist on all deployments)
-            COALESCE(j.employer_name, NULL) as employer_name,
-            COALESCE(j.employer_address, NULL) as employer_address,
-            COALESCE(j.bank_name, NULL) as bank_name,
-            COALESCE(j.bank_address, NULL) as bank_address
-        FROM public.judgments j
-        WHERE j.id = %s
-    """
 
-    try:
-        async with pool.cursor() as cur:
-            await cur.execute(query, (judgment_id,))
-            row = await cur.fetchone()
-    except Exception as e:
-        # Handle case where enrichment columns don't exist
-        logger.warning(f"Query failed, trying basic query: {e}")
-        basic_query = """
-            SELECT
-                id,
-                case_number,
-                plaintiff_name,
-                defendant_name,
-                judgment_amount,
-                entry_date,
-                defendant_address,
-                defendant_phone,
-                defendant_email,
-                status,
-                notes
-            FROM public.judgments
-            WHERE id = %s
-        """
-        async with pool.cursor() as cur:
-            await cur.execute(basic_query, (judgment_id,))
-            row = await cur.fetchone()
+def _context_query(where: str, enrichment: bool = True) -> str:
+    columns = _CONTEXT_COLUMNS + (_ENRICHMENT_COLUMNS if enrichment else "")
+    return f"SELECT {columns} FROM public.judgments j WHERE {where}"
 
-    if row is None:
-        raise PacketError(f"Judgment {judgment_id} not found")
 
-    # Build context dict
-    # Note: Column order matches query above
+def _context_from_row(row: Any, interest_rate_percent: float) -> dict[str, Any]:
+    """Build the template context from a judgment row (full or basic query)."""
+    # Note: Column order matches _context_query()
     if len(row) >= 15:
         # Full query with enrichment
         (
@@ -178,9 +157,6 @@ async def load_judgment_context(judgment_id: int) -> dict[str, Any]:
 
     judgment_amount_decimal = Decimal(str(judgment_amount)) if judgment_amount else Decimal("0")
 
-    # Get interest rate from settings
-    settings = get_settings()
-
     return {
         "judgment_id": id_,
         "case_number": case_number or "",
@@ -203,10 +179,87 @@ async def load_judgment_context(judgment_id: int) -> dict[str, Any]:
         "bank_address": bank_address or "",
         # Interest rate from config
         # NOTE: Confirm NY post-judgment rate with counsel (CPLR 5004)
-        "interest_rate_percent": settings.ny_interest_rate_percent,
+        "interest_rate_percent": interest_rate_percent,
     }
 
 
+async def load_judgment_context(judgment_id: int) -> dict[str, Any]:
+    """
+    Load judgment data and build a context dict for template rendering.
+
+    Fetches from public.judgments and joins enrichment data if available.
+
+    Args:
+        judgment_id: The judgment ID to load
+
+    Returns:
+        Context dict with all template fields
+
+    Raises:
+        PacketError: If judgment not found or query fails
+    """
+    pool = await get_pool()
+    if pool is None:
+        raise PacketError("Database connection not available")
+
+    try:
+        async with pool.cursor() as cur:
+            await cur.execute(_context_query("j.id = %s"), (judgment_id,))
+            row = await cur.fetchone()
+    except Exception as e:
+        # Handle case where enrichment columns don't exist
+        logger.warning(f"Query failed, trying basic query: {e}")
+        async with pool.cursor() as cur:
+            await cur.execute(_context_query("j.id = %s", enrichment=False), (judgment_id,))
+            row = await cur.fetchone()
+
+    if row is None:
+        raise PacketError(f"Judgment {judgment_id} not found")
+
+    # Get interest rate from settings
+    settings = get_settings()
+    return _context_from_row(row, settings.ny_interest_rate_percent)
+
+
+async def load_judgment_contexts(judgment_ids: list[int]) -> dict[int, dict[str, Any]]:
+    """
+    Load template contexts for many judgments with a single query.
+
+    Args:
+        judgment_ids: Judgment IDs to load
+
+    Returns:
+        Context dicts keyed by judgment ID (missing judgments are absent)
+
+    Raises:
+        PacketError: If the database is unavailable
+    """
+    if not judgment_ids:
+        return {}
+
+    pool = await get_pool()
+    if pool is None:
+        raise PacketError("Database connection not available")
+
+    ids = list(judgment_ids)
+    async with pool.connection() as conn:
+        try:
+            async with conn.cursor() as cur:
+                await cur.execute(_context_query("j.id = ANY(%s)"), (ids,))
+                rows = await cur.fetchall()
+        except Exception as e:
+            # Handle case where enrichment columns don't exist
+            logger.warning(f"Batch query failed, trying basic query: {e}")
+            await conn.rollback()
+            async with conn.cursor() as cur:
+                await cur.execute(_context_query("j.id = ANY(%s)", enrichment=False), (ids,))
+                rows = await cur.fetchall()
+
+    settings = get_settings()
+    contexts = (_context_from_row(row, settings.ny_interest_rate_percent) for row in rows)
+    return {context["judgment_id"]: context for context in contexts}
+
+
 def calculate_interest(
     judgment_amount: Decimal,
     judgment_date: Optional[date],
@@ -272,7 +325,6 @@ def _emit_event_best_effort(
     This hooks into our event stream for tracking and automation.
     Uses asyncio.create_task to run async emission in the background.
     """
-    import asyncio
 
     async def _emit():
         try:
@@ -310,7 +362,107 @@ def _emit_event_best_effort(
 
 
 # =============================================================================
-# Core Function
+# Rendering & Upload
+# =============================================================================
+
+
+def _template_path(packet_type: str) -> Path:
+    """Validate packet_type and return its template path."""
+    if packet_type not in PACKET_TYPES:
+        raise PacketError(
+            f"Invalid packet type: {packet_type}. Valid types: {list(PACKET_TYPES.keys())}"
+        )
+
+    template_path = TEMPLATES_DIR / PACKET_TYPES[packet_type]
+    if not template_path.exists():
+        raise PacketError(
+            f"Template not found: {template_path}. Please ensure the template file exists."
+        )
+    return template_path
+
+
+def _add_generated_fields(context: dict[str, Any]) -> dict[str, Any]:
+    """Add interest and generation timestamps to a judgment context."""
+    interest_data = calculate_interest(
+        judgment_amount=context["judgment_amount"],
+        judgment_date=context["judgment_date"],
+        annual_rate=Decimal(str(context["interest_rate_percent"])),
+    )
+    context.update(interest_data)
+
+    context["generated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    context["generated_date"] = date.today().strftime("%m/%d/%Y")
+    return context
+
+
+def _upload_packet(bucket_name: str, storage_path: str, file_bytes: bytes) -> str:
+    """
+    Upload rendered packet bytes and return a signed (or public) URL.
+
+    Blocking (sync Supabase client); call via asyncio.to_thread.
+    """
+    supabase = get_supabase_client()
+
+    supabase.storage.from_(bucket_name).upload(
+        path=storage_path,
+        file=file_bytes,
+        file_options={"content-type": DOCX_CONTENT_TYPE},
+    )
+
+    # Generate signed URL (1 hour expiry)
+    signed_url_response = supabase.storage.from_(bucket_name).create_signed_url(
+        path=storage_path,
+        expires_in=3600,  # 1 hour
+    )
+
+    if signed_url_response and "signedURL" in signed_url_response:
+        return signed_url_response["signedURL"]
+    # Fallback to public URL if signed URL fails
+    return supabase.storage.from_(bucket_name).get_public_url(storage_path)
+
+
+async def _render_and_upload(
+    judgment_id: int,
+    packet_type: str,
+    template_path: Path,
+    context: dict[str, Any],
+) -> str:
+    """Render a packet in the render pool and upload it straight from memory."""
+    file_bytes = await get_packet_renderer().render(template_path, context)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    storage_path = f"{packet_type}/judgment_{judgment_id}_{timestamp}.docx"
+    bucket_name = get_settings().legal_packet_bucket
+
+    try:
+        packet_url = await asyncio.to_thread(_upload_packet, bucket_name, storage_path, file_bytes)
+    except Exception as e:
+        logger.error(
+            "Failed to upload packet to storage",
+            extra={
+                "judgment_id": judgment_id,
+                "packet_type": packet_type,
+                "error": str(e),
+            },
+        )
+        raise PacketError(f"Failed to upload document: {str(e)}")
+
+    logger.info(
+        f"Packet uploaded successfully: {storage_path}",
+        extra={
+            "judgment_id": judgment_id,
+            "packet_type": packet_type,
+            "storage_path": storage_path,
+        },
+    )
+
+    # Emit event (best-effort)
+    _emit_event_best_effort(judgment_id, packet_type, packet_url)
+    return packet_url
+
+
+# =============================================================================
+# Core Functions
 # =============================================================================
 
 
@@ -324,7 +476,7 @@ async def generate_packet(
     1. Validates packet_type
     2. Loads judgment context from database
     3. Calculates interest
-    4. Renders DOCX template
+    4. Renders DOCX template (render process pool, in memory)
     5. Uploads to Supabase Storage
     6. Returns signed/public URL
 
@@ -338,19 +490,7 @@ async def generate_packet(
     Raises:
         PacketError: If generation fails for any reason
     """
-    # Validate packet type
-    if packet_type not in PACKET_TYPES:
-        raise PacketError(
-            f"Invalid packet type: {packet_type}. Valid types: {list(PACKET_TYPES.keys())}"
-        )
-
-    template_filename = PACKET_TYPES[packet_type]
-    template_path = TEMPLATES_DIR / template_filename
-
-    if not template_path.exists():
-        raise PacketError(
-            f"Template not found: {template_path}. Please ensure the template file exists."
-        )
+    template_path = _template_path(packet_type)
 
     logger.info(
         f"Generating {packet_type} packet for judgment {judgment_id}",
@@ -358,97 +498,8 @@ async def generate_packet(
     )
 
     try:
-        # Load judgment data
-        context = await load_judgment_context(judgment_id)
-
-        # Calculate interest
-        interest_data = calculate_interest(
-            judgment_amount=context["judgment_amount"],
-            judgment_date=context["judgment_date"],
-            annual_rate=Decimal(str(context["interest_rate_percent"])),
-        )
-        context.update(interest_data)
-
-        # Add generation timestamp
-        context["generated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        context["generated_date"] = date.today().strftime("%m/%d/%Y")
-
-        # Render template
-        doc = DocxTemplate(template_path)
-        doc.render(context)
-
-        # Write to temp file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_filename = f"judgment_{judgment_id}_{timestamp}.docx"
-
-        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp_file:
-            doc.save(tmp_file.name)
-            tmp_path = tmp_file.name
-
-        # Upload to Supabase Storage
-        settings = get_settings()
-        bucket_name = settings.legal_packet_bucket
-        storage_path = f"{packet_type}/{output_filename}"
-
-        try:
-            supabase = get_supabase_client()
-
-            # Read the file bytes
-            with open(tmp_path, "rb") as f:
-                file_bytes = f.read()
-
-            # Upload to storage
-            supabase.storage.from_(bucket_name).upload(
-                path=storage_path,
-                file=file_bytes,
-                file_options={
-                    "content-type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                },
-            )
-
-            # Generate signed URL (1 hour expiry)
-            signed_url_response = supabase.storage.from_(bucket_name).create_signed_url(
-                path=storage_path,
-                expires_in=3600,  # 1 hour
-            )
-
-            if signed_url_response and "signedURL" in signed_url_response:
-                packet_url = signed_url_response["signedURL"]
-            else:
-                # Fallback to public URL if signed URL fails
-                packet_url = supabase.storage.from_(bucket_name).get_public_url(storage_path)
-
-            logger.info(
-                f"Packet uploaded successfully: {storage_path}",
-                extra={
-                    "judgment_id": judgment_id,
-                    "packet_type": packet_type,
-                    "storage_path": storage_path,
-                },
-            )
-
-        except Exception as e:
-            logger.error(
-                "Failed to upload packet to storage",
-                extra={
-                    "judgment_id": judgment_id,
-                    "packet_type": packet_type,
-                    "error": str(e),
-                },
-            )
-            raise PacketError(f"Failed to upload document: {str(e)}")
-
-        finally:
-            # Clean up temp file
-            try:
-                Path(tmp_path).unlink()
-            except Exception:
-                pass
-
-        # Emit event (best-effort)
-        _emit_event_best_effort(judgment_id, packet_type, packet_url)
-
-        return packet_url
+        context = _add_generated_fields(await load_judgment_context(judgment_id))
+        return await _render_and_upload(judgment_id, packet_type, template_path, context)
 
     except PacketError:
         raise
@@ -462,3 +513,64 @@ async def generate_packet(
             },
         )
         raise PacketError(f"Packet generation failed: {str(e)}")
+
+
+async def generate_packets(
+    judgment_ids: list[int],
+    packet_type: Literal["income_execution_ny", "info_subpoena_ny"],
+    *,
+    concurrency: int = PACKET_BATCH_CONCURRENCY,
+) -> list[PacketResult]:
+    """
+    Generate the same packet type for many judgments.
+
+    Contexts are loaded with one query, documents render in the render
+    process pool and uploads run concurrently (at most ``concurrency``
+    packets in flight). A failure for one judgment does not stop the batch.
+
+    Args:
+        judgment_ids: Judgment IDs (duplicates are generated once)
+        packet_type: Type of packet (income_execution_ny, info_subpoena_ny)
+        concurrency: Maximum packets rendering/uploading at once
+
+    Returns:
+        One PacketResult per unique judgment ID, in input order
+
+    Raises:
+        PacketError: If packet_type is invalid or contexts cannot be loaded
+    """
+    template_path = _template_path(packet_type)
+    ids = list(dict.fromkeys(judgment_ids))
+
+    logger.info(
+        f"Generating {packet_type} packets for {len(ids)} judgments",
+        extra={"packet_type": packet_type, "count": len(ids)},
+    )
+
+    contexts = await load_judgment_contexts(ids)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(judgment_id: int) -> PacketResult:
+        context = contexts.get(judgment_id)
+        if context is None:
+            return PacketResult(judgment_id, error=f"Judgment {judgment_id} not found")
+        async with semaphore:
+            try:
+                _add_generated_fields(context)
+                url = await _render_and_upload(judgment_id, packet_type, template_path, context)
+                return PacketResult(judgment_id, packet_url=url)
+            except Exception as e:
+                logger.warning(
+                    f"Packet generation failed for judgment {judgment_id}: {e}",
+                    extra={"judgment_id": judgment_id, "packet_type": packet_type},
+                )
+                return PacketResult(judgment_id, error=str(e))
+
+    results = await asyncio.gather(*(_one(judgment_id) for judgment_id in ids))
+
+    succeeded = sum(1 for r in results if r.ok)
+    logger.info(
+        f"Generated {succeeded}/{len(results)} {packet_type} packets",
+        extra={"packet_type": packet_type, "succeeded": succeeded, "count": len(results)},
+    )
+    return list(results)
@@ -0,0 +1,192 @@
+"""
+Dragonfly Engine - Portfolio Rollups
+
+Reads the incrementally maintained portfolio aggregates in
+analytics.portfolio_rollups (judgment counts, amount sums and active counts
+by status, tier, enforcement stage and pool) and reconciles them against a
+full scan of public.judgments.
+
+The rollups are kept current by statement-level triggers on public.judgments
+(20261113_portfolio_rollups.sql). Each writing transaction adds its deltas to
+one of several shard rows per bucket, and the analytics.portfolio_rollups view
+sums them (20261119_portfolio_rollup_shards.sql). Analytics endpoints read a
+few hundred rows at most, whatever the portfolio size. Reconciliation runs
+nightly from the scheduler and corrects the rollups if they drifted.
+
+Usage:
+    from backend.services.portfolio_rollups import fetch_portfolio_rollups
+
+    rollups = await fetch_portfolio_rollups()
+    rollups.total_count, rollups.total_amount, rollups.active_count
+    rollups.counts("tier")   # {"A": 312, "B": 445, "unassigned": 45}
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Correct rollups when nightly reconciliation finds drift
+PORTFOLIO_ROLLUP_AUTO_REPAIR = os.getenv("PORTFOLIO_ROLLUP_AUTO_REPAIR", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+DIMENSIONS = ("status", "tier", "stage", "pool")
+
+_FETCH_SQL = """
+    SELECT dimension, bucket, judgment_count, amount_sum, active_count, updated_at
+    FROM public.portfolio_rollup_metrics()
+"""
+
+_REPEATABLE_READ_SQL = "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"
+_RECONCILE_SQL = "SELECT * FROM analytics.reconcile_portfolio_rollups($1)"
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RollupBucket:
+    """Aggregates for one (dimension, bucket) pair."""
+
+    judgment_count: int
+    amount_sum: float
+    active_count: int
+
+
+@dataclass
+class PortfolioRollups:
+    """All portfolio rollups, keyed by dimension then bucket."""
+
+    total_count: int = 0
+    total_amount: float = 0.0
+    active_count: int = 0
+    buckets: dict[str, dict[str, RollupBucket]] = field(default_factory=dict)
+    updated_at: Optional[datetime] = None
+
+    def counts(self, dimension: str) -> dict[str, int]:
+        return {k: b.judgment_count for k, b in self.buckets.get(dimension, {}).items()}
+
+    def amounts(self, dimension: str) -> dict[str, float]:
+        return {k: b.amount_sum for k, b in self.buckets.get(dimension, {}).items()}
+
+
+@dataclass(frozen=True)
+class RollupDrift:
+    """A bucket where the rollup disagrees with a full scan."""
+
+    dimension: str
+    bucket: str
+    expected_count: int
+    actual_count: int
+    expected_amount: float
+    actual_amount: float
+    expected_active: int
+    actual_active: int
+
+
+def _to_float(value: Any) -> float:
+    return round(float(value), 2) if value is not None else 0.0
+
+
+def rollups_from_rows(rows: Iterable[dict[str, Any]]) -> PortfolioRollups:
+    """Build PortfolioRollups from public.portfolio_rollup_metrics() rows."""
+    rollups = PortfolioRollups()
+    for row in rows:
+        bucket = RollupBucket(
+            judgment_count=int(row.get("judgment_count") or 0),
+            amount_sum=_to_float(row.get("amount_sum")),
+            active_count=int(row.get("active_count") or 0),
+        )
+        dimension = row["dimension"]
+        if dimension == "total":
+            rollups.total_count = bucket.judgment_count
+            rollups.total_amount = bucket.amount_sum
+            rollups.active_count = bucket.active_count
+        else:
+            rollups.buckets.setdefault(dimension, {})[row["bucket"]] = bucket
+        updated_at = row.get("updated_at")
+        if updated_at is not None:
+            rollups.updated_at = max(updated_at, rollups.updated_at or updated_at)
+    return rollups
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+
+async def fetch_portfolio_rollups() -> PortfolioRollups:
+    """Read all rollup rows (one small indexed table, independent of portfolio size)."""
+    from ..db import get_connection
+
+    async with get_connection() as conn:
+        rows = await conn.fetch(_FETCH_SQL)
+    return rollups_from_rows(rows)
+
+
+async def reconcile_portfolio_rollups(repair: bool = False) -> list[RollupDrift]:
+    """
+    Compare rollups against a full scan of public.judgments.
+
+    Both reads share one REPEATABLE READ snapshot, so judgments written while
+    the scan runs are not reported as drift. Returns the buckets that
+    disagree (empty when consistent). With ``repair`` the difference is added
+    to the rollups as a correction delta, without blocking judgment writes.
+    """
+    from ..db import get_connection
+
+    async with get_connection() as conn:
+        async with conn.transaction():
+            # Must be the transaction's first statement to take effect
+            await conn.execute(_REPEATABLE_READ_SQL)
+            rows = await conn.fetch(_RECONCILE_SQL, repair)
+    return [
+        RollupDrift(
+            dimension=row["dimension"],
+            bucket=row["bucket"],
+            expected_count=int(row["expected_count"]),
+            actual_count=int(row["actual_count"]),
+            expected_amount=_to_float(row["expected_amount"]),
+            actual_amount=_to_float(row["actual_amount"]),
+            expected_active=int(row["expected_active"]),
+            actual_active=int(row["actual_active"]),
+        )
+        for row in rows
+    ]
+
+
+async def run_rollup_reconciliation(auto_repair: bool = PORTFOLIO_ROLLUP_AUTO_REPAIR) -> int:
+    """
+    Nightly check: verify first (read-only), rebuild only if drift was found.
+
+    Returns the number of drifted buckets.
+    """
+    drift = await reconcile_portfolio_rollups(repair=False)
+    if not drift:
+        logger.info("Portfolio rollups consistent with judgments")
+        return 0
+
+    for d in drift[:10]:
+        logger.warning(
+            "Portfolio rollup drift %s=%s: count %d vs %d, amount %.2f vs %.2f",
+            d.dimension,
+            d.bucket,
+            d.actual_count,
+            d.expected_count,
+            d.actual_amount,
+            d.expected_amount,
+        )
+    if auto_repair:
+        await reconcile_portfolio_rollups(repair=True)
+        logger.warning("Portfolio rollups corrected (%d buckets drifted)", len(drift))
+    return len(drift)
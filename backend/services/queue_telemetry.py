@@ -0,0 +1,270 @@
+"""
+Dragonfly Engine - Queue Telemetry and Scaling Signals
+
+Records per-queue samples (pgmq depth, cumulative enqueued/drained counts,
+active workers) into workers.queue_samples and derives scaling signals from
+the history:
+
+- arrival rate: messages enqueued per minute
+- drain rate: jobs finished (completed + failed) per minute
+- backlog ETA: seconds until the current backlog is gone at the net rate
+- recommended replicas: workers needed to absorb arrivals and clear the
+  backlog within QUEUE_TARGET_DRAIN_SECONDS, from observed per-worker rate
+
+Counters in the table are cumulative, so a rate over a window is just the
+difference between its first and last sample; the table can be thinned to
+hourly without changing long-window rates.
+
+Usage:
+    from backend.services.queue_telemetry import queue_sampler, load_queue_forecasts
+
+    queue_sampler.sample(conn)                  # platform watchdog, each iteration
+    forecasts = await load_queue_forecasts(conn) # /api/v1/metrics/queues/forecast
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
+
+from psycopg.rows import dict_row
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+QUEUE_TELEMETRY_WINDOW_MINUTES = int(os.getenv("QUEUE_TELEMETRY_WINDOW_MINUTES", "15"))
+QUEUE_TARGET_DRAIN_SECONDS = int(os.getenv("QUEUE_TARGET_DRAIN_SECONDS", "300"))
+QUEUE_MAX_REPLICAS = int(os.getenv("QUEUE_MAX_REPLICAS", "20"))
+QUEUE_SCALING_HEADROOM = float(os.getenv("QUEUE_SCALING_HEADROOM", "0.2"))
+
+# Raw samples older than this are thinned to hourly; older than keep are dropped
+QUEUE_SAMPLES_RAW_DAYS = int(os.getenv("QUEUE_SAMPLES_RAW_DAYS", "7"))
+QUEUE_SAMPLES_KEEP_DAYS = int(os.getenv("QUEUE_SAMPLES_KEEP_DAYS", "90"))
+DOWNSAMPLE_INTERVAL_S = 3600.0
+
+
+# ---------------------------------------------------------------------------
+# Data
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class QueueSample:
+    """One row of workers.queue_samples."""
+
+    queue_name: str
+    sampled_at: datetime
+    queue_length: int
+    oldest_msg_age_sec: Optional[int]
+    enqueued_total: int
+    drained_total: int
+    active_workers: int
+
+
+@dataclass
+class QueueForecast:
+    """Scaling signals for one queue over a sample window."""
+
+    queue_name: str
+    window_seconds: float
+    samples: int
+    queue_length: int
+    oldest_msg_age_sec: Optional[int]
+    active_workers: int
+    arrival_per_min: float
+    drain_per_min: float
+    per_worker_per_min: Optional[float]
+    backlog_eta_seconds: Optional[float]
+    trend: str
+    recommended_replicas: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+# ---------------------------------------------------------------------------
+# Forecast math
+# ---------------------------------------------------------------------------
+
+
+def forecast_queue(
+    samples: list[QueueSample],
+    *,
+    target_drain_seconds: int = QUEUE_TARGET_DRAIN_SECONDS,
+    max_replicas: int = QUEUE_MAX_REPLICAS,
+    headroom: float = QUEUE_SCALING_HEADROOM,
+) -> Optional[QueueForecast]:
+    """
+    Compute scaling signals from one queue's samples (oldest first).
+
+    Returns None when fewer than two samples span a non-zero interval.
+    Counter resets (drained_total going backwards after a metrics reset)
+    are treated as zero throughput rather than negative.
+    """
+    if len(samples) < 2:
+        return None
+    first, last = samples[0], samples[-1]
+    window = (last.sampled_at - first.sampled_at).total_seconds()
+    if window <= 0:
+        return None
+
+    arrival = max(0.0, (last.enqueued_total - first.enqueued_total) / window)
+    drain = max(0.0, (last.drained_total - first.drained_total) / window)
+    avg_workers = sum(s.active_workers for s in samples) / len(samples)
+    per_worker = drain / avg_workers if drain > 0 and avg_workers > 0 else None
+
+    backlog = last.queue_length
+    net = drain - arrival
+    if backlog == 0:
+        eta: Optional[float] = 0.0
+    elif net > 0:
+        eta = backlog / net
+    else:
+        eta = None  # not draining: backlog steady or growing
+
+    if net > 0 and backlog > 0:
+        trend = "draining"
+    elif arrival > drain or backlog > first.queue_length:
+        trend = "growing"
+    else:
+        trend = "steady"
+
+    needs_workers = arrival > 0 or backlog > 0
+    if per_worker is None:
+        # No observed throughput to size from: keep what runs (at least one) if there is work
+        replicas = max(last.active_workers, 1) if needs_workers else 0
+    else:
+        required = arrival + backlog / max(target_drain_seconds, 1)
+        replicas = math.ceil(required * (1 + headroom) / per_worker) if required > 0 else 0
+        replicas = max(replicas, 1 if needs_workers else 0)
+    replicas = min(replicas, max_replicas)
+
+    return QueueForecast(
+        queue_name=last.queue_name,
+        window_seconds=window,
+        samples=len(samples),
+        queue_length=backlog,
+        oldest_msg_age_sec=last.oldest_msg_age_sec,
+        active_workers=last.active_workers,
+        arrival_per_min=round(arrival * 60, 2),
+        drain_per_min=round(drain * 60, 2),
+        per_worker_per_min=round(per_worker * 60, 2) if per_worker is not None else None,
+        backlog_eta_seconds=round(eta, 1) if eta is not None else None,
+        trend=trend,
+        recommended_replicas=replicas,
+    )
+
+
+def forecast_all(samples: Iterable[QueueSample], **kwargs: Any) -> list[QueueForecast]:
+    """Group samples by queue (input ordered by queue, time) and forecast each."""
+    by_queue: dict[str, list[QueueSample]] = {}
+    for sample in samples:
+        by_queue.setdefault(sample.queue_name, []).append(sample)
+    forecasts = (forecast_queue(rows, **kwargs) for rows in by_queue.values())
+    return [f for f in forecasts if f is not None]
+
+
+# ---------------------------------------------------------------------------
+# Sampling (sync, platform watchdog)
+# ---------------------------------------------------------------------------
+
+
+def _scalar(row: Any) -> int:
+    """First column of a tuple or dict row (the watchdog connection uses dict_row)."""
+    if not row:
+        return 0
+    value = next(iter(row.values())) if isinstance(row, dict) else row[0]
+    return int(value or 0)
+
+
+def record_queue_samples(conn: Any) -> int:
+    """Write one sample per pgmq queue. Returns the number of rows written."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT workers.record_queue_samples()")
+        row = cur.fetchone()
+    return _scalar(row)
+
+
+def downsample_queue_samples(
+    conn: Any,
+    raw_days: int = QUEUE_SAMPLES_RAW_DAYS,
+    keep_days: int = QUEUE_SAMPLES_KEEP_DAYS,
+) -> int:
+    """Thin old samples to hourly and expire very old ones. Returns rows deleted."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT workers.downsample_queue_samples(%s, %s)", (raw_days, keep_days))
+        row = cur.fetchone()
+    return _scalar(row)
+
+
+class QueueTelemetrySampler:
+    """Records samples on every call and downsamples at most once per interval."""
+
+    def __init__(
+        self,
+        downsample_interval: float = DOWNSAMPLE_INTERVAL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.downsample_interval = downsample_interval
+        self._clock = clock
+        self._last_downsample: Optional[float] = None
+
+    def sample(self, conn: Any) -> int:
+        """Record a sample for every queue; never raises (telemetry is best-effort)."""
+        try:
+            written = record_queue_samples(conn)
+            now = self._clock()
+            if (
+                self._last_downsample is None
+                or now - self._last_downsample >= self.downsample_interval
+            ):
+                self._last_downsample = now
+                removed = downsample_queue_samples(conn)
+                if removed:
+                    logger.info("Queue telemetry downsampled: %d rows removed", removed)
+            return written
+        except Exception as e:
+            logger.warning("Queue telemetry sample failed: %s", e)
+            return 0
+
+
+queue_sampler = QueueTelemetrySampler()
+
+
+# ---------------------------------------------------------------------------
+# Reading (async, API)
+# ---------------------------------------------------------------------------
+
+
+async def load_queue_samples(conn: Any, window_minutes: int) -> list[QueueSample]:
+    """Load samples for all queues in the trailing window, ordered by queue, time."""
+    async with conn.cursor(row_factory=dict_row) as cur:
+        await cur.execute(
+            """
+            SELECT queue_name, sampled_at, queue_length, oldest_msg_age_sec,
+                   enqueued_total, drained_total, active_workers
+            FROM workers.queue_samples
+            WHERE sampled_at > now() - make_interval(mins => %s)
+            ORDER BY queue_name, sampled_at
+            """,
+            (window_minutes,),
+        )
+        rows = await cur.fetchall()
+    return [QueueSample(**row) for row in rows]
+
+
+async def load_queue_forecasts(
+    conn: Any,
+    window_minutes: int = QUEUE_TELEMETRY_WINDOW_MINUTES,
+    **kwargs: Any,
+) -> list[QueueForecast]:
+    """Forecast every queue with samples in the trailing window."""
+    return forecast_all(await load_queue_samples(conn, window_minutes), **kwargs)
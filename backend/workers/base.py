@@ -11,7 +11,8 @@ Features:
 - Automatic idempotency via workers.processed_jobs registry
 - Dead letter queue (DLQ) handling for poison messages
 - Heartbeat reporting to workers.heartbeats
-- Performance metrics to workers.metrics
+- Performance metrics to workers.metrics, aggregated in process and flushed
+  with the heartbeat over a long-lived side connection
 - Configurable visibility timeout and batch size
 - Graceful shutdown with signal handling
 - Structured logging with job context
@@ -67,10 +68,12 @@ from psycopg.rows import dict_row
 from backend.middleware.version import ENV_NAME, GIT_SHA_SHORT
 from backend.workers.db_connect import (
     EXIT_CODE_DB_UNAVAILABLE,
+    RetryConfig,
     connect_with_retry,
     get_safe_application_name,
 )
 from backend.workers.envelope import InvalidEnvelopeError, JobEnvelope
+from backend.workers.metrics import APPLY_METRICS_DELTA_SQL, QueueMetricsAggregator
 
 if TYPE_CHECKING:
     from psycopg import Connection
@@ -89,6 +92,9 @@ DEFAULT_MAX_RETRIES = 3  # retries before DLQ
 DEFAULT_SHUTDOWN_TIMEOUT = 30  # seconds to wait for graceful shutdown
 DEFAULT_HEARTBEAT_INTERVAL = 30  # seconds between heartbeats
 
+# Heartbeat side connection: fail fast, the next interval retries
+SIDE_CONNECTION_RETRY = RetryConfig(initial_delay=0.5, max_delay=5.0, max_attempts=3)
+
 # Dead letter queue name
 DLQ_QUEUE_NAME = "q_dead_letter"
 
@@ -232,10 +238,15 @@ class BaseWorker(ABC):
         self._jobs_skipped = 0
         self._jobs_invalid = 0  # Invalid envelope count
 
-        # Heartbeat thread
+        # Queue metrics, aggregated here and flushed with each heartbeat
+        self._metrics = QueueMetricsAggregator(self.queue_name)
+
+        # Heartbeat thread and its long-lived side connection
         self._heartbeat_thread: threading.Thread | None = None
         self._heartbeat_stop_event = threading.Event()
         self._worker_status: str = "starting"
+        self._side_conn: Connection | None = None
+        self._side_conn_lock = threading.Lock()
 
         # Worker metadata
         self._hostname = platform.node()
@@ -439,9 +450,16 @@ class BaseWorker(ABC):
             self._heartbeat_stop_event.wait(self.heartbeat_interval)
 
     def _send_heartbeat(self) -> None:
-        """Send a single heartbeat update to the database."""
-        try:
-            with self._get_connection() as conn:
+        """
+        Send a heartbeat and flush aggregated metrics in one transaction.
+
+        Uses the long-lived side connection; on failure the connection is
+        dropped (reopened next interval) and the metrics delta is kept.
+        """
+        with self._side_conn_lock:
+            delta = self._metrics.drain()
+            try:
+                conn = self._get_side_connection()
                 with conn.cursor() as cur:
                     cur.execute(
                         """
@@ -467,16 +485,46 @@ class BaseWorker(ABC):
                             ),
                         ),
                     )
+                    if delta is not None:
+                        cur.execute(APPLY_METRICS_DELTA_SQL, delta.as_params())
                 conn.commit()
                 logger.debug(
-                    "Heartbeat sent status=%s processed=%d failed=%d",
+                    "Heartbeat sent status=%s processed=%d failed=%d metrics_jobs=%d",
                     self._worker_status,
                     self._jobs_processed,
                     self._jobs_failed,
+                    (delta.processed + delta.failed) if delta else 0,
                 )
-        except Exception as e:
-            # Don't let heartbeat failures crash the worker
-            logger.warning("Failed to send heartbeat: %s", e)
+            except Exception as e:
+                # Don't let heartbeat failures crash the worker
+                logger.warning("Failed to send heartbeat: %s", e)
+                if delta is not None:
+                    self._metrics.restore(delta)
+                self._close_side_connection()
+
+    def _get_side_connection(self) -> Connection:
+        """Return the heartbeat side connection, opening it if needed."""
+        if self._side_conn is None or self._side_conn.closed:
+            conn = connect_with_retry(
+                dsn=self.db_url,
+                worker_type=f"{self.__class__.__name__}-heartbeat",
+                config=SIDE_CONNECTION_RETRY,
+                exit_on_failure=False,
+                row_factory=dict_row,
+            )
+            if conn is None:
+                raise psycopg.OperationalError("heartbeat side connection unavailable")
+            self._side_conn = conn
+        return self._side_conn
+
+    def _close_side_connection(self) -> None:
+        """Close the heartbeat side connection (reopened lazily)."""
+        conn, self._side_conn = self._side_conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
 
     def _send_final_heartbeat(self) -> None:
         """Send a final 'stopped' heartbeat before shutdown."""
@@ -485,6 +533,9 @@ class BaseWorker(ABC):
             self._send_heartbeat()
         except Exception as e:
             logger.warning("Failed to send final heartbeat: %s", e)
+        finally:
+            with self._side_conn_lock:
+                self._close_side_connection()
 
     # -------------------------------------------------------------------------
     # Metrics Reporting
@@ -492,22 +543,16 @@ class BaseWorker(ABC):
 
     def _update_metrics(
         self,
-        conn: Connection,
         job_id: uuid.UUID,
         latency_ms: int,
         success: bool = True,
     ) -> None:
-        """Update queue metrics after job completion."""
-        try:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT workers.update_metrics(%s, %s, %s, %s)",
-                    (self.queue_name, str(job_id), latency_ms, success),
-                )
-            # Don't commit here - let the caller handle transaction
-        except Exception as e:
-            # Metrics update failure should not affect job processing
-            logger.warning("Failed to update metrics: %s", e)
+        """
+        Record queue metrics after job completion.
+
+        In-memory only; the heartbeat flushes the aggregate to workers.metrics.
+        """
+        self._metrics.record(job_id, latency_ms, success)
 
     # -------------------------------------------------------------------------
     # Database Connection
@@ -830,11 +875,11 @@ class BaseWorker(ABC):
             # Step 5: Mark as completed and archive
             self._complete_job(conn, idempotency_key, result)
             self._archive_message(conn, msg.msg_id)
+            conn.commit()
             self._jobs_processed += 1
 
-            # Step 6: Update queue metrics
-            self._update_metrics(conn, envelope.job_id, latency_ms, success=True)
-            conn.commit()
+            # Step 6: Record queue metrics (flushed with the heartbeat)
+            self._update_metrics(envelope.job_id, latency_ms, success=True)
 
             logger.info(
                 "Completed job job_id=%s key=%s latency=%dms",
@@ -861,8 +906,8 @@ class BaseWorker(ABC):
             self._fail_job(conn, idempotency_key, error_message)
             self._jobs_failed += 1
 
-            # Update metrics for failure
-            self._update_metrics(conn, envelope.job_id, latency_ms, success=False)
+            # Record metrics for failure (flushed with the heartbeat)
+            self._update_metrics(envelope.job_id, latency_ms, success=False)
 
             # Check if we should move to DLQ
             attempt_count = self._get_attempt_count(conn, idempotency_key)
@@ -1024,6 +1069,7 @@ class BaseWorker(ABC):
 
     def get_stats(self) -> dict[str, Any]:
         """Get worker statistics."""
+        pending = self._metrics.pending()
         return {
             "worker_id": str(self.worker_id),
             "queue_name": self.queue_name,
@@ -1035,6 +1081,7 @@ class BaseWorker(ABC):
             "jobs_failed": self._jobs_failed,
             "jobs_skipped": self._jobs_skipped,
             "jobs_invalid": self._jobs_invalid,
+            "metrics_pending": pending.processed + pending.failed,
             "shutdown_requested": self._shutdown_requested,
         }
 
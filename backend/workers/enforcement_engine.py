@@ -10,6 +10,8 @@ Architecture:
 - Uses FOR UPDATE SKIP LOCKED for safe concurrent dequeue
 - Transactional job state management
 - Idempotent design (can safely retry failed jobs)
+- Deterministic enforcement_strategy jobs are claimed and evaluated in
+  batches (one intelligence query and one plan insert per batch)
 - Structured logging with correlation IDs
 - Logs activity to ops.intake_logs for observability
 
@@ -50,6 +52,7 @@ from psycopg.rows import dict_row
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from backend.core.logging import configure_worker_logging
+from backend.workers.bootstrap import WorkerBootstrap, WorkerConfig
 from backend.workers.rpc_client import RPCClient
 from src.core_config import log_startup_diagnostics
 from src.supabase_client import get_supabase_db_url, get_supabase_env
@@ -61,6 +64,12 @@ logger = configure_worker_logging("enforcement_engine")
 POLL_INTERVAL_SECONDS = 5.0
 LOCK_TIMEOUT_MINUTES = 30
 JOB_TYPES = ("enforcement_strategy", "enforcement_drafting", "enforcement_generate_packet")
+# Max enforcement_strategy jobs claimed and evaluated together (1 disables batching)
+STRATEGY_BATCH_SIZE = max(1, int(os.environ.get("ENFORCEMENT_STRATEGY_BATCH_SIZE", "100")))
+# Retry policy for jobs settled here rather than by WorkerBootstrap (same defaults)
+MAX_JOB_ATTEMPTS = WorkerConfig.max_job_attempts
+RETRY_BASE_BACKOFF_SECONDS = WorkerConfig.base_backoff_seconds
+RETRY_MAX_BACKOFF_SECONDS = WorkerConfig.max_backoff_seconds
 
 
 # =============================================================================
@@ -122,7 +131,7 @@ def run_smart_strategy(conn: psycopg.Connection, judgment_id: str) -> dict[str,
             "success": True,
             "strategy_type": decision.strategy_type.value,
             "strategy_reason": decision.strategy_reason,
-            "plan_id": None,  # Plan ID is generated during persist but not returned
+            "plan_id": decision.plan_id,
             "error_message": None,
         }
     except Exception as e:
@@ -136,6 +145,57 @@ def run_smart_strategy(conn: psycopg.Connection, judgment_id: str) -> dict[str,
         }
 
 
+def run_smart_strategy_batch(
+    conn: psycopg.Connection, judgment_ids: list[str]
+) -> dict[str, dict[str, Any]]:
+    """
+    Execute Smart Strategy for many judgments in one pass.
+
+    Uses SmartStrategy.evaluate_many (one intelligence query, one plan
+    insert). If the batch fails as a whole, each judgment is retried through
+    run_smart_strategy() so one bad id cannot fail its neighbours.
+
+    Args:
+        conn: Active database connection
+        judgment_ids: UUIDs of judgments to process
+
+    Returns:
+        Map of judgment_id → result dict (same shape as run_smart_strategy)
+    """
+    from backend.workers.smart_strategy import SmartStrategy
+
+    logger.info(f"[enforcement_strategy] Running Smart Strategy for {len(judgment_ids)} judgments")
+
+    try:
+        agent = SmartStrategy(conn)
+        # One chunk: a partial commit followed by the per-judgment fallback
+        # would persist some plans twice
+        decisions = agent.evaluate_many(
+            judgment_ids, persist=True, chunk_size=max(1, len(judgment_ids))
+        )
+    except Exception as e:
+        logger.warning(f"[enforcement_strategy] Batch evaluation failed, retrying per job: {e}")
+        conn.rollback()
+        results: dict[str, dict[str, Any]] = {}
+        for judgment_id in judgment_ids:
+            results[judgment_id] = run_smart_strategy(conn, judgment_id)
+            if not results[judgment_id]["success"]:
+                conn.rollback()
+        return results
+
+    # evaluate_many returns decisions in input order
+    return {
+        judgment_id: {
+            "success": True,
+            "strategy_type": decision.strategy_type.value,
+            "strategy_reason": decision.strategy_reason,
+            "plan_id": decision.plan_id,
+            "error_message": None,
+        }
+        for judgment_id, decision in zip(dict.fromkeys(judgment_ids), decisions)
+    }
+
+
 async def run_strategy_pipeline(judgment_id: str) -> dict[str, Any]:
     """
     Execute strategy-only pipeline via Orchestrator (AI-powered).
@@ -274,11 +334,177 @@ async def process_job(conn: psycopg.Connection, job: dict[str, Any]) -> None:
         raise RuntimeError(error_msg)
 
 
+def _job_payload(job: dict[str, Any]) -> dict[str, Any]:
+    payload = job.get("payload") or {}
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except json.JSONDecodeError:
+            payload = {}
+    return payload
+
+
+def is_smart_strategy_job(job: dict[str, Any]) -> bool:
+    """True for enforcement_strategy jobs handled by the deterministic Smart Strategy."""
+    if str(job.get("job_type", "")).strip() != "enforcement_strategy":
+        return False
+    payload = _job_payload(job)
+    return bool(payload.get("judgment_id")) and not payload.get("use_ai_pipeline", False)
+
+
+def process_strategy_batch(
+    conn: psycopg.Connection, jobs: list[dict[str, Any]]
+) -> dict[str, str | None]:
+    """
+    Process a batch of claimed jobs.
+
+    Smart Strategy jobs are evaluated together via run_smart_strategy_batch();
+    any other job goes through process_job() one at a time.
+
+    Returns:
+        Map of job_id → error message (None on success)
+    """
+    smart = [job for job in jobs if is_smart_strategy_job(job)]
+    results: dict[str, str | None] = {}
+
+    if smart:
+        judgment_ids = [str(_job_payload(job)["judgment_id"]) for job in smart]
+        by_judgment = run_smart_strategy_batch(conn, list(dict.fromkeys(judgment_ids)))
+        for job, judgment_id in zip(smart, judgment_ids):
+            result = by_judgment.get(judgment_id)
+            if result is None:
+                results[str(job["id"])] = f"No strategy result for judgment_id={judgment_id}"
+            elif result["success"]:
+                results[str(job["id"])] = None
+            else:
+                results[str(job["id"])] = result.get("error_message") or "Smart Strategy failed"
+
+        log_job_event(
+            conn,
+            None,
+            "INFO",
+            f"Completed {len(smart)} enforcement_strategy jobs in batch",
+            {"job_ids": [str(job["id"]) for job in smart]},
+        )
+
+    for job in jobs:
+        if is_smart_strategy_job(job):
+            continue
+        try:
+            asyncio.run(process_job(conn, job))
+            results[str(job["id"])] = None
+        except Exception as e:
+            logger.exception(f"Job {job['id']} failed: {e}")
+            results[str(job["id"])] = str(e)[:500]
+
+    return results
+
+
+def _retry_backoff_seconds(attempts: int) -> int:
+    """Exponential backoff matching WorkerBootstrap: min(2^attempts * base, max)."""
+    return int(min((2**attempts) * RETRY_BASE_BACKOFF_SECONDS, RETRY_MAX_BACKOFF_SECONDS))
+
+
+def settle_jobs(rpc: RPCClient, jobs: list[dict[str, Any]], results: dict[str, str | None]) -> None:
+    """
+    Settle processed jobs the way WorkerBootstrap settles its own.
+
+    Completed jobs share one status RPC. A failed job below MAX_JOB_ATTEMPTS
+    goes back to pending with exponential backoff (the next claim counts the
+    attempt); at MAX_JOB_ATTEMPTS it moves to the DLQ ('failed'), one RPC per
+    distinct error.
+    """
+    attempts_by_id = {str(job["id"]): job.get("attempts") or 1 for job in jobs}
+    completed = [job_id for job_id, error in results.items() if error is None]
+    rpc.update_job_statuses(completed, "completed")
+
+    dlq_by_error: dict[str, list[str]] = {}
+    for job_id, error in results.items():
+        if error is None:
+            continue
+        attempts = attempts_by_id.get(job_id, 1)
+        if attempts >= MAX_JOB_ATTEMPTS:
+            message = f"[DLQ] Max attempts ({attempts}) exceeded: {error[:500]}"
+            dlq_by_error.setdefault(message, []).append(job_id)
+            continue
+
+        backoff_seconds = _retry_backoff_seconds(attempts)
+        try:
+            rpc.update_job_status(
+                job_id=job_id,
+                status="pending",
+                error_message=(
+                    f"Retry scheduled (attempt {attempts}/{MAX_JOB_ATTEMPTS}): {error[:500]}"
+                ),
+                backoff_seconds=backoff_seconds,
+            )
+            logger.info(
+                f"Job {job_id} scheduled for retry in {backoff_seconds}s "
+                f"(attempt {attempts}/{MAX_JOB_ATTEMPTS})"
+            )
+        except Exception as e:
+            # Left in processing; the stale job reaper picks it up after lock timeout
+            logger.error(f"Failed to schedule retry for job {job_id}: {e}")
+
+    for message, job_ids in dlq_by_error.items():
+        rpc.update_job_statuses(job_ids, "failed", error_message=message)
+        logger.warning(f"Jobs {job_ids} moved to DLQ: {message}")
+
+
+def claim_strategy_jobs(
+    conn: psycopg.Connection, limit: int, worker_id: str | None = None
+) -> list[dict[str, Any]]:
+    """Claim up to ``limit`` pending enforcement_strategy jobs in one RPC."""
+    if limit <= 0:
+        return []
+    claimed = RPCClient(conn).claim_pending_jobs(
+        job_types=["enforcement_strategy"],
+        limit=limit,
+        lock_timeout_minutes=LOCK_TIMEOUT_MINUTES,
+        worker_id=worker_id,
+    )
+    return [
+        {
+            "id": job.job_id,
+            "job_type": job.job_type,
+            "payload": job.payload,
+            "attempts": job.attempts,
+        }
+        for job in claimed
+    ]
+
+
+def _default_worker_id(prefix: str) -> str:
+    import socket
+
+    return f"{prefix}_{socket.gethostname()}_{os.getpid()}"
+
+
 # =============================================================================
 # Main Worker Loop
 # =============================================================================
 
 
+def run_strategy_batch(
+    conn: psycopg.Connection,
+    worker_id: str | None = None,
+    batch_size: int = STRATEGY_BATCH_SIZE,
+) -> int:
+    """
+    Claim and process up to ``batch_size`` enforcement_strategy jobs.
+
+    Returns:
+        Number of jobs processed (0 if none available)
+    """
+    jobs = claim_strategy_jobs(conn, batch_size, worker_id or _default_worker_id("enforcement"))
+    if not jobs:
+        return 0
+
+    results = process_strategy_batch(conn, jobs)
+    settle_jobs(RPCClient(conn), jobs, results)
+    return len(jobs)
+
+
 def run_once(conn: psycopg.Connection, worker_id: str | None = None) -> bool:
     """
     Claim and process a single job (if available).
@@ -334,14 +560,27 @@ def _job_processor(conn: psycopg.Connection, job: dict[str, Any]) -> None:
 
     This is the callback passed to WorkerBootstrap.run(). The bootstrap handles
     job claiming; this function only processes the job.
+
+    A Smart Strategy job pulls up to STRATEGY_BATCH_SIZE - 1 more pending
+    strategy jobs along with it. The extras are settled here; the bootstrap's
+    job is settled by the bootstrap (raise on failure).
     """
-    asyncio.run(process_job(conn, job))
+    if STRATEGY_BATCH_SIZE <= 1 or not is_smart_strategy_job(job):
+        asyncio.run(process_job(conn, job))
+        return
+
+    extras = claim_strategy_jobs(
+        conn, STRATEGY_BATCH_SIZE - 1, _default_worker_id("enforcement_batch")
+    )
+    results = process_strategy_batch(conn, [job, *extras])
+    error = results.pop(str(job["id"]), None)
+    settle_jobs(RPCClient(conn), extras, results)
+    if error is not None:
+        raise RuntimeError(error)
 
 
 def main() -> None:
     """Entry point for the enforcement engine worker."""
-    from backend.workers.bootstrap import WorkerBootstrap
-
     bootstrap = WorkerBootstrap(
         worker_type="enforcement_engine",
         job_types=list(JOB_TYPES),
@@ -0,0 +1,184 @@
+"""
+Dragonfly Engine - In-process Queue Metrics Aggregation
+
+Workers record job outcomes here instead of calling workers.update_metrics()
+inside every job transaction. The heartbeat thread drains the aggregate once
+per interval and writes it as a single delta via workers.apply_metrics_delta(),
+so job transactions carry only job work and workers of the same queue no
+longer contend on the workers.metrics row per job.
+
+Usage:
+    from backend.workers.metrics import QueueMetricsAggregator
+
+    metrics = QueueMetricsAggregator("q_ingest_raw")
+    metrics.record(job_id, latency_ms=42, success=True)
+
+    delta = metrics.drain()          # on the heartbeat thread
+    if delta is not None:
+        try:
+            flush(delta.as_params())
+        except Exception:
+            metrics.restore(delta)   # keep the counts for the next interval
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+# Upper bounds (ms) of the latency histogram buckets; slower jobs land in "inf"
+LATENCY_BUCKETS_MS: tuple[int, ...] = (
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+)
+
+APPLY_METRICS_DELTA_SQL = """
+    SELECT workers.apply_metrics_delta(
+        p_queue_name := %(queue_name)s,
+        p_processed := %(processed)s,
+        p_failed := %(failed)s,
+        p_latency_sum_ms := %(latency_sum_ms)s,
+        p_latency_count := %(latency_count)s,
+        p_min_latency_ms := %(min_latency_ms)s,
+        p_max_latency_ms := %(max_latency_ms)s,
+        p_latency_buckets := %(latency_buckets)s::jsonb,
+        p_last_job_id := %(last_job_id)s::uuid,
+        p_last_success_at := %(last_success_at)s
+    )
+"""
+
+
+def bucket_label(latency_ms: int, bounds: tuple[int, ...] = LATENCY_BUCKETS_MS) -> str:
+    """Histogram bucket key for a latency: the smallest bound >= latency, or 'inf'."""
+    idx = bisect.bisect_left(bounds, latency_ms)
+    return str(bounds[idx]) if idx < len(bounds) else "inf"
+
+
+@dataclass
+class MetricsDelta:
+    """Job outcomes for one queue accumulated since the last flush."""
+
+    queue_name: str
+    processed: int = 0
+    failed: int = 0
+    # Successful jobs only, matching the rolling average in workers.metrics
+    latency_sum_ms: int = 0
+    latency_count: int = 0
+    # All jobs
+    min_latency_ms: int | None = None
+    max_latency_ms: int | None = None
+    latency_buckets: dict[str, int] = field(default_factory=dict)
+    last_job_id: uuid.UUID | None = None
+    last_success_at: datetime | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self.processed == 0 and self.failed == 0
+
+    def merge(self, other: MetricsDelta) -> None:
+        """Fold ``other`` into this delta (``other`` is treated as older)."""
+        self.processed += other.processed
+        self.failed += other.failed
+        self.latency_sum_ms += other.latency_sum_ms
+        self.latency_count += other.latency_count
+        if other.min_latency_ms is not None:
+            self.min_latency_ms = (
+                other.min_latency_ms
+                if self.min_latency_ms is None
+                else min(self.min_latency_ms, other.min_latency_ms)
+            )
+        if other.max_latency_ms is not None:
+            self.max_latency_ms = (
+                other.max_latency_ms
+                if self.max_latency_ms is None
+                else max(self.max_latency_ms, other.max_latency_ms)
+            )
+        for label, count in other.latency_buckets.items():
+            self.latency_buckets[label] = self.latency_buckets.get(label, 0) + count
+        if self.last_success_at is None and other.last_success_at is not None:
+            self.last_job_id = other.last_job_id
+            self.last_success_at = other.last_success_at
+
+    def as_params(self) -> dict[str, Any]:
+        """Named parameters for APPLY_METRICS_DELTA_SQL."""
+        return {
+            "queue_name": self.queue_name,
+            "processed": self.processed,
+            "failed": self.failed,
+            "latency_sum_ms": self.latency_sum_ms,
+            "latency_count": self.latency_count,
+            "min_latency_ms": self.min_latency_ms,
+            "max_latency_ms": self.max_latency_ms,
+            "latency_buckets": json.dumps(self.latency_buckets),
+            "last_job_id": str(self.last_job_id) if self.last_job_id else None,
+            "last_success_at": self.last_success_at,
+        }
+
+
+class QueueMetricsAggregator:
+    """
+    Thread-safe accumulator of job outcomes for one queue.
+
+    record() is called on the job thread and only touches memory; drain()
+    swaps out the accumulated delta for the heartbeat thread to flush.
+    """
+
+    def __init__(self, queue_name: str, bounds: tuple[int, ...] = LATENCY_BUCKETS_MS):
+        self.queue_name = queue_name
+        self._bounds = bounds
+        self._lock = threading.Lock()
+        self._delta = MetricsDelta(queue_name)
+
+    def record(self, job_id: uuid.UUID | None, latency_ms: int, success: bool = True) -> None:
+        """Record one finished job."""
+        label = bucket_label(latency_ms, self._bounds)
+        with self._lock:
+            delta = self._delta
+            if success:
+                delta.processed += 1
+                delta.latency_sum_ms += latency_ms
+                delta.latency_count += 1
+                delta.last_job_id = job_id
+                delta.last_success_at = datetime.now(timezone.utc)
+            else:
+                delta.failed += 1
+            if delta.min_latency_ms is None or latency_ms < delta.min_latency_ms:
+                delta.min_latency_ms = latency_ms
+            if delta.max_latency_ms is None or latency_ms > delta.max_latency_ms:
+                delta.max_latency_ms = latency_ms
+            delta.latency_buckets[label] = delta.latency_buckets.get(label, 0) + 1
+
+    def drain(self) -> MetricsDelta | None:
+        """Take the accumulated delta, or None if nothing was recorded."""
+        with self._lock:
+            if self._delta.is_empty:
+                return None
+            delta, self._delta = self._delta, MetricsDelta(self.queue_name)
+        return delta
+
+    def restore(self, delta: MetricsDelta) -> None:
+        """Put back a delta whose flush failed so it goes out with the next one."""
+        with self._lock:
+            self._delta.merge(delta)
+
+    def pending(self) -> MetricsDelta:
+        """Copy of the not-yet-flushed delta (for stats and tests)."""
+        with self._lock:
+            copy = MetricsDelta(self.queue_name)
+            copy.merge(self._delta)
+        return copy
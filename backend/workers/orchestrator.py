@@ -17,7 +17,12 @@ Pipeline Flow:
 
 Architecture:
     - Poll-based: Checks for 'uploaded' and 'validated' batches
-    - Event-driven: Can also respond to database triggers (future)
+    - Event-driven: LISTENs on 'orchestration_stage_done', which the
+      ops.job_queue counter triggers raise when a stage has no pending jobs
+    - Set-based fan-out: One INSERT ... SELECT per stage from
+      intake.simplicity_validated_rows into ops.job_queue
+    - Counter-based completion: ops.orchestration_stage_counters is kept
+      current by triggers, so completion checks are a primary-key lookup
     - Idempotent: Safe to run multiple instances (uses FOR UPDATE SKIP LOCKED)
     - Transactional: All state changes are atomic
 
@@ -68,6 +73,15 @@ logger = configure_worker_logging("orchestrator")
 POLL_INTERVAL_SECONDS = 5.0
 BATCH_LOCK_TIMEOUT_MINUTES = 60
 
+# NOTIFY channel raised by ops.apply_orchestration_counter_deltas()
+STAGE_DONE_CHANNEL = "orchestration_stage_done"
+
+# Job-driven stages, keyed by the job type whose counters track them
+_STAGE_FOR_JOB = {
+    JobType.ENTITY_RESOLVE: PipelineStage.ENTITY_RESOLVING,
+    JobType.JUDGMENT_CREATE: PipelineStage.JUDGMENT_CREATING,
+}
+
 
 # =============================================================================
 # DATA CLASSES
@@ -89,6 +103,21 @@ class BatchOrchestration:
     error_message: Optional[str]
 
 
+@dataclass
+class StageCounters:
+    """Trigger-maintained job counters for one (batch, stage)."""
+
+    job_type: JobType
+    total: int
+    pending: int
+    completed: int
+    failed: int
+
+    @property
+    def is_complete(self) -> bool:
+        return self.pending == 0 and self.total > 0
+
+
 @dataclass
 class ImportRow:
     """A validated import row ready for processing."""
@@ -196,17 +225,56 @@ def find_batches_ready_for_orchestration(
         return cur.fetchall()
 
 
+def find_batches_ready_to_advance(
+    conn: psycopg.Connection, limit: int = 10
+) -> List[Dict[str, Any]]:
+    """
+    Find in-flight batches whose current stage has no pending jobs left.
+
+    Only batches the orchestrator took over (orchestrated_at set) are
+    considered; the Simplicity mapper also writes 'upserting' and upserts
+    those rows itself. Reads the latest stage counters for each batch, so the
+    check never touches ops.job_queue.
+    Uses FOR UPDATE SKIP LOCKED for safe concurrent access.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT b.id AS batch_id, s.job_type
+            FROM intake.simplicity_batches b
+            JOIN LATERAL (
+                SELECT c.job_type, c.jobs_total, c.jobs_pending
+                FROM ops.orchestration_stage_counters c
+                WHERE c.batch_id = b.id
+                  AND c.job_type IN ('entity_resolve', 'judgment_create')
+                ORDER BY (c.job_type = 'judgment_create') DESC
+                LIMIT 1
+            ) s ON true
+            WHERE b.status = 'upserting'
+              AND b.orchestrated_at IS NOT NULL
+              AND s.jobs_pending = 0
+              AND s.jobs_total > 0
+            ORDER BY b.created_at ASC
+            LIMIT %s
+            FOR UPDATE OF b SKIP LOCKED
+            """,
+            (limit,),
+        )
+        return cur.fetchall()
+
+
 def create_orchestration_record(conn: psycopg.Connection, batch_id: UUID) -> None:
     """
     Transition a batch from 'validated' to 'upserting' status.
 
-    This marks the batch as being actively processed by the orchestrator.
+    This marks the batch as being actively processed by the orchestrator;
+    orchestrated_at tells it apart from batches the mapper upserts itself.
     """
     with conn.cursor() as cur:
         cur.execute(
             """
             UPDATE intake.simplicity_batches
-            SET status = 'upserting'
+            SET status = 'upserting', orchestrated_at = now()
             WHERE id = %s AND status = 'validated'
             """,
             (str(batch_id),),
@@ -230,26 +298,40 @@ def get_orchestration_by_batch(
         if not row:
             return None
 
-        # Map batch status to pipeline stage
-        status_to_stage = {
-            "validated": PipelineStage.VALIDATED,
-            "upserting": PipelineStage.ENTITY_RESOLVING,
-            "completed": PipelineStage.COMPLETE,
-            "failed": PipelineStage.FAILED,
-        }
-        stage = status_to_stage.get(row["status"], PipelineStage.VALIDATED)
-
-        return BatchOrchestration(
-            id=UUID(str(row["id"])),
-            batch_id=UUID(str(row["id"])),  # batch_id == id for this table
-            stage=stage,
-            jobs_total=row["row_count_valid"] or 0,
-            jobs_completed=0,
-            jobs_failed=0,
-            started_at=None,
-            completed_at=None,
-            error_message=None,
-        )
+    # Map batch status to pipeline stage
+    status_to_stage = {
+        "validated": PipelineStage.VALIDATED,
+        "upserting": PipelineStage.ENTITY_RESOLVING,
+        "completed": PipelineStage.COMPLETE,
+        "failed": PipelineStage.FAILED,
+    }
+    stage = status_to_stage.get(row["status"], PipelineStage.VALIDATED)
+    jobs_total = row["row_count_valid"] or 0
+    jobs_completed = jobs_failed = 0
+
+    # 'upserting' covers every in-flight stage; the latest stage with
+    # counters says which one. No counters yet means jobs were never fanned out.
+    if row["status"] == "upserting":
+        counters = get_current_stage_counters(conn, batch_id)
+        if counters is None:
+            stage = PipelineStage.VALIDATED
+        else:
+            stage = _STAGE_FOR_JOB[counters.job_type]
+            jobs_total = counters.total
+            jobs_completed = counters.completed
+            jobs_failed = counters.failed
+
+    return BatchOrchestration(
+        id=UUID(str(row["id"])),
+        batch_id=UUID(str(row["id"])),  # batch_id == id for this table
+        stage=stage,
+        jobs_total=jobs_total,
+        jobs_completed=jobs_completed,
+        jobs_failed=jobs_failed,
+        started_at=None,
+        completed_at=None,
+        error_message=None,
+    )
 
 
 def update_orchestration_stage(
@@ -397,6 +479,137 @@ def count_jobs_by_status(
         return {row["status"]: row["count"] for row in cur.fetchall()}
 
 
+def _counters_from_row(row: Dict[str, Any]) -> StageCounters:
+    return StageCounters(
+        job_type=JobType(row["job_type"]),
+        total=row["jobs_total"],
+        pending=row["jobs_pending"],
+        completed=row["jobs_completed"],
+        failed=row["jobs_failed"],
+    )
+
+
+def get_stage_counters(
+    conn: psycopg.Connection,
+    batch_id: UUID,
+    job_type: JobType,
+) -> Optional[StageCounters]:
+    """
+    Read the trigger-maintained counters for one stage of a batch.
+
+    Returns None when no job of this type was ever enqueued for the batch.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT job_type, jobs_total, jobs_pending, jobs_completed, jobs_failed
+            FROM ops.orchestration_stage_counters
+            WHERE batch_id = %s AND job_type = %s
+            """,
+            (str(batch_id), job_type.value),
+        )
+        row = cur.fetchone()
+        return _counters_from_row(row) if row else None
+
+
+def get_current_stage_counters(conn: psycopg.Connection, batch_id: UUID) -> Optional[StageCounters]:
+    """Read the counters of the latest job-driven stage a batch has reached."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT job_type, jobs_total, jobs_pending, jobs_completed, jobs_failed
+            FROM ops.orchestration_stage_counters
+            WHERE batch_id = %s
+              AND job_type IN ('entity_resolve', 'judgment_create')
+            ORDER BY (job_type = 'judgment_create') DESC
+            LIMIT 1
+            """,
+            (str(batch_id),),
+        )
+        row = cur.fetchone()
+        return _counters_from_row(row) if row else None
+
+
+def fan_out_stage_jobs(
+    conn: psycopg.Connection,
+    batch_id: UUID,
+    job_type: JobType,
+    *,
+    include_data: bool = False,
+    correlation_id: Optional[UUID] = None,
+) -> int:
+    """
+    Enqueue one job per validated row of a batch in a single statement.
+
+    Rows are copied from intake.simplicity_validated_rows into ops.job_queue
+    with INSERT ... SELECT; the dedup key ({job_type}-{batch_id}-{row_index})
+    makes re-runs a no-op. Payloads match what enqueue_job() used to build per
+    row, with 'data' included only when include_data is set.
+
+    Returns the number of jobs in the stage (validated rows), whether they
+    were inserted now or by an earlier run.
+    """
+    dedup_prefix = f"{job_type.value}-{batch_id}-"
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            WITH src AS (
+                SELECT id, row_index, case_number, plaintiff_name, defendant_name,
+                       judgment_amount, entry_date, judgment_date, court, county
+                FROM intake.simplicity_validated_rows
+                WHERE batch_id = %(batch_id)s
+                  AND validation_status = 'valid'
+            ),
+            inserted AS (
+                INSERT INTO ops.job_queue (job_type, payload, dedup_key, correlation_id)
+                SELECT
+                    %(job_type)s::ops.job_type_enum,
+                    jsonb_build_object(
+                        'batch_id', %(batch_id)s::text,
+                        'row_id', lpad(to_hex(src.id), 32, '0')::uuid::text,
+                        'row_index', src.row_index
+                    ) || CASE WHEN %(include_data)s THEN jsonb_build_object(
+                        'data', jsonb_build_object(
+                            'case_number', src.case_number,
+                            'plaintiff_name', src.plaintiff_name,
+                            'defendant_name', src.defendant_name,
+                            'judgment_amount', src.judgment_amount,
+                            'entry_date', src.entry_date,
+                            'judgment_date', src.judgment_date,
+                            'court', src.court,
+                            'county', src.county
+                        )
+                    ) ELSE '{}'::jsonb END,
+                    %(dedup_prefix)s || src.row_index,
+                    %(correlation_id)s::uuid
+                FROM src
+                ORDER BY src.row_index
+                ON CONFLICT DO NOTHING
+                RETURNING 1
+            )
+            SELECT
+                (SELECT COUNT(*) FROM src) AS total,
+                (SELECT COUNT(*) FROM inserted) AS inserted
+            """,
+            {
+                "batch_id": str(batch_id),
+                "job_type": job_type.value,
+                "include_data": include_data,
+                "dedup_prefix": dedup_prefix,
+                "correlation_id": str(correlation_id) if correlation_id else None,
+            },
+        )
+        row = cur.fetchone()
+
+    total = row["total"] if row else 0
+    inserted = row["inserted"] if row else 0
+    logger.info(
+        f"Fanned out {job_type.value} for batch {batch_id}: "
+        f"{inserted} new, {total - inserted} already queued"
+    )
+    return total
+
+
 # =============================================================================
 # ORCHESTRATION LOGIC
 # =============================================================================
@@ -411,32 +624,17 @@ def enqueue_entity_resolve_jobs(
 
     Returns the number of jobs enqueued.
     """
-    rows = get_validated_rows_for_batch(conn, orchestration.batch_id)
+    enqueued = fan_out_stage_jobs(
+        conn,
+        orchestration.batch_id,
+        JobType.ENTITY_RESOLVE,
+        include_data=True,
+        correlation_id=orchestration.batch_id,
+    )
 
-    if not rows:
+    if not enqueued:
         logger.warning(f"Batch {orchestration.batch_id} has no validated rows")
-        return 0
-
-    enqueued = 0
-    for row in rows:
-        payload = {
-            "batch_id": str(orchestration.batch_id),
-            "row_id": str(row.id),
-            "row_index": row.row_index,
-            "data": row.data,
-        }
-        dedup_key = f"{JobType.ENTITY_RESOLVE.value}-{orchestration.batch_id}-{row.row_index}"
-
-        enqueue_job(
-            conn,
-            JobType.ENTITY_RESOLVE,
-            payload,
-            dedup_key=dedup_key,
-            correlation_id=orchestration.batch_id,
-        )
-        enqueued += 1
 
-    logger.info(f"Enqueued {enqueued} entity_resolve jobs for batch {orchestration.batch_id}")
     return enqueued
 
 
@@ -448,8 +646,16 @@ def check_stage_completion(
     """
     Check if all jobs for a stage have completed.
 
+    Reads the trigger-maintained stage counters; falls back to counting
+    ops.job_queue only when the batch has no counter row (jobs enqueued
+    before the counters existed).
+
     Returns: (is_complete, total, completed, failed)
     """
+    counters = get_stage_counters(conn, orchestration.batch_id, job_type)
+    if counters is not None:
+        return counters.is_complete, counters.total, counters.completed, counters.failed
+
     counts = count_jobs_by_status(conn, job_type, orchestration.batch_id)
 
     total = sum(counts.values())
@@ -489,6 +695,7 @@ def advance_pipeline(
                 jobs_completed=0,
                 jobs_failed=0,
             )
+            orchestration.stage = PipelineStage.ENTITY_RESOLVING
             logger.info(
                 f"Batch {orchestration.batch_id}: VALIDATED → ENTITY_RESOLVING ({jobs_count} jobs)"
             )
@@ -496,6 +703,7 @@ def advance_pipeline(
         else:
             # No rows to process - mark as complete
             update_orchestration_stage(conn, orchestration.batch_id, PipelineStage.COMPLETE)
+            orchestration.stage = PipelineStage.COMPLETE
             logger.info(f"Batch {orchestration.batch_id}: No rows, marked COMPLETE")
             return True
 
@@ -515,6 +723,7 @@ def advance_pipeline(
                     jobs_failed=failed,
                     error_message=f"All {failed} entity_resolve jobs failed",
                 )
+                orchestration.stage = PipelineStage.FAILED
                 logger.error(f"Batch {orchestration.batch_id}: ENTITY_RESOLVING → FAILED")
             else:
                 update_orchestration_stage(
@@ -524,6 +733,7 @@ def advance_pipeline(
                     jobs_completed=completed,
                     jobs_failed=failed,
                 )
+                orchestration.stage = PipelineStage.ENTITY_RESOLVED
                 logger.info(
                     f"Batch {orchestration.batch_id}: ENTITY_RESOLVING → ENTITY_RESOLVED ({completed}/{total})"
                 )
@@ -538,17 +748,7 @@ def advance_pipeline(
     # ENTITY_RESOLVED → JUDGMENT_CREATING: Enqueue judgment create jobs
     if stage == PipelineStage.ENTITY_RESOLVED:
         # For now, we reuse the same rows - in production, we'd read resolved data
-        rows = get_validated_rows_for_batch(conn, orchestration.batch_id)
-        jobs_count = 0
-        for row in rows:
-            payload = {
-                "batch_id": str(orchestration.batch_id),
-                "row_id": str(row.id),
-                "row_index": row.row_index,
-            }
-            dedup_key = f"{JobType.JUDGMENT_CREATE.value}-{orchestration.batch_id}-{row.row_index}"
-            enqueue_job(conn, JobType.JUDGMENT_CREATE, payload, dedup_key=dedup_key)
-            jobs_count += 1
+        jobs_count = fan_out_stage_jobs(conn, orchestration.batch_id, JobType.JUDGMENT_CREATE)
 
         if jobs_count > 0:
             update_orchestration_stage(
@@ -559,12 +759,14 @@ def advance_pipeline(
                 jobs_completed=0,
                 jobs_failed=0,
             )
+            orchestration.stage = PipelineStage.JUDGMENT_CREATING
             logger.info(
                 f"Batch {orchestration.batch_id}: ENTITY_RESOLVED → JUDGMENT_CREATING ({jobs_count} jobs)"
             )
             return True
         else:
             update_orchestration_stage(conn, orchestration.batch_id, PipelineStage.COMPLETE)
+            orchestration.stage = PipelineStage.COMPLETE
             return True
 
     # JUDGMENT_CREATING → JUDGMENT_CREATED: Check if all jobs done
@@ -580,6 +782,7 @@ def advance_pipeline(
                 jobs_completed=completed,
                 jobs_failed=failed,
             )
+            orchestration.stage = PipelineStage.JUDGMENT_CREATED
             logger.info(f"Batch {orchestration.batch_id}: JUDGMENT_CREATING → JUDGMENT_CREATED")
             return True
         return False
@@ -589,6 +792,7 @@ def advance_pipeline(
         # Query judgments created from this batch and enqueue enrichment
         # For simplicity, skip enrichment in MVP - mark complete
         update_orchestration_stage(conn, orchestration.batch_id, PipelineStage.COMPLETE)
+        orchestration.stage = PipelineStage.COMPLETE
         logger.info(
             f"Batch {orchestration.batch_id}: JUDGMENT_CREATED → COMPLETE (enrichment skipped in MVP)"
         )
@@ -600,35 +804,59 @@ def advance_pipeline(
     return False
 
 
+def drive_batch(conn: psycopg.Connection, orchestration: BatchOrchestration) -> bool:
+    """
+    Advance a batch through as many stages as are ready in one transaction.
+
+    Stages that only enqueue work (VALIDATED, ENTITY_RESOLVED, JUDGMENT_CREATED)
+    are passed straight through, so a finished stage fans out the next one
+    immediately instead of waiting for another tick. Stops at the first stage
+    still waiting on jobs.
+
+    Returns True if the batch moved at least one stage.
+    """
+    advanced = False
+    while advance_pipeline(conn, orchestration):
+        advanced = True
+        if is_terminal_stage(orchestration.stage):
+            break
+    return advanced
+
+
 def process_one_batch(conn: psycopg.Connection) -> bool:
     """
     Process one batch through the pipeline.
 
+    Picks up newly validated batches first, then in-flight batches whose
+    current stage has finished.
+
     Returns True if a batch was processed, False if no work available.
     """
     # Find batches ready for orchestration
     batches = find_batches_ready_for_orchestration(conn, limit=1)
 
-    if not batches:
-        return False
-
-    batch_info = batches[0]
-    batch_id = UUID(str(batch_info["batch_id"]))
-
-    # Transition batch to 'upserting' status
-    create_orchestration_record(conn, batch_id)
-    conn.commit()
-    logger.info(f"Batch {batch_id} transitioned to upserting")
+    if batches:
+        batch_id = UUID(str(batches[0]["batch_id"]))
+        # Transition batch to 'upserting' status; committed with the fan-out
+        create_orchestration_record(conn, batch_id)
+        logger.info(f"Batch {batch_id} transitioned to upserting")
+    else:
+        batches = find_batches_ready_to_advance(conn, limit=1)
+        if not batches:
+            conn.rollback()
+            return False
+        batch_id = UUID(str(batches[0]["batch_id"]))
 
     # Get current orchestration state
     orchestration = get_orchestration_by_batch(conn, batch_id)
     if not orchestration:
+        conn.rollback()
         logger.error(f"Failed to get orchestration for batch {batch_id}")
         return False
 
     # Attempt to advance the pipeline
     try:
-        advanced = advance_pipeline(conn, orchestration)
+        advanced = drive_batch(conn, orchestration)
         conn.commit()
         return advanced
     except Exception as e:
@@ -682,13 +910,44 @@ def process_uploaded_batches_sync() -> bool:
         return False
 
 
+def open_listen_connection() -> Optional[psycopg.Connection]:
+    """
+    Open an autocommit connection LISTENing for finished stages.
+
+    Returns None if the connection cannot be opened (e.g. a transaction-mode
+    pooler that drops LISTEN); the loop then falls back to plain polling.
+    """
+    try:
+        conn = psycopg.connect(get_supabase_db_url(), autocommit=True)
+        conn.execute(f"LISTEN {STAGE_DONE_CHANNEL}")
+        return conn
+    except psycopg.Error as e:
+        logger.warning(f"LISTEN {STAGE_DONE_CHANNEL} unavailable, polling only: {e}")
+        return None
+
+
+def wait_for_stage_done(listen_conn: Optional[psycopg.Connection], timeout: float) -> bool:
+    """
+    Block until a stage-done notification arrives or the timeout passes.
+
+    Returns True if woken by a notification.
+    """
+    if listen_conn is None:
+        time.sleep(timeout)
+        return False
+    for notify in listen_conn.notifies(timeout=timeout, stop_after=1):
+        logger.debug(f"Stage done: {notify.payload}")
+        return True
+    return False
+
+
 def run_once() -> bool:
     """
     Run a single orchestration tick. Returns True if work was done.
 
     Priority:
     1. Process uploaded batches (CSV → judgments via IngestionService)
-    2. Advance validated batches through the pipeline (future entity resolution)
+    2. Advance validated batches and batches whose current stage finished
     """
     # First, check for uploaded batches that need processing
     if process_uploaded_batches_sync():
@@ -706,9 +965,13 @@ def run_loop() -> None:
     logger.info(f"Poll interval: {POLL_INTERVAL_SECONDS}s")
 
     consecutive_idle = 0
+    listen_conn = open_listen_connection()
 
     while True:
         try:
+            if listen_conn is None and consecutive_idle % 60 == 59:
+                listen_conn = open_listen_connection()
+
             did_work = run_once()
 
             if did_work:
@@ -721,7 +984,13 @@ def run_loop() -> None:
                 if consecutive_idle % 60 == 0:  # Every 5 minutes at 5s interval
                     logger.debug("Orchestrator idle, no batches to process")
 
-            time.sleep(POLL_INTERVAL_SECONDS)
+            # Wake on a finished stage, or after the poll interval for new uploads
+            try:
+                wait_for_stage_done(listen_conn, POLL_INTERVAL_SECONDS)
+            except psycopg.OperationalError as e:
+                logger.warning(f"Lost {STAGE_DONE_CHANNEL} listener, polling only: {e}")
+                listen_conn.close()
+                listen_conn = None
 
         except KeyboardInterrupt:
             logger.info("Orchestrator shutting down (KeyboardInterrupt)")
@@ -731,6 +1000,9 @@ def run_loop() -> None:
             # Back off on errors
             time.sleep(POLL_INTERVAL_SECONDS * 2)
 
+    if listen_conn is not None:
+        listen_conn.close()
+
 
 def main() -> None:
     """Entry point for the orchestrator worker."""
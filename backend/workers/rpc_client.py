@@ -134,6 +134,23 @@ class ClaimedJob:
     attempts: int
 
 
+def _claimed_job_from_row(row: dict[str, Any]) -> ClaimedJob:
+    """Build a ClaimedJob from a claim RPC row, decoding string payloads."""
+    payload = row.get("payload") or {}
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except json.JSONDecodeError:
+            payload = {}
+
+    return ClaimedJob(
+        job_id=row["job_id"],
+        job_type=row.get("job_type", ""),
+        payload=payload,
+        attempts=row.get("attempts", 1),
+    )
+
+
 class RPCClient:
     """
     Type-safe wrapper for SECURITY DEFINER RPC functions.
@@ -479,21 +496,84 @@ class RPCClient:
             self.conn.commit()
 
             if row and row.get("job_id"):
-                payload = row.get("payload") or {}
-                if isinstance(payload, str):
-                    try:
-                        payload = json.loads(payload)
-                    except json.JSONDecodeError:
-                        payload = {}
-
-                return ClaimedJob(
-                    job_id=row["job_id"],
-                    job_type=row.get("job_type", ""),
-                    payload=payload,
-                    attempts=row.get("attempts", 1),
-                )
+                return _claimed_job_from_row(row)
             return None
 
+    @with_circuit_breaker(max_attempts=3, min_wait=1.0, max_wait=10.0)
+    def claim_pending_jobs(
+        self,
+        job_types: list[str],
+        limit: int,
+        lock_timeout_minutes: int = 30,
+        worker_id: str | None = None,
+    ) -> list[ClaimedJob]:
+        """
+        Claim up to ``limit`` pending jobs using ops.claim_pending_jobs RPC.
+
+        Same selection and locking rules as claim_pending_job(), in one
+        round-trip. Includes circuit breaker retry logic for transient failures.
+
+        Args:
+            job_types: List of job types to claim
+            limit: Maximum number of jobs to claim
+            lock_timeout_minutes: Lock timeout in minutes
+            worker_id: Optional worker ID for tracking
+
+        Returns:
+            Claimed jobs (empty if none available)
+        """
+        with self.conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                SELECT * FROM ops.claim_pending_jobs(
+                    p_job_types := %s,
+                    p_limit := %s,
+                    p_lock_timeout_minutes := %s,
+                    p_worker_id := %s
+                )
+                """,
+                (job_types, limit, lock_timeout_minutes, worker_id),
+            )
+            rows = cur.fetchall()
+            self.conn.commit()
+
+        return [_claimed_job_from_row(row) for row in rows if row.get("job_id")]
+
+    @with_circuit_breaker(max_attempts=3, min_wait=1.0, max_wait=10.0)
+    def update_job_statuses(
+        self,
+        job_ids: list[str | UUID],
+        status: str,
+        error_message: str | None = None,
+    ) -> int:
+        """
+        Update the status of many jobs using ops.update_job_status_many RPC.
+
+        Args:
+            job_ids: Job UUIDs
+            status: New status (pending, processing, completed, failed)
+            error_message: Optional error message recorded on every job
+
+        Returns:
+            Number of jobs updated
+        """
+        if not job_ids:
+            return 0
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT ops.update_job_status_many(
+                    p_job_ids := %s::uuid[],
+                    p_status := %s,
+                    p_error_message := %s
+                )
+                """,
+                ([str(job_id) for job_id in job_ids], status, error_message),
+            )
+            row = cur.fetchone()
+            self.conn.commit()
+            return int(row[0]) if row and row[0] is not None else 0
+
     def record_outcome(
         self,
         judgment_id: str | UUID,
@@ -20,6 +20,10 @@ Usage:
 
     print(decision.strategy_type)   # "wage_garnishment"
     print(decision.strategy_reason) # "Employer found: ACME Corp at 123 Main St"
+
+    # Portfolio-wide re-planning: one intelligence query and one plan insert
+    # per chunk of judgments instead of two round-trips per judgment
+    decisions = strategy.evaluate_many(judgment_ids)
 """
 
 from __future__ import annotations
@@ -29,13 +33,30 @@ import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import psycopg
 from psycopg.rows import dict_row
 
 logger = logging.getLogger(__name__)
 
+# Judgments per intelligence query / plan insert in evaluate_many()
+EVALUATE_CHUNK_SIZE = 1000
+
+_INTEL_COLUMNS = """
+    judgment_id::text,
+    employer_name,
+    employer_address,
+    income_band,
+    bank_name,
+    bank_address,
+    home_ownership,
+    has_benefits_only_account,
+    confidence_score,
+    is_verified,
+    data_source
+"""
+
 
 class StrategyType(str, Enum):
     """Available enforcement strategies."""
@@ -83,6 +104,23 @@ class DebtorIntelligence:
         return self.home_ownership and self.home_ownership.lower() == "owner"
 
 
+def _intel_from_row(row: dict[str, Any]) -> DebtorIntelligence:
+    """Build DebtorIntelligence from a public.debtor_intelligence row."""
+    return DebtorIntelligence(
+        judgment_id=row["judgment_id"],
+        employer_name=row.get("employer_name"),
+        employer_address=row.get("employer_address"),
+        income_band=row.get("income_band"),
+        bank_name=row.get("bank_name"),
+        bank_address=row.get("bank_address"),
+        home_ownership=row.get("home_ownership"),
+        has_benefits_only_account=row.get("has_benefits_only_account"),
+        confidence_score=(float(row["confidence_score"]) if row.get("confidence_score") else None),
+        is_verified=row.get("is_verified", False),
+        data_source=row.get("data_source"),
+    )
+
+
 @dataclass
 class StrategyDecision:
     """Result of strategy evaluation."""
@@ -92,6 +130,7 @@ class StrategyDecision:
     strategy_reason: str
     intelligence: Optional[DebtorIntelligence] = None
     created_at: datetime = None
+    plan_id: Optional[str] = None  # Set once the plan is persisted
 
     def __post_init__(self):
         if self.created_at is None:
@@ -152,19 +191,8 @@ class SmartStrategy:
         """
         with self.conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
-                SELECT
-                    judgment_id::text,
-                    employer_name,
-                    employer_address,
-                    income_band,
-                    bank_name,
-                    bank_address,
-                    home_ownership,
-                    has_benefits_only_account,
-                    confidence_score,
-                    is_verified,
-                    data_source
+                f"""
+                SELECT {_INTEL_COLUMNS}
                 FROM public.debtor_intelligence
                 WHERE judgment_id = %s::uuid
                 ORDER BY confidence_score DESC NULLS LAST, created_at DESC
@@ -177,21 +205,40 @@ class SmartStrategy:
         if not row:
             return None
 
-        return DebtorIntelligence(
-            judgment_id=row["judgment_id"],
-            employer_name=row.get("employer_name"),
-            employer_address=row.get("employer_address"),
-            income_band=row.get("income_band"),
-            bank_name=row.get("bank_name"),
-            bank_address=row.get("bank_address"),
-            home_ownership=row.get("home_ownership"),
-            has_benefits_only_account=row.get("has_benefits_only_account"),
-            confidence_score=(
-                float(row["confidence_score"]) if row.get("confidence_score") else None
-            ),
-            is_verified=row.get("is_verified", False),
-            data_source=row.get("data_source"),
-        )
+        return _intel_from_row(row)
+
+    def fetch_debtor_intelligence_many(
+        self, judgment_ids: list[str]
+    ) -> dict[str, DebtorIntelligence]:
+        """
+        Fetch the best debtor intelligence row for many judgments at once.
+
+        Uses DISTINCT ON (judgment_id) with the same ordering as
+        fetch_debtor_intelligence(), so each judgment gets the row the
+        single-judgment query would have returned.
+
+        Args:
+            judgment_ids: UUIDs of core_judgments
+
+        Returns:
+            Map of lowercase judgment_id → DebtorIntelligence (missing ids omitted)
+        """
+        if not judgment_ids:
+            return {}
+
+        with self.conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                f"""
+                SELECT DISTINCT ON (judgment_id) {_INTEL_COLUMNS}
+                FROM public.debtor_intelligence
+                WHERE judgment_id = ANY(%s::uuid[])
+                ORDER BY judgment_id, confidence_score DESC NULLS LAST, created_at DESC
+                """,
+                (judgment_ids,),
+            )
+            rows = cur.fetchall()
+
+        return {row["judgment_id"].lower(): _intel_from_row(row) for row in rows}
 
     def persist_plan(self, decision: StrategyDecision) -> str:
         """
@@ -248,6 +295,61 @@ class SmartStrategy:
         )
         return created_id
 
+    def persist_plans(self, decisions: list[StrategyDecision]) -> list[str]:
+        """
+        Persist many enforcement plans with one multi-row insert.
+
+        Equivalent to calling persist_plan() for each decision, with a single
+        INSERT ... SELECT FROM unnest(...) and a single commit.
+
+        Args:
+            decisions: Strategy decisions to persist
+
+        Returns:
+            UUIDs of the created plans, in input order
+        """
+        if not decisions:
+            return []
+
+        plan_ids = [str(uuid.uuid4()) for _ in decisions]
+
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO enforcement.enforcement_plans (
+                    id,
+                    judgment_id,
+                    plan_status,
+                    priority,
+                    strategy_type,
+                    strategy_reason,
+                    created_at,
+                    updated_at
+                )
+                SELECT
+                    p.id,
+                    p.judgment_id,
+                    'pending',
+                    1,
+                    p.strategy_type,
+                    p.strategy_reason,
+                    now(),
+                    now()
+                FROM unnest(%s::uuid[], %s::uuid[], %s::text[], %s::text[])
+                    AS p(id, judgment_id, strategy_type, strategy_reason)
+                """,
+                (
+                    plan_ids,
+                    [d.judgment_id for d in decisions],
+                    [d.strategy_type.value for d in decisions],
+                    [d.strategy_reason for d in decisions],
+                ),
+            )
+            self.conn.commit()
+
+        logger.info(f"[SmartStrategy] Persisted {len(plan_ids)} plans")
+        return plan_ids
+
     # =========================================================================
     # DECISION LOGIC
     # =========================================================================
@@ -345,11 +447,57 @@ class SmartStrategy:
 
         # Persist if requested
         if persist:
-            plan_id = self.persist_plan(decision)
-            logger.debug(f"[SmartStrategy] Created plan_id={plan_id}")
+            decision.plan_id = self.persist_plan(decision)
+            logger.debug(f"[SmartStrategy] Created plan_id={decision.plan_id}")
 
         return decision
 
+    def evaluate_many(
+        self,
+        judgment_ids: Iterable[str],
+        persist: bool = True,
+        chunk_size: int = EVALUATE_CHUNK_SIZE,
+    ) -> list[StrategyDecision]:
+        """
+        Evaluate enforcement strategy for many judgments.
+
+        Per chunk: one DISTINCT ON query for intelligence, in-memory
+        decisions, and one multi-row plan insert. Decisions are identical to
+        calling evaluate() per judgment.
+
+        Args:
+            judgment_ids: UUIDs of the judgments to evaluate (duplicates ignored)
+            persist: If True, persist plans to enforcement.enforcement_plans
+            chunk_size: Judgments per query/insert
+
+        Returns:
+            StrategyDecisions in input order
+        """
+        ids = list(dict.fromkeys(judgment_ids))
+        chunk_size = max(1, chunk_size)
+        decisions: list[StrategyDecision] = []
+
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            intel_by_id = self.fetch_debtor_intelligence_many(chunk)
+            batch = [
+                self.decide(intel_by_id.get(judgment_id.lower()), judgment_id)
+                for judgment_id in chunk
+            ]
+            if persist:
+                for decision, plan_id in zip(batch, self.persist_plans(batch)):
+                    decision.plan_id = plan_id
+            decisions.extend(batch)
+
+        if decisions:
+            counts: dict[str, int] = {}
+            for decision in decisions:
+                key = decision.strategy_type.value
+                counts[key] = counts.get(key, 0) + 1
+            logger.info(f"[SmartStrategy] Evaluated {len(decisions)} judgments: {counts}")
+
+        return decisions
+
 
 # =============================================================================
 # CONVENIENCE FUNCTION
@@ -372,3 +520,21 @@ def run_smart_strategy(
     """
     agent = SmartStrategy(conn)
     return agent.evaluate(judgment_id, persist=persist)
+
+
+def run_smart_strategy_many(
+    conn: psycopg.Connection, judgment_ids: Iterable[str], persist: bool = True
+) -> list[StrategyDecision]:
+    """
+    Convenience function to run Smart Strategy over many judgments.
+
+    Args:
+        conn: Database connection
+        judgment_ids: UUIDs of judgments to evaluate
+        persist: Whether to save the plans
+
+    Returns:
+        StrategyDecisions in input order
+    """
+    agent = SmartStrategy(conn)
+    return agent.evaluate_many(judgment_ids, persist=persist)
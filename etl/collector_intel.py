@@ -5,8 +5,9 @@ from __future__ import annotations
 import json
 import logging
 import re
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import typer
 
@@ -68,12 +69,34 @@ STATE_CODES = (
     "WV",
     "WY",
 )
-PHONE_DIGITS_RE = re.compile(r"\d")
 EMPLOYER_KEYWORDS = ("employer", "payroll", "wage", "garnish")
 BANK_KEYWORDS = ("bank", "account", "levy", "lien", "freeze")
 SUCCESS_KEYWORDS = ("collected", "paid", "satisfied", "remitted", "settled")
 MOMENTUM_KEYWORDS = ("levy", "lien", "turnover", "garnish", "attachment")
 
+# Compiled once so each address/message is scanned in a single pass instead
+# of one substring test per state code or keyword.
+NON_DIGIT_RE = re.compile(r"\D")
+DIGIT_RE = re.compile(r"\d")
+STATE_TOKEN_RE = re.compile(r"(?<![^ ])(?:%s)(?![^ ])" % "|".join(STATE_CODES))
+
+
+def _keyword_pattern(keywords: Sequence[str]) -> "re.Pattern[str]":
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+KEYWORD_PATTERNS: Dict[Tuple[str, ...], "re.Pattern[str]"] = {
+    tuple(keywords): _keyword_pattern(keywords)
+    for keywords in (EMPLOYER_KEYWORDS, BANK_KEYWORDS, SUCCESS_KEYWORDS, MOMENTUM_KEYWORDS)
+}
+
+# Bulk scoring: ids per PostgREST in.() filter (keeps URLs short) and rows
+# per ranged page (PostgREST caps responses at 1000 rows by default).
+IN_FILTER_CHUNK = 200
+FETCH_PAGE_SIZE = 1000
+SCORE_ALL_PAGE_SIZE = 500
+PERSIST_CHUNK = 500
+
 
 @dataclass
 class CollectorSignals:
@@ -166,6 +189,88 @@ class CollectorIntelEngine:
             self._logger.warning("judgments.cases update failed for %s: %s", case_id, exc)
             raise
 
+    def score_many(self, plaintiff_ids: Sequence[str]) -> Dict[str, CollectorScore]:
+        """Score many plaintiffs with one batched query per relation.
+
+        Plaintiffs that do not exist are omitted from the result.
+        """
+        contexts = self._gather_plaintiff_contexts(plaintiff_ids)
+        return {
+            plaintiff_id: self._build_score(
+                plaintiff_id=plaintiff_id,
+                case_id=None,
+                case_number=context.get("representative_case_number"),
+                signals=context["signals"],
+            )
+            for plaintiff_id, context in contexts.items()
+        }
+
+    def score_all(
+        self, *, page_size: int = SCORE_ALL_PAGE_SIZE, persist: bool = True
+    ) -> Dict[str, int]:
+        """Rescore every plaintiff's cases, a page of plaintiffs at a time.
+
+        Each page costs one batched query per relation plus one for the case
+        lookup and one persist RPC per PERSIST_CHUNK cases, regardless of how
+        many plaintiffs it holds.
+        """
+        summary = {"plaintiffs": 0, "cases": 0, "persisted": 0}
+        last_id: Optional[str] = None
+        while True:
+            query = self._client.table("plaintiffs").select("id").order("id").limit(page_size)
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            page = [str(row["id"]) for row in self._extract_rows(query.execute()) if row.get("id")]
+            if not page:
+                break
+            last_id = page[-1]
+
+            contexts = self._gather_plaintiff_contexts(page)
+            case_scores = self._score_contexts_by_case(contexts)
+            summary["plaintiffs"] += len(contexts)
+            summary["cases"] += len(case_scores)
+            if persist and case_scores:
+                summary["persisted"] += self.persist_case_scores(case_scores)
+            if len(page) < page_size:
+                break
+        self._logger.info(
+            "collector_intel score_all plaintiffs=%d cases=%d persisted=%d",
+            summary["plaintiffs"],
+            summary["cases"],
+            summary["persisted"],
+        )
+        return summary
+
+    def persist_case_scores(self, scores: Mapping[str, CollectorScore]) -> int:
+        """Write many case scores with the set_case_collectability_scores RPC.
+
+        Falls back to :meth:`persist_case_score` per case when the RPC is
+        unavailable. Returns the number of cases written.
+        """
+        items = [
+            {"case_id": case_id, "score": round(score.total_score, 2)}
+            for case_id, score in scores.items()
+            if case_id
+        ]
+        written = 0
+        for start in range(0, len(items), PERSIST_CHUNK):
+            chunk = items[start : start + PERSIST_CHUNK]
+            try:
+                response = self._client.rpc(
+                    "set_case_collectability_scores", {"p_scores": chunk}
+                ).execute()
+            except Exception as exc:
+                self._logger.warning(
+                    "bulk collectability persist failed, falling back per case: %s", exc
+                )
+                for item in chunk:
+                    self.persist_case_score(item["case_id"], scores[item["case_id"]])
+                    written += 1
+                continue
+            data = getattr(response, "data", None)
+            written += data if isinstance(data, int) else len(chunk)
+        return written
+
     # ------------------------------------------------------------------
     # Static scoring helpers (public for tests)
     # ------------------------------------------------------------------
@@ -211,8 +316,6 @@ class CollectorIntelEngine:
             .execute()
         )
 
-        addresses, phones = self._extract_contact_channels(plaintiff, contacts)
-
         judgments = self._extract_rows(
             self._client.table("judgments")
             .select("id,case_number,notes,metadata,plaintiff_id")
@@ -220,10 +323,6 @@ class CollectorIntelEngine:
             .execute()
         )
         judgment_ids = [row["id"] for row in judgments if row.get("id")]
-        representative_case_number = next(
-            (row.get("case_number") for row in judgments if row.get("case_number")),
-            None,
-        )
 
         enforcement_cases = []
         if judgment_ids:
@@ -233,11 +332,6 @@ class CollectorIntelEngine:
                 .in_("judgment_id", judgment_ids)
                 .execute()
             )
-            if representative_case_number is None:
-                representative_case_number = next(
-                    (row.get("case_number") for row in enforcement_cases if row.get("case_number")),
-                    None,
-                )
 
         events = []
         case_ids = [row["id"] for row in enforcement_cases if row.get("id")]
@@ -258,6 +352,115 @@ class CollectorIntelEngine:
                 .execute()
             )
 
+        return self._build_context(
+            plaintiff, contacts, judgments, enforcement_cases, events, history
+        )
+
+    def _gather_plaintiff_contexts(self, plaintiff_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Bulk variant of :meth:`_gather_plaintiff_context`.
+
+        Pulls each relation once for the whole id set and groups the rows in
+        memory, so the query count depends on the number of id chunks rather
+        than the number of plaintiffs.
+        """
+        ids = list(dict.fromkeys(str(pid) for pid in plaintiff_ids if pid))
+        if not ids:
+            return {}
+
+        plaintiffs = {str(row["id"]): row for row in self._fetch_in("plaintiffs", "*", "id", ids)}
+        found = [pid for pid in ids if pid in plaintiffs]
+        missing = len(ids) - len(found)
+        if missing:
+            self._logger.warning("collector_intel: %d plaintiffs not found", missing)
+        if not found:
+            return {}
+
+        contacts = self._group_by(
+            self._fetch_in(
+                "plaintiff_contacts",
+                "kind,value,phone,email,address,role,plaintiff_id",
+                "plaintiff_id",
+                found,
+            ),
+            "plaintiff_id",
+        )
+        judgments = self._group_by(
+            self._fetch_in(
+                "judgments", "id,case_number,notes,metadata,plaintiff_id", "plaintiff_id", found
+            ),
+            "plaintiff_id",
+        )
+        judgment_ids = [row["id"] for rows in judgments.values() for row in rows if row.get("id")]
+        enforcement_cases = self._group_by(
+            self._fetch_in(
+                "enforcement_cases",
+                "id,judgment_id,case_number,status,current_stage,metadata",
+                "judgment_id",
+                judgment_ids,
+            ),
+            "judgment_id",
+        )
+        case_ids = [
+            row["id"] for rows in enforcement_cases.values() for row in rows if row.get("id")
+        ]
+        events = self._group_by(
+            self._fetch_in(
+                "enforcement_events", "case_id,event_type,notes,metadata", "case_id", case_ids
+            ),
+            "case_id",
+        )
+        history = self._group_by(
+            self._fetch_in(
+                "enforcement_history",
+                "judgment_id,stage,note,changed_by",
+                "judgment_id",
+                judgment_ids,
+            ),
+            "judgment_id",
+        )
+
+        contexts: Dict[str, Dict[str, Any]] = {}
+        for pid in found:
+            own_judgments = judgments.get(pid, [])
+            own_cases = [
+                case
+                for judgment in own_judgments
+                for case in enforcement_cases.get(str(judgment.get("id")), [])
+            ]
+            contexts[pid] = self._build_context(
+                plaintiffs[pid],
+                contacts.get(pid, []),
+                own_judgments,
+                own_cases,
+                [event for case in own_cases for event in events.get(str(case.get("id")), [])],
+                [
+                    row
+                    for judgment in own_judgments
+                    for row in history.get(str(judgment.get("id")), [])
+                ],
+            )
+        return contexts
+
+    def _build_context(
+        self,
+        plaintiff: Dict[str, Any],
+        contacts: Sequence[Dict[str, Any]],
+        judgments: Sequence[Dict[str, Any]],
+        enforcement_cases: Sequence[Dict[str, Any]],
+        events: Sequence[Dict[str, Any]],
+        history: Sequence[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        addresses, phones = self._extract_contact_channels(plaintiff, contacts)
+        representative_case_number = next(
+            (row.get("case_number") for row in judgments if row.get("case_number")),
+            None,
+        )
+        if representative_case_number is None:
+            representative_case_number = next(
+                (row.get("case_number") for row in enforcement_cases if row.get("case_number")),
+                None,
+            )
+
         employer_indicators: List[str] = []
         bank_indicators: List[str] = []
         enforcement_indicators: List[str] = []
@@ -283,8 +486,43 @@ class CollectorIntelEngine:
         return {
             "signals": signals,
             "representative_case_number": representative_case_number,
+            "case_numbers": list(
+                dict.fromkeys(row["case_number"] for row in judgments if row.get("case_number"))
+            ),
         }
 
+    def _score_contexts_by_case(
+        self, contexts: Mapping[str, Dict[str, Any]]
+    ) -> Dict[str, CollectorScore]:
+        """Map each plaintiff's judgments.cases rows to that plaintiff's score."""
+        plaintiff_by_number: Dict[str, str] = {}
+        for plaintiff_id, context in contexts.items():
+            for case_number in context["case_numbers"]:
+                plaintiff_by_number.setdefault(case_number, plaintiff_id)
+        if not plaintiff_by_number:
+            return {}
+
+        cases = self._fetch_in(
+            "cases",
+            "case_id,case_number",
+            "case_number",
+            list(plaintiff_by_number),
+            "judgments",
+            key="case_id",
+        )
+        scores: Dict[str, CollectorScore] = {}
+        for row in cases:
+            plaintiff_id = plaintiff_by_number.get(row.get("case_number") or "")
+            if not plaintiff_id or not row.get("case_id"):
+                continue
+            scores[str(row["case_id"])] = self._build_score(
+                plaintiff_id=plaintiff_id,
+                case_id=str(row["case_id"]),
+                case_number=row.get("case_number"),
+                signals=contexts[plaintiff_id]["signals"],
+            )
+        return scores
+
     def _resolve_case_mapping(
         self, case_id: str, plaintiff_id: Optional[str]
     ) -> Dict[str, Optional[str]]:
@@ -449,6 +687,49 @@ class CollectorIntelEngine:
             raise ValueError(f"No rows returned from {relation}")
         return row
 
+    def _fetch_in(
+        self,
+        table: str,
+        columns: str,
+        column: str,
+        values: Sequence[Any],
+        schema: Optional[str] = None,
+        key: str = "id",
+    ) -> List[Dict[str, Any]]:
+        """Fetch ``table`` rows where ``column`` is in ``values``.
+
+        Values are sent in IN_FILTER_CHUNK-sized in.() filters and each chunk
+        is paged with range() until a short page comes back. Pages are
+        ordered by ``column`` then the unique ``key`` so offsets are stable.
+        """
+        unique = list(dict.fromkeys(values))
+        rows: List[Dict[str, Any]] = []
+        for start in range(0, len(unique), IN_FILTER_CHUNK):
+            chunk = unique[start : start + IN_FILTER_CHUNK]
+            offset = 0
+            while True:
+                source = self._client.schema(schema) if schema else self._client
+                query = source.table(table).select(columns).in_(column, chunk).order(column)
+                if key != column:
+                    query = query.order(key)
+                page = self._extract_rows(
+                    query.range(offset, offset + FETCH_PAGE_SIZE - 1).execute()
+                )
+                rows.extend(page)
+                if len(page) < FETCH_PAGE_SIZE:
+                    break
+                offset += FETCH_PAGE_SIZE
+        return rows
+
+    @staticmethod
+    def _group_by(rows: Iterable[Dict[str, Any]], key: str) -> Dict[str, List[Dict[str, Any]]]:
+        grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            value = row.get(key)
+            if value is not None:
+                grouped[str(value)].append(row)
+        return grouped
+
     def _extract_contact_channels(
         self, plaintiff: Dict[str, Any], contacts: Sequence[Dict[str, Any]]
     ) -> Tuple[List[str], List[str]]:
@@ -504,8 +785,8 @@ class CollectorIntelEngine:
         score = 4.0
         for address in addresses:
             upper = address.upper()
-            has_digits = bool(re.search(r"\d", upper))
-            has_state = any(f" {state} " in f" {upper} " for state in STATE_CODES)
+            has_digits = DIGIT_RE.search(upper) is not None
+            has_state = STATE_TOKEN_RE.search(upper) is not None
             if has_digits and has_state:
                 score += 8.0
             elif has_digits or has_state:
@@ -520,7 +801,7 @@ class CollectorIntelEngine:
     def _score_phone_validity(phones: Sequence[str]) -> float:
         if not phones:
             return 0.0
-        normalized = ["".join(PHONE_DIGITS_RE.findall(phone)) for phone in phones]
+        normalized = [NON_DIGIT_RE.sub("", phone) for phone in phones]
         valid = sum(1 for digits in normalized if len(digits) >= 10)
         if valid == 0:
             return 5.0
@@ -535,13 +816,8 @@ class CollectorIntelEngine:
     ) -> float:
         if not messages:
             return base
-        hits = 0
-        for message in messages:
-            text = str(message or "").lower()
-            if not text:
-                continue
-            if any(keyword in text for keyword in keywords):
-                hits += 1
+        pattern = KEYWORD_PATTERNS.get(tuple(keywords)) or _keyword_pattern(keywords)
+        hits = sum(1 for message in messages if message and pattern.search(str(message).lower()))
         if hits == 0:
             return base
         return min(20.0, base + hits * step)
@@ -550,10 +826,11 @@ class CollectorIntelEngine:
     def _score_enforcement_success(indicators: Sequence[str]) -> float:
         if not indicators:
             return 6.0
-        normalized = [str(item or "").lower() for item in indicators if item]
-        if any(keyword in text for text in normalized for keyword in SUCCESS_KEYWORDS):
+        # One joined scan per keyword set; the separator never matches a keyword
+        text = "\n".join(str(item).lower() for item in indicators if item)
+        if KEYWORD_PATTERNS[SUCCESS_KEYWORDS].search(text):
             return 20.0
-        if any(keyword in text for text in normalized for keyword in MOMENTUM_KEYWORDS):
+        if KEYWORD_PATTERNS[MOMENTUM_KEYWORDS].search(text):
             return 12.0
         return 8.0
 
@@ -595,5 +872,20 @@ def cli_score_case(
     _render(score)
 
 
+@app.command("all")
+def cli_score_all(
+    page_size: int = typer.Option(SCORE_ALL_PAGE_SIZE, "--page-size", help="Plaintiffs per batch"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Score without persisting"),
+) -> None:
+    engine = CollectorIntelEngine()
+    try:
+        summary = engine.score_all(page_size=page_size, persist=not dry_run)
+    except Exception as exc:  # pragma: no cover - CLI convenience
+        logger.error("collector_intel bulk scoring failed: %s", exc)
+        typer.echo(f"Error scoring portfolio: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+    typer.echo(json.dumps(summary, indent=2, sort_keys=True))
+
+
 if __name__ == "__main__":  # pragma: no cover - CLI hook
     app()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Mapping, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import psycopg2
-from psycopg2.extras import Json
+from psycopg2 import sql
+from psycopg2.extras import Json, execute_values
 
 logger = logging.getLogger(__name__)
 
@@ -28,14 +30,7 @@ def _execute_upsert(
         return str(record_id), bool(inserted)
 
 
-CASE_UPSERT_SQL = """
-    INSERT INTO judgments.cases (
-        case_number, court_name, county, state, case_type, filing_date,
-        case_status, case_url, metadata, ingestion_run_id
-    ) VALUES (
-        %(case_number)s, %(court_name)s, %(county)s, %(state)s, %(case_type)s,
-        %(filing_date)s, %(case_status)s, %(case_url)s, %(metadata)s, %(ingestion_run_id)s
-    )
+CASE_CONFLICT_SQL = """
     ON CONFLICT (state, county, case_number) DO UPDATE SET
         court_name = COALESCE(EXCLUDED.court_name, judgments.cases.court_name),
         case_type = COALESCE(EXCLUDED.case_type, judgments.cases.case_type),
@@ -45,28 +40,37 @@ CASE_UPSERT_SQL = """
         metadata = COALESCE(judgments.cases.metadata, '{}'::jsonb) || COALESCE(EXCLUDED.metadata, '{}'::jsonb),
         ingestion_run_id = EXCLUDED.ingestion_run_id,
         updated_at = NOW()
-    RETURNING id, (xmax = 0) AS inserted;
 """
 
+CASE_UPSERT_SQL = (
+    """
+    INSERT INTO judgments.cases (
+        case_number, court_name, county, state, case_type, filing_date,
+        case_status, case_url, metadata, ingestion_run_id
+    ) VALUES (
+        %(case_number)s, %(court_name)s, %(county)s, %(state)s, %(case_type)s,
+        %(filing_date)s, %(case_status)s, %(case_url)s, %(metadata)s, %(ingestion_run_id)s
+    )
+"""
+    + CASE_CONFLICT_SQL
+    + """    RETURNING id, (xmax = 0) AS inserted;
+"""
+)
 
-def upsert_case(conn: psycopg2.extensions.connection, data: Dict[str, Any]) -> Tuple[str, bool]:
-    payload = data.copy()
+
+def _case_payload(data: Mapping[str, Any]) -> Dict[str, Any]:
+    payload = dict(data)
     payload.setdefault("state", "CA")
     payload.setdefault("ingestion_run_id", None)
     payload["metadata"] = _json(payload.get("metadata"))
-    return _execute_upsert(conn, CASE_UPSERT_SQL, payload)
+    return payload
 
 
-JUDGMENT_UPSERT_SQL = """
-    INSERT INTO judgments.judgments (
-        case_id, judgment_number, judgment_date, amount_awarded, amount_remaining,
-        interest_rate, judgment_type, judgment_status, renewal_date, expiration_date,
-        notes, metadata, ingestion_run_id
-    ) VALUES (
-        %(case_id)s, %(judgment_number)s, %(judgment_date)s, %(amount_awarded)s,
-        %(amount_remaining)s, %(interest_rate)s, %(judgment_type)s, %(judgment_status)s,
-        %(renewal_date)s, %(expiration_date)s, %(notes)s, %(metadata)s, %(ingestion_run_id)s
-    )
+def upsert_case(conn: psycopg2.extensions.connection, data: Dict[str, Any]) -> Tuple[str, bool]:
+    return _execute_upsert(conn, CASE_UPSERT_SQL, _case_payload(data))
+
+
+JUDGMENT_CONFLICT_SQL = """
     ON CONFLICT (case_id, judgment_date, amount_awarded)
     WHERE amount_awarded IS NOT NULL DO UPDATE SET
         judgment_number = COALESCE(EXCLUDED.judgment_number, judgments.judgments.judgment_number),
@@ -80,29 +84,38 @@ JUDGMENT_UPSERT_SQL = """
         metadata = COALESCE(judgments.judgments.metadata, '{}'::jsonb) || COALESCE(EXCLUDED.metadata, '{}'::jsonb),
         ingestion_run_id = EXCLUDED.ingestion_run_id,
         updated_at = NOW()
-    RETURNING id, (xmax = 0) AS inserted;
 """
 
+JUDGMENT_UPSERT_SQL = (
+    """
+    INSERT INTO judgments.judgments (
+        case_id, judgment_number, judgment_date, amount_awarded, amount_remaining,
+        interest_rate, judgment_type, judgment_status, renewal_date, expiration_date,
+        notes, metadata, ingestion_run_id
+    ) VALUES (
+        %(case_id)s, %(judgment_number)s, %(judgment_date)s, %(amount_awarded)s,
+        %(amount_remaining)s, %(interest_rate)s, %(judgment_type)s, %(judgment_status)s,
+        %(renewal_date)s, %(expiration_date)s, %(notes)s, %(metadata)s, %(ingestion_run_id)s
+    )
+"""
+    + JUDGMENT_CONFLICT_SQL
+    + """    RETURNING id, (xmax = 0) AS inserted;
+"""
+)
+
 
-def upsert_judgment(conn: psycopg2.extensions.connection, data: Dict[str, Any]) -> Tuple[str, bool]:
-    payload = data.copy()
+def _judgment_payload(data: Mapping[str, Any]) -> Dict[str, Any]:
+    payload = dict(data)
     payload.setdefault("ingestion_run_id", None)
     payload["metadata"] = _json(payload.get("metadata"))
-    return _execute_upsert(conn, JUDGMENT_UPSERT_SQL, payload)
+    return payload
 
 
-PARTY_UPSERT_SQL = """
-    INSERT INTO judgments.parties (
-        case_id, party_type, party_role, is_business, name_full,
-        name_first, name_last, name_business, name_normalized,
-        address_line1, address_line2, city, state, zip,
-        phone, email, metadata, ingestion_run_id
-    ) VALUES (
-        %(case_id)s, %(party_type)s, %(party_role)s, %(is_business)s, %(name_full)s,
-        %(name_first)s, %(name_last)s, %(name_business)s, %(name_normalized)s,
-        %(address_line1)s, %(address_line2)s, %(city)s, %(state)s, %(zip)s,
-        %(phone)s, %(email)s, %(metadata)s, %(ingestion_run_id)s
-    )
+def upsert_judgment(conn: psycopg2.extensions.connection, data: Dict[str, Any]) -> Tuple[str, bool]:
+    return _execute_upsert(conn, JUDGMENT_UPSERT_SQL, _judgment_payload(data))
+
+
+PARTY_CONFLICT_SQL = """
     ON CONFLICT (case_id, party_role, name_normalized)
     WHERE party_role IS NOT NULL AND name_normalized IS NOT NULL DO UPDATE SET
         party_type = COALESCE(EXCLUDED.party_type, judgments.parties.party_type),
@@ -121,28 +134,41 @@ PARTY_UPSERT_SQL = """
         metadata = COALESCE(judgments.parties.metadata, '{}'::jsonb) || COALESCE(EXCLUDED.metadata, '{}'::jsonb),
         ingestion_run_id = EXCLUDED.ingestion_run_id,
         updated_at = NOW()
-    RETURNING id, (xmax = 0) AS inserted;
 """
 
+PARTY_UPSERT_SQL = (
+    """
+    INSERT INTO judgments.parties (
+        case_id, party_type, party_role, is_business, name_full,
+        name_first, name_last, name_business, name_normalized,
+        address_line1, address_line2, city, state, zip,
+        phone, email, metadata, ingestion_run_id
+    ) VALUES (
+        %(case_id)s, %(party_type)s, %(party_role)s, %(is_business)s, %(name_full)s,
+        %(name_first)s, %(name_last)s, %(name_business)s, %(name_normalized)s,
+        %(address_line1)s, %(address_line2)s, %(city)s, %(state)s, %(zip)s,
+        %(phone)s, %(email)s, %(metadata)s, %(ingestion_run_id)s
+    )
+"""
+    + PARTY_CONFLICT_SQL
+    + """    RETURNING id, (xmax = 0) AS inserted;
+"""
+)
+
 
-def upsert_party(conn: psycopg2.extensions.connection, data: Dict[str, Any]) -> Tuple[str, bool]:
-    payload = data.copy()
+def _party_payload(data: Mapping[str, Any]) -> Dict[str, Any]:
+    payload = dict(data)
     payload.setdefault("is_business", False)
     payload.setdefault("ingestion_run_id", None)
     payload["metadata"] = _json(payload.get("metadata"))
-    return _execute_upsert(conn, PARTY_UPSERT_SQL, payload)
+    return payload
 
 
-CONTACT_UPSERT_SQL = """
-    INSERT INTO judgments.contacts (
-        party_id, contact_type, contact_value, contact_label,
-        is_verified, is_primary, source, last_verified_at,
-        notes, metadata, ingestion_run_id
-    ) VALUES (
-        %(party_id)s, %(contact_type)s, %(contact_value)s, %(contact_label)s,
-        %(is_verified)s, %(is_primary)s, %(source)s, %(last_verified_at)s,
-        %(notes)s, %(metadata)s, %(ingestion_run_id)s
-    )
+def upsert_party(conn: psycopg2.extensions.connection, data: Dict[str, Any]) -> Tuple[str, bool]:
+    return _execute_upsert(conn, PARTY_UPSERT_SQL, _party_payload(data))
+
+
+CONTACT_CONFLICT_SQL = """
     ON CONFLICT (party_id, contact_type, contact_value)
     WHERE contact_type IS NOT NULL AND contact_value IS NOT NULL DO UPDATE SET
         contact_label = COALESCE(EXCLUDED.contact_label, judgments.contacts.contact_label),
@@ -154,14 +180,313 @@ CONTACT_UPSERT_SQL = """
         metadata = COALESCE(judgments.contacts.metadata, '{}'::jsonb) || COALESCE(EXCLUDED.metadata, '{}'::jsonb),
         ingestion_run_id = EXCLUDED.ingestion_run_id,
         updated_at = NOW()
-    RETURNING id, (xmax = 0) AS inserted;
 """
 
+CONTACT_UPSERT_SQL = (
+    """
+    INSERT INTO judgments.contacts (
+        party_id, contact_type, contact_value, contact_label,
+        is_verified, is_primary, source, last_verified_at,
+        notes, metadata, ingestion_run_id
+    ) VALUES (
+        %(party_id)s, %(contact_type)s, %(contact_value)s, %(contact_label)s,
+        %(is_verified)s, %(is_primary)s, %(source)s, %(last_verified_at)s,
+        %(notes)s, %(metadata)s, %(ingestion_run_id)s
+    )
+"""
+    + CONTACT_CONFLICT_SQL
+    + """    RETURNING id, (xmax = 0) AS inserted;
+"""
+)
 
-def upsert_contact(conn: psycopg2.extensions.connection, data: Dict[str, Any]) -> Tuple[str, bool]:
-    payload = data.copy()
+
+def _contact_payload(data: Mapping[str, Any]) -> Dict[str, Any]:
+    payload = dict(data)
     payload.setdefault("is_verified", False)
     payload.setdefault("is_primary", False)
     payload.setdefault("ingestion_run_id", None)
     payload["metadata"] = _json(payload.get("metadata"))
-    return _execute_upsert(conn, CONTACT_UPSERT_SQL, payload)
+    return payload
+
+
+def upsert_contact(conn: psycopg2.extensions.connection, data: Dict[str, Any]) -> Tuple[str, bool]:
+    return _execute_upsert(conn, CONTACT_UPSERT_SQL, _contact_payload(data))
+
+
+# ---------------------------------------------------------------------------
+# Bulk loaders
+#
+# Each bulk_upsert_* stages its records in a temp table (execute_values),
+# then merges them with a single INSERT ... SELECT ... ON CONFLICT using the
+# same conflict rules as the single-row upserts. Duplicate natural keys
+# within one call collapse to the last record. The result maps each natural
+# key to its row id so dependent loaders can resolve foreign keys without
+# querying: pass ``case_key`` / ``party_key`` instead of ``case_id`` /
+# ``party_id`` together with the parent result's ``ids``.
+# ---------------------------------------------------------------------------
+
+BULK_PAGE_SIZE = 1000
+
+CASE_COLUMNS = (
+    "case_number", "court_name", "county", "state", "case_type", "filing_date",
+    "case_status", "case_url", "metadata", "ingestion_run_id",
+)  # fmt: skip
+CASE_KEY = ("state", "county", "case_number")
+
+JUDGMENT_COLUMNS = (
+    "case_id", "judgment_number", "judgment_date", "amount_awarded", "amount_remaining",
+    "interest_rate", "judgment_type", "judgment_status", "renewal_date", "expiration_date",
+    "notes", "metadata", "ingestion_run_id",
+)  # fmt: skip
+JUDGMENT_KEY = ("case_id", "judgment_date", "amount_awarded")
+
+PARTY_COLUMNS = (
+    "case_id", "party_type", "party_role", "is_business", "name_full",
+    "name_first", "name_last", "name_business", "name_normalized",
+    "address_line1", "address_line2", "city", "state", "zip",
+    "phone", "email", "metadata", "ingestion_run_id",
+)  # fmt: skip
+PARTY_KEY = ("case_id", "party_role", "name_normalized")
+
+CONTACT_COLUMNS = (
+    "party_id", "contact_type", "contact_value", "contact_label",
+    "is_verified", "is_primary", "source", "last_verified_at",
+    "notes", "metadata", "ingestion_run_id",
+)  # fmt: skip
+CONTACT_KEY = ("party_id", "contact_type", "contact_value")
+
+NaturalKey = Tuple[Any, ...]
+
+
+@dataclass
+class BulkUpsertResult:
+    """Outcome of a bulk upsert: row ids by natural key plus counts.
+
+    Records whose natural key contains NULL never conflict, so they are
+    written and counted but cannot be addressed in ``ids``.
+    """
+
+    ids: Dict[NaturalKey, str] = field(default_factory=dict)
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+    def id_for(self, *key: Any) -> Optional[str]:
+        return self.ids.get(tuple(key))
+
+
+def _resolve_parent(
+    payload: Dict[str, Any],
+    fk_column: str,
+    key_field: str,
+    parent_ids: Optional[Mapping[NaturalKey, str]],
+) -> bool:
+    """Fill ``fk_column`` from ``parent_ids`` via ``payload[key_field]``."""
+    parent_key = payload.pop(key_field, None)
+    if payload.get(fk_column) is None and parent_key is not None and parent_ids is not None:
+        payload[fk_column] = parent_ids.get(tuple(parent_key))
+    return payload.get(fk_column) is not None
+
+
+def _bulk_upsert(
+    conn: psycopg2.extensions.connection,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    table: str,
+    columns: Sequence[str],
+    key: Sequence[str],
+    conflict_sql: str,
+    prepare: Callable[[Mapping[str, Any]], Dict[str, Any]],
+    fk: Optional[Tuple[str, str, Optional[Mapping[NaturalKey, str]]]] = None,
+    page_size: int = BULK_PAGE_SIZE,
+) -> BulkUpsertResult:
+    result = BulkUpsertResult()
+    rows: List[Tuple[Any, ...]] = []
+    keys: List[NaturalKey] = []
+
+    for record in records:
+        payload = prepare(record)
+        if fk is not None and not _resolve_parent(payload, *fk):
+            result.skipped += 1
+            continue
+        keys.append(tuple(payload.get(col) for col in key))
+        rows.append((len(rows), *(payload.get(col) for col in columns)))
+
+    if not rows:
+        return result
+
+    schema, name = table.split(".")
+    staging = sql.Identifier(f"_bulk_{name}")
+    target = sql.Identifier(schema, name)
+    cols = sql.SQL(", ").join(sql.Identifier(col) for col in columns)
+    key_cols = sql.SQL(", ").join(sql.Identifier(col) for col in key)
+    key_present = sql.SQL(" AND ").join(
+        sql.SQL("{} IS NOT NULL").format(sql.Identifier(col)) for col in key
+    )
+    key_join = sql.SQL(" AND ").join(
+        sql.SQL("m.{col} = s.{col}").format(col=sql.Identifier(col)) for col in key
+    )
+
+    with conn.cursor() as cur:
+        cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(staging))
+        cur.execute(
+            sql.SQL(
+                "CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                "SELECT {cols} FROM {target} WITH NO DATA"
+            ).format(staging=staging, cols=cols, target=target)
+        )
+        cur.execute(sql.SQL("ALTER TABLE {} ADD COLUMN _ord integer").format(staging))
+        execute_values(
+            cur,
+            sql.SQL("INSERT INTO {} (_ord, {}) VALUES %s").format(staging, cols),
+            rows,
+            page_size=page_size,
+        )
+
+        # Last record wins per natural key; rows with a NULL key cannot
+        # conflict and pass through untouched.
+        merge = sql.SQL(
+            """
+            WITH merged AS (
+                INSERT INTO {target} ({cols})
+                SELECT {cols} FROM (
+                    SELECT DISTINCT ON ({key_cols}) {cols}
+                    FROM {staging}
+                    WHERE {key_present}
+                    ORDER BY {key_cols}, _ord DESC
+                ) latest
+                UNION ALL
+                SELECT {cols} FROM {staging} WHERE NOT ({key_present})
+                {conflict}
+                RETURNING id, {key_cols}, (xmax = 0) AS inserted
+            )
+            SELECT s._ord, m.id, m.inserted
+            FROM merged m
+            LEFT JOIN {staging} s ON {key_join}
+            """
+        ).format(
+            target=target,
+            cols=cols,
+            key_cols=key_cols,
+            staging=staging,
+            key_present=key_present,
+            conflict=sql.SQL(conflict_sql),
+            key_join=key_join,
+        )
+        cur.execute(merge)
+        merged = cur.fetchall()
+        cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(staging))
+
+    outcome: Dict[str, bool] = {}
+    for ordinal, record_id, inserted in merged:
+        outcome[str(record_id)] = bool(inserted)
+        if ordinal is not None and None not in keys[ordinal]:
+            result.ids[keys[ordinal]] = str(record_id)
+
+    result.inserted = sum(1 for inserted in outcome.values() if inserted)
+    result.updated = len(outcome) - result.inserted
+    logger.debug(
+        "bulk upsert %s rows=%d inserted=%d updated=%d skipped=%d",
+        table,
+        len(rows),
+        result.inserted,
+        result.updated,
+        result.skipped,
+    )
+    return result
+
+
+def bulk_upsert_cases(
+    conn: psycopg2.extensions.connection,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    page_size: int = BULK_PAGE_SIZE,
+) -> BulkUpsertResult:
+    """Upsert cases; ``ids`` is keyed on (state, county, case_number)."""
+    return _bulk_upsert(
+        conn,
+        records,
+        table="judgments.cases",
+        columns=CASE_COLUMNS,
+        key=CASE_KEY,
+        conflict_sql=CASE_CONFLICT_SQL,
+        prepare=_case_payload,
+        page_size=page_size,
+    )
+
+
+def bulk_upsert_judgments(
+    conn: psycopg2.extensions.connection,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    case_ids: Optional[Mapping[NaturalKey, str]] = None,
+    page_size: int = BULK_PAGE_SIZE,
+) -> BulkUpsertResult:
+    """Upsert judgments; ``ids`` is keyed on (case_id, judgment_date, amount_awarded).
+
+    Records may carry ``case_key`` (a case natural key) instead of
+    ``case_id``; it is resolved through ``case_ids``. Records whose case
+    cannot be resolved are skipped.
+    """
+    return _bulk_upsert(
+        conn,
+        records,
+        table="judgments.judgments",
+        columns=JUDGMENT_COLUMNS,
+        key=JUDGMENT_KEY,
+        conflict_sql=JUDGMENT_CONFLICT_SQL,
+        prepare=_judgment_payload,
+        fk=("case_id", "case_key", case_ids),
+        page_size=page_size,
+    )
+
+
+def bulk_upsert_parties(
+    conn: psycopg2.extensions.connection,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    case_ids: Optional[Mapping[NaturalKey, str]] = None,
+    page_size: int = BULK_PAGE_SIZE,
+) -> BulkUpsertResult:
+    """Upsert parties; ``ids`` is keyed on (case_id, party_role, name_normalized).
+
+    Records may carry ``case_key`` instead of ``case_id``, resolved
+    through ``case_ids``.
+    """
+    return _bulk_upsert(
+        conn,
+        records,
+        table="judgments.parties",
+        columns=PARTY_COLUMNS,
+        key=PARTY_KEY,
+        conflict_sql=PARTY_CONFLICT_SQL,
+        prepare=_party_payload,
+        fk=("case_id", "case_key", case_ids),
+        page_size=page_size,
+    )
+
+
+def bulk_upsert_contacts(
+    conn: psycopg2.extensions.connection,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    party_ids: Optional[Mapping[NaturalKey, str]] = None,
+    page_size: int = BULK_PAGE_SIZE,
+) -> BulkUpsertResult:
+    """Upsert contacts; ``ids`` is keyed on (party_id, contact_type, contact_value).
+
+    Records may carry ``party_key`` (a party natural key, whose case_id may
+    itself be a resolved id) instead of ``party_id``, resolved through
+    ``party_ids``.
+    """
+    return _bulk_upsert(
+        conn,
+        records,
+        table="judgments.contacts",
+        columns=CONTACT_COLUMNS,
+        key=CONTACT_KEY,
+        conflict_sql=CONTACT_CONFLICT_SQL,
+        prepare=_contact_payload,
+        fk=("party_id", "party_key", party_ids),
+        page_size=page_size,
+    )
@@ -18,10 +18,11 @@ from src.supabase_client import create_supabase_client, get_supabase_db_url, get
 from .core_judgment_bridge import CoreJudgmentBridge
 from .pipeline_support import (
     ContactSync,
+    EnforcementStageWriter,
+    FollowUpTaskWriter,
+    ImportFlushGroup,
     QueueJobManager,
     RawImportWriter,
-    ensure_follow_up_task,
-    initialize_enforcement_stage,
     sync_row_contacts,
 )
 from .simplicity_plaintiffs import (
@@ -305,21 +306,24 @@ def run_jbi_900_import(
     raw_writer: RawImportWriter | None = None
     contact_sync: ContactSync | None = None
     queue_manager: QueueJobManager | None = None
+    follow_up_writer: FollowUpTaskWriter | None = None
+    enforcement_writer: EnforcementStageWriter | None = None
+    flush_group: ImportFlushGroup | None = None
     core_judgment_bridge: CoreJudgmentBridge | None = None
 
     contact_totals = {"primary": 0, "address": 0}
-    follow_up_totals = {"created": 0, "existing": 0}
-    enforcement_initializations = 0
     core_judgments_stats = {"inserted": 0, "skipped": 0, "errors": 0}
 
     def _record_row_status(
         row_model: SimplicityImportRow,
         status: str,
         error: Optional[str] = None,
-    ) -> Optional[int]:
+        *,
+        target: Dict[str, Any],
+    ) -> None:
         if raw_writer is None:
-            return None
-        return raw_writer.record(
+            return
+        raw_writer.stage(
             row_number=row_model.raw_row_number or 0,
             payload=row_model.model_dump(mode="json"),
             status=status,
@@ -327,12 +331,45 @@ def run_jbi_900_import(
             source_system=JBI_SOURCE_SYSTEM,
             source_reference=source_ref,
             error=error,
+            target=target,
         )
 
+    def _resolve_row(
+        operation: Dict[str, Any],
+        row_model: SimplicityImportRow,
+        error: Optional[Exception],
+    ) -> None:
+        """Count a row and log its raw status once its staged writes resolve."""
+        nonlocal insert_count, row_failure_count, error_count
+        if error is not None and operation.get("status") == "inserted":
+            operation["status"] = "error"
+            operation["error"] = f"staged writes failed: {error}"
+        if operation.get("status") == "inserted":
+            insert_count += 1
+            for key, value in operation.get("contacts", {}).items():
+                contact_totals[key] += value
+        else:
+            row_failure_count += 1
+            error_count += 1
+        _record_row_status(
+            row_model,
+            operation.get("status", "error"),
+            operation.get("error"),
+            target=operation,
+        )
+
+    def _follow_up_totals() -> Dict[str, int]:
+        if follow_up_writer is None:
+            return {"created": 0, "existing": 0}
+        return follow_up_writer.totals()
+
+    def _enforcement_initializations() -> int:
+        return enforcement_writer.initialized if enforcement_writer is not None else 0
+
     def _refresh_runtime_metadata() -> None:
         metadata["contact_inserts"] = dict(contact_totals)
-        metadata["follow_up_tasks"] = dict(follow_up_totals)
-        metadata["enforcement_initializations"] = enforcement_initializations
+        metadata["follow_up_tasks"] = _follow_up_totals()
+        metadata["enforcement_initializations"] = _enforcement_initializations()
         metadata["queued_jobs"] = queue_manager.summary() if queue_manager is not None else []
         metadata["raw_import_log"] = (
             raw_writer.summary() if raw_writer is not None else {"enabled": False}
@@ -384,6 +421,22 @@ def run_jbi_900_import(
             raw_writer = RawImportWriter(db_conn)
             contact_sync = ContactSync(db_conn)
             queue_manager = QueueJobManager(db_conn) if enqueue_jobs else None
+            follow_up_writer = FollowUpTaskWriter(
+                db_conn, batch_name=batch_name, created_by=JBI_CREATED_BY
+            )
+            enforcement_writer = EnforcementStageWriter(
+                db_conn, actor=JBI_CREATED_BY, note="JBI importer initialization"
+            )
+            # Rows are counted and logged once their staged writes resolve
+            flush_group = ImportFlushGroup(
+                db_conn,
+                contact_sync,
+                follow_up_writer,
+                enforcement_writer,
+                queue_manager,
+                resolve_row=_resolve_row,
+                log_writer=raw_writer,
+            )
 
             # Initialize core_judgments bridge if new pipeline is enabled
             if enable_new_pipeline:
@@ -396,7 +449,7 @@ def run_jbi_900_import(
 
             if JBI_LAST_PARSE_ERRORS:
                 for idx, issue in enumerate(JBI_LAST_PARSE_ERRORS):
-                    record_id = raw_writer.record(
+                    raw_writer.stage(
                         row_number=issue.row_number,
                         payload=issue.raw or {},
                         status="parse_error",
@@ -404,9 +457,8 @@ def run_jbi_900_import(
                         source_system=JBI_SOURCE_SYSTEM,
                         source_reference=source_ref,
                         error=issue.error,
+                        target=parse_errors[idx] if idx < len(parse_errors) else None,
                     )
-                    if idx < len(parse_errors):
-                        parse_errors[idx]["raw_import_id"] = record_id
 
         judgment_columns: set[str] = set()
         if not dry_run:
@@ -440,7 +492,7 @@ def run_jbi_900_import(
                 operation["action"] = "skip_existing_judgment"
                 operation["status"] = "skipped"
                 if not dry_run:
-                    operation["raw_import_id"] = _record_row_status(row, "skipped")
+                    _record_row_status(row, "skipped", target=operation)
                 row_operations.append(operation)
                 continue
 
@@ -460,9 +512,9 @@ def run_jbi_900_import(
                 continue
 
             contacts_info: Optional[Dict[str, int]] = None
-            follow_up_result: Optional[Dict[str, Any]] = None
-            enforcement_set = False
             queued_jobs: List[Dict[str, Any]] = []
+            # Filled in when the staged writers flush
+            operation["enforcement_stage_initialized"] = False
 
             try:
                 with db_conn.transaction():
@@ -490,35 +542,19 @@ def run_jbi_900_import(
                             )
 
                 if contact_sync is not None and plaintiff_id is not None:
+                    if created:
+                        contact_sync.track_new_plaintiff(plaintiff_id)
                     contacts_info = sync_row_contacts(
                         contact_sync,
                         plaintiff_id=plaintiff_id,
                         row=row,
                     )
-                    for key, value in contacts_info.items():
-                        contact_totals[key] += value
 
-                if plaintiff_id is not None:
-                    follow_up_result = ensure_follow_up_task(
-                        db_conn,
-                        plaintiff_id=plaintiff_id,
-                        batch_name=batch_name,
-                        created_by=JBI_CREATED_BY,
-                    )
-                    if follow_up_result.get("created"):
-                        follow_up_totals["created"] += 1
-                    else:
-                        follow_up_totals["existing"] += 1
-
-                if judgment_id is not None:
-                    enforcement_set = initialize_enforcement_stage(
-                        db_conn,
-                        judgment_id=judgment_id,
-                        actor=JBI_CREATED_BY,
-                        note="JBI importer initialization",
-                    )
-                    if enforcement_set:
-                        enforcement_initializations += 1
+                if follow_up_writer is not None and plaintiff_id is not None:
+                    follow_up_writer.stage(plaintiff_id, target=operation)
+
+                if enforcement_writer is not None and judgment_id is not None:
+                    enforcement_writer.stage(judgment_id, target=operation)
 
                 # Insert into core_judgments if new pipeline is enabled
                 # This triggers the judgment_enrich queue via DB trigger
@@ -547,7 +583,7 @@ def run_jbi_900_import(
 
                 if queue_manager is not None and judgment_id is not None:
                     queued_jobs.append(
-                        queue_manager.enqueue(
+                        queue_manager.stage(
                             kind="enrich",
                             payload={
                                 "plaintiff_id": plaintiff_id,
@@ -560,7 +596,7 @@ def run_jbi_900_import(
                         )
                     )
                     queued_jobs.append(
-                        queue_manager.enqueue(
+                        queue_manager.stage(
                             kind="enforce",
                             payload={
                                 "plaintiff_id": plaintiff_id,
@@ -573,36 +609,26 @@ def run_jbi_900_import(
                         )
                     )
 
-                insert_count += 1
                 operation["status"] = "inserted"
                 operation["plaintiff_id"] = plaintiff_id
                 operation["judgment_id"] = judgment_id
                 operation["new_plaintiff"] = created
             except Exception as exc:  # noqa: BLE001
-                row_failure_count += 1
-                error_count += 1
                 operation["status"] = "error"
                 operation["error"] = str(exc)
                 logger.exception("jbi 900 import row failure", exc_info=exc)
-            finally:
-                if not dry_run:
-                    raw_id = _record_row_status(
-                        row,
-                        operation.get("status", "error"),
-                        operation.get("error"),
-                    )
-                    if raw_id is not None:
-                        operation["raw_import_id"] = raw_id
 
             if contacts_info is not None:
                 operation["contacts"] = contacts_info
-            if follow_up_result:
-                operation["follow_up_task"] = follow_up_result
-            operation["enforcement_stage_initialized"] = enforcement_set
             if queued_jobs:
                 operation["queued_jobs"] = queued_jobs
 
             row_operations.append(operation)
+            if flush_group is not None:
+                flush_group.row_done(operation, row)
+
+        if flush_group is not None:
+            flush_group.flush()
 
         metadata["summary"] = {
             "row_count": row_count,
@@ -618,8 +644,8 @@ def run_jbi_900_import(
 
         summary_block: Dict[str, Any] = metadata["summary"]
         summary_block["contact_inserts"] = dict(contact_totals)
-        summary_block["follow_up_tasks"] = dict(follow_up_totals)
-        summary_block["enforcement_initializations"] = enforcement_initializations
+        summary_block["follow_up_tasks"] = _follow_up_totals()
+        summary_block["enforcement_initializations"] = _enforcement_initializations()
 
         _refresh_runtime_metadata()
 
@@ -643,6 +669,9 @@ def run_jbi_900_import(
         elif dry_run and managed_connection:
             db_conn.rollback()
     except Exception as exc:
+        if flush_group is not None:
+            # Fail the unflushed rows without writing work that is about to roll back
+            flush_group.discard(f"not written: import aborted ({exc})")
         if managed_connection:
             db_conn.rollback()
             if import_run_id is not None and not dry_run:
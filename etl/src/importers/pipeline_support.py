@@ -3,21 +3,42 @@
 These utilities keep all production ETL entrypoints aligned on how we log raw
 rows, hydrate plaintiff contacts, seed follow-up tasks, set enforcement stages,
 and enqueue downstream jobs.
+
+Per-row side effects can be staged instead of written immediately: each
+writer's ``stage`` method buffers the work and ``flush`` writes the buffer
+with one multi-row statement, filling the caller's ``target`` dict (or the
+returned job metadata) in place once the write has succeeded.
+:class:`ImportFlushGroup` flushes a set of writers together every N rows in
+a savepoint, replays a failed batch one row at a time, and only then hands
+each row its final outcome.
 """
 
 from __future__ import annotations
 
 import json
+import logging
 import re
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import psycopg
 from psycopg import sql
 from psycopg.types.json import Jsonb
 
+logger = logging.getLogger(__name__)
+
+# Staged contacts written per multi-row insert, and the most per-plaintiff
+# contact ledgers held in memory during an import.
+CONTACT_FLUSH_SIZE = 500
+CONTACT_CACHE_MAX_LEDGERS = 10_000
+
+# Rows between flushes of the staged per-row writes (raw log rows, follow-up
+# tasks, enforcement stages, queue jobs) during an import.
+IMPORT_FLUSH_ROWS = 200
+
 
 def _normalize_email(value: Optional[str]) -> Optional[str]:
     return value.strip().lower() if value else None
@@ -42,13 +63,64 @@ def _jsonify(value: Any) -> Any:
     return value
 
 
-class RawImportWriter:
+# A staged raw row: insert params plus the caller's target dict
+_RawRow = Tuple[Tuple[Any, ...], Optional[Dict[str, Any]]]
+
+
+class _StagedWriter:
+    """Buffer shared by the staged writers below.
+
+    A flush runs in two phases so :class:`ImportFlushGroup` can write several
+    writers inside one savepoint and record results only once it holds:
+    ``_write`` runs the SQL for a slice of the buffer and may raise, and
+    ``_apply`` fills the callers' targets and the writer's counters.
+    """
+
+    flush_size: int
+    # Cleared by ImportFlushGroup, which decides when the buffer is written
+    auto_flush = True
+    _pending: List[Any]
+
+    def _write(self, pending: List[Any]) -> Any:
+        raise NotImplementedError
+
+    def _apply(self, pending: List[Any], result: Any) -> int:
+        raise NotImplementedError
+
+    def _drop(self, pending: List[Any], reason: str) -> None:
+        """Record that staged items will not be written."""
+
+    def _take_pending(self) -> List[Any]:
+        pending, self._pending = self._pending, []
+        return pending
+
+    def _maybe_flush(self) -> None:
+        if self.auto_flush and len(self._pending) >= self.flush_size:
+            self.flush()
+
+    def flush(self) -> int:
+        pending = self._take_pending()
+        if not pending:
+            return 0
+        return self._apply(pending, self._write(pending))
+
+    def discard(self, reason: str) -> int:
+        """Drop staged items without writing them. Returns how many were dropped."""
+        pending = self._take_pending()
+        if pending:
+            self._drop(pending, reason)
+        return len(pending)
+
+
+class RawImportWriter(_StagedWriter):
     """Best-effort logger for raw import rows and errors."""
 
     def __init__(
         self,
         conn: psycopg.Connection,
         table_candidates: Sequence[Tuple[str, str]] | None = None,
+        *,
+        flush_size: int = IMPORT_FLUSH_ROWS,
     ) -> None:
         self.conn = conn
         self.table_candidates = table_candidates or [
@@ -56,8 +128,10 @@ class RawImportWriter:
             ("public", "raw_import_log"),
         ]
         self.table: Tuple[str, str] | None = self._detect_table()
+        self.flush_size = max(1, flush_size)
         self.rows_written = 0
         self.failures: List[str] = []
+        self._pending: List[_RawRow] = []
 
     def _detect_table(self) -> Tuple[str, str] | None:
         query = sql.SQL(
@@ -101,6 +175,120 @@ class RawImportWriter:
                 self.failures.append(error)
             return None
 
+        params = self._row_params(
+            row_number=row_number,
+            payload=payload,
+            status=status,
+            batch_name=batch_name,
+            source_system=source_system,
+            source_reference=source_reference,
+            error=error,
+        )
+        with self.conn.cursor() as cur:
+            cur.execute(self._insert_query(), params)
+            row = cur.fetchone()
+            assert row is not None
+            inserted_id: int = row[0]
+        self.rows_written += 1
+        return inserted_id
+
+    def stage(
+        self,
+        *,
+        row_number: int,
+        payload: Dict[str, Any],
+        status: str,
+        batch_name: Optional[str] = None,
+        source_system: Optional[str] = None,
+        source_reference: Optional[str] = None,
+        error: Optional[str] = None,
+        target: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Buffer a raw row; :meth:`flush` sets ``target["raw_import_id"]``."""
+        if not self.enabled:
+            if error:
+                self.failures.append(error)
+            return
+
+        params = self._row_params(
+            row_number=row_number,
+            payload=payload,
+            status=status,
+            batch_name=batch_name,
+            source_system=source_system,
+            source_reference=source_reference,
+            error=error,
+        )
+        self._pending.append((params, target))
+        self._maybe_flush()
+
+    def flush(self) -> int:
+        """Write all staged rows with one insert.
+
+        The batch runs in a savepoint; if it fails, rows are retried one at a
+        time so a bad row lands in ``failures`` (and its target's
+        ``raw_import_error``) without losing the rest of the batch.
+
+        Returns the number of rows written.
+        """
+        pending = self._take_pending()
+        if not pending:
+            return 0
+
+        try:
+            with self.conn.transaction():
+                ids = self._write(pending)
+        except Exception:  # noqa: BLE001 - isolate the failing row
+            written = 0
+            for item in pending:
+                try:
+                    with self.conn.transaction():
+                        ids = self._write([item])
+                except Exception as exc:  # noqa: BLE001 - best-effort log
+                    self._drop([item], str(exc))
+                    continue
+                written += self._apply([item], ids)
+            return written
+        return self._apply(pending, ids)
+
+    def _write(self, pending: List[_RawRow]) -> List[int]:
+        with self.conn.cursor() as cur:
+            if len(pending) == 1:
+                cur.execute(self._insert_query(), pending[0][0])
+                return [row[0] for row in cur.fetchall()]
+
+            columns: Tuple[List[Any], List[Any], List[Any]] = ([], [], [])
+            for row_params, _ in pending:
+                for column, value in zip(columns, row_params):
+                    column.append(value)
+            cur.execute(self._batch_insert_query(), columns)
+            ids = {ord_: inserted_id for ord_, inserted_id in cur.fetchall()}
+        return [ids[ord_] for ord_ in range(1, len(pending) + 1)]
+
+    def _apply(self, pending: List[_RawRow], ids: List[int]) -> int:
+        for (_, target), inserted_id in zip(pending, ids):
+            if target is not None:
+                target["raw_import_id"] = inserted_id
+        self.rows_written += len(pending)
+        return len(pending)
+
+    def _drop(self, pending: List[_RawRow], reason: str) -> None:
+        for row_params, target in pending:
+            self.failures.append(f"row {row_params[0].obj.get('row_number')}: {reason}")
+            if target is not None:
+                target["raw_import_error"] = reason
+
+    @staticmethod
+    def _row_params(
+        *,
+        row_number: int,
+        payload: Dict[str, Any],
+        status: str,
+        batch_name: Optional[str],
+        source_system: Optional[str],
+        source_reference: Optional[str],
+        error: Optional[str],
+    ) -> Tuple[Any, ...]:
         record = {
             "row_number": row_number,
             "batch_name": batch_name,
@@ -109,29 +297,61 @@ class RawImportWriter:
             "payload": _jsonify(payload),
         }
         error_payload = {"message": error} if error else None
+        return (Jsonb(record), status, Jsonb(error_payload) if error_payload else None)
+
+    def _table_sql(self) -> sql.Composed:
         assert self.table is not None  # guarded by enabled check
-        insert_query = sql.SQL(
+        return sql.SQL("{}.{}").format(sql.Identifier(self.table[0]), sql.Identifier(self.table[1]))
+
+    def _insert_query(self) -> sql.Composed:
+        return sql.SQL(
             """
-            insert into {}.{} (raw_data, imported_at, status, error_log)
+            insert into {} (raw_data, imported_at, status, error_log)
             values (%s, timezone('utc', now()), %s, %s)
             returning id
             """
-        ).format(sql.Identifier(self.table[0]), sql.Identifier(self.table[1]))
+        ).format(self._table_sql())
 
-        with self.conn.cursor() as cur:
-            cur.execute(
-                insert_query,
-                (
-                    Jsonb(record),
-                    status,
-                    Jsonb(error_payload) if error_payload else None,
-                ),
+    def _batch_insert_query(self) -> sql.Composed:
+        """Insert unnest()ed rows and return ``(ordinal, id)`` pairs.
+
+        RETURNING order is unspecified for a multi-row insert, so each
+        inserted row is joined back to its input position on content;
+        identical rows are interchangeable and are paired off by ordinal.
+        """
+        return sql.SQL(
+            """
+            with input as (
+                select raw_data, status, error_log, ord,
+                       row_number() over (
+                           partition by raw_data, status, error_log order by ord
+                       ) as dup
+                from unnest(%s::jsonb[], %s::text[], %s::jsonb[])
+                    with ordinality as t(raw_data, status, error_log, ord)
+            ),
+            inserted as (
+                insert into {} (raw_data, imported_at, status, error_log)
+                select raw_data, timezone('utc', now()), status, error_log
+                from input
+                order by ord
+                returning id, raw_data, status, error_log
+            ),
+            numbered as (
+                select id, raw_data, status, error_log,
+                       row_number() over (
+                           partition by raw_data, status, error_log order by id
+                       ) as dup
+                from inserted
             )
-            row = cur.fetchone()
-            assert row is not None
-            inserted_id: int = row[0]
-        self.rows_written += 1
-        return inserted_id
+            select input.ord, numbered.id
+            from input
+            join numbered
+              on numbered.raw_data = input.raw_data
+             and numbered.status is not distinct from input.status
+             and numbered.error_log is not distinct from input.error_log
+             and numbered.dup = input.dup
+            """
+        ).format(self._table_sql())
 
     def summary(self) -> Dict[str, Any]:
         return {
@@ -142,13 +362,15 @@ class RawImportWriter:
         }
 
 
-class QueueJobManager:
+class QueueJobManager(_StagedWriter):
     """Helper that wraps queue_job RPC calls and collects job metadata."""
 
-    def __init__(self, conn: psycopg.Connection) -> None:
+    def __init__(self, conn: psycopg.Connection, *, flush_size: int = IMPORT_FLUSH_ROWS) -> None:
         self.conn = conn
         self.available = self._check_available()
+        self.flush_size = max(1, flush_size)
         self.jobs: List[Dict[str, Any]] = []
+        self._pending: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
 
     def _check_available(self) -> bool:
         with self.conn.cursor() as cur:
@@ -204,6 +426,89 @@ class QueueJobManager:
         self.jobs.append(job_meta)
         return job_meta
 
+    def stage(
+        self,
+        *,
+        kind: str,
+        payload: Dict[str, Any],
+        idempotency_key: str,
+    ) -> Dict[str, Any]:
+        """Buffer a job; the returned metadata is completed by :meth:`flush`."""
+        job_meta: Dict[str, Any] = {
+            "kind": kind,
+            "idempotency_key": idempotency_key,
+        }
+        self.jobs.append(job_meta)
+        if not self.available:
+            job_meta["status"] = "skipped"
+            job_meta["reason"] = "queue_job RPC missing"
+            return job_meta
+
+        job_meta["status"] = "pending"
+        job = {"kind": kind, "payload": payload, "idempotency_key": idempotency_key}
+        self._pending.append((job_meta, job))
+        self._maybe_flush()
+        return job_meta
+
+    def _write(self, pending: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Tuple[str, Any]]:
+        """Enqueue staged jobs with one queue_job call per row of a single select.
+
+        If the batch fails (e.g. one job is rejected), jobs are retried one at
+        a time so each job records its own outcome. Returns a ``(status,
+        message_id or error)`` outcome per job.
+        """
+        try:
+            with self.conn.transaction():
+                with self.conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        select public.queue_job(job)
+                        from unnest(%s::jsonb[]) with ordinality as t(job, ord)
+                        order by ord
+                        """,
+                        ([Jsonb(job) for _, job in pending],),
+                    )
+                    message_ids = [row[0] for row in cur.fetchall()]
+        except Exception:  # noqa: BLE001 - fall back to per-job outcomes
+            return self._write_one_by_one(pending)
+        return [("queued", message_id) for message_id in message_ids]
+
+    def _write_one_by_one(
+        self, pending: List[Tuple[Dict[str, Any], Dict[str, Any]]]
+    ) -> List[Tuple[str, Any]]:
+        outcomes: List[Tuple[str, Any]] = []
+        for _, job in pending:
+            try:
+                with self.conn.transaction():
+                    with self.conn.cursor() as cur:
+                        cur.execute("select public.queue_job(%s)", (Jsonb(job),))
+                        row = cur.fetchone()
+                        assert row is not None
+                        outcomes.append(("queued", row[0]))
+            except Exception as exc:  # noqa: BLE001 - bubble details into metadata
+                outcomes.append(("error", str(exc)))
+        return outcomes
+
+    def _apply(
+        self,
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        outcomes: List[Tuple[str, Any]],
+    ) -> int:
+        queued = 0
+        for (job_meta, _), (status, value) in zip(pending, outcomes):
+            job_meta["status"] = status
+            if status == "queued":
+                job_meta["message_id"] = value
+                queued += 1
+            else:
+                job_meta["error"] = value
+        return queued
+
+    def _drop(self, pending: List[Tuple[Dict[str, Any], Dict[str, Any]]], reason: str) -> None:
+        for job_meta, _ in pending:
+            job_meta["status"] = "error"
+            job_meta["error"] = reason
+
     def summary(self) -> List[Dict[str, Any]]:
         return self.jobs
 
@@ -215,13 +520,35 @@ class ContactLedger:
     kv_pairs: set[Tuple[Optional[str], str]] = field(default_factory=set)
 
 
-class ContactSync:
-    """Minimal contact upsert helper with de-dup support."""
+class ContactSync(_StagedWriter):
+    """Contact upsert helper with de-dup support and batched writes.
+
+    Ledgers for existing plaintiffs are bulk-loaded with :meth:`warm` (one
+    ``= ANY`` query per batch) and plaintiffs created during the import are
+    registered with :meth:`track_new_plaintiff` so they never need a lookup.
+    New contacts are staged by :meth:`ensure_contact` and written with one
+    multi-row insert by :meth:`flush`, which runs automatically every
+    ``flush_size`` contacts; callers must flush before committing.
+    """
 
-    def __init__(self, conn: psycopg.Connection) -> None:
+    # Optional plaintiff_contacts columns, written when present in the table
+    _OPTIONAL_COLUMNS = ("email", "phone", "value", "kind")
+
+    def __init__(
+        self,
+        conn: psycopg.Connection,
+        *,
+        flush_size: int = CONTACT_FLUSH_SIZE,
+        max_cached_ledgers: int = CONTACT_CACHE_MAX_LEDGERS,
+    ) -> None:
         self.conn = conn
+        self.flush_size = max(1, flush_size)
+        self.max_cached_ledgers = max(1, max_cached_ledgers)
         self._columns = self._fetch_columns()
-        self._cache: Dict[str, ContactLedger] = {}
+        self._cache: OrderedDict[str, ContactLedger] = OrderedDict()
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_plaintiffs: set[str] = set()
+        self.contacts_flushed = 0
 
     def _fetch_columns(self) -> set[str]:
         with self.conn.cursor() as cur:
@@ -234,31 +561,72 @@ class ContactSync:
             )
             return {row[0] for row in cur.fetchall()}
 
-    def _ledger_for(self, plaintiff_id: str) -> ContactLedger:
-        if plaintiff_id in self._cache:
-            return self._cache[plaintiff_id]
-        ledger = ContactLedger()
+    def _remember(self, plaintiff_id: str, ledger: ContactLedger) -> ContactLedger:
+        self._cache[plaintiff_id] = ledger
+        self._cache.move_to_end(plaintiff_id)
+        while len(self._cache) > self.max_cached_ledgers:
+            evicted = next(iter(self._cache))
+            if evicted in self._pending_plaintiffs:
+                # Staged contacts exist only in this ledger until flushed
+                if not self.auto_flush:
+                    # The flush group owns the buffer; evict after it writes
+                    break
+                self.flush()
+            self._cache.popitem(last=False)
+        return ledger
+
+    def warm(self, plaintiff_ids: Sequence[Any]) -> int:
+        """Load ledgers for every uncached plaintiff with a single query.
+
+        Returns the number of plaintiffs loaded.
+        """
+        ids = (str(pid) for pid in plaintiff_ids if pid)
+        missing = [pid for pid in dict.fromkeys(ids) if pid not in self._cache]
+        if not missing:
+            return 0
+
+        ledgers = {pid: ContactLedger() for pid in missing}
         with self.conn.cursor() as cur:
             cur.execute(
                 """
-                select lower(nullif(email, '')) as email,
+                select plaintiff_id::text,
+                       lower(nullif(email, '')) as email,
                        regexp_replace(coalesce(phone, ''), '\\D', '', 'g') as phone,
                        kind,
                        coalesce(value, '') as value
                 from public.plaintiff_contacts
-                where plaintiff_id = %s
+                where plaintiff_id = any(%s::uuid[])
                 """,
-                (plaintiff_id,),
+                (missing,),
             )
-            for email, phone, kind, value in cur.fetchall():
+            for plaintiff_id, email, phone, kind, value in cur.fetchall():
+                ledger = ledgers.get(plaintiff_id)
+                if ledger is None:
+                    continue
                 if email:
                     ledger.emails.add(email)
                 if phone:
                     ledger.phones.add(phone)
                 if value:
                     ledger.kv_pairs.add((kind, value.strip().lower()))
-        self._cache[plaintiff_id] = ledger
-        return ledger
+
+        for plaintiff_id, ledger in ledgers.items():
+            self._remember(plaintiff_id, ledger)
+        return len(missing)
+
+    def track_new_plaintiff(self, plaintiff_id: Any) -> None:
+        """Register a plaintiff created in this import; it has no stored contacts."""
+        key = str(plaintiff_id)
+        if key not in self._cache:
+            self._remember(key, ContactLedger())
+
+    def _ledger_for(self, plaintiff_id: Any) -> ContactLedger:
+        key = str(plaintiff_id)
+        if key not in self._cache:
+            self.warm([key])
+        else:
+            self._cache.move_to_end(key)
+        return self._cache[key]
 
     def ensure_contact(
         self,
@@ -270,13 +638,20 @@ class ContactSync:
         phone: Optional[str] = None,
         kind: Optional[str] = None,
         value: Optional[str] = None,
-    ) -> Optional[int]:
+        counts: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        """Stage a contact unless every identifier is already on file.
+
+        Returns True when a new contact was staged for insert. When *counts*
+        is given, ``counts[role]`` is incremented once the flush confirms the
+        insert wrote the row (conflicting rows are skipped and not counted).
+        """
         normalized_email = _normalize_email(email)
         normalized_phone = _normalize_phone(phone)
         normalized_value = value.strip().lower() if value else None
 
         if not any([normalized_email, normalized_phone, normalized_value]):
-            return None
+            return False
 
         ledger = self._ledger_for(plaintiff_id)
         if normalized_email and normalized_email in ledger.emails:
@@ -287,48 +662,91 @@ class ContactSync:
             normalized_value = None
 
         if not any([normalized_email, normalized_phone, normalized_value]):
-            return None
+            return False
+
+        self._pending.append(
+            {
+                "plaintiff_id": plaintiff_id,
+                "name": name,
+                "role": role,
+                "email": email if normalized_email else None,
+                "phone": phone if normalized_phone else None,
+                "value": value if normalized_value is not None else None,
+                "kind": kind,
+                "_counts": counts,
+            }
+        )
+        self._pending_plaintiffs.add(str(plaintiff_id))
+
+        if normalized_email:
+            ledger.emails.add(normalized_email)
+        if normalized_phone:
+            ledger.phones.add(normalized_phone)
+        if normalized_value is not None:
+            ledger.kv_pairs.add((kind, normalized_value))
+
+        self._maybe_flush()
+        return True
+
+    def _take_pending(self) -> List[Dict[str, Any]]:
+        self._pending_plaintiffs.clear()
+        return super()._take_pending()
+
+    def _insert_columns(self) -> List[str]:
+        return ["plaintiff_id", "name", "role"] + [
+            col for col in self._OPTIONAL_COLUMNS if col in self._columns
+        ]
+
+    @staticmethod
+    def _row_key(values: Sequence[Any]) -> Tuple[Optional[str], ...]:
+        return tuple(None if value is None else str(value) for value in values)
 
-        columns = ["plaintiff_id", "name", "role"]
-        values: List[Any] = [plaintiff_id, name, role]
-        if "email" in self._columns:
-            columns.append("email")
-            values.append(email if normalized_email else None)
-        if "phone" in self._columns:
-            columns.append("phone")
-            values.append(phone if normalized_phone else None)
-        if normalized_value is not None and "value" in self._columns:
-            columns.append("value")
-            values.append(value)
-        if kind and "kind" in self._columns:
-            columns.append("kind")
-            values.append(kind)
+    def _write(self, pending: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        """Write staged contacts with one multi-row insert.
 
+        Returns the rows the insert actually wrote; ``on conflict do nothing``
+        leaves conflicting rows out of ``RETURNING``.
+        """
+        columns = self._insert_columns()
+        row_sql = sql.SQL("({})").format(sql.SQL(", ").join(sql.Placeholder() for _ in columns))
+        column_list = sql.SQL(", ").join(sql.Identifier(col) for col in columns)
         insert_query = sql.SQL(
             """
             insert into public.plaintiff_contacts ({cols})
-            values ({placeholders})
-            returning id
+            values {rows}
+            on conflict do nothing
+            returning {cols}
             """
         ).format(
-            cols=sql.SQL(", ").join(sql.Identifier(col) for col in columns),
-            placeholders=sql.SQL(", ").join(sql.Placeholder() for _ in columns),
+            cols=column_list,
+            rows=sql.SQL(", ").join(row_sql for _ in pending),
         )
+        params = [contact[col] for contact in pending for col in columns]
 
         with self.conn.cursor() as cur:
-            cur.execute(insert_query, values)
-            row = cur.fetchone()
-            assert row is not None
-            contact_id: int = row[0]
+            cur.execute(insert_query, params)
+            return list(cur.fetchall())
 
-        ledger = self._ledger_for(plaintiff_id)
-        if normalized_email:
-            ledger.emails.add(normalized_email)
-        if normalized_phone:
-            ledger.phones.add(normalized_phone)
-        if normalized_value is not None:
-            ledger.kv_pairs.add((kind, normalized_value))
-        return contact_id
+    def _apply(self, pending: List[Dict[str, Any]], result: List[Tuple[Any, ...]]) -> int:
+        columns = self._insert_columns()
+        written = Counter(self._row_key(row) for row in result)
+        inserted = 0
+        for contact in pending:
+            key = self._row_key([contact[col] for col in columns])
+            if written[key] <= 0:
+                continue
+            written[key] -= 1
+            inserted += 1
+            counts = contact.get("_counts")
+            if counts is not None:
+                counts[contact["role"]] = counts.get(contact["role"], 0) + 1
+        self.contacts_flushed += inserted
+        return inserted
+
+    def _drop(self, pending: List[Dict[str, Any]], reason: str) -> None:
+        # The ledgers already list these contacts; reload them from the table
+        for contact in pending:
+            self._cache.pop(str(contact["plaintiff_id"]), None)
 
 
 FOLLOW_UP_TASK_KIND = "call"
@@ -433,25 +851,339 @@ def initialize_enforcement_stage(
             return bool(cur.fetchone())
 
 
+class FollowUpTaskWriter(_StagedWriter):
+    """Batched :func:`ensure_follow_up_task`.
+
+    :meth:`stage` buffers a plaintiff; :meth:`flush` looks up open call tasks
+    for every staged plaintiff with one query, creates the missing ones with
+    one multi-row insert and sets ``target["follow_up_task"]`` to the same
+    ``{"id", "created"}`` shape the single-row helper returns.
+    """
+
+    def __init__(
+        self,
+        conn: psycopg.Connection,
+        *,
+        batch_name: str,
+        created_by: str,
+        due_in_days: int = 7,
+        flush_size: int = IMPORT_FLUSH_ROWS,
+    ) -> None:
+        self.conn = conn
+        self.batch_name = batch_name
+        self.created_by = created_by
+        self.due_in_days = due_in_days
+        self.flush_size = max(1, flush_size)
+        self.created = 0
+        self.existing = 0
+        self._pending: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+
+    def stage(self, plaintiff_id: Any, *, target: Optional[Dict[str, Any]] = None) -> None:
+        self._pending.append((str(plaintiff_id), target))
+        self._maybe_flush()
+
+    def _write(
+        self, pending: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> Tuple[Dict[str, str], Dict[str, Optional[str]]]:
+        """Look up and create tasks; returns the existing and created task ids."""
+        plaintiff_ids = list(dict.fromkeys(pid for pid, _ in pending))
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                select distinct on (plaintiff_id) plaintiff_id::text, id
+                from public.plaintiff_tasks
+                where plaintiff_id = any(%s::uuid[]) and kind = %s and status = 'open'
+                order by plaintiff_id, created_at asc
+                """,
+                (plaintiff_ids, FOLLOW_UP_TASK_KIND),
+            )
+            existing = {pid: str(task_id) for pid, task_id in cur.fetchall()}
+
+            missing = [pid for pid in plaintiff_ids if pid not in existing]
+            created: Dict[str, Optional[str]] = {}
+            if missing:
+                metadata = Jsonb({"batch_name": self.batch_name, "source": "importer"})
+                note = f"Automated outreach task for batch {self.batch_name}"
+                row_sql = sql.SQL(
+                    "(%s, %s, 'open', timezone('utc', now()) + (%s || ' days')::interval,"
+                    " %s, %s, %s)"
+                )
+                cur.execute(
+                    sql.SQL(
+                        """
+                        insert into public.plaintiff_tasks (
+                            plaintiff_id,
+                            kind,
+                            status,
+                            due_at,
+                            note,
+                            created_by,
+                            metadata
+                        )
+                        values {}
+                        returning plaintiff_id::text, id
+                        """
+                    ).format(sql.SQL(", ").join(row_sql for _ in missing)),
+                    [
+                        value
+                        for pid in missing
+                        for value in (
+                            pid,
+                            FOLLOW_UP_TASK_KIND,
+                            self.due_in_days,
+                            note,
+                            self.created_by,
+                            metadata,
+                        )
+                    ],
+                )
+                created = {pid: str(task_id) for pid, task_id in cur.fetchall()}
+        return existing, created
+
+    def _apply(
+        self,
+        pending: List[Tuple[str, Optional[Dict[str, Any]]]],
+        result: Tuple[Dict[str, str], Dict[str, Optional[str]]],
+    ) -> int:
+        existing, created = result
+        # The first staged row for a plaintiff creates its task; later rows see it
+        reported: set[str] = set()
+        for pid, target in pending:
+            if pid in existing or pid in reported:
+                result = {"id": existing.get(pid) or created.get(pid), "created": False}
+                self.existing += 1
+            else:
+                result = {"id": created.get(pid), "created": True}
+                self.created += 1
+                reported.add(pid)
+            if target is not None:
+                target["follow_up_task"] = result
+        return len(created)
+
+    def totals(self) -> Dict[str, int]:
+        return {"created": self.created, "existing": self.existing}
+
+
+class EnforcementStageWriter(_StagedWriter):
+    """Batched :func:`initialize_enforcement_stage`.
+
+    :meth:`flush` calls ``set_enforcement_stage`` for every staged judgment in
+    one select (or, when the RPC is missing, one bulk update) and sets
+    ``target["enforcement_stage_initialized"]`` per judgment. A failing batch
+    is retried one judgment at a time so the failure stays with its row.
+    """
+
+    def __init__(
+        self,
+        conn: psycopg.Connection,
+        *,
+        actor: str,
+        note: str = "Importer initialization",
+        stage: str = "pre_enforcement",
+        flush_size: int = IMPORT_FLUSH_ROWS,
+    ) -> None:
+        self.conn = conn
+        self.actor = actor
+        self.note = note
+        self.stage_name = stage
+        self.flush_size = max(1, flush_size)
+        self.initialized = 0
+        self._pending: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+
+    def stage(self, judgment_id: Any, *, target: Optional[Dict[str, Any]] = None) -> None:
+        self._pending.append((str(judgment_id), target))
+        self._maybe_flush()
+
+    def _write(self, pending: List[Tuple[str, Optional[Dict[str, Any]]]]) -> set[str]:
+        """Initialize staged judgments; returns the ids that were initialized."""
+        judgment_ids = list(dict.fromkeys(jid for jid, _ in pending))
+        try:
+            done = self._initialize_many(judgment_ids)
+        except Exception:  # noqa: BLE001 - isolate the failing judgment
+            done = set()
+            for judgment_id in judgment_ids:
+                try:
+                    if self._initialize_many([judgment_id]):
+                        done.add(judgment_id)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "enforcement stage init failed judgment_id=%s error=%s", judgment_id, exc
+                    )
+        return done
+
+    def _apply(self, pending: List[Tuple[str, Optional[Dict[str, Any]]]], done: set[str]) -> int:
+        for judgment_id, target in pending:
+            if target is not None:
+                target["enforcement_stage_initialized"] = judgment_id in done
+        initialized = sum(1 for judgment_id, _ in pending if judgment_id in done)
+        self.initialized += initialized
+        return initialized
+
+    def _initialize_many(self, judgment_ids: List[str]) -> set[str]:
+        try:
+            with self.conn.transaction():
+                with self.conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        select public.set_enforcement_stage(j.id, %s, %s, %s)
+                        from unnest(%s::bigint[]) as j(id)
+                        """,
+                        (self.stage_name, self.note, self.actor, judgment_ids),
+                    )
+                    cur.fetchall()
+                    return set(judgment_ids)
+        except psycopg.errors.UndefinedFunction:
+            with self.conn.transaction():
+                with self.conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        update public.judgments
+                        set enforcement_stage = %s,
+                            enforcement_stage_updated_at = timezone('utc', now())
+                        where id = any(%s::bigint[])
+                        returning id::text
+                        """,
+                        (self.stage_name, judgment_ids),
+                    )
+                    return {row[0] for row in cur.fetchall()}
+
+
+# Called with (operation, context, error) once a row's staged writes resolve
+RowResolver = Callable[[Dict[str, Any], Any, Optional[Exception]], None]
+
+
+@dataclass(slots=True)
+class _StagedRow:
+    operation: Dict[str, Any]
+    context: Any
+    # End offset of the row's items in each writer's buffer
+    ends: List[int]
+
+
+class ImportFlushGroup:
+    """Flush a set of staged writers together every ``flush_rows`` rows.
+
+    Each batch is written inside one savepoint. If it fails, the savepoint
+    is rolled back and the batch is replayed one row at a time, each row in
+    its own savepoint, so a bad row fails alone. Only then is each row
+    handed to ``resolve_row(operation, context, error)`` with its outcome;
+    ``log_writer`` (the raw row writer) is flushed after that so the status
+    logged for each row is final.
+    """
+
+    def __init__(
+        self,
+        conn: psycopg.Connection,
+        *writers: Optional[_StagedWriter],
+        resolve_row: RowResolver,
+        log_writer: Optional[_StagedWriter] = None,
+        flush_rows: int = IMPORT_FLUSH_ROWS,
+    ) -> None:
+        self.conn = conn
+        self.writers = [writer for writer in writers if writer is not None]
+        for writer in self.writers:
+            writer.auto_flush = False
+        self.resolve_row = resolve_row
+        self.log_writer = log_writer
+        self.flush_rows = max(1, flush_rows)
+        self._rows: List[_StagedRow] = []
+
+    def row_done(self, operation: Dict[str, Any], context: Any = None) -> None:
+        """Mark the end of a row's staged writes; ``context`` is passed back on resolve."""
+        ends = [len(writer._pending) for writer in self.writers]
+        self._rows.append(_StagedRow(operation, context, ends))
+        if len(self._rows) >= self.flush_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        rows, self._rows = self._rows, []
+        batches = [writer._take_pending() for writer in self.writers]
+        errors: Dict[int, Exception] = {}
+        try:
+            self._write_and_apply(batches)
+        except Exception as exc:  # noqa: BLE001 - isolate the failing rows
+            logger.warning(
+                "import batch flush failed; replaying %d rows one at a time: %s", len(rows), exc
+            )
+            errors = self._replay(rows, batches)
+
+        for idx, row in enumerate(rows):
+            self.resolve_row(row.operation, row.context, errors.get(idx))
+        if self.log_writer is not None:
+            self.log_writer.flush()
+
+    def discard(self, reason: str) -> None:
+        """Fail every unflushed row without writing any of its staged work."""
+        rows, self._rows = self._rows, []
+        for writer in self.writers:
+            writer.discard(reason)
+        if self.log_writer is not None:
+            self.log_writer.auto_flush = False
+        error = RuntimeError(reason)
+        for row in rows:
+            self.resolve_row(row.operation, row.context, error)
+        if self.log_writer is not None:
+            self.log_writer.discard(reason)
+
+    def _write_and_apply(self, batches: List[List[Any]]) -> None:
+        with self.conn.transaction():
+            results = [
+                writer._write(batch) if batch else None
+                for writer, batch in zip(self.writers, batches)
+            ]
+        for writer, batch, result in zip(self.writers, batches, results):
+            if batch:
+                writer._apply(batch, result)
+
+    def _replay(self, rows: List[_StagedRow], batches: List[List[Any]]) -> Dict[int, Exception]:
+        errors: Dict[int, Exception] = {}
+        starts = [0] * len(self.writers)
+        for idx, row in enumerate(rows):
+            parts = [batch[start:end] for batch, start, end in zip(batches, starts, row.ends)]
+            starts = row.ends
+            try:
+                self._write_and_apply(parts)
+            except Exception as exc:  # noqa: BLE001 - recorded on the row
+                errors[idx] = exc
+                for writer, part in zip(self.writers, parts):
+                    if part:
+                        writer._drop(part, str(exc))
+
+        # Work staged after the last row_done() belongs to no row
+        leftovers = [batch[start:] for batch, start in zip(batches, starts)]
+        if any(leftovers):
+            try:
+                self._write_and_apply(leftovers)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("import buffer flush failed for unassigned writes: %s", exc)
+                for writer, part in zip(self.writers, leftovers):
+                    if part:
+                        writer._drop(part, str(exc))
+        return errors
+
+
 def sync_row_contacts(
     contact_sync: ContactSync,
     *,
     plaintiff_id: str,
     row: Any,
 ) -> Dict[str, int]:
-    """Insert the primary + address contacts for the row if missing."""
+    """Stage the primary + address contacts for the row if missing.
+
+    The returned counts are filled in when the contacts flush, so read them
+    after the flush (the flush group resolves rows only after writing).
+    """
 
     inserted = {"primary": 0, "address": 0}
     name = getattr(row, "plaintiff_name", None) or "Unknown"
-    primary_id = contact_sync.ensure_contact(
+    contact_sync.ensure_contact(
         plaintiff_id,
         name=name,
         role="primary",
         email=getattr(row, "plaintiff_email", None),
         phone=getattr(row, "plaintiff_phone", None),
+        counts=inserted,
     )
-    if primary_id:
-        inserted["primary"] = 1
 
     address_parts = [
         getattr(row, "plaintiff_address_1", None),
@@ -462,21 +1194,23 @@ def sync_row_contacts(
     ]
     address_value = ", ".join(part for part in address_parts if part)
     if address_value:
-        address_id = contact_sync.ensure_contact(
+        contact_sync.ensure_contact(
             plaintiff_id,
             name=f"{name} address",
             role="address",
             kind="address",
             value=address_value,
+            counts=inserted,
         )
-        if address_id:
-            inserted["address"] = 1
     return inserted
 
 
 __all__ = [
     "ContactLedger",
     "ContactSync",
+    "EnforcementStageWriter",
+    "FollowUpTaskWriter",
+    "ImportFlushGroup",
     "QueueJobManager",
     "RawImportWriter",
     "ensure_follow_up_task",
@@ -31,6 +31,7 @@ import argparse
 import asyncio
 import csv
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
@@ -49,6 +50,11 @@ logger = logging.getLogger(__name__)
 # schema.
 REQUIRED_HEADERS = {"plaintiffname", "contactname"}
 
+# Plaintiffs whose contact ledgers are bulk-loaded per query, and the most
+# ledgers held in memory at once during an import.
+CONTACT_WARM_CHUNK = 500
+CONTACT_CACHE_MAX_ENTRIES = 10_000
+
 
 def _resolve_db_target() -> tuple[str, str, str, str]:
     env = get_supabase_env()
@@ -295,37 +301,74 @@ class ContactLedger:
 
 
 class ContactCache:
-    """Lazy-load contact deduplication data per plaintiff."""
+    """Contact deduplication data per plaintiff, bulk-loadable and size-bounded.
+
+    Ledgers are normally loaded in bulk with :meth:`warm`; :meth:`get` falls
+    back to a single-plaintiff query on a miss. At most ``max_entries``
+    ledgers are kept, evicting the least recently used.
+    """
 
-    def __init__(self, conn: Connection) -> None:
+    def __init__(self, conn: Connection, *, max_entries: int = CONTACT_CACHE_MAX_ENTRIES) -> None:
         self.conn = conn
-        self._cache: Dict[str, ContactLedger] = {}
+        self.max_entries = max(1, max_entries)
+        self._cache: OrderedDict[str, ContactLedger] = OrderedDict()
+
+    def _remember(self, plaintiff_id: str, ledger: ContactLedger) -> ContactLedger:
+        key = str(plaintiff_id)
+        self._cache[key] = ledger
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return ledger
 
-    def get(self, plaintiff_id: str) -> ContactLedger:
-        if plaintiff_id in self._cache:
-            return self._cache[plaintiff_id]
-        ledger = ContactLedger()
+    def _load(self, plaintiff_ids: List[str]) -> Dict[str, ContactLedger]:
+        ledgers = {str(plaintiff_id): ContactLedger() for plaintiff_id in plaintiff_ids}
         with self.conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
                 """
                 SELECT
+                    plaintiff_id::text AS plaintiff_id,
                     lower(email) AS normalized_email,
                     regexp_replace(lower(trim(name)), '\\s+', ' ', 'g') AS normalized_name
                 FROM public.plaintiff_contacts
-                WHERE plaintiff_id = %s
+                WHERE plaintiff_id = ANY(%s::uuid[])
                 """,
-                (plaintiff_id,),
+                (list(ledgers),),
             )
             for row in cur.fetchall():
+                ledger = ledgers.get(row["plaintiff_id"])
+                if ledger is None:
+                    continue
                 if row.get("normalized_email"):
                     ledger.emails.add(row["normalized_email"])
                 if row.get("normalized_name"):
                     ledger.names.add(row["normalized_name"])
-        self._cache[plaintiff_id] = ledger
-        return ledger
+        return ledgers
+
+    def warm(self, plaintiff_ids: Iterable[str]) -> int:
+        """Load ledgers for every uncached plaintiff id with one query.
+
+        Returns the number of plaintiffs loaded.
+        """
+        ids = (str(pid) for pid in plaintiff_ids if pid)
+        missing = [pid for pid in dict.fromkeys(ids) if pid not in self._cache]
+        if not missing:
+            return 0
+        for plaintiff_id, ledger in self._load(missing).items():
+            self._remember(plaintiff_id, ledger)
+        return len(missing)
+
+    def get(self, plaintiff_id: str) -> ContactLedger:
+        key = str(plaintiff_id)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        return self._remember(key, self._load([key])[key])
 
     def add(self, plaintiff_id: str, contact: ContactCandidate) -> None:
-        ledger = self._cache.setdefault(plaintiff_id, ContactLedger())
+        ledger = self._cache.get(str(plaintiff_id))
+        if ledger is None:
+            ledger = self._remember(plaintiff_id, ContactLedger())
         if contact.normalized_email:
             ledger.emails.add(contact.normalized_email)
         ledger.names.add(contact.normalized_name)
@@ -530,7 +573,13 @@ def _process_candidates(
     index = ExistingIndex.load(conn, candidates)
     contact_cache = ContactCache(conn)
 
-    for candidate in candidates:
+    for position, candidate in enumerate(candidates):
+        if position % CONTACT_WARM_CHUNK == 0:
+            upcoming = candidates[position : position + CONTACT_WARM_CHUNK]
+            contact_cache.warm(
+                match.id for match in map(index.lookup, upcoming) if match is not None
+            )
+
         existing = index.lookup(candidate)
         action_description = None
         new_contacts = 0
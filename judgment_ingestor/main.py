@@ -1,15 +1,29 @@
-"""File watcher for ingesting CSV data into Supabase."""
+"""File watcher for ingesting CSV data into Supabase.
+
+New files are picked up through filesystem notifications (watchfiles, which
+uses inotify on Linux) or by polling when watchfiles is unavailable or
+``--poll`` is given. A file is only processed once its size and mtime have
+been stable for ``--settle`` seconds, so partially written drops are not
+ingested early. Ready files are processed concurrently by up to
+``--workers`` threads. Each file is hashed and checked against the manifest
+before it is parsed; new files are then parsed in chunks and streamed to the
+uploader without holding every record in memory.
+"""
 
 import argparse
 import hashlib
+import itertools
 import json
 import logging
 import math
 import os
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
 import pandas as pd
 import yaml
@@ -24,6 +38,11 @@ from src.settings import get_settings as get_app_settings
 from src.telemetry import log_run_error, log_run_ok, log_run_start
 from workers.queue_client import QueueClient, QueueRpcNotFound
 
+try:
+    import watchfiles
+except ImportError:  # pragma: no cover - polling fallback
+    watchfiles = None  # type: ignore[assignment]
+
 configure_logging()
 logger = logging.getLogger(__name__)
 
@@ -36,10 +55,19 @@ LOCKFILE_PATH = RUN_DIR / "judgment_watcher.lock"
 MANIFEST_PATH = STATE_DIR / "manifest.jsonl"
 SCHEMA_MAP_PATH = Path("config/schema_map.yaml")
 POLL_INTERVAL_SECONDS = 2
+SETTLE_SECONDS = 2.0
+MAX_WORKERS = int(os.getenv("INGESTOR_MAX_WORKERS", "4"))
+READ_CHUNK_ROWS = 5_000
+UPLOAD_CHUNK_ROWS = 500
+HASH_BLOCK_SIZE = 1 << 20
 
 
 PROCESSED_HASHES: set[str] = set()
 _MANIFEST_LOADED = False
+_MANIFEST_LOCK = threading.Lock()
+# Hashes being processed right now, so identical files dropped together are
+# not ingested twice by concurrent workers.
+_IN_FLIGHT_HASHES: set[str] = set()
 SCHEMA_MAP: dict[str, list[str]] = {}
 SCHEMA_DEFAULTS: dict[str, object] = {}
 _SCHEMA_LOADED = False
@@ -65,6 +93,23 @@ def _parse_args() -> argparse.Namespace:
         default=float(POLL_INTERVAL_SECONDS),
         help="Polling interval in seconds when watching for files (default: 2).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help="Files processed concurrently (default: INGESTOR_MAX_WORKERS or 4).",
+    )
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=SETTLE_SECONDS,
+        help="Seconds a file's size and mtime must be unchanged before it is processed.",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Poll the directory instead of using filesystem notifications.",
+    )
     return parser.parse_args()
 
 
@@ -139,11 +184,48 @@ def _load_schema_map() -> None:
 def compute_sha256(path: Path) -> str:
     sha256 = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
+        for chunk in iter(lambda: handle.read(HASH_BLOCK_SIZE), b""):
             sha256.update(chunk)
     return sha256.hexdigest()
 
 
+def _normalize_chunks(source: Path, *, keep_default_na: bool) -> Iterator[dict]:
+    for chunk in pd.read_csv(
+        source, dtype=str, keep_default_na=keep_default_na, chunksize=READ_CHUNK_ROWS
+    ):
+        yield from _normalize_dataframe(chunk.replace({"": None}))
+
+
+def _iter_records(file_path: Path) -> Iterator[dict]:
+    """Parse and normalize a CSV in READ_CHUNK_ROWS-row chunks, yielding records."""
+    yielded = False
+    try:
+        for record in _normalize_chunks(file_path, keep_default_na=False):
+            yielded = True
+            yield record
+    except Exception:
+        if yielded:
+            raise
+        # Same fallback as a full read, while no record has been handed out
+        yield from _normalize_chunks(file_path, keep_default_na=True)
+
+
+class _RowCounter:
+    """Iterator wrapper that counts the records streamed through it."""
+
+    def __init__(self, rows: Iterable[dict]) -> None:
+        self._rows = iter(rows)
+        self.count = 0
+
+    def __iter__(self) -> "_RowCounter":
+        return self
+
+    def __next__(self) -> dict:
+        row = next(self._rows)
+        self.count += 1
+        return row
+
+
 def _ensure_manifest_initialized() -> None:
     global PROCESSED_HASHES, _MANIFEST_LOADED
     if _MANIFEST_LOADED:
@@ -184,9 +266,30 @@ def _append_manifest(sha256_hash: str, filename: str) -> None:
         "filename": filename,
         "processed_at": datetime.now(timezone.utc).isoformat(),
     }
-    with MANIFEST_PATH.open("a", encoding="utf-8") as manifest_file:
-        manifest_file.write(json.dumps(record) + "\n")
-    PROCESSED_HASHES.add(sha256_hash)
+    line = (json.dumps(record) + "\n").encode("utf-8")
+    with _MANIFEST_LOCK:
+        # One O_APPEND write per record so concurrent workers never interleave
+        fd = os.open(MANIFEST_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        PROCESSED_HASHES.add(sha256_hash)
+
+
+def _claim_hash(sha256_hash: str) -> bool:
+    """Reserve a hash for this worker; False if another worker holds it."""
+    with _MANIFEST_LOCK:
+        if sha256_hash in _IN_FLIGHT_HASHES:
+            return False
+        _IN_FLIGHT_HASHES.add(sha256_hash)
+        return True
+
+
+def _release_hash(sha256_hash: str) -> None:
+    with _MANIFEST_LOCK:
+        _IN_FLIGHT_HASHES.discard(sha256_hash)
 
 
 def _move_file(file_path: Path, destination_dir: Path) -> Path:
@@ -452,23 +555,20 @@ def process_file(file_path: Path, *, dry_run: bool = False) -> int:
             extra=log_extra,
         )
         try:
-            try:
-                dataframe = pd.read_csv(file_path, dtype=str, keep_default_na=False)
-            except Exception:
-                dataframe = pd.read_csv(file_path, dtype=str)
-
-            dataframe = dataframe.replace({"": None})
-            records = _normalize_dataframe(dataframe)
+            dry_rows = _RowCounter(_iter_records(file_path))
+            first = next(dry_rows, None)
 
-            if not records:
+            if first is None:
                 logger.info("Dry-run: no valid data found in file.", extra=log_extra)
                 return 0
 
-            preview_keys = list(records[0])[:6]
-            preview = {key: records[0].get(key) for key in preview_keys}
+            for _ in dry_rows:
+                pass
+            preview_keys = list(first)[:6]
+            preview = {key: first.get(key) for key in preview_keys}
             logger.info(
                 "Dry-run: %s valid records detected. First row preview: %s",
-                len(records),
+                dry_rows.count,
                 preview,
                 extra=log_extra,
             )
@@ -478,12 +578,24 @@ def process_file(file_path: Path, *, dry_run: bool = False) -> int:
 
     run_id: str | None = None
     run_details: dict[str, object] = {"file": file_name}
-    records: list[dict] | None = None
+    rows: _RowCounter | None = None
+    claimed_hash: str | None = None
 
     try:
         _ensure_manifest_initialized()
+        # Hash before parsing so already-processed files are never parsed
         file_hash = compute_sha256(file_path)
         run_details["sha256"] = file_hash
+
+        if file_hash not in PROCESSED_HASHES and not _claim_hash(file_hash):
+            logger.info(
+                "Identical file already in progress (hash=%s); leaving for next scan.",
+                file_hash,
+                extra=log_extra,
+            )
+            return 0
+        claimed_hash = file_hash if file_hash not in PROCESSED_HASHES else None
+
         run_id = log_run_start("csv_ingest", run_details)
         log_extra["run_id"] = run_id or "-"
 
@@ -507,15 +619,11 @@ def process_file(file_path: Path, *, dry_run: bool = False) -> int:
                 )
             return 0
 
-        try:
-            dataframe = pd.read_csv(file_path, dtype=str, keep_default_na=False)
-        except Exception:
-            dataframe = pd.read_csv(file_path, dtype=str)
-
-        dataframe = dataframe.replace({"": None})
-        records = _normalize_dataframe(dataframe)
+        rows = _RowCounter(_iter_records(file_path))
+        # Peek one record past a single request to choose the upload path
+        head = list(itertools.islice(rows, UPLOAD_CHUNK_ROWS + 1))
 
-        if not records:
+        if not head:
             logger.info(
                 "No valid data found in file. Moving to processed.",
                 extra=log_extra,
@@ -534,25 +642,22 @@ def process_file(file_path: Path, *, dry_run: bool = False) -> int:
                 )
             return 0
 
-        logger.info(
-            "Found %s valid records. Uploading to Supabase...",
-            len(records),
-            extra=log_extra,
-        )
-        preview_keys = list(records[0])[:6]
-        preview = {key: records[0].get(key) for key in preview_keys}
+        logger.info("Found valid records. Uploading to Supabase...", extra=log_extra)
+        preview_keys = list(head[0])[:6]
+        preview = {key: head[0].get(key) for key in preview_keys}
         logger.info("First row preview: %s", preview, extra=log_extra)
         try:
-            if len(records) > 500:
+            if len(head) > UPLOAD_CHUNK_ROWS:
                 logger.info(
-                    "Uploading in chunks of 500 to avoid overloading PostgREST",
+                    "Uploading in chunks of %s to avoid overloading PostgREST",
+                    UPLOAD_CHUNK_ROWS,
                     extra=log_extra,
                 )
                 effective_count, returned_rows, status_code = upsert_public_judgments_chunked(
-                    records
+                    itertools.chain(head, rows), chunk_size=UPLOAD_CHUNK_ROWS
                 )
             else:
-                effective_count, returned_rows, status_code = upsert_public_judgments(records)
+                effective_count, returned_rows, status_code = upsert_public_judgments(head)
         except ChunkUploadError as chunk_exc:
             _handle_chunk_failure(
                 file_path,
@@ -560,12 +665,13 @@ def process_file(file_path: Path, *, dry_run: bool = False) -> int:
                 chunk_exc,
                 run_id,
                 run_details,
-                len(records),
+                rows.count,
                 log_extra,
             )
             return 1
         logger.info(
-            "Upload successful! Effective count: %s | Returned rows: %s | Status: %s",
+            "Upload successful! Records: %s | Effective count: %s | Returned rows: %s | Status: %s",
+            rows.count,
             effective_count,
             len(returned_rows),
             status_code,
@@ -637,7 +743,7 @@ def process_file(file_path: Path, *, dry_run: bool = False) -> int:
         if run_id:
             telemetry_details: dict[str, object] = {
                 **run_details,
-                "row_count": len(records),
+                "row_count": rows.count,
                 "skipped": False,
             }
             if queue_errors:
@@ -665,7 +771,7 @@ def process_file(file_path: Path, *, dry_run: bool = False) -> int:
             error_payload = {
                 "file": destination.name,
                 "sha256": run_details.get("sha256"),
-                "row_count": len(records) if records is not None else 0,
+                "row_count": rows.count if rows is not None else 0,
                 "error": error_info,
                 "created_at": datetime.now(timezone.utc).isoformat(),
             }
@@ -674,16 +780,110 @@ def process_file(file_path: Path, *, dry_run: bool = False) -> int:
             logger.info("Wrote failure report to %s", err_path, extra=log_extra)
         if run_id:
             error_details: dict[str, object] = {**run_details}
-            if records is not None:
-                error_details["row_count"] = len(records)
+            if rows is not None:
+                error_details["row_count"] = rows.count
             log_run_error(run_id, error_info, error_details)
         return 1
+    finally:
+        if claimed_hash is not None:
+            _release_hash(claimed_hash)
+
+
+class _SettleTracker:
+    """Report files whose size and mtime have not changed for ``settle`` seconds."""
+
+    def __init__(self, settle: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.settle = max(0.0, settle)
+        self._clock = clock
+        self._seen: dict[Path, tuple[tuple[int, int], float]] = {}
+
+    def ready(self, paths: list[Path]) -> list[Path]:
+        now = self._clock()
+        current: dict[Path, tuple[tuple[int, int], float]] = {}
+        ready: list[Path] = []
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            previous = self._seen.get(path)
+            since = previous[1] if previous and previous[0] == signature else now
+            current[path] = (signature, since)
+            if now - since >= self.settle:
+                ready.append(path)
+        self._seen = current
+        return ready
+
+
+def _change_waiter(interval: float, *, poll: bool) -> Iterator[None]:
+    """Yield each time the input directory may have new files.
+
+    Uses filesystem notifications when available, still waking every
+    ``interval`` seconds so settling files are re-checked; otherwise sleeps.
+    """
+    if watchfiles is not None and not poll:
+        logger.info("Watching %s with filesystem notifications", DATA_IN_DIR)
+        for _changes in watchfiles.watch(
+            DATA_IN_DIR,
+            watch_filter=lambda _change, path: path.endswith(".csv"),
+            rust_timeout=max(1, int(interval * 1000)),
+            yield_on_timeout=True,
+        ):
+            yield
+        return
+
+    logger.info("Polling %s every %.2fs", DATA_IN_DIR, interval)
+    while True:
+        time.sleep(interval)
+        yield
+
+
+def _process_batch(paths: list[Path], *, dry_run: bool, workers: int) -> int:
+    """Process ``paths`` concurrently and return the first non-zero exit code."""
+    exit_code = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for result in pool.map(lambda path: process_file(path, dry_run=dry_run), paths):
+            if result and not exit_code:
+                exit_code = result
+    return exit_code
+
+
+def _watch(*, interval: float, settle: float, workers: int, poll: bool) -> int:
+    """Process files as they settle until a file fails; returns its exit code."""
+    tracker = _SettleTracker(settle)
+    in_flight: dict[Path, Future] = {}
+    exit_code = 0
+    waiter = _change_waiter(interval, poll=poll)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while True:
+            for path, future in list(in_flight.items()):
+                if future.done():
+                    del in_flight[path]
+                    if future.result() and not exit_code:
+                        exit_code = future.result()
+
+            if exit_code:
+                # Let running files finish, but start nothing new
+                wait(list(in_flight.values()))
+                return exit_code
+
+            candidates = sorted(DATA_IN_DIR.glob("*.csv"))
+            for path in tracker.ready(candidates):
+                if path not in in_flight:
+                    in_flight[path] = pool.submit(process_file, path)
+
+            if in_flight:
+                wait(list(in_flight.values()), timeout=interval, return_when=FIRST_COMPLETED)
+            else:
+                next(waiter)
 
 
 def main() -> int:
     args = _parse_args()
     _ensure_directories()
     _ensure_manifest_initialized()
+    _load_schema_map()
     if not _acquire_lock():
         return 0
 
@@ -697,44 +897,35 @@ def main() -> int:
 
     logger.info("Starting data ingestor")
     logger.info(
-        "Mode -> dry_run=%s, once=%s, interval=%.2fs",
+        "Mode -> dry_run=%s, once=%s, interval=%.2fs, workers=%s, settle=%.2fs",
         args.dry_run,
         run_once,
         poll_interval,
+        args.workers,
+        args.settle,
     )
     logger.info("Watching for files in: %s", DATA_IN_DIR)
 
+    workers = max(1, args.workers)
     exit_code = 0
     try:
-        while True:
+        if run_once:
             csv_files = sorted(DATA_IN_DIR.glob("*.csv"))
             if not csv_files:
-                if run_once:
-                    logger.info("No files to process; exiting (--once/--dry-run).")
-                    break
-                time.sleep(poll_interval)
-                continue
-
-            for csv_path in csv_files:
-                file_result = process_file(csv_path, dry_run=args.dry_run)
-                if file_result:
-                    exit_code = file_result
-                    break
-
-            if exit_code:
-                logger.error("Detected ingest errors; exiting with code %s", exit_code)
-                break
-
-            if args.dry_run:
-                logger.info("Dry-run complete; exiting without modifying files.")
-                break
-
-            if run_once:
-                logger.info("Processed current queue; exiting (--once).")
-                break
-
-            logger.info("All files processed. Waiting for new files...")
-            time.sleep(poll_interval)
+                logger.info("No files to process; exiting (--once/--dry-run).")
+            else:
+                exit_code = _process_batch(csv_files, dry_run=args.dry_run, workers=workers)
+                if exit_code:
+                    logger.error("Detected ingest errors; exiting with code %s", exit_code)
+                elif args.dry_run:
+                    logger.info("Dry-run complete; exiting without modifying files.")
+                else:
+                    logger.info("Processed current queue; exiting (--once).")
+        else:
+            exit_code = _watch(
+                interval=poll_interval, settle=args.settle, workers=workers, poll=args.poll
+            )
+            logger.error("Detected ingest errors; exiting with code %s", exit_code)
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     finally:
@@ -62,6 +62,18 @@ class _SupabaseClient(httpx.Client):
         return super().request(method, url, *args, **kwargs)
 
 
+class _AsyncSupabaseClient(httpx.AsyncClient):
+    async def request(self, method: str, url: str, *args, **kwargs):  # type: ignore[override]
+        if isinstance(url, str):
+            url = _path(url)
+        headers = kwargs.get("headers")
+        if headers is None:
+            kwargs["headers"] = COMMON
+        else:
+            kwargs["headers"] = {**COMMON, **headers}
+        return await super().request(method, url, *args, **kwargs)
+
+
 def get_supabase_url() -> str:
     """Return the configured Supabase base URL."""
 
@@ -81,6 +93,18 @@ def postgrest(timeout: Optional[float] = 10.0) -> httpx.Client:
     return _SupabaseClient(base_url=base_url, headers=COMMON, timeout=timeout)
 
 
+def postgrest_async(
+    timeout: Optional[float] = 10.0, max_connections: int = 10
+) -> httpx.AsyncClient:
+    """Return a configured :class:`httpx.AsyncClient` for the Supabase PostgREST API."""
+
+    base_url = f"{_BASE_URL}{_REST_PATH}"
+    limits = httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+    return _AsyncSupabaseClient(base_url=base_url, headers=COMMON, timeout=timeout, limits=limits)
+
+
 if __name__ == "__main__":  # pragma: no cover - manual smoke test
     import json
 
@@ -168,10 +168,6 @@ def upsert_public_judgments_chunked(
     chunk_size: int = 500,
     max_retries: int = 3,
 ) -> Tuple[int, List[Dict], int]:
-    rows_list = list(rows)
-    if not rows_list:
-        return 0, [], 200
-
     if chunk_size <= 0:
         raise ValueError("chunk_size must be positive")
     if max_retries < 1:
@@ -188,7 +184,7 @@ def upsert_public_judgments_chunked(
     aggregated_data: List[Dict] = []
     last_status = 200
 
-    for chunk in chunked(rows_list, chunk_size):
+    for chunk in chunked(rows, chunk_size):
         try:
             effective_count, data, status_code = retryer(upsert_public_judgments, chunk)
         except Exception as exc:  # pragma: no cover - propagated to caller
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import atexit
 import base64
 import json
 import logging
 import os
-from typing import Any, Literal, Tuple
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Literal, Optional, Tuple
 
 import httpx
 from postgrest.constants import DEFAULT_POSTGREST_CLIENT_TIMEOUT
@@ -14,6 +18,13 @@ from supabase import Client, ClientOptions, create_client
 
 from .core_config import Settings, get_settings
 
+try:  # pragma: no cover - optional dependency
+    import h2  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover - httpx[http2] not installed
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
 SupabaseClient = Any
 SupabaseEnv = Literal["dev", "prod"]
 _EnvInput = str | SupabaseEnv | None
@@ -22,12 +33,26 @@ logger = logging.getLogger(__name__)
 
 _HTTPX_TIMEOUT = DEFAULT_POSTGREST_CLIENT_TIMEOUT
 
+# Connection pool for the shared httpx client. Keep-alive connections are
+# reused across jobs so TLS is negotiated once per connection, not per call.
+_HTTP_MAX_CONNECTIONS = int(os.getenv("SUPABASE_HTTP_MAX_CONNECTIONS", "20"))
+_HTTP_MAX_KEEPALIVE = int(os.getenv("SUPABASE_HTTP_MAX_KEEPALIVE", "10"))
+_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("SUPABASE_HTTP_KEEPALIVE_EXPIRY", "30"))
+
+# Cached clients unused for longer than this are rebuilt on next use (0 = never).
+_CLIENT_IDLE_SECONDS = float(os.getenv("SUPABASE_CLIENT_IDLE_SECONDS", "300"))
+
 
 def _build_supabase_http_client() -> httpx.Client:
     """Return an httpx client configured for Supabase REST calls."""
 
     timeout = httpx.Timeout(_HTTPX_TIMEOUT)
-    return httpx.Client(timeout=timeout)
+    limits = httpx.Limits(
+        max_connections=_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=_HTTP_KEEPALIVE_EXPIRY,
+    )
+    return httpx.Client(timeout=timeout, limits=limits, http2=_HTTP2_AVAILABLE)
 
 
 def _client_options() -> ClientOptions:
@@ -124,6 +149,93 @@ def create_supabase_client(env: _EnvInput = None) -> Client:
     return client
 
 
+def _close_client(client: Client) -> None:
+    http_client = getattr(client, "_dragonfly_httpx_client", None)
+    if http_client is None:
+        return
+    try:
+        http_client.close()
+    except Exception:  # pragma: no cover - best-effort cleanup
+        logger.debug("Failed to close Supabase httpx client", exc_info=True)
+
+
+@dataclass
+class _CachedClient:
+    client: Client
+    last_used: float
+
+
+class SupabaseClientRegistry:
+    """
+    Thread-safe, process-wide cache of Supabase clients keyed by SupabaseEnv.
+
+    Queue handlers call :meth:`get` once per job; the first call per env builds
+    the client (credential lookup, JWT role check, httpx pool) and later calls
+    reuse it. Clients idle for more than ``idle_seconds`` are replaced (not
+    closed, since a caller may still hold one), and :meth:`reset` closes cached
+    clients after a credential rotation.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[SupabaseEnv], Client] | None = None,
+        *,
+        idle_seconds: float = _CLIENT_IDLE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._factory = factory or create_supabase_client
+        self._idle_seconds = idle_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[SupabaseEnv, _CachedClient] = {}
+
+    def get(self, env: _EnvInput = None) -> Client:
+        supabase_env = _coerce_supabase_env(env)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(supabase_env)
+            if entry is not None:
+                if self._idle_seconds <= 0 or now - entry.last_used <= self._idle_seconds:
+                    entry.last_used = now
+                    return entry.client
+                # Callers may still hold the idle client, so it is not closed
+                # here; its pool is released once the last reference is gone.
+                logger.info("Recycling idle Supabase client for env='%s'", supabase_env)
+            client = self._factory(supabase_env)
+            self._entries[supabase_env] = _CachedClient(client, now)
+        return client
+
+    def reset(self, env: _EnvInput = None) -> int:
+        """Close and forget cached clients (all envs when ``env`` is None)."""
+
+        with self._lock:
+            if env is None:
+                dropped = list(self._entries.values())
+                self._entries.clear()
+            else:
+                entry = self._entries.pop(_coerce_supabase_env(env), None)
+                dropped = [entry] if entry is not None else []
+        for entry in dropped:
+            _close_client(entry.client)
+        return len(dropped)
+
+
+_REGISTRY = SupabaseClientRegistry()
+atexit.register(_REGISTRY.reset)
+
+
+def get_supabase_client(env: _EnvInput = None) -> Client:
+    """Return the cached Supabase client for ``env``, building it on first use."""
+
+    return _REGISTRY.get(env)
+
+
+def reset_supabase_clients(env: _EnvInput = None) -> int:
+    """Drop cached Supabase clients, e.g. after rotating SUPABASE_SERVICE_ROLE_KEY."""
+
+    return _REGISTRY.reset(env)
+
+
 def _strip(value: str | None) -> str | None:
     if not value:
         return None
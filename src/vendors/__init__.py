@@ -6,15 +6,31 @@ allowing workers to switch between mock and real implementations.
 Usage:
     from src.vendors import SkipTraceVendor, SkipTraceResult, MockIdiCORE
 
+    executor = get_vendor_executor(MockIdiCORE())
+    result = await executor.enrich("John Smith", "NYC-2024-001234")
+
 """
 
 from __future__ import annotations
 
-from .base import SkipTraceResult, SkipTraceVendor
+from .base import BatchSkipTraceVendor, SkipTraceResult, SkipTraceVendor
+from .executor import (
+    MemoryResultCache,
+    SupabaseResultCache,
+    TokenBucket,
+    VendorExecutor,
+    get_vendor_executor,
+)
 from .mock_idicore import MockIdiCORE
 
 __all__ = [
+    "BatchSkipTraceVendor",
     "SkipTraceResult",
     "SkipTraceVendor",
     "MockIdiCORE",
+    "MemoryResultCache",
+    "SupabaseResultCache",
+    "TokenBucket",
+    "VendorExecutor",
+    "get_vendor_executor",
 ]
@@ -7,7 +7,7 @@ that all vendor implementations must follow.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Literal, Protocol, runtime_checkable
+from typing import Any, Literal, Protocol, Sequence, runtime_checkable
 
 IncomeBand = Literal["LOW", "MED", "HIGH", "UNKNOWN"]
 HomeOwnership = Literal["owner", "renter", "unknown"]
@@ -94,3 +94,25 @@ class SkipTraceVendor(Protocol):
             Exception: If the enrichment call fails.
         """
         ...
+
+
+@runtime_checkable
+class BatchSkipTraceVendor(SkipTraceVendor, Protocol):
+    """Optional extension for vendors that accept several lookups per call.
+
+    VendorExecutor detects this protocol and groups cache misses into
+    ``enrich_many`` calls of at most ``max_batch_size`` lookups.
+    """
+
+    @property
+    def max_batch_size(self) -> int:
+        """Return the largest number of lookups accepted by one call."""
+        ...
+
+    async def enrich_many(self, requests: Sequence[tuple[str, str]]) -> list[SkipTraceResult]:
+        """Enrich several ``(debtor_name, case_index)`` pairs in one vendor call.
+
+        Returns:
+            One SkipTraceResult per request, in request order.
+        """
+        ...
@@ -0,0 +1,534 @@
+"""Execution layer around SkipTraceVendor implementations.
+
+VendorExecutor wraps a vendor and is itself a SkipTraceVendor, so workers
+can use it as a drop-in replacement. For every lookup it:
+
+1. Coalesces concurrent requests for the same normalized debtor name onto a
+   single in-flight lookup.
+2. Collects lookups for a short window and reads them from the result cache
+   in one query (SupabaseResultCache persists to public.skip_trace_cache so
+   results survive restarts; MemoryResultCache is the in-process default).
+3. Sends cache misses to the vendor, grouped into ``enrich_many`` calls when
+   the vendor implements BatchSkipTraceVendor.
+4. Gates every vendor call behind a per-provider token bucket and
+   concurrency cap.
+
+Results carry ``raw_meta["cache_status"]`` ("miss", "hit" or "coalesced") so
+FCRA audit logs record whether the vendor was actually called.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+
+from ..supabase_client import get_supabase_client
+from .base import BatchSkipTraceVendor, SkipTraceResult, SkipTraceVendor
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL_SECONDS = float(os.getenv("SKIP_TRACE_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+BATCH_WINDOW_SECONDS = float(os.getenv("SKIP_TRACE_BATCH_WINDOW_SECONDS", "0.05"))
+BATCH_SIZE = int(os.getenv("SKIP_TRACE_BATCH_SIZE", "25"))
+RATE_PER_SECOND = float(os.getenv("SKIP_TRACE_RATE_PER_SECOND", "5"))
+RATE_BURST = int(os.getenv("SKIP_TRACE_RATE_BURST", "10"))
+MAX_CONCURRENCY = int(os.getenv("SKIP_TRACE_MAX_CONCURRENCY", "4"))
+CACHE_TABLE = "skip_trace_cache"
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+# Placeholder names that must never share a cached result
+_UNCACHEABLE_NAMES = {"", "unknown"}
+
+
+def normalize_debtor_name(name: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return _SPACE_RE.sub(" ", _PUNCT_RE.sub(" ", (name or "").lower())).strip()
+
+
+def debtor_cache_key(normalized_name: str) -> str:
+    """Return the cache key for a normalized name (sha256, never the raw name)."""
+    return hashlib.sha256(normalized_name.encode("utf-8")).hexdigest()
+
+
+def result_to_json(result: SkipTraceResult) -> Dict[str, Any]:
+    """Serialize a SkipTraceResult for the cache table."""
+    return {**result.to_dict(), "raw_meta": dict(result.raw_meta)}
+
+
+def result_from_json(data: Mapping[str, Any]) -> SkipTraceResult:
+    """Rebuild a SkipTraceResult from :func:`result_to_json` output."""
+    known = {f.name for f in fields(SkipTraceResult)}
+    return SkipTraceResult(**{k: v for k, v in data.items() if k in known})
+
+
+# =============================================================================
+# Result caches
+# =============================================================================
+
+
+class ResultCache(Protocol):
+    """Storage for vendor results keyed by (provider, debtor cache key)."""
+
+    async def get_many(self, provider: str, keys: Sequence[str]) -> Dict[str, SkipTraceResult]:
+        """Return unexpired results for the keys that are cached."""
+        ...
+
+    async def put_many(
+        self, provider: str, results: Mapping[str, SkipTraceResult], ttl_seconds: float
+    ) -> None:
+        """Store results for ``ttl_seconds``."""
+        ...
+
+
+class MemoryResultCache:
+    """In-process TTL cache; results are lost on restart."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._entries: Dict[Tuple[str, str], Tuple[float, SkipTraceResult]] = {}
+
+    async def get_many(self, provider: str, keys: Sequence[str]) -> Dict[str, SkipTraceResult]:
+        now = self._clock()
+        found: Dict[str, SkipTraceResult] = {}
+        for key in keys:
+            entry = self._entries.get((provider, key))
+            if entry is None:
+                continue
+            expires_at, result = entry
+            if expires_at <= now:
+                del self._entries[(provider, key)]
+                continue
+            found[key] = result
+        return found
+
+    async def put_many(
+        self, provider: str, results: Mapping[str, SkipTraceResult], ttl_seconds: float
+    ) -> None:
+        expires_at = self._clock() + ttl_seconds
+        for key, result in results.items():
+            self._entries[(provider, key)] = (expires_at, result)
+
+
+class SupabaseResultCache:
+    """TTL cache persisted to public.skip_trace_cache through PostgREST.
+
+    The supabase client is synchronous, so calls run in a worker thread.
+    ``client_factory`` is called for every operation rather than once, so the
+    cache always uses the registry's current client.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_factory: Callable[[], Any] = get_supabase_client,
+        table: str = CACHE_TABLE,
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._client_factory = client_factory
+        self._table = table
+        self._now = now
+
+    async def get_many(self, provider: str, keys: Sequence[str]) -> Dict[str, SkipTraceResult]:
+        if not keys:
+            return {}
+        return await asyncio.to_thread(self._select, provider, list(keys))
+
+    async def put_many(
+        self, provider: str, results: Mapping[str, SkipTraceResult], ttl_seconds: float
+    ) -> None:
+        if not results:
+            return
+        await asyncio.to_thread(self._upsert, provider, dict(results), ttl_seconds)
+
+    def _select(self, provider: str, keys: List[str]) -> Dict[str, SkipTraceResult]:
+        response = (
+            self._client_factory()
+            .table(self._table)
+            .select("debtor_key,result")
+            .eq("provider", provider)
+            .in_("debtor_key", keys)
+            .gt("expires_at", self._now().isoformat())
+            .execute()
+        )
+        return {row["debtor_key"]: result_from_json(row["result"]) for row in response.data or []}
+
+    def _upsert(
+        self, provider: str, results: Dict[str, SkipTraceResult], ttl_seconds: float
+    ) -> None:
+        now = self._now()
+        expires_at = (now + timedelta(seconds=ttl_seconds)).isoformat()
+        rows = [
+            {
+                "provider": provider,
+                "debtor_key": key,
+                "result": result_to_json(result),
+                "fetched_at": now.isoformat(),
+                "expires_at": expires_at,
+            }
+            for key, result in results.items()
+        ]
+        client = self._client_factory()
+        client.table(self._table).upsert(rows, on_conflict="provider,debtor_key").execute()
+
+
+# =============================================================================
+# Rate limiting
+# =============================================================================
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, up to ``burst`` stored.
+
+    A non-positive rate disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, float(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return
+            await self._sleep((tokens - self._tokens) / self.rate)
+
+
+# =============================================================================
+# Executor
+# =============================================================================
+
+
+@dataclass
+class ExecutorStats:
+    """Counters for one VendorExecutor."""
+
+    requests: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    vendor_calls: int = 0
+    vendor_lookups: int = 0
+    uncacheable: int = 0
+    errors: int = 0
+
+
+@dataclass
+class _Lookup:
+    key: str
+    debtor_name: str
+    case_index: str
+    future: "asyncio.Future[Tuple[SkipTraceResult, str]]"
+
+
+def _retrieve_exception(future: "asyncio.Future[Any]") -> None:
+    # Waiters may have been cancelled; mark the exception as seen.
+    if not future.cancelled():
+        future.exception()
+
+
+def _annotate(result: SkipTraceResult, cache_status: str) -> SkipTraceResult:
+    return replace(result, raw_meta={**result.raw_meta, "cache_status": cache_status})
+
+
+class VendorExecutor:
+    """Coalescing, caching, batching and rate-limited wrapper for a vendor.
+
+    Usage:
+        executor = VendorExecutor(MockIdiCORE(), cache=MemoryResultCache())
+        result = await executor.enrich("John Smith", "NYC-2024-001234")
+    """
+
+    def __init__(
+        self,
+        vendor: SkipTraceVendor,
+        *,
+        cache: Optional[ResultCache] = None,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+        batch_size: int = BATCH_SIZE,
+        batch_window: float = BATCH_WINDOW_SECONDS,
+        rate_per_second: float = RATE_PER_SECOND,
+        burst: int = RATE_BURST,
+        max_concurrency: int = MAX_CONCURRENCY,
+        bucket: Optional[TokenBucket] = None,
+    ) -> None:
+        self._vendor = vendor
+        self._cache: ResultCache = cache if cache is not None else MemoryResultCache()
+        self._ttl_seconds = ttl_seconds
+        self._batch_size = max(1, batch_size)
+        self._batch_window = max(0.0, batch_window)
+        self._max_concurrency = max(1, max_concurrency)
+        self._bucket = bucket or TokenBucket(rate_per_second, burst)
+        self.stats = ExecutorStats()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bind_loop()
+
+    @property
+    def provider_name(self) -> str:
+        return self._vendor.provider_name
+
+    @property
+    def endpoint(self) -> str:
+        return self._vendor.endpoint
+
+    @property
+    def vendor(self) -> SkipTraceVendor:
+        return self._vendor
+
+    async def enrich(self, debtor_name: str, case_index: str) -> SkipTraceResult:
+        """Return the result for ``debtor_name``, calling the vendor only on a miss."""
+        self._bind_loop()
+        self.stats.requests += 1
+        normalized = normalize_debtor_name(debtor_name)
+        if normalized in _UNCACHEABLE_NAMES:
+            self.stats.uncacheable += 1
+            async with self._limited():
+                self.stats.vendor_calls += 1
+                self.stats.vendor_lookups += 1
+                result = await self._vendor.enrich(debtor_name, case_index)
+            return _annotate(result, "miss")
+
+        key = debtor_cache_key(normalized)
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+            result, _ = await asyncio.shield(future)
+            return _annotate(result, "coalesced")
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_retrieve_exception)
+        self._inflight[key] = future
+        self._enqueue(_Lookup(key, debtor_name, case_index, future))
+        result, cache_status = await asyncio.shield(future)
+        return _annotate(result, cache_status)
+
+    async def enrich_many(self, requests: Sequence[Tuple[str, str]]) -> List[SkipTraceResult]:
+        """Enrich several ``(debtor_name, case_index)`` pairs through the executor."""
+        return list(await asyncio.gather(*(self.enrich(name, idx) for name, idx in requests)))
+
+    async def drain(self) -> None:
+        """Flush queued lookups now and wait for in-flight batches."""
+        self._start_flush()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Batching
+    # ------------------------------------------------------------------
+
+    def _bind_loop(self) -> None:
+        """Reset loop-bound state when first used from a new event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is self._loop and loop is not None:
+            return
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._inflight: Dict[str, "asyncio.Future[Tuple[SkipTraceResult, str]]"] = {}
+        self._pending: List[_Lookup] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def _enqueue(self, lookup: _Lookup) -> None:
+        self._pending.append(lookup)
+        if len(self._pending) >= self._batch_size:
+            self._start_flush()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self._batch_window, self._start_flush)
+
+    def _start_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[_Lookup]) -> None:
+        try:
+            cached = await self._cache_get([lookup.key for lookup in batch])
+            misses: List[_Lookup] = []
+            for lookup in batch:
+                hit = cached.get(lookup.key)
+                if hit is None:
+                    misses.append(lookup)
+                else:
+                    self.stats.cache_hits += 1
+                    self._settle(lookup, result=(hit, "hit"))
+            if misses:
+                await self._fetch_misses(misses)
+        except BaseException as exc:
+            for lookup in batch:
+                if not lookup.future.done():
+                    self._settle(lookup, error=exc)
+            if not isinstance(exc, Exception):
+                raise
+
+    async def _fetch_misses(self, misses: List[_Lookup]) -> None:
+        vendor = self._vendor
+        if isinstance(vendor, BatchSkipTraceVendor):
+            size = max(1, min(self._batch_size, vendor.max_batch_size))
+            groups = [misses[i : i + size] for i in range(0, len(misses), size)]
+            outcomes = await asyncio.gather(
+                *(self._call_batch(vendor, group) for group in groups), return_exceptions=True
+            )
+        else:
+            groups = [[lookup] for lookup in misses]
+            outcomes = await asyncio.gather(
+                *(self._call_single(lookup) for lookup in misses), return_exceptions=True
+            )
+
+        fresh: Dict[str, SkipTraceResult] = {}
+        for group, outcome in zip(groups, outcomes):
+            if isinstance(outcome, BaseException):
+                self.stats.errors += 1
+                for lookup in group:
+                    self._settle(lookup, error=outcome)
+                continue
+            for lookup, result in zip(group, outcome):
+                fresh[lookup.key] = result
+                self._settle(lookup, result=(result, "miss"))
+        await self._cache_put(fresh)
+
+    async def _call_batch(
+        self, vendor: BatchSkipTraceVendor, group: List[_Lookup]
+    ) -> List[SkipTraceResult]:
+        async with self._limited():
+            self.stats.vendor_calls += 1
+            self.stats.vendor_lookups += len(group)
+            results = await vendor.enrich_many(
+                [(lookup.debtor_name, lookup.case_index) for lookup in group]
+            )
+        if len(results) != len(group):
+            raise RuntimeError(
+                f"{vendor.provider_name} returned {len(results)} results for {len(group)} lookups"
+            )
+        return results
+
+    async def _call_single(self, lookup: _Lookup) -> List[SkipTraceResult]:
+        async with self._limited():
+            self.stats.vendor_calls += 1
+            self.stats.vendor_lookups += 1
+            return [await self._vendor.enrich(lookup.debtor_name, lookup.case_index)]
+
+    @asynccontextmanager
+    async def _limited(self) -> AsyncIterator[None]:
+        async with self._semaphore:
+            await self._bucket.acquire()
+            yield
+
+    def _settle(
+        self,
+        lookup: _Lookup,
+        *,
+        result: Optional[Tuple[SkipTraceResult, str]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if self._inflight.get(lookup.key) is lookup.future:
+            del self._inflight[lookup.key]
+        if lookup.future.done():
+            return
+        if error is not None:
+            lookup.future.set_exception(error)
+        else:
+            lookup.future.set_result(result)  # type: ignore[arg-type]
+
+    # ------------------------------------------------------------------
+    # Cache access (failures degrade to vendor calls, never fail a job)
+    # ------------------------------------------------------------------
+
+    async def _cache_get(self, keys: List[str]) -> Dict[str, SkipTraceResult]:
+        try:
+            return await self._cache.get_many(self.provider_name, keys)
+        except Exception:
+            logger.warning(
+                "skip_trace_cache_read_failed provider=%s keys=%d",
+                self.provider_name,
+                len(keys),
+                exc_info=True,
+            )
+            return {}
+
+    async def _cache_put(self, results: Dict[str, SkipTraceResult]) -> None:
+        if not results:
+            return
+        try:
+            await self._cache.put_many(self.provider_name, results, self._ttl_seconds)
+        except Exception:
+            logger.warning(
+                "skip_trace_cache_write_failed provider=%s keys=%d",
+                self.provider_name,
+                len(results),
+                exc_info=True,
+            )
+
+
+_EXECUTORS: Dict[str, VendorExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def get_vendor_executor(
+    vendor: SkipTraceVendor,
+    *,
+    cache_factory: Optional[Callable[[], ResultCache]] = None,
+) -> VendorExecutor:
+    """Return the process-wide executor for ``vendor.provider_name``.
+
+    Sharing one executor per provider is what makes the rate limit, the
+    concurrency cap and request coalescing apply across jobs.
+    """
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(vendor.provider_name)
+        if executor is None:
+            cache = cache_factory() if cache_factory is not None else None
+            executor = VendorExecutor(vendor, cache=cache)
+            _EXECUTORS[vendor.provider_name] = executor
+        return executor
+
+
+def reset_vendor_executors() -> None:
+    """Forget cached executors (tests, configuration reloads)."""
+    with _EXECUTORS_LOCK:
+        _EXECUTORS.clear()
@@ -7,9 +7,9 @@ No external HTTP calls are made.
 from __future__ import annotations
 
 import hashlib
-from typing import Any
+from typing import Any, Sequence
 
-from .base import HomeOwnership, IncomeBand, SkipTraceResult, SkipTraceVendor
+from .base import BatchSkipTraceVendor, HomeOwnership, IncomeBand, SkipTraceResult, SkipTraceVendor
 
 # Realistic fake data pools
 _EMPLOYERS = [
@@ -66,6 +66,11 @@ class MockIdiCORE:
         """Return the API endpoint for FCRA audit logging."""
         return "/mock/person/search"
 
+    @property
+    def max_batch_size(self) -> int:
+        """Return the largest batch accepted by enrich_many."""
+        return 25
+
     async def enrich(self, debtor_name: str, case_index: str) -> SkipTraceResult:
         """Generate deterministic fake enrichment data.
 
@@ -124,6 +129,20 @@ class MockIdiCORE:
             raw_meta=raw_meta,
         )
 
+    async def enrich_many(self, requests: Sequence[tuple[str, str]]) -> list[SkipTraceResult]:
+        """Generate results for several lookups, mirroring a batch search call.
+
+        Args:
+            requests: (debtor_name, case_index) pairs, at most max_batch_size.
+
+        Returns:
+            One SkipTraceResult per request, in request order.
+        """
+        if len(requests) > self.max_batch_size:
+            raise ValueError(f"batch of {len(requests)} exceeds {self.max_batch_size}")
+        return [await self.enrich(debtor_name, case_index) for debtor_name, case_index in requests]
+
 
 # Verify MockIdiCORE implements SkipTraceVendor protocol
 assert isinstance(MockIdiCORE(), SkipTraceVendor), "MockIdiCORE must implement SkipTraceVendor"
+assert isinstance(MockIdiCORE(), BatchSkipTraceVendor), "MockIdiCORE must support batching"
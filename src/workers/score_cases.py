@@ -1,18 +1,29 @@
-"""Compute enrichment collectability scores and persist them via Supabase."""
+"""
+Compute enrichment collectability scores and persist them via Supabase.
+
+Candidate cases are streamed from ``v_cases`` page by page. For each page the
+related collectability, roles, entities, contacts and assets rows are fetched
+with concurrent, size-bounded ``in.(...)`` requests and the resulting scores
+are upserted in batches, so a full-table run uses bounded memory and a number
+of round-trips proportional to pages rather than cases.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import httpx
 import typer
 
 from src.config.api_surface import SCHEMA_PROFILE
-from src.db.supabase_client import COMMON, postgrest
+from src.db.supabase_client import COMMON, postgrest_async
 
 app = typer.Typer(help="Score cases for enrichment collectability")
 
@@ -36,6 +47,16 @@ MERGE_MINIMAL = "resolution=merge-duplicates,return=minimal"
 ADDRESS_REGEX = re.compile(r"\d+\s+.+\s+[A-Z]{2}\s+\d{5}")
 RECENCY_WINDOW = timedelta(days=7)
 
+# Streaming limits: v_cases page size, max characters in one in.(...) id list
+# (keeps request URLs well under proxy limits), PostgREST page size for the
+# relation fetches, rows per collectability upsert, and concurrent requests.
+CASE_PAGE_SIZE = int(os.getenv("SCORE_CASES_PAGE_SIZE", "500"))
+IN_FILTER_MAX_CHARS = int(os.getenv("SCORE_CASES_IN_FILTER_CHARS", "4000"))
+FETCH_PAGE_SIZE = 1000
+UPSERT_BATCH_SIZE = int(os.getenv("SCORE_CASES_UPSERT_BATCH", "250"))
+FETCH_CONCURRENCY = int(os.getenv("SCORE_CASES_CONCURRENCY", "8"))
+TABLE_ROWS = 50
+
 
 def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
     if not value:
@@ -50,31 +71,107 @@ def _clamp(value: float, minimum: float = 0.0, maximum: float = 100.0) -> float:
     return max(minimum, min(maximum, value))
 
 
-def _fetch_cases(client: httpx.Client, limit: Optional[int]) -> List[dict]:
+def _chunk_ids(ids: Iterable[str], budget: Optional[int] = None) -> Iterator[List[str]]:
+    """Split ids into ``in.(...)`` lists whose joined length stays under ``budget``."""
+
+    budget = budget or IN_FILTER_MAX_CHARS
+    chunk: List[str] = []
+    size = 0
+    for value in ids:
+        cost = len(value) + 1
+        if chunk and size + cost > budget:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(value)
+        size += cost
+    if chunk:
+        yield chunk
+
+
+def _group_rows(rows: Iterable[dict], key: str) -> Dict[str, List[dict]]:
+    grouped: Dict[str, List[dict]] = defaultdict(list)
+    for row in rows:
+        grouped[row[key]].append(row)
+    return grouped
+
+
+async def _fetch_in(
+    client: httpx.AsyncClient,
+    path: str,
+    column: str,
+    ids: Iterable[str],
+    select: str,
+    headers: Dict[str, str],
+    limiter: asyncio.Semaphore,
+    key: Sequence[str],
+) -> List[dict]:
+    """Fetch rows whose ``column`` is in ``ids``, one concurrent request per id chunk.
+
+    ``key`` is the table's unique key. Pages are ordered by ``column`` and then
+    by ``key``, so offset paging cannot skip or repeat rows that tie on ``column``.
+    """
+
+    unique = list(dict.fromkeys(ids))
+    if not unique:
+        return []
+    order = ",".join(f"{name}.asc" for name in dict.fromkeys((column, *key)))
+
+    async def fetch_chunk(chunk: List[str]) -> List[dict]:
+        rows: List[dict] = []
+        offset = 0
+        while True:
+            params = {
+                column: f"in.({','.join(chunk)})",
+                "select": select,
+                "order": order,
+                "limit": str(FETCH_PAGE_SIZE),
+                "offset": str(offset),
+            }
+            async with limiter:
+                response = await client.get(path, params=params, headers=headers)
+            response.raise_for_status()
+            page = response.json()
+            rows.extend(page)
+            if len(page) < FETCH_PAGE_SIZE:
+                return rows
+            offset += FETCH_PAGE_SIZE
+
+    chunks = await asyncio.gather(*(fetch_chunk(chunk) for chunk in _chunk_ids(unique)))
+    return [row for rows in chunks for row in rows]
+
+
+async def _fetch_case_page(
+    client: httpx.AsyncClient, after: Optional[str], page_size: int
+) -> List[dict]:
+    """Return the next ``page_size`` candidate cases with ``case_id`` after ``after``."""
+
     params = {
         "status": STATUS_FILTER,
         "select": "case_id,index_no,status,principal_amt,judgment_at,created_at",
-        "order": "updated_at.asc",
+        "order": "case_id.asc",
+        "limit": str(page_size),
     }
-    if limit is not None:
-        params["limit"] = str(limit)
-    response = client.get("/v_cases", params=params, headers=JUDGMENTS_HEADERS)
+    if after is not None:
+        params["case_id"] = f"gt.{after}"
+    response = await client.get("/v_cases", params=params, headers=JUDGMENTS_HEADERS)
     response.raise_for_status()
     return response.json()
 
 
-def _fetch_collectability(client: httpx.Client, case_ids: Iterable[str]) -> Dict[str, dict]:
-    ids = [case_id for case_id in case_ids]
-    if not ids:
-        return {}
-    params = {
-        "case_id": f"in.({','.join(ids)})",
-        "select": "case_id,updated_at,total_score,tier",
-    }
-    response = client.get("/collectability", params=params, headers=ENRICHMENT_HEADERS)
-    response.raise_for_status()
-    records = response.json()
-    return {row["case_id"]: row for row in records}
+async def _fetch_collectability(
+    client: httpx.AsyncClient, case_ids: Iterable[str], limiter: asyncio.Semaphore
+) -> Dict[str, dict]:
+    rows = await _fetch_in(
+        client,
+        "/collectability",
+        "case_id",
+        case_ids,
+        "case_id,updated_at,total_score,tier",
+        ENRICHMENT_HEADERS,
+        limiter,
+        key=("case_id",),
+    )
+    return {row["case_id"]: row for row in rows}
 
 
 def _filter_stale_cases(cases: List[dict], collectability: Dict[str, dict]) -> List[dict]:
@@ -91,65 +188,68 @@ def _filter_stale_cases(cases: List[dict], collectability: Dict[str, dict]) -> L
     return stale_cases
 
 
-def _fetch_roles(client: httpx.Client, case_ids: Iterable[str]) -> Dict[str, List[dict]]:
-    ids = list(case_ids)
-    if not ids:
-        return {}
-    params = {
-        "case_id": f"in.({','.join(ids)})",
-        "select": "case_id,entity_id,role",
-    }
-    response = client.get("/roles", params=params, headers=PARTIES_HEADERS)
-    response.raise_for_status()
-    roles_by_case: Dict[str, List[dict]] = defaultdict(list)
-    for row in response.json():
-        roles_by_case[row["case_id"]].append(row)
-    return roles_by_case
-
-
-def _fetch_entities(client: httpx.Client, entity_ids: Iterable[str]) -> Dict[str, dict]:
-    ids = list(entity_ids)
-    if not ids:
-        return {}
-    params = {
-        "entity_id": f"in.({','.join(ids)})",
-        "select": "entity_id,name_norm",
-    }
-    response = client.get("/entities", params=params, headers=PARTIES_HEADERS)
-    response.raise_for_status()
-    return {row["entity_id"]: row for row in response.json()}
-
-
-def _fetch_contacts(client: httpx.Client, entity_ids: Iterable[str]) -> Dict[str, List[dict]]:
-    ids = list(entity_ids)
-    if not ids:
-        return {}
-    params = {
-        "entity_id": f"in.({','.join(ids)})",
-        "select": "entity_id,kind,value,validated_bool",
-    }
-    response = client.get("/contacts", params=params, headers=ENRICHMENT_HEADERS)
-    response.raise_for_status()
-    contacts: Dict[str, List[dict]] = defaultdict(list)
-    for row in response.json():
-        contacts[row["entity_id"]].append(row)
-    return contacts
-
-
-def _fetch_assets(client: httpx.Client, entity_ids: Iterable[str]) -> Dict[str, List[dict]]:
-    ids = list(entity_ids)
-    if not ids:
-        return {}
-    params = {
-        "entity_id": f"in.({','.join(ids)})",
-        "select": "entity_id,asset_type",
-    }
-    response = client.get("/assets", params=params, headers=ENRICHMENT_HEADERS)
-    response.raise_for_status()
-    assets: Dict[str, List[dict]] = defaultdict(list)
-    for row in response.json():
-        assets[row["entity_id"]].append(row)
-    return assets
+async def _fetch_roles(
+    client: httpx.AsyncClient, case_ids: Iterable[str], limiter: asyncio.Semaphore
+) -> Dict[str, List[dict]]:
+    rows = await _fetch_in(
+        client,
+        "/roles",
+        "case_id",
+        case_ids,
+        "case_id,entity_id,role",
+        PARTIES_HEADERS,
+        limiter,
+        key=("case_id", "entity_id", "role"),
+    )
+    return _group_rows(rows, "case_id")
+
+
+async def _fetch_entities(
+    client: httpx.AsyncClient, entity_ids: Iterable[str], limiter: asyncio.Semaphore
+) -> Dict[str, dict]:
+    rows = await _fetch_in(
+        client,
+        "/entities",
+        "entity_id",
+        entity_ids,
+        "entity_id,name_norm",
+        PARTIES_HEADERS,
+        limiter,
+        key=("entity_id",),
+    )
+    return {row["entity_id"]: row for row in rows}
+
+
+async def _fetch_contacts(
+    client: httpx.AsyncClient, entity_ids: Iterable[str], limiter: asyncio.Semaphore
+) -> Dict[str, List[dict]]:
+    rows = await _fetch_in(
+        client,
+        "/contacts",
+        "entity_id",
+        entity_ids,
+        "entity_id,kind,value,validated_bool",
+        ENRICHMENT_HEADERS,
+        limiter,
+        key=("contact_id",),
+    )
+    return _group_rows(rows, "entity_id")
+
+
+async def _fetch_assets(
+    client: httpx.AsyncClient, entity_ids: Iterable[str], limiter: asyncio.Semaphore
+) -> Dict[str, List[dict]]:
+    rows = await _fetch_in(
+        client,
+        "/assets",
+        "entity_id",
+        entity_ids,
+        "entity_id,asset_type",
+        ENRICHMENT_HEADERS,
+        limiter,
+        key=("asset_id",),
+    )
+    return _group_rows(rows, "entity_id")
 
 
 def _identity_score(roles: List[dict], entities: Dict[str, dict]) -> float:
@@ -240,19 +340,155 @@ def _tier(total: float) -> str:
     return "D"
 
 
-def _upsert_collectability(client: httpx.Client, payload: dict) -> None:
+async def _upsert_collectability(
+    client: httpx.AsyncClient, payloads: List[dict], limiter: asyncio.Semaphore
+) -> int:
+    """Upsert score payloads in arrays of ``UPSERT_BATCH_SIZE`` rows."""
+
     headers = {
         **COMMON,
         "Accept-Profile": "enrichment",
         "Content-Profile": "enrichment",
         "Prefer": MERGE_MINIMAL,
     }
-    response = client.post(
-        "/enrichment.collectability?on_conflict=case_id",
-        json=[payload],
-        headers=headers,
+
+    async def post(batch: List[dict]) -> None:
+        async with limiter:
+            response = await client.post(
+                "/collectability",
+                params={"on_conflict": "case_id"},
+                json=batch,
+                headers=headers,
+            )
+        response.raise_for_status()
+
+    batches = [
+        payloads[i : i + UPSERT_BATCH_SIZE] for i in range(0, len(payloads), UPSERT_BATCH_SIZE)
+    ]
+    await asyncio.gather(*(post(batch) for batch in batches))
+    return len(payloads)
+
+
+def _score_case(
+    case: dict,
+    roles: Dict[str, List[dict]],
+    entities: Dict[str, dict],
+    contacts: Dict[str, List[dict]],
+    assets: Dict[str, List[dict]],
+) -> Tuple[dict, dict]:
+    """Return the collectability upsert payload and the summary row for one case."""
+
+    case_id = case["case_id"]
+    case_roles = roles.get(case_id, [])
+    entity_ids = [role["entity_id"] for role in case_roles if role["role"] == "defendant"]
+    identity = _identity_score(case_roles, entities)
+    contactability = _contactability_score(entity_ids, contacts)
+    asset_score = _asset_score(entity_ids, assets)
+    recency_score = _recency_amount_score(case)
+    adverse_penalty = 0.0
+    total = _total_score(identity, contactability, asset_score, recency_score, adverse_penalty)
+    payload = {
+        "case_id": case_id,
+        "identity_score": round(identity, 2),
+        "contactability_score": round(contactability, 2),
+        "asset_score": round(asset_score, 2),
+        "recency_amount_score": round(recency_score, 2),
+        "adverse_penalty": round(adverse_penalty, 2),
+    }
+    return payload, {"case_id": case_id, "total_score": total, "tier": _tier(total)}
+
+
+@dataclass
+class ScoreRun:
+    """Totals for one scoring run; only the first ``TABLE_ROWS`` results are retained."""
+
+    scanned: int = 0
+    scored: int = 0
+    pages: int = 0
+    tiers: Counter = field(default_factory=Counter)
+    results: List[dict] = field(default_factory=list)
+
+    def record(self, result: dict) -> None:
+        self.scored += 1
+        self.tiers[result["tier"]] += 1
+        if len(self.results) < TABLE_ROWS:
+            self.results.append(result)
+
+
+async def _score_page(
+    client: httpx.AsyncClient, cases: List[dict], limiter: asyncio.Semaphore, run: ScoreRun
+) -> None:
+    case_ids = [case["case_id"] for case in cases]
+    collectability, roles = await asyncio.gather(
+        _fetch_collectability(client, case_ids, limiter),
+        _fetch_roles(client, case_ids, limiter),
     )
-    response.raise_for_status()
+    stale_cases = _filter_stale_cases(cases, collectability)
+    if not stale_cases:
+        return
+    entity_ids = sorted(
+        {
+            role["entity_id"]
+            for case in stale_cases
+            for role in roles.get(case["case_id"], [])
+            if role["role"] == "defendant"
+        }
+    )
+    entities, contacts, assets = await asyncio.gather(
+        _fetch_entities(client, entity_ids, limiter),
+        _fetch_contacts(client, entity_ids, limiter),
+        _fetch_assets(client, entity_ids, limiter),
+    )
+    payloads: List[dict] = []
+    for case in stale_cases:
+        payload, result = _score_case(case, roles, entities, contacts, assets)
+        payloads.append(payload)
+        run.record(result)
+    await _upsert_collectability(client, payloads, limiter)
+
+
+async def score_stale_cases(
+    client: httpx.AsyncClient,
+    *,
+    limit: Optional[int] = None,
+    page_size: int = CASE_PAGE_SIZE,
+    concurrency: int = FETCH_CONCURRENCY,
+) -> ScoreRun:
+    """
+    Score every candidate case whose collectability is missing or stale.
+
+    Cases are read from ``v_cases`` in keyset pages on ``case_id``; the next
+    page is fetched while the current one is scored, so at most two pages are
+    held in memory regardless of table size.
+    """
+
+    run = ScoreRun()
+    limiter = asyncio.Semaphore(max(1, concurrency))
+    page_size = max(1, page_size)
+    remaining = limit
+
+    def next_size() -> int:
+        return page_size if remaining is None else min(page_size, remaining)
+
+    requested = next_size()
+    page = await _fetch_case_page(client, None, requested) if requested > 0 else []
+    while page:
+        run.pages += 1
+        run.scanned += len(page)
+        if remaining is not None:
+            remaining -= len(page)
+        prefetch: Optional[asyncio.Task] = None
+        if len(page) == requested and next_size() > 0:
+            requested = next_size()
+            prefetch = asyncio.create_task(_fetch_case_page(client, page[-1]["case_id"], requested))
+        try:
+            await _score_page(client, page, limiter, run)
+        except BaseException:
+            if prefetch is not None:
+                prefetch.cancel()
+            raise
+        page = await prefetch if prefetch is not None else []
+    return run
 
 
 def _print_table(results: List[dict]) -> None:
@@ -279,60 +515,33 @@ def _print_table(results: List[dict]) -> None:
         )
 
 
+async def _run(limit: Optional[int], page_size: int) -> ScoreRun:
+    async with postgrest_async(max_connections=FETCH_CONCURRENCY) as client:
+        return await score_stale_cases(client, limit=limit, page_size=page_size)
+
+
 @app.command()
 def main(
     limit: Optional[int] = typer.Option(None, "--limit", help="Maximum cases to evaluate"),
+    page_size: int = typer.Option(CASE_PAGE_SIZE, "--page-size", help="Cases fetched per page"),
 ) -> None:
-    with postgrest() as client:
-        cases = _fetch_cases(client, limit)
-        if not cases:
-            typer.echo("No cases match the status filter.")
-            return
-        collectability = _fetch_collectability(client, (case["case_id"] for case in cases))
-        stale_cases = _filter_stale_cases(cases, collectability)
-        if not stale_cases:
-            typer.echo("All cases have recent collectability scores.")
-            return
-        case_ids = [case["case_id"] for case in stale_cases]
-        roles = _fetch_roles(client, case_ids)
-        defendant_entities = {
-            case_id: [
-                role["entity_id"] for role in roles.get(case_id, []) if role["role"] == "defendant"
-            ]
-            for case_id in case_ids
-        }
-        all_entity_ids = sorted(
-            {entity for entities in defendant_entities.values() for entity in entities}
-        )
-        entities = _fetch_entities(client, all_entity_ids)
-        contacts = _fetch_contacts(client, all_entity_ids)
-        assets = _fetch_assets(client, all_entity_ids)
-
-        results: List[dict] = []
-        for case in stale_cases:
-            case_id = case["case_id"]
-            entity_ids = defendant_entities.get(case_id, [])
-            identity = _identity_score(roles.get(case_id, []), entities)
-            contactability = _contactability_score(entity_ids, contacts)
-            asset_score = _asset_score(entity_ids, assets)
-            recency_score = _recency_amount_score(case)
-            adverse_penalty = 0.0
-            total = _total_score(
-                identity, contactability, asset_score, recency_score, adverse_penalty
-            )
-            tier = _tier(total)
-            payload = {
-                "case_id": case_id,
-                "identity_score": round(identity, 2),
-                "contactability_score": round(contactability, 2),
-                "asset_score": round(asset_score, 2),
-                "recency_amount_score": round(recency_score, 2),
-                "adverse_penalty": round(adverse_penalty, 2),
-            }
-            _upsert_collectability(client, payload)
-            results.append({"case_id": case_id, "total_score": total, "tier": tier})
-        typer.echo(json.dumps({"processed": len(results)}, indent=2))
-        _print_table(results)
+    run = asyncio.run(_run(limit, page_size))
+    if not run.scanned:
+        typer.echo("No cases match the status filter.")
+        return
+    if not run.scored:
+        typer.echo("All cases have recent collectability scores.")
+        return
+    summary = {
+        "processed": run.scored,
+        "scanned": run.scanned,
+        "pages": run.pages,
+        "tiers": dict(sorted(run.tiers.items())),
+    }
+    typer.echo(json.dumps(summary, indent=2))
+    _print_table(run.results)
+    if run.scored > len(run.results):
+        typer.echo(f"... {run.scored - len(run.results)} more")
 
 
 if __name__ == "__main__":
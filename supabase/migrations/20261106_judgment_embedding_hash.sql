@@ -0,0 +1,20 @@
+-- 20261106_judgment_embedding_hash.sql
+-- Embedding Backfill Support
+-- Purpose: Track which judgment context each stored embedding was generated
+--          from, so backfills only re-embed rows whose context changed.
+-- Depends: 20251205000000_dragonfly_brain.sql (description_embedding column)
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: Context hash + timestamp columns
+-- ===========================================================================
+ALTER TABLE public.judgments
+ADD COLUMN IF NOT EXISTS embedding_context_hash TEXT;
+ALTER TABLE public.judgments
+ADD COLUMN IF NOT EXISTS embedded_at TIMESTAMPTZ;
+COMMENT ON COLUMN public.judgments.embedding_context_hash IS 'sha256 of embed model, dimensions and judgment context used for description_embedding';
+COMMENT ON COLUMN public.judgments.embedded_at IS 'When description_embedding was last written by the embedding pipeline';
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
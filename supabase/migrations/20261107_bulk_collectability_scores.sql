@@ -0,0 +1,36 @@
+-- 20261107_bulk_collectability_scores.sql
+-- Bulk Collectability Score Writes
+-- Purpose: Let CollectorIntelEngine.score_all persist a page of case scores
+--          with one RPC instead of one PostgREST update per case.
+-- Depends: judgments.cases.collectability_score
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: set_case_collectability_scores(p_scores jsonb)
+-- p_scores: [{"case_id": "<uuid>", "score": 72.5}, ...]
+-- Returns the number of judgments.cases rows updated.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION public.set_case_collectability_scores(p_scores JSONB) RETURNS INTEGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = public,
+    judgments,
+    pg_temp AS $$
+DECLARE v_updated INTEGER;
+BEGIN
+UPDATE judgments.cases c
+SET collectability_score = s.score,
+    updated_at = NOW()
+FROM jsonb_to_recordset(COALESCE(p_scores, '[]'::jsonb)) AS s(case_id UUID, score NUMERIC)
+WHERE c.case_id = s.case_id
+    AND c.collectability_score IS DISTINCT FROM s.score;
+GET DIAGNOSTICS v_updated = ROW_COUNT;
+RETURN v_updated;
+END;
+$$;
+REVOKE ALL ON FUNCTION public.set_case_collectability_scores(JSONB)
+FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.set_case_collectability_scores(JSONB) TO service_role;
+COMMENT ON FUNCTION public.set_case_collectability_scores(JSONB) IS 'Bulk-write collectability_score on judgments.cases from a [{case_id, score}] array (service_role only)';
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
@@ -0,0 +1,41 @@
+-- 20261108_skip_trace_cache.sql
+-- Skip-Trace Result Cache
+-- Purpose: Persist skip-trace vendor results per (provider, normalized debtor)
+--          so repeat debtors across judgments are served from cache for the
+--          TTL instead of being re-queried and billed, across worker restarts.
+-- Depends: none
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: public.skip_trace_cache
+-- debtor_key is the sha256 of the normalized debtor name, never the raw name.
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS public.skip_trace_cache (
+    provider TEXT NOT NULL,
+    debtor_key TEXT NOT NULL,
+    result JSONB NOT NULL,
+    fetched_at TIMESTAMPTZ NOT NULL DEFAULT timezone('utc', now()),
+    expires_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (provider, debtor_key)
+);
+CREATE INDEX IF NOT EXISTS idx_skip_trace_cache_expires ON public.skip_trace_cache (expires_at);
+COMMENT ON TABLE public.skip_trace_cache IS 'TTL cache of skip-trace vendor results keyed by provider and hashed normalized debtor name (service_role only).';
+COMMENT ON COLUMN public.skip_trace_cache.debtor_key IS 'sha256 hex of the normalized debtor name.';
+COMMENT ON COLUMN public.skip_trace_cache.expires_at IS 'Rows past this time are ignored by readers and overwritten on the next lookup.';
+-- ===========================================================================
+-- STEP 2: Security (service_role only)
+-- ===========================================================================
+ALTER TABLE public.skip_trace_cache ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON public.skip_trace_cache
+FROM PUBLIC;
+REVOKE ALL ON public.skip_trace_cache
+FROM anon,
+    authenticated;
+GRANT SELECT,
+    INSERT,
+    UPDATE,
+    DELETE ON public.skip_trace_cache TO service_role;
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
@@ -0,0 +1,248 @@
+-- 20261109_orchestration_stage_counters.sql
+-- Orchestration Stage Counters
+-- Purpose: Keep per-batch, per-stage job counters for the Golden Path
+--          orchestrator so stage completion is a primary-key lookup instead of
+--          a GROUP BY over ops.job_queue on every tick, and notify the
+--          orchestrator the moment a stage has no pending jobs left.
+-- Depends: ops.job_queue (job_type, status, payload)
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: ops.orchestration_stage_counters
+-- One row per (batch_id, job_type). Maintained only by the triggers below.
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS ops.orchestration_stage_counters (
+    batch_id UUID NOT NULL,
+    job_type TEXT NOT NULL,
+    jobs_total INTEGER NOT NULL DEFAULT 0,
+    jobs_pending INTEGER NOT NULL DEFAULT 0,
+    jobs_completed INTEGER NOT NULL DEFAULT 0,
+    jobs_failed INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (batch_id, job_type)
+);
+COMMENT ON TABLE ops.orchestration_stage_counters IS 'Per-batch job counters for orchestrator stages, maintained by triggers on ops.job_queue.';
+COMMENT ON COLUMN ops.orchestration_stage_counters.jobs_pending IS 'Jobs in pending/processing/locked; the stage is complete when this reaches 0.';
+-- ===========================================================================
+-- STEP 2: Helpers
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION ops.orchestration_batch_id(p_job_type TEXT, p_payload JSONB) RETURNS UUID LANGUAGE sql IMMUTABLE AS $$
+SELECT CASE
+        WHEN p_job_type IN ('entity_resolve', 'judgment_create')
+        AND p_payload->>'batch_id' ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$' THEN (p_payload->>'batch_id')::UUID
+    END;
+$$;
+CREATE OR REPLACE FUNCTION ops.job_status_class(p_status TEXT) RETURNS TEXT LANGUAGE sql IMMUTABLE AS $$
+SELECT CASE
+        WHEN p_status IN ('completed', 'success') THEN 'completed'
+        WHEN p_status IN ('failed', 'dead_letter') THEN 'failed'
+        WHEN p_status IN ('pending', 'processing', 'locked') THEN 'pending'
+        ELSE 'other'
+    END;
+$$;
+-- p_deltas: [{"batch_id", "job_type", "total", "pending", "completed", "failed"}]
+CREATE OR REPLACE FUNCTION ops.apply_orchestration_counter_deltas(p_deltas JSONB) RETURNS VOID LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = ops,
+    pg_temp AS $$
+DECLARE r RECORD;
+BEGIN FOR r IN
+INSERT INTO ops.orchestration_stage_counters AS c (
+        batch_id,
+        job_type,
+        jobs_total,
+        jobs_pending,
+        jobs_completed,
+        jobs_failed
+    )
+SELECT d.batch_id,
+    d.job_type,
+    d.total,
+    d.pending,
+    d.completed,
+    d.failed
+FROM jsonb_to_recordset(COALESCE(p_deltas, '[]'::jsonb)) AS d(
+        batch_id UUID,
+        job_type TEXT,
+        total INTEGER,
+        pending INTEGER,
+        completed INTEGER,
+        failed INTEGER
+    )
+WHERE d.total <> 0
+    OR d.pending <> 0
+    OR d.completed <> 0
+    OR d.failed <> 0 ON CONFLICT (batch_id, job_type) DO
+UPDATE
+SET jobs_total = c.jobs_total + EXCLUDED.jobs_total,
+    jobs_pending = c.jobs_pending + EXCLUDED.jobs_pending,
+    jobs_completed = c.jobs_completed + EXCLUDED.jobs_completed,
+    jobs_failed = c.jobs_failed + EXCLUDED.jobs_failed,
+    updated_at = now()
+RETURNING c.batch_id,
+    c.job_type,
+    c.jobs_total,
+    c.jobs_pending LOOP IF r.jobs_pending = 0
+    AND r.jobs_total > 0 THEN PERFORM pg_notify(
+        'orchestration_stage_done',
+        json_build_object('batch_id', r.batch_id, 'job_type', r.job_type)::text
+    );
+END IF;
+END LOOP;
+END;
+$$;
+-- ===========================================================================
+-- STEP 3: Statement-level triggers on ops.job_queue
+-- Transition tables aggregate a whole INSERT ... SELECT fan-out into one
+-- counter upsert per (batch, stage).
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION ops.trg_job_queue_counters_insert() RETURNS trigger LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = ops,
+    pg_temp AS $$ BEGIN PERFORM ops.apply_orchestration_counter_deltas(
+        (
+            SELECT jsonb_agg(to_jsonb(d))
+            FROM (
+                    SELECT ops.orchestration_batch_id(n.job_type::text, n.payload) AS batch_id,
+                        n.job_type::text AS job_type,
+                        count(*) AS total,
+                        count(*) FILTER (
+                            WHERE ops.job_status_class(n.status::text) = 'pending'
+                        ) AS pending,
+                        count(*) FILTER (
+                            WHERE ops.job_status_class(n.status::text) = 'completed'
+                        ) AS completed,
+                        count(*) FILTER (
+                            WHERE ops.job_status_class(n.status::text) = 'failed'
+                        ) AS failed
+                    FROM new_rows n
+                    WHERE ops.orchestration_batch_id(n.job_type::text, n.payload) IS NOT NULL
+                    GROUP BY 1,
+                        2
+                ) d
+        )
+    );
+RETURN NULL;
+END;
+$$;
+CREATE OR REPLACE FUNCTION ops.trg_job_queue_counters_update() RETURNS trigger LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = ops,
+    pg_temp AS $$ BEGIN PERFORM ops.apply_orchestration_counter_deltas(
+        (
+            SELECT jsonb_agg(to_jsonb(d))
+            FROM (
+                    SELECT x.batch_id,
+                        x.job_type,
+                        0 AS total,
+                        sum(x.pending) AS pending,
+                        sum(x.completed) AS completed,
+                        sum(x.failed) AS failed
+                    FROM (
+                            SELECT ops.orchestration_batch_id(n.job_type::text, n.payload) AS batch_id,
+                                n.job_type::text AS job_type,
+                                (ops.job_status_class(n.status::text) = 'pending')::int - (ops.job_status_class(o.status::text) = 'pending')::int AS pending,
+                                (ops.job_status_class(n.status::text) = 'completed')::int - (ops.job_status_class(o.status::text) = 'completed')::int AS completed,
+                                (ops.job_status_class(n.status::text) = 'failed')::int - (ops.job_status_class(o.status::text) = 'failed')::int AS failed
+                            FROM new_rows n
+                                JOIN old_rows o ON o.id = n.id
+                            WHERE n.status IS DISTINCT FROM o.status
+                        ) x
+                    WHERE x.batch_id IS NOT NULL
+                    GROUP BY 1,
+                        2
+                ) d
+        )
+    );
+RETURN NULL;
+END;
+$$;
+CREATE OR REPLACE FUNCTION ops.trg_job_queue_counters_delete() RETURNS trigger LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = ops,
+    pg_temp AS $$ BEGIN PERFORM ops.apply_orchestration_counter_deltas(
+        (
+            SELECT jsonb_agg(to_jsonb(d))
+            FROM (
+                    SELECT ops.orchestration_batch_id(o.job_type::text, o.payload) AS batch_id,
+                        o.job_type::text AS job_type,
+                        - count(*) AS total,
+                        - count(*) FILTER (
+                            WHERE ops.job_status_class(o.status::text) = 'pending'
+                        ) AS pending,
+                        - count(*) FILTER (
+                            WHERE ops.job_status_class(o.status::text) = 'completed'
+                        ) AS completed,
+                        - count(*) FILTER (
+                            WHERE ops.job_status_class(o.status::text) = 'failed'
+                        ) AS failed
+                    FROM old_rows o
+                    WHERE ops.orchestration_batch_id(o.job_type::text, o.payload) IS NOT NULL
+                    GROUP BY 1,
+                        2
+                ) d
+        )
+    );
+RETURN NULL;
+END;
+$$;
+DROP TRIGGER IF EXISTS trg_job_queue_counters_insert ON ops.job_queue;
+CREATE TRIGGER trg_job_queue_counters_insert
+AFTER
+INSERT ON ops.job_queue REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION ops.trg_job_queue_counters_insert();
+DROP TRIGGER IF EXISTS trg_job_queue_counters_update ON ops.job_queue;
+CREATE TRIGGER trg_job_queue_counters_update
+AFTER
+UPDATE ON ops.job_queue REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION ops.trg_job_queue_counters_update();
+DROP TRIGGER IF EXISTS trg_job_queue_counters_delete ON ops.job_queue;
+CREATE TRIGGER trg_job_queue_counters_delete
+AFTER DELETE ON ops.job_queue REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION ops.trg_job_queue_counters_delete();
+-- ===========================================================================
+-- STEP 4: Backfill counters for batches already in flight
+-- ===========================================================================
+INSERT INTO ops.orchestration_stage_counters (
+        batch_id,
+        job_type,
+        jobs_total,
+        jobs_pending,
+        jobs_completed,
+        jobs_failed
+    )
+SELECT ops.orchestration_batch_id(q.job_type::text, q.payload),
+    q.job_type::text,
+    count(*),
+    count(*) FILTER (
+        WHERE ops.job_status_class(q.status::text) = 'pending'
+    ),
+    count(*) FILTER (
+        WHERE ops.job_status_class(q.status::text) = 'completed'
+    ),
+    count(*) FILTER (
+        WHERE ops.job_status_class(q.status::text) = 'failed'
+    )
+FROM ops.job_queue q
+WHERE q.job_type::text IN ('entity_resolve', 'judgment_create')
+    AND ops.orchestration_batch_id(q.job_type::text, q.payload) IS NOT NULL
+GROUP BY 1,
+    2 ON CONFLICT (batch_id, job_type) DO NOTHING;
+-- ===========================================================================
+-- STEP 5: Security
+-- ===========================================================================
+ALTER TABLE ops.orchestration_stage_counters ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON ops.orchestration_stage_counters
+FROM PUBLIC;
+GRANT SELECT ON ops.orchestration_stage_counters TO service_role;
+REVOKE ALL ON FUNCTION ops.apply_orchestration_counter_deltas(JSONB)
+FROM PUBLIC;
+DO $$ BEGIN IF EXISTS (
+    SELECT 1
+    FROM pg_roles
+    WHERE rolname = 'dragonfly_app'
+) THEN
+GRANT SELECT ON ops.orchestration_stage_counters TO dragonfly_app;
+DROP POLICY IF EXISTS orchestration_stage_counters_app_read ON ops.orchestration_stage_counters;
+CREATE POLICY orchestration_stage_counters_app_read ON ops.orchestration_stage_counters FOR
+SELECT TO dragonfly_app USING (true);
+RAISE NOTICE '✓ Granted orchestration counter read access to dragonfly_app';
+END IF;
+END $$;
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
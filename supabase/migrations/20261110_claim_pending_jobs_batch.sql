@@ -0,0 +1,124 @@
+-- 20261110_claim_pending_jobs_batch.sql
+-- Batch Job Claim and Status RPCs
+-- Purpose: Let workers that can process jobs in bulk (enforcement_engine's
+--          Smart Strategy path) claim and settle up to N jobs per round-trip
+--          instead of one claim plus one status update per job.
+-- Depends: ops.job_queue, ops.claim_pending_job, ops.update_job_status
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: ops.claim_pending_jobs(job_types, limit, lock_timeout, worker_id)
+-- Same selection and locking rules as ops.claim_pending_job, up to p_limit rows.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION ops.claim_pending_jobs(
+        p_job_types TEXT [],
+        p_limit INTEGER DEFAULT 50,
+        p_lock_timeout_minutes INTEGER DEFAULT 30,
+        p_worker_id TEXT DEFAULT NULL
+    ) RETURNS TABLE (
+        job_id UUID,
+        job_type TEXT,
+        payload JSONB,
+        attempts INTEGER,
+        created_at TIMESTAMPTZ
+    ) LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = ops,
+    public AS $$ BEGIN RETURN QUERY
+UPDATE ops.job_queue jq
+SET status = 'processing',
+    locked_at = now(),
+    started_at = now(),
+    worker_id = p_worker_id,
+    attempts = jq.attempts + 1
+WHERE jq.id IN (
+        SELECT inner_jq.id
+        FROM ops.job_queue inner_jq
+        WHERE inner_jq.job_type::text = ANY(p_job_types)
+            AND inner_jq.status::text = 'pending'
+            AND (
+                inner_jq.next_run_at IS NULL
+                OR inner_jq.next_run_at <= now()
+            )
+            AND (
+                inner_jq.locked_at IS NULL
+                OR inner_jq.locked_at < now() - (p_lock_timeout_minutes || ' minutes')::interval
+            )
+        ORDER BY COALESCE(inner_jq.next_run_at, inner_jq.created_at) ASC
+        LIMIT GREATEST(p_limit, 1) FOR
+        UPDATE SKIP LOCKED
+    )
+RETURNING jq.id,
+    jq.job_type::text,
+    jq.payload,
+    jq.attempts,
+    jq.created_at;
+END;
+$$;
+COMMENT ON FUNCTION ops.claim_pending_jobs(TEXT [], INTEGER, INTEGER, TEXT) IS 'Batch job claim RPC. Claims up to p_limit pending jobs with the same rules as ops.claim_pending_job. SECURITY DEFINER.';
+-- ===========================================================================
+-- STEP 2: ops.update_job_status_many(job_ids, status, error_message)
+-- Same field handling as ops.update_job_status, for a set of jobs.
+-- Returns the number of jobs updated.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION ops.update_job_status_many(
+        p_job_ids UUID [],
+        p_status TEXT,
+        p_error_message TEXT DEFAULT NULL
+    ) RETURNS INTEGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = ops,
+    public AS $$
+DECLARE v_updated INTEGER;
+BEGIN
+UPDATE ops.job_queue jq
+SET status = p_status::ops.job_status_enum,
+    last_error = COALESCE(LEFT(p_error_message, 2000), jq.last_error),
+    next_run_at = NULL,
+    updated_at = now(),
+    locked_at = CASE
+        WHEN p_status IN ('completed', 'failed') THEN NULL
+        ELSE jq.locked_at
+    END,
+    started_at = CASE
+        WHEN p_status IN ('completed', 'failed') THEN NULL
+        ELSE jq.started_at
+    END,
+    worker_id = CASE
+        WHEN p_status IN ('completed', 'failed') THEN NULL
+        ELSE jq.worker_id
+    END
+WHERE jq.id = ANY(p_job_ids);
+GET DIAGNOSTICS v_updated = ROW_COUNT;
+RETURN v_updated;
+END;
+$$;
+COMMENT ON FUNCTION ops.update_job_status_many(UUID [], TEXT, TEXT) IS 'Bulk job status update. Clears processing fields on terminal states. SECURITY DEFINER.';
+-- ===========================================================================
+-- STEP 3: Grants (mirror ops.claim_pending_job / ops.update_job_status)
+-- ===========================================================================
+REVOKE ALL ON FUNCTION ops.claim_pending_jobs(TEXT [], INTEGER, INTEGER, TEXT)
+FROM PUBLIC;
+REVOKE ALL ON FUNCTION ops.update_job_status_many(UUID [], TEXT, TEXT)
+FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION ops.claim_pending_jobs(TEXT [], INTEGER, INTEGER, TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION ops.update_job_status_many(UUID [], TEXT, TEXT) TO service_role;
+DO $$ BEGIN IF EXISTS (
+    SELECT 1
+    FROM pg_roles
+    WHERE rolname = 'dragonfly_worker'
+) THEN
+GRANT EXECUTE ON FUNCTION ops.claim_pending_jobs(TEXT [], INTEGER, INTEGER, TEXT) TO dragonfly_worker;
+GRANT EXECUTE ON FUNCTION ops.update_job_status_many(UUID [], TEXT, TEXT) TO dragonfly_worker;
+END IF;
+IF EXISTS (
+    SELECT 1
+    FROM pg_roles
+    WHERE rolname = 'dragonfly_app'
+) THEN
+GRANT EXECUTE ON FUNCTION ops.claim_pending_jobs(TEXT [], INTEGER, INTEGER, TEXT) TO dragonfly_app;
+GRANT EXECUTE ON FUNCTION ops.update_job_status_many(UUID [], TEXT, TEXT) TO dragonfly_app;
+END IF;
+END $$;
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
@@ -0,0 +1,103 @@
+-- 20261111_worker_metrics_deltas.sql
+-- Worker Metrics Deltas
+-- Purpose: Let BaseWorker aggregate queue metrics in process and flush one
+--          delta per heartbeat interval instead of calling
+--          workers.update_metrics() inside every job transaction.
+-- Depends: workers.metrics, workers.update_metrics (20260601000000)
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: Latency histogram columns on workers.metrics
+-- ===========================================================================
+ALTER TABLE workers.metrics
+ADD COLUMN IF NOT EXISTS latency_buckets JSONB NOT NULL DEFAULT '{}'::jsonb;
+COMMENT ON COLUMN workers.metrics.latency_buckets IS 'Job count per latency bucket, keyed by bucket upper bound in ms ("inf" for the overflow bucket)';
+-- ===========================================================================
+-- STEP 2: workers.apply_metrics_delta(...)
+-- Same semantics as workers.update_metrics() applied once per job:
+--   totals add up, min/max widen, and the rolling average moves as if
+--   p_latency_count successes at the delta's mean latency arrived in a row.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION workers.apply_metrics_delta(
+        p_queue_name TEXT,
+        p_processed INTEGER,
+        p_failed INTEGER,
+        p_latency_sum_ms BIGINT,
+        p_latency_count INTEGER,
+        p_min_latency_ms INTEGER,
+        p_max_latency_ms INTEGER,
+        p_latency_buckets JSONB DEFAULT '{}'::jsonb,
+        p_last_job_id UUID DEFAULT NULL,
+        p_last_success_at TIMESTAMPTZ DEFAULT NULL
+    ) RETURNS VOID LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = workers,
+    pg_temp AS $$
+DECLARE v_mean INTEGER := CASE
+        WHEN p_latency_count > 0 THEN (p_latency_sum_ms / p_latency_count)::INTEGER
+    END;
+v_keep NUMERIC := power(0.9, GREATEST(p_latency_count, 0));
+BEGIN
+INSERT INTO workers.metrics AS m (
+        queue_name,
+        last_job_id,
+        last_success_at,
+        total_processed,
+        total_failed,
+        avg_latency_ms,
+        max_latency_ms,
+        min_latency_ms,
+        latency_buckets,
+        updated_at
+    )
+VALUES (
+        p_queue_name,
+        p_last_job_id,
+        p_last_success_at,
+        p_processed,
+        p_failed,
+        COALESCE(v_mean, 0),
+        COALESCE(p_max_latency_ms, 0),
+        p_min_latency_ms,
+        COALESCE(p_latency_buckets, '{}'::jsonb),
+        now()
+    ) ON CONFLICT (queue_name) DO
+UPDATE
+SET last_job_id = COALESCE(p_last_job_id, m.last_job_id),
+    last_success_at = COALESCE(p_last_success_at, m.last_success_at),
+    total_processed = m.total_processed + p_processed,
+    total_failed = m.total_failed + p_failed,
+    avg_latency_ms = CASE
+        WHEN v_mean IS NULL THEN m.avg_latency_ms
+        ELSE (m.avg_latency_ms * v_keep + v_mean * (1 - v_keep))::INTEGER
+    END,
+    max_latency_ms = GREATEST(m.max_latency_ms, COALESCE(p_max_latency_ms, 0)),
+    min_latency_ms = LEAST(
+        COALESCE(m.min_latency_ms, p_min_latency_ms),
+        COALESCE(p_min_latency_ms, m.min_latency_ms)
+    ),
+    latency_buckets = (
+        SELECT COALESCE(jsonb_object_agg(b.key, b.total), '{}'::jsonb)
+        FROM (
+                SELECT e.key,
+                    sum(e.value::BIGINT) AS total
+                FROM (
+                        SELECT *
+                        FROM jsonb_each_text(m.latency_buckets)
+                        UNION ALL
+                        SELECT *
+                        FROM jsonb_each_text(COALESCE(p_latency_buckets, '{}'::jsonb))
+                    ) e
+                GROUP BY e.key
+            ) b
+    ),
+    updated_at = now();
+END;
+$$;
+COMMENT ON FUNCTION workers.apply_metrics_delta IS 'Apply an aggregated per-interval metrics delta for a queue (flushed with worker heartbeats).';
+REVOKE ALL ON FUNCTION workers.apply_metrics_delta
+FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION workers.apply_metrics_delta TO service_role;
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
@@ -0,0 +1,132 @@
+-- 20261112_queue_telemetry.sql
+-- Queue Telemetry Time-Series
+-- Purpose: Retain pgmq queue depth and worker throughput history so arrival
+--          rate, drain rate, backlog ETA and replica recommendations can be
+--          computed per queue (backend/services/queue_telemetry.py).
+--          Raw samples are kept for p_raw_days, then thinned to one sample
+--          per queue per hour; everything older than p_keep_days is dropped.
+-- Depends: pgmq.metrics_all(), workers.metrics, workers.heartbeats
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: workers.queue_samples
+-- Counters (enqueued_total, drained_total) are cumulative, so rates over any
+-- window are the difference between its first and last sample. That is what
+-- makes thinning to one row per hour lossless for rate math.
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS workers.queue_samples (
+    queue_name TEXT NOT NULL,
+    sampled_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    queue_length BIGINT NOT NULL DEFAULT 0,
+    oldest_msg_age_sec INTEGER,
+    enqueued_total BIGINT NOT NULL DEFAULT 0,
+    drained_total BIGINT NOT NULL DEFAULT 0,
+    active_workers INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (queue_name, sampled_at)
+);
+COMMENT ON TABLE workers.queue_samples IS 'Rolling per-queue telemetry samples (pgmq depth + worker throughput). Raw for a few days, then hourly.';
+COMMENT ON COLUMN workers.queue_samples.enqueued_total IS 'pgmq total_messages at sample time (cumulative messages ever sent)';
+COMMENT ON COLUMN workers.queue_samples.drained_total IS 'workers.metrics total_processed + total_failed at sample time (cumulative)';
+COMMENT ON COLUMN workers.queue_samples.active_workers IS 'Workers on the queue with a non-stopped heartbeat in the last 2 minutes';
+CREATE INDEX IF NOT EXISTS ix_queue_samples_sampled_at ON workers.queue_samples (sampled_at);
+-- ===========================================================================
+-- STEP 2: workers.record_queue_samples()
+-- One row per pgmq queue per call. Returns the number of rows written.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION workers.record_queue_samples() RETURNS INTEGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = workers,
+    pgmq,
+    pg_temp AS $$
+DECLARE v_rows INTEGER;
+BEGIN
+INSERT INTO workers.queue_samples (
+        queue_name,
+        sampled_at,
+        queue_length,
+        oldest_msg_age_sec,
+        enqueued_total,
+        drained_total,
+        active_workers
+    )
+SELECT q.queue_name,
+    now(),
+    COALESCE(q.queue_length, 0),
+    q.oldest_msg_age_sec,
+    COALESCE(q.total_messages, 0),
+    COALESCE(m.total_processed, 0) + COALESCE(m.total_failed, 0),
+    COALESCE(h.active_workers, 0)
+FROM pgmq.metrics_all() q
+    LEFT JOIN workers.metrics m ON m.queue_name = q.queue_name
+    LEFT JOIN (
+        SELECT hb.queue_name,
+            count(*)::INTEGER AS active_workers
+        FROM workers.heartbeats hb
+        WHERE hb.status <> 'stopped'
+            AND hb.last_heartbeat_at > now() - INTERVAL '2 minutes'
+        GROUP BY hb.queue_name
+    ) h ON h.queue_name = q.queue_name ON CONFLICT (queue_name, sampled_at) DO NOTHING;
+GET DIAGNOSTICS v_rows = ROW_COUNT;
+RETURN v_rows;
+END;
+$$;
+COMMENT ON FUNCTION workers.record_queue_samples IS 'Record one telemetry sample per pgmq queue (called by the platform watchdog each iteration).';
+-- ===========================================================================
+-- STEP 3: workers.downsample_queue_samples(p_raw_days, p_keep_days)
+-- Keeps the last sample of each (queue, hour) older than p_raw_days and
+-- drops samples older than p_keep_days. Returns rows deleted.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION workers.downsample_queue_samples(
+        p_raw_days INTEGER DEFAULT 7,
+        p_keep_days INTEGER DEFAULT 90
+    ) RETURNS INTEGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = workers,
+    pg_temp AS $$
+DECLARE v_thinned INTEGER;
+v_expired INTEGER;
+BEGIN
+DELETE FROM workers.queue_samples s
+WHERE s.sampled_at < now() - make_interval(days => p_raw_days)
+    AND s.sampled_at >= now() - make_interval(days => p_keep_days)
+    AND EXISTS (
+        SELECT 1
+        FROM workers.queue_samples later
+        WHERE later.queue_name = s.queue_name
+            AND date_trunc('hour', later.sampled_at) = date_trunc('hour', s.sampled_at)
+            AND later.sampled_at > s.sampled_at
+    );
+GET DIAGNOSTICS v_thinned = ROW_COUNT;
+DELETE FROM workers.queue_samples
+WHERE sampled_at < now() - make_interval(days => p_keep_days);
+GET DIAGNOSTICS v_expired = ROW_COUNT;
+RETURN v_thinned + v_expired;
+END;
+$$;
+COMMENT ON FUNCTION workers.downsample_queue_samples IS 'Thin queue telemetry older than p_raw_days to hourly and expire rows older than p_keep_days.';
+-- ===========================================================================
+-- STEP 4: Security
+-- ===========================================================================
+ALTER TABLE workers.queue_samples ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON workers.queue_samples
+FROM PUBLIC;
+GRANT SELECT ON workers.queue_samples TO service_role;
+REVOKE ALL ON FUNCTION workers.record_queue_samples
+FROM PUBLIC;
+REVOKE ALL ON FUNCTION workers.downsample_queue_samples
+FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION workers.record_queue_samples TO service_role;
+GRANT EXECUTE ON FUNCTION workers.downsample_queue_samples TO service_role;
+DO $$ BEGIN IF EXISTS (
+    SELECT 1
+    FROM pg_roles
+    WHERE rolname = 'dragonfly_app'
+) THEN
+GRANT SELECT ON workers.queue_samples TO dragonfly_app;
+DROP POLICY IF EXISTS queue_samples_app_read ON workers.queue_samples;
+CREATE POLICY queue_samples_app_read ON workers.queue_samples FOR
+SELECT TO dragonfly_app USING (true);
+END IF;
+END $$;
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
@@ -0,0 +1,339 @@
+-- 20261113_portfolio_rollups.sql
+-- Incrementally Maintained Portfolio Rollups
+-- Purpose: Keep judgment counts and amount sums by status, tier, enforcement
+--          stage and pool in a small summary table so the analytics overview
+--          and pipeline endpoints read O(1) rows instead of scanning
+--          public.judgments on every request.
+--          Maintained by statement-level triggers (transition tables), so a
+--          bulk insert of N judgments costs one grouped upsert, not N.
+--          analytics.reconcile_portfolio_rollups() verifies (and optionally
+--          repairs) the rollups against a full scan; run nightly by the
+--          scheduler (backend/services/portfolio_rollups.py).
+-- Depends: public.judgments, analytics schema
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: analytics.portfolio_rollups
+-- One row per (dimension, bucket). dimension is one of
+--   'total' (bucket 'all'), 'status', 'tier', 'stage', 'pool'.
+-- active_count matches the overview's definition: status <> 'closed'.
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS analytics.portfolio_rollups (
+    dimension TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    judgment_count BIGINT NOT NULL DEFAULT 0,
+    amount_sum NUMERIC NOT NULL DEFAULT 0,
+    active_count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (dimension, bucket)
+);
+COMMENT ON TABLE analytics.portfolio_rollups IS 'Portfolio aggregates by status/tier/stage/pool, maintained by statement-level triggers on public.judgments.';
+-- ===========================================================================
+-- STEP 2: analytics.portfolio_rollup_keys(row)
+-- The rollup buckets a judgment row contributes to. Reads the row as JSONB
+-- so environments that lack one of the optional columns still work.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION analytics.portfolio_rollup_keys(p_row JSONB) RETURNS TABLE (
+        dimension TEXT,
+        bucket TEXT,
+        amount NUMERIC,
+        active INTEGER
+    ) LANGUAGE sql IMMUTABLE
+SET search_path = analytics,
+    pg_temp AS $$
+SELECT k.dimension,
+    k.bucket,
+    COALESCE(NULLIF(p_row->>'judgment_amount', '')::NUMERIC, 0),
+    CASE
+        WHEN p_row->>'status' IS NOT NULL
+        AND p_row->>'status' <> 'closed' THEN 1
+        ELSE 0
+    END
+FROM (
+        VALUES ('total', 'all'),
+            ('status', COALESCE(p_row->>'status', 'intake')),
+            ('tier', COALESCE(p_row->>'tier', 'unassigned')),
+            ('stage', COALESCE(p_row->>'enforcement_stage', 'unknown')),
+            ('pool', COALESCE(p_row->>'pool_id', 'unpooled'))
+    ) AS k(dimension, bucket);
+$$;
+-- ===========================================================================
+-- STEP 3: Statement-level triggers
+-- Each statement folds +1 per new row and -1 per old row into one grouped
+-- upsert. Buckets whose net change is zero (e.g. an UPDATE that touches no
+-- rolled-up column) are skipped, so unrelated updates take no rollup locks.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION analytics.apply_portfolio_rollup_delta(p_delta JSONB) RETURNS VOID LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = analytics,
+    pg_temp AS $$ BEGIN
+INSERT INTO analytics.portfolio_rollups AS r (
+        dimension,
+        bucket,
+        judgment_count,
+        amount_sum,
+        active_count,
+        updated_at
+    )
+SELECT d->>'dimension',
+    d->>'bucket',
+    (d->>'judgment_count')::BIGINT,
+    (d->>'amount_sum')::NUMERIC,
+    (d->>'active_count')::BIGINT,
+    now()
+FROM jsonb_array_elements(p_delta) d
+ORDER BY 1,
+    2 ON CONFLICT (dimension, bucket) DO
+UPDATE
+SET judgment_count = r.judgment_count + EXCLUDED.judgment_count,
+    amount_sum = r.amount_sum + EXCLUDED.amount_sum,
+    active_count = r.active_count + EXCLUDED.active_count,
+    updated_at = now();
+END;
+$$;
+CREATE OR REPLACE FUNCTION analytics.trg_judgments_rollup_insert() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = analytics,
+    public,
+    pg_temp AS $$
+DECLARE v_delta JSONB;
+BEGIN
+SELECT jsonb_agg(to_jsonb(g))
+FROM (
+        SELECT k.dimension,
+            k.bucket,
+            count(*) AS judgment_count,
+            sum(k.amount) AS amount_sum,
+            sum(k.active) AS active_count
+        FROM new_rows n
+            CROSS JOIN LATERAL analytics.portfolio_rollup_keys(to_jsonb(n)) k
+        GROUP BY k.dimension,
+            k.bucket
+    ) g INTO v_delta;
+IF v_delta IS NOT NULL THEN PERFORM analytics.apply_portfolio_rollup_delta(v_delta);
+END IF;
+RETURN NULL;
+END;
+$$;
+CREATE OR REPLACE FUNCTION analytics.trg_judgments_rollup_update() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = analytics,
+    public,
+    pg_temp AS $$
+DECLARE v_delta JSONB;
+BEGIN
+SELECT jsonb_agg(to_jsonb(g))
+FROM (
+        SELECT k.dimension,
+            k.bucket,
+            sum(d.sign) AS judgment_count,
+            sum(d.sign * k.amount) AS amount_sum,
+            sum(d.sign * k.active) AS active_count
+        FROM (
+                SELECT 1 AS sign,
+                    to_jsonb(n) AS j
+                FROM new_rows n
+                UNION ALL
+                SELECT -1,
+                    to_jsonb(o)
+                FROM old_rows o
+            ) d
+            CROSS JOIN LATERAL analytics.portfolio_rollup_keys(d.j) k
+        GROUP BY k.dimension,
+            k.bucket
+        HAVING sum(d.sign) <> 0
+            OR sum(d.sign * k.amount) <> 0
+            OR sum(d.sign * k.active) <> 0
+    ) g INTO v_delta;
+IF v_delta IS NOT NULL THEN PERFORM analytics.apply_portfolio_rollup_delta(v_delta);
+END IF;
+RETURN NULL;
+END;
+$$;
+CREATE OR REPLACE FUNCTION analytics.trg_judgments_rollup_delete() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = analytics,
+    public,
+    pg_temp AS $$
+DECLARE v_delta JSONB;
+BEGIN
+SELECT jsonb_agg(to_jsonb(g))
+FROM (
+        SELECT k.dimension,
+            k.bucket,
+            - count(*) AS judgment_count,
+            - sum(k.amount) AS amount_sum,
+            - sum(k.active) AS active_count
+        FROM old_rows o
+            CROSS JOIN LATERAL analytics.portfolio_rollup_keys(to_jsonb(o)) k
+        GROUP BY k.dimension,
+            k.bucket
+    ) g INTO v_delta;
+IF v_delta IS NOT NULL THEN PERFORM analytics.apply_portfolio_rollup_delta(v_delta);
+END IF;
+RETURN NULL;
+END;
+$$;
+CREATE OR REPLACE FUNCTION analytics.trg_judgments_rollup_truncate() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = analytics,
+    pg_temp AS $$ BEGIN
+DELETE FROM analytics.portfolio_rollups;
+RETURN NULL;
+END;
+$$;
+DROP TRIGGER IF EXISTS trg_judgments_rollup_insert ON public.judgments;
+CREATE TRIGGER trg_judgments_rollup_insert
+AFTER
+INSERT ON public.judgments REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION analytics.trg_judgments_rollup_insert();
+DROP TRIGGER IF EXISTS trg_judgments_rollup_update ON public.judgments;
+CREATE TRIGGER trg_judgments_rollup_update
+AFTER
+UPDATE ON public.judgments REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION analytics.trg_judgments_rollup_update();
+DROP TRIGGER IF EXISTS trg_judgments_rollup_delete ON public.judgments;
+CREATE TRIGGER trg_judgments_rollup_delete
+AFTER DELETE ON public.judgments REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION analytics.trg_judgments_rollup_delete();
+DROP TRIGGER IF EXISTS trg_judgments_rollup_truncate ON public.judgments;
+CREATE TRIGGER trg_judgments_rollup_truncate
+AFTER TRUNCATE ON public.judgments FOR EACH STATEMENT EXECUTE FUNCTION analytics.trg_judgments_rollup_truncate();
+-- ===========================================================================
+-- STEP 4: analytics.reconcile_portfolio_rollups(p_repair)
+-- Full scan of public.judgments compared bucket by bucket with the rollups.
+-- Returns only buckets that disagree. With p_repair the rollups are rebuilt
+-- under a SHARE lock (blocks judgment writes for the duration of the scan).
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION analytics.reconcile_portfolio_rollups(p_repair BOOLEAN DEFAULT false) RETURNS TABLE (
+        dimension TEXT,
+        bucket TEXT,
+        expected_count BIGINT,
+        actual_count BIGINT,
+        expected_amount NUMERIC,
+        actual_amount NUMERIC,
+        expected_active BIGINT,
+        actual_active BIGINT
+    ) LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = analytics,
+    public,
+    pg_temp AS $$ BEGIN IF p_repair THEN LOCK TABLE public.judgments IN SHARE MODE;
+END IF;
+CREATE TEMP TABLE _portfolio_rollup_scan ON COMMIT DROP AS
+SELECT k.dimension,
+    k.bucket,
+    count(*)::BIGINT AS judgment_count,
+    sum(k.amount) AS amount_sum,
+    sum(k.active)::BIGINT AS active_count
+FROM public.judgments j
+    CROSS JOIN LATERAL analytics.portfolio_rollup_keys(to_jsonb(j)) k
+GROUP BY k.dimension,
+    k.bucket;
+RETURN QUERY
+SELECT COALESCE(s.dimension, r.dimension),
+    COALESCE(s.bucket, r.bucket),
+    COALESCE(s.judgment_count, 0),
+    COALESCE(r.judgment_count, 0),
+    COALESCE(s.amount_sum, 0),
+    COALESCE(r.amount_sum, 0),
+    COALESCE(s.active_count, 0),
+    COALESCE(r.active_count, 0)
+FROM _portfolio_rollup_scan s
+    FULL JOIN analytics.portfolio_rollups r ON r.dimension = s.dimension
+    AND r.bucket = s.bucket
+WHERE COALESCE(s.judgment_count, 0) <> COALESCE(r.judgment_count, 0)
+    OR COALESCE(s.amount_sum, 0) <> COALESCE(r.amount_sum, 0)
+    OR COALESCE(s.active_count, 0) <> COALESCE(r.active_count, 0)
+ORDER BY 1,
+    2;
+IF p_repair THEN
+DELETE FROM analytics.portfolio_rollups;
+INSERT INTO analytics.portfolio_rollups (
+        dimension,
+        bucket,
+        judgment_count,
+        amount_sum,
+        active_count
+    )
+SELECT s.dimension,
+    s.bucket,
+    s.judgment_count,
+    s.amount_sum,
+    s.active_count
+FROM _portfolio_rollup_scan s;
+END IF;
+DROP TABLE _portfolio_rollup_scan;
+END;
+$$;
+COMMENT ON FUNCTION analytics.reconcile_portfolio_rollups IS 'Compare portfolio rollups with a full scan of public.judgments; p_repair rebuilds them.';
+-- ===========================================================================
+-- STEP 5: public.portfolio_rollup_metrics() (PostgREST / API read path)
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION public.portfolio_rollup_metrics() RETURNS TABLE (
+        dimension TEXT,
+        bucket TEXT,
+        judgment_count BIGINT,
+        amount_sum NUMERIC,
+        active_count BIGINT,
+        updated_at TIMESTAMPTZ
+    ) LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = analytics,
+    pg_temp AS $$
+SELECT r.dimension,
+    r.bucket,
+    r.judgment_count,
+    r.amount_sum,
+    r.active_count,
+    r.updated_at
+FROM analytics.portfolio_rollups r
+WHERE r.judgment_count <> 0
+ORDER BY r.dimension,
+    r.bucket;
+$$;
+COMMENT ON FUNCTION public.portfolio_rollup_metrics IS 'Portfolio aggregates by status/tier/stage/pool (O(1) read of analytics.portfolio_rollups).';
+-- ===========================================================================
+-- STEP 6: Backfill (trigger creation above holds a lock that blocks judgment
+-- writes until COMMIT, so the scan and the triggers cannot drift apart)
+-- ===========================================================================
+DELETE FROM analytics.portfolio_rollups;
+INSERT INTO analytics.portfolio_rollups (
+        dimension,
+        bucket,
+        judgment_count,
+        amount_sum,
+        active_count
+    )
+SELECT k.dimension,
+    k.bucket,
+    count(*),
+    sum(k.amount),
+    sum(k.active)
+FROM public.judgments j
+    CROSS JOIN LATERAL analytics.portfolio_rollup_keys(to_jsonb(j)) k
+GROUP BY k.dimension,
+    k.bucket;
+-- ===========================================================================
+-- STEP 7: Security
+-- ===========================================================================
+ALTER TABLE analytics.portfolio_rollups ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON analytics.portfolio_rollups
+FROM PUBLIC;
+GRANT SELECT ON analytics.portfolio_rollups TO service_role;
+REVOKE ALL ON FUNCTION analytics.apply_portfolio_rollup_delta
+FROM PUBLIC;
+REVOKE ALL ON FUNCTION analytics.reconcile_portfolio_rollups
+FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.portfolio_rollup_metrics
+FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION analytics.reconcile_portfolio_rollups TO service_role;
+GRANT EXECUTE ON FUNCTION public.portfolio_rollup_metrics TO service_role,
+    authenticated;
+DO $$ BEGIN IF EXISTS (
+    SELECT 1
+    FROM pg_roles
+    WHERE rolname = 'dragonfly_app'
+) THEN
+GRANT SELECT ON analytics.portfolio_rollups TO dragonfly_app;
+GRANT EXECUTE ON FUNCTION public.portfolio_rollup_metrics TO dragonfly_app;
+GRANT EXECUTE ON FUNCTION analytics.reconcile_portfolio_rollups TO dragonfly_app;
+DROP POLICY IF EXISTS portfolio_rollups_app_read ON analytics.portfolio_rollups;
+CREATE POLICY portfolio_rollups_app_read ON analytics.portfolio_rollups FOR
+SELECT TO dragonfly_app USING (true);
+END IF;
+END $$;
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
@@ -0,0 +1,191 @@
+-- 20261114_pool_nav_incremental.sql
+-- Incremental Pool NAV Snapshots
+-- Purpose: Track which pools changed since their last NAV snapshot so
+--          finance_service.calculate_nav_all() can recompute only those and
+--          upsert today's point in finance.pool_nav_history.
+--          Changes are recorded by statement-level triggers on
+--          public.judgments and finance.pool_transactions; a judgment moved
+--          between pools marks both pools.
+-- Depends: finance.pools, finance.pool_transactions, finance.pool_nav_history,
+--          public.judgments.pool_id (20251219003000_securitization.sql)
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: finance.pool_nav_dirty
+-- One row per pool with changes not yet reflected in a snapshot. The
+-- snapshot writer deletes the rows it claims in the same transaction as the
+-- recompute, so a change committed after the claim re-marks the pool.
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS finance.pool_nav_dirty (
+    pool_id UUID PRIMARY KEY REFERENCES finance.pools(id) ON DELETE CASCADE,
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+COMMENT ON TABLE finance.pool_nav_dirty IS 'Pools whose judgments or transactions changed since their last NAV snapshot.';
+CREATE OR REPLACE FUNCTION finance.mark_pools_nav_dirty(p_pool_ids UUID []) RETURNS VOID LANGUAGE sql SECURITY DEFINER
+SET search_path = finance,
+    pg_temp AS $$
+INSERT INTO finance.pool_nav_dirty (pool_id, changed_at)
+SELECT DISTINCT p.id,
+    now()
+FROM unnest(p_pool_ids) AS u(pool_id)
+    JOIN finance.pools p ON p.id = u.pool_id
+ORDER BY p.id ON CONFLICT (pool_id) DO
+UPDATE
+SET changed_at = EXCLUDED.changed_at;
+$$;
+-- ===========================================================================
+-- STEP 2: Triggers on public.judgments
+-- Only pool_id, judgment_amount and enforcement_stage feed NAV; updates that
+-- touch none of them mark nothing.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION finance.trg_judgments_nav_insert() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = finance,
+    public,
+    pg_temp AS $$ BEGIN PERFORM finance.mark_pools_nav_dirty(
+        ARRAY(
+            SELECT DISTINCT n.pool_id
+            FROM new_rows n
+            WHERE n.pool_id IS NOT NULL
+        )
+    );
+RETURN NULL;
+END;
+$$;
+CREATE OR REPLACE FUNCTION finance.trg_judgments_nav_update() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = finance,
+    public,
+    pg_temp AS $$ BEGIN PERFORM finance.mark_pools_nav_dirty(
+        ARRAY(
+            SELECT x.pool_id
+            FROM new_rows n
+                JOIN old_rows o ON o.id = n.id
+                CROSS JOIN LATERAL (
+                    VALUES (n.pool_id),
+                        (o.pool_id)
+                ) AS x(pool_id)
+            WHERE x.pool_id IS NOT NULL
+                AND (
+                    n.pool_id IS DISTINCT FROM o.pool_id
+                    OR n.judgment_amount IS DISTINCT FROM o.judgment_amount
+                    OR n.enforcement_stage IS DISTINCT FROM o.enforcement_stage
+                )
+        )
+    );
+RETURN NULL;
+END;
+$$;
+CREATE OR REPLACE FUNCTION finance.trg_judgments_nav_delete() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = finance,
+    public,
+    pg_temp AS $$ BEGIN PERFORM finance.mark_pools_nav_dirty(
+        ARRAY(
+            SELECT DISTINCT o.pool_id
+            FROM old_rows o
+            WHERE o.pool_id IS NOT NULL
+        )
+    );
+RETURN NULL;
+END;
+$$;
+DROP TRIGGER IF EXISTS trg_judgments_nav_insert ON public.judgments;
+CREATE TRIGGER trg_judgments_nav_insert
+AFTER
+INSERT ON public.judgments REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION finance.trg_judgments_nav_insert();
+DROP TRIGGER IF EXISTS trg_judgments_nav_update ON public.judgments;
+CREATE TRIGGER trg_judgments_nav_update
+AFTER
+UPDATE ON public.judgments REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION finance.trg_judgments_nav_update();
+DROP TRIGGER IF EXISTS trg_judgments_nav_delete ON public.judgments;
+CREATE TRIGGER trg_judgments_nav_delete
+AFTER DELETE ON public.judgments REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION finance.trg_judgments_nav_delete();
+-- ===========================================================================
+-- STEP 3: Triggers on finance.pool_transactions
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION finance.trg_pool_transactions_nav_insert() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = finance,
+    pg_temp AS $$ BEGIN PERFORM finance.mark_pools_nav_dirty(
+        ARRAY(
+            SELECT DISTINCT n.pool_id
+            FROM new_rows n
+        )
+    );
+RETURN NULL;
+END;
+$$;
+CREATE OR REPLACE FUNCTION finance.trg_pool_transactions_nav_update() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = finance,
+    pg_temp AS $$ BEGIN PERFORM finance.mark_pools_nav_dirty(
+        ARRAY(
+            SELECT n.pool_id
+            FROM new_rows n
+            UNION
+            SELECT o.pool_id
+            FROM old_rows o
+        )
+    );
+RETURN NULL;
+END;
+$$;
+CREATE OR REPLACE FUNCTION finance.trg_pool_transactions_nav_delete() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = finance,
+    pg_temp AS $$ BEGIN PERFORM finance.mark_pools_nav_dirty(
+        ARRAY(
+            SELECT DISTINCT o.pool_id
+            FROM old_rows o
+        )
+    );
+RETURN NULL;
+END;
+$$;
+DROP TRIGGER IF EXISTS trg_pool_transactions_nav_insert ON finance.pool_transactions;
+CREATE TRIGGER trg_pool_transactions_nav_insert
+AFTER
+INSERT ON finance.pool_transactions REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION finance.trg_pool_transactions_nav_insert();
+DROP TRIGGER IF EXISTS trg_pool_transactions_nav_update ON finance.pool_transactions;
+CREATE TRIGGER trg_pool_transactions_nav_update
+AFTER
+UPDATE ON finance.pool_transactions REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION finance.trg_pool_transactions_nav_update();
+DROP TRIGGER IF EXISTS trg_pool_transactions_nav_delete ON finance.pool_transactions;
+CREATE TRIGGER trg_pool_transactions_nav_delete
+AFTER DELETE ON finance.pool_transactions REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION finance.trg_pool_transactions_nav_delete();
+-- ===========================================================================
+-- STEP 4: Seed - every existing pool starts dirty (no snapshot yet)
+-- ===========================================================================
+INSERT INTO finance.pool_nav_dirty (pool_id)
+SELECT id
+FROM finance.pools ON CONFLICT (pool_id) DO NOTHING;
+-- ===========================================================================
+-- STEP 5: Security
+-- Snapshots upsert today's row, so the writer needs UPDATE on the history.
+-- ===========================================================================
+ALTER TABLE finance.pool_nav_dirty ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON finance.pool_nav_dirty
+FROM PUBLIC;
+REVOKE ALL ON FUNCTION finance.mark_pools_nav_dirty
+FROM PUBLIC;
+GRANT SELECT,
+    DELETE ON finance.pool_nav_dirty TO service_role;
+GRANT UPDATE ON finance.pool_nav_history TO service_role;
+GRANT EXECUTE ON FUNCTION finance.mark_pools_nav_dirty TO service_role;
+DROP POLICY IF EXISTS pool_nav_dirty_service_all ON finance.pool_nav_dirty;
+CREATE POLICY pool_nav_dirty_service_all ON finance.pool_nav_dirty FOR ALL TO service_role USING (true) WITH CHECK (true);
+DO $$ BEGIN IF EXISTS (
+    SELECT 1
+    FROM pg_roles
+    WHERE rolname = 'dragonfly_app'
+) THEN
+GRANT SELECT,
+    INSERT,
+    UPDATE ON finance.pool_nav_history TO dragonfly_app;
+GRANT SELECT,
+    DELETE ON finance.pool_nav_dirty TO dragonfly_app;
+DROP POLICY IF EXISTS pool_nav_history_app_all ON finance.pool_nav_history;
+CREATE POLICY pool_nav_history_app_all ON finance.pool_nav_history FOR ALL TO dragonfly_app USING (true) WITH CHECK (true);
+DROP POLICY IF EXISTS pool_nav_dirty_app_all ON finance.pool_nav_dirty;
+CREATE POLICY pool_nav_dirty_app_all ON finance.pool_nav_dirty FOR ALL TO dragonfly_app USING (true) WITH CHECK (true);
+END IF;
+END $$;
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
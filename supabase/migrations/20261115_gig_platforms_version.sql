@@ -0,0 +1,70 @@
+-- 20261115_gig_platforms_version.sql
+-- Gig Platform Catalog Version
+-- Purpose: Give gig_service a cheap way to tell whether its cached keyword
+--          matcher is stale. A single-row counter is bumped by a
+--          statement-level trigger whenever intelligence.gig_platforms is
+--          inserted, updated, deleted or truncated; the service compares it
+--          against the version its matcher was built from and reloads the
+--          platforms only when it moved.
+-- Depends: intelligence.gig_platforms (20251219002000_gig_hunter.sql)
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: intelligence.gig_platforms_version
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS intelligence.gig_platforms_version (
+    singleton BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (singleton),
+    version BIGINT NOT NULL DEFAULT 1,
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+COMMENT ON TABLE intelligence.gig_platforms_version IS 'Change counter for intelligence.gig_platforms; gig_service reloads its keyword matcher when it moves.';
+INSERT INTO intelligence.gig_platforms_version (singleton)
+VALUES (TRUE) ON CONFLICT (singleton) DO NOTHING;
+-- ===========================================================================
+-- STEP 2: Bump on any change to the catalog
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION intelligence.trg_gig_platforms_bump_version() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = intelligence,
+    pg_temp AS $$ BEGIN
+UPDATE intelligence.gig_platforms_version
+SET version = version + 1,
+    changed_at = now()
+WHERE singleton;
+RETURN NULL;
+END;
+$$;
+DROP TRIGGER IF EXISTS trg_gig_platforms_version ON intelligence.gig_platforms;
+CREATE TRIGGER trg_gig_platforms_version
+AFTER
+INSERT
+    OR
+UPDATE
+    OR DELETE
+    OR TRUNCATE ON intelligence.gig_platforms FOR EACH STATEMENT EXECUTE FUNCTION intelligence.trg_gig_platforms_bump_version();
+-- ===========================================================================
+-- STEP 3: Permissions
+-- ===========================================================================
+ALTER TABLE intelligence.gig_platforms_version ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON intelligence.gig_platforms_version
+FROM PUBLIC;
+REVOKE ALL ON FUNCTION intelligence.trg_gig_platforms_bump_version
+FROM PUBLIC;
+GRANT SELECT ON intelligence.gig_platforms_version TO service_role;
+DROP POLICY IF EXISTS gig_platforms_version_service_read ON intelligence.gig_platforms_version;
+CREATE POLICY gig_platforms_version_service_read ON intelligence.gig_platforms_version FOR
+SELECT TO service_role USING (true);
+DO $$ BEGIN IF EXISTS (
+    SELECT 1
+    FROM pg_roles
+    WHERE rolname = 'dragonfly_app'
+) THEN
+GRANT SELECT ON intelligence.gig_platforms_version TO dragonfly_app;
+DROP POLICY IF EXISTS gig_platforms_version_app_read ON intelligence.gig_platforms_version;
+CREATE POLICY gig_platforms_version_app_read ON intelligence.gig_platforms_version FOR
+SELECT TO dragonfly_app USING (true);
+END IF;
+END $$;
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
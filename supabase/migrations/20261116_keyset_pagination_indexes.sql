@@ -0,0 +1,33 @@
+-- 20261116_keyset_pagination_indexes.sql
+-- Keyset Pagination Indexes
+-- Purpose: Composite indexes matching the ORDER BY of the keyset-paginated
+--          list endpoints (backend/api/pagination.py), so each page is an
+--          index range scan that starts after the cursor instead of an
+--          OFFSET scan that reads and discards every earlier row.
+--          ops.intake_logs needs nothing new: uq_intake_log_batch_row
+--          (batch_id, row_index) already serves its error listing.
+-- Depends: public.judgments, ops.ingest_batches,
+--          intake.simplicity_failed_rows (20251225000000_simplicity_ingestion_pipeline.sql)
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: /v1/cases (open judgments, best collectability first)
+-- ===========================================================================
+CREATE INDEX IF NOT EXISTS idx_judgments_cases_keyset ON public.judgments (
+    (COALESCE(collectability_score, -1)) DESC,
+    (COALESCE(judgment_amount, 0)) DESC,
+    id DESC
+)
+WHERE status IS NULL
+    OR status NOT IN ('closed', 'collected', 'satisfied');
+-- ===========================================================================
+-- STEP 2: /intake/batches (newest first, optionally by status)
+-- ===========================================================================
+CREATE INDEX IF NOT EXISTS idx_ingest_batches_keyset ON ops.ingest_batches (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_ingest_batches_status_keyset ON ops.ingest_batches (status, created_at DESC, id DESC);
+-- ===========================================================================
+-- STEP 3: /intake/v1/batches/{id}/errors (unresolved Simplicity rows)
+-- ===========================================================================
+CREATE INDEX IF NOT EXISTS idx_simplicity_failed_rows_keyset ON intake.simplicity_failed_rows (batch_id, row_index, id)
+WHERE resolved_at IS NULL;
+COMMIT;
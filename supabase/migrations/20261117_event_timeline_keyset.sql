@@ -0,0 +1,16 @@
+-- 20261117_event_timeline_keyset.sql
+-- Event Timeline Keyset Index
+-- Purpose: Serve newest-first, cursor-paginated timelines from
+--          intelligence.events. Timelines seek on (created_at, id) within an
+--          entity in either direction, so one (entity_id, created_at, id)
+--          index replaces idx_events_entity_created_at (a backward scan
+--          covers the newest-first case; id breaks created_at ties so
+--          cursors are exact).
+--          Live updates need no schema: emit_event() issues
+--          pg_notify('intelligence_events', ...) in its INSERT statement.
+-- Depends: intelligence.events (20251207000000_event_stream.sql)
+-- ===========================================================================
+BEGIN;
+CREATE INDEX IF NOT EXISTS idx_events_entity_timeline ON intelligence.events (entity_id, created_at, id);
+DROP INDEX IF EXISTS intelligence.idx_events_entity_created_at;
+COMMIT;
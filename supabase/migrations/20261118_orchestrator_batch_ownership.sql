@@ -0,0 +1,19 @@
+-- 20261118_orchestrator_batch_ownership.sql
+-- Orchestrator Batch Ownership
+-- Purpose: Mark the batches the Golden Path orchestrator has taken over.
+--          'upserting' is also written by the Simplicity mapper, which
+--          upserts its own rows in-process, so the status alone cannot say
+--          whose batch it is. The orchestrator stamps orchestrated_at when it
+--          moves a batch from 'validated' to 'upserting' and only advances
+--          stamped batches.
+-- Depends: intake.simplicity_batches, ops.orchestration_stage_counters
+--          (20261109_orchestration_stage_counters.sql)
+-- ===========================================================================
+BEGIN;
+ALTER TABLE intake.simplicity_batches
+ADD COLUMN IF NOT EXISTS orchestrated_at TIMESTAMPTZ;
+COMMENT ON COLUMN intake.simplicity_batches.orchestrated_at IS 'Set when the orchestrator takes the batch from validated to upserting; NULL for batches upserted by the mapper.';
+CREATE INDEX IF NOT EXISTS idx_simplicity_batches_orchestrated_inflight ON intake.simplicity_batches (created_at)
+WHERE status = 'upserting'
+    AND orchestrated_at IS NOT NULL;
+COMMIT;
@@ -0,0 +1,231 @@
+-- 20261119_portfolio_rollup_shards.sql
+-- Sharded Portfolio Rollups
+-- Purpose: Stop portfolio rollups from serializing judgment writers. Every
+--          judgment write touches the ('total', 'all') row, so with one row
+--          per bucket all concurrent writers queued on the same row lock
+--          until COMMIT. Deltas now land in one of 16 shard rows per bucket,
+--          picked by txid % 16, and readers sum the shards through the
+--          analytics.portfolio_rollups view.
+--          Reconciliation compares the scan with the rollups in a single
+--          REPEATABLE READ snapshot and repairs drift with a correction
+--          delta. Judgment writes are no longer blocked.
+-- Depends: 20261113_portfolio_rollups.sql
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: analytics.portfolio_rollup_shards
+-- Writers use shards 0..15; shard -1 holds reconciliation corrections, so a
+-- repair never updates a row a concurrent writer touched.
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS analytics.portfolio_rollup_shards (
+    dimension TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    shard SMALLINT NOT NULL,
+    judgment_count BIGINT NOT NULL DEFAULT 0,
+    amount_sum NUMERIC NOT NULL DEFAULT 0,
+    active_count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (dimension, bucket, shard)
+);
+COMMENT ON TABLE analytics.portfolio_rollup_shards IS 'Sharded portfolio aggregate deltas; sum over shard gives the rollup. Maintained by statement-level triggers on public.judgments.';
+COMMENT ON COLUMN analytics.portfolio_rollup_shards.shard IS 'txid % 16 of the writing transaction; -1 for reconciliation corrections.';
+-- Lock out judgment writers while existing rollups move into shard 0
+LOCK TABLE public.judgments IN SHARE MODE;
+INSERT INTO analytics.portfolio_rollup_shards (
+        dimension,
+        bucket,
+        shard,
+        judgment_count,
+        amount_sum,
+        active_count,
+        updated_at
+    )
+SELECT dimension,
+    bucket,
+    0,
+    judgment_count,
+    amount_sum,
+    active_count,
+    updated_at
+FROM analytics.portfolio_rollups ON CONFLICT DO NOTHING;
+DROP TABLE analytics.portfolio_rollups;
+-- ===========================================================================
+-- STEP 2: analytics.portfolio_rollups (read path: sum of shards)
+-- ===========================================================================
+CREATE OR REPLACE VIEW analytics.portfolio_rollups AS
+SELECT dimension,
+    bucket,
+    sum(judgment_count)::BIGINT AS judgment_count,
+    sum(amount_sum) AS amount_sum,
+    sum(active_count)::BIGINT AS active_count,
+    max(updated_at) AS updated_at
+FROM analytics.portfolio_rollup_shards
+GROUP BY dimension,
+    bucket;
+COMMENT ON VIEW analytics.portfolio_rollups IS 'Portfolio aggregates by status/tier/stage/pool: analytics.portfolio_rollup_shards summed over shards.';
+-- ===========================================================================
+-- STEP 3: Trigger write path
+-- Same grouped delta as before, applied to this transaction's shard. Rows
+-- are still upserted in (dimension, bucket) order so two statements in
+-- the same shard cannot deadlock.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION analytics.apply_portfolio_rollup_delta(p_delta JSONB) RETURNS VOID LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = analytics,
+    pg_temp AS $$
+DECLARE v_shard SMALLINT := (txid_current() % 16)::SMALLINT;
+BEGIN
+INSERT INTO analytics.portfolio_rollup_shards AS r (
+        dimension,
+        bucket,
+        shard,
+        judgment_count,
+        amount_sum,
+        active_count,
+        updated_at
+    )
+SELECT d->>'dimension',
+    d->>'bucket',
+    v_shard,
+    (d->>'judgment_count')::BIGINT,
+    (d->>'amount_sum')::NUMERIC,
+    (d->>'active_count')::BIGINT,
+    now()
+FROM jsonb_array_elements(p_delta) d
+ORDER BY 1,
+    2 ON CONFLICT (dimension, bucket, shard) DO
+UPDATE
+SET judgment_count = r.judgment_count + EXCLUDED.judgment_count,
+    amount_sum = r.amount_sum + EXCLUDED.amount_sum,
+    active_count = r.active_count + EXCLUDED.active_count,
+    updated_at = now();
+END;
+$$;
+CREATE OR REPLACE FUNCTION analytics.trg_judgments_rollup_truncate() RETURNS TRIGGER LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = analytics,
+    pg_temp AS $$ BEGIN
+DELETE FROM analytics.portfolio_rollup_shards;
+RETURN NULL;
+END;
+$$;
+-- ===========================================================================
+-- STEP 4: analytics.reconcile_portfolio_rollups(p_repair)
+-- Must run in a REPEATABLE READ (or SERIALIZABLE) transaction: the scan and
+-- the rollup read then share one snapshot, so writes committing in between
+-- cannot show up as drift. Repair adds expected - actual to the correction
+-- shard instead of rebuilding. Deltas committed after the snapshot are in
+-- neither read, and they survive because repair only adds to the rollups.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION analytics.reconcile_portfolio_rollups(p_repair BOOLEAN DEFAULT false) RETURNS TABLE (
+        dimension TEXT,
+        bucket TEXT,
+        expected_count BIGINT,
+        actual_count BIGINT,
+        expected_amount NUMERIC,
+        actual_amount NUMERIC,
+        expected_active BIGINT,
+        actual_active BIGINT
+    ) LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = analytics,
+    public,
+    pg_temp AS $$ BEGIN IF current_setting('transaction_isolation') NOT IN ('repeatable read', 'serializable') THEN RAISE EXCEPTION 'reconcile_portfolio_rollups requires a REPEATABLE READ transaction (got %)',
+    current_setting('transaction_isolation');
+END IF;
+CREATE TEMP TABLE _portfolio_rollup_drift ON COMMIT DROP AS WITH scan AS (
+    SELECT k.dimension,
+        k.bucket,
+        count(*)::BIGINT AS judgment_count,
+        sum(k.amount) AS amount_sum,
+        sum(k.active)::BIGINT AS active_count
+    FROM public.judgments j
+        CROSS JOIN LATERAL analytics.portfolio_rollup_keys(to_jsonb(j)) k
+    GROUP BY k.dimension,
+        k.bucket
+)
+SELECT COALESCE(s.dimension, r.dimension) AS dimension,
+    COALESCE(s.bucket, r.bucket) AS bucket,
+    COALESCE(s.judgment_count, 0) AS expected_count,
+    COALESCE(r.judgment_count, 0) AS actual_count,
+    COALESCE(s.amount_sum, 0) AS expected_amount,
+    COALESCE(r.amount_sum, 0) AS actual_amount,
+    COALESCE(s.active_count, 0) AS expected_active,
+    COALESCE(r.active_count, 0) AS actual_active
+FROM scan s
+    FULL JOIN analytics.portfolio_rollups r ON r.dimension = s.dimension
+    AND r.bucket = s.bucket
+WHERE COALESCE(s.judgment_count, 0) <> COALESCE(r.judgment_count, 0)
+    OR COALESCE(s.amount_sum, 0) <> COALESCE(r.amount_sum, 0)
+    OR COALESCE(s.active_count, 0) <> COALESCE(r.active_count, 0);
+RETURN QUERY
+SELECT d.dimension,
+    d.bucket,
+    d.expected_count,
+    d.actual_count,
+    d.expected_amount,
+    d.actual_amount,
+    d.expected_active,
+    d.actual_active
+FROM _portfolio_rollup_drift d
+ORDER BY 1,
+    2;
+IF p_repair THEN
+INSERT INTO analytics.portfolio_rollup_shards AS r (
+        dimension,
+        bucket,
+        shard,
+        judgment_count,
+        amount_sum,
+        active_count,
+        updated_at
+    )
+SELECT d.dimension,
+    d.bucket,
+    -1,
+    d.expected_count - d.actual_count,
+    d.expected_amount - d.actual_amount,
+    d.expected_active - d.actual_active,
+    now()
+FROM _portfolio_rollup_drift d
+ORDER BY 1,
+    2 ON CONFLICT (dimension, bucket, shard) DO
+UPDATE
+SET judgment_count = r.judgment_count + EXCLUDED.judgment_count,
+    amount_sum = r.amount_sum + EXCLUDED.amount_sum,
+    active_count = r.active_count + EXCLUDED.active_count,
+    updated_at = now();
+END IF;
+DROP TABLE _portfolio_rollup_drift;
+END;
+$$;
+COMMENT ON FUNCTION analytics.reconcile_portfolio_rollups IS 'Compare portfolio rollups with a full scan of public.judgments in one REPEATABLE READ snapshot; p_repair adds a correction delta.';
+-- ===========================================================================
+-- STEP 5: Security (the old table's grants and policy went with it)
+-- ===========================================================================
+ALTER TABLE analytics.portfolio_rollup_shards ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON analytics.portfolio_rollup_shards
+FROM PUBLIC;
+REVOKE ALL ON analytics.portfolio_rollups
+FROM PUBLIC;
+GRANT SELECT ON analytics.portfolio_rollup_shards TO service_role;
+GRANT SELECT ON analytics.portfolio_rollups TO service_role;
+REVOKE ALL ON FUNCTION analytics.apply_portfolio_rollup_delta
+FROM PUBLIC;
+REVOKE ALL ON FUNCTION analytics.reconcile_portfolio_rollups
+FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION analytics.reconcile_portfolio_rollups TO service_role;
+DO $$ BEGIN IF EXISTS (
+    SELECT 1
+    FROM pg_roles
+    WHERE rolname = 'dragonfly_app'
+) THEN
+GRANT SELECT ON analytics.portfolio_rollup_shards TO dragonfly_app;
+GRANT SELECT ON analytics.portfolio_rollups TO dragonfly_app;
+GRANT EXECUTE ON FUNCTION analytics.reconcile_portfolio_rollups TO dragonfly_app;
+DROP POLICY IF EXISTS portfolio_rollup_shards_app_read ON analytics.portfolio_rollup_shards;
+CREATE POLICY portfolio_rollup_shards_app_read ON analytics.portfolio_rollup_shards FOR
+SELECT TO dragonfly_app USING (true);
+END IF;
+END $$;
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
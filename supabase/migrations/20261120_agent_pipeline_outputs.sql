@@ -0,0 +1,84 @@
+-- 20261120_agent_pipeline_outputs.sql
+-- Agent Pipeline Outputs
+-- Purpose: Tables for what the agent Orchestrator (backend/agents) persists:
+--          the Strategist's plan, the Drafter's document packet and the
+--          Auditor's review, one row each per pipeline run.
+--          enforcement.enforcement_plans / enforcement.draft_packets track
+--          the Smart Strategy worker and packet jobs (case-scoped status
+--          rows). They cannot hold the agents' steps, documents or audit
+--          findings, so the agent outputs get their own tables.
+--          The Orchestrator also moves public.judgments.enforcement_stage to
+--          'plan_generated' and stamps enforcement_stage_updated_at
+--          (0073_enforcement_stages.sql).
+-- Depends: public.judgments, enforcement schema
+-- ===========================================================================
+BEGIN;
+-- ===========================================================================
+-- STEP 1: enforcement.agent_plans (EnforcementPlan)
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS enforcement.agent_plans (
+    id TEXT PRIMARY KEY,
+    judgment_id BIGINT NOT NULL REFERENCES public.judgments(id) ON DELETE CASCADE,
+    strategy_name TEXT NOT NULL,
+    strategy_rationale TEXT NOT NULL DEFAULT '',
+    steps JSONB NOT NULL DEFAULT '[]'::jsonb,
+    total_estimated_cost NUMERIC NOT NULL DEFAULT 0,
+    total_estimated_duration_days INTEGER NOT NULL DEFAULT 0,
+    expected_recovery_rate DOUBLE PRECISION NOT NULL DEFAULT 0,
+    risk_assessment TEXT NOT NULL DEFAULT '',
+    fallback_strategies JSONB NOT NULL DEFAULT '[]'::jsonb,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS idx_agent_plans_judgment ON enforcement.agent_plans (judgment_id, created_at DESC);
+COMMENT ON TABLE enforcement.agent_plans IS 'Enforcement plans generated by the agent Orchestrator (Strategist stage).';
+-- ===========================================================================
+-- STEP 2: enforcement.agent_draft_packets (DraftPacket)
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS enforcement.agent_draft_packets (
+    id TEXT PRIMARY KEY,
+    judgment_id BIGINT NOT NULL REFERENCES public.judgments(id) ON DELETE CASCADE,
+    plan_id TEXT NOT NULL REFERENCES enforcement.agent_plans(id) ON DELETE CASCADE,
+    documents JSONB NOT NULL DEFAULT '[]'::jsonb,
+    cover_letter TEXT,
+    filing_checklist JSONB NOT NULL DEFAULT '[]'::jsonb,
+    total_filing_fees NUMERIC NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS idx_agent_draft_packets_judgment ON enforcement.agent_draft_packets (judgment_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_agent_draft_packets_plan ON enforcement.agent_draft_packets (plan_id);
+COMMENT ON TABLE enforcement.agent_draft_packets IS 'Document packets drafted by the agent Orchestrator (Drafter stage).';
+-- ===========================================================================
+-- STEP 3: enforcement.agent_audit_results (AuditorOutput), one per packet
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS enforcement.agent_audit_results (
+    packet_id TEXT PRIMARY KEY REFERENCES enforcement.agent_draft_packets(id) ON DELETE CASCADE,
+    judgment_id BIGINT NOT NULL REFERENCES public.judgments(id) ON DELETE CASCADE,
+    is_approved BOOLEAN NOT NULL,
+    score NUMERIC NOT NULL,
+    issues JSONB NOT NULL DEFAULT '[]'::jsonb,
+    warnings JSONB NOT NULL DEFAULT '[]'::jsonb,
+    passed_checks JSONB NOT NULL DEFAULT '[]'::jsonb,
+    recommendations JSONB NOT NULL DEFAULT '[]'::jsonb,
+    audited_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS idx_agent_audit_results_judgment ON enforcement.agent_audit_results (judgment_id);
+COMMENT ON TABLE enforcement.agent_audit_results IS 'Auditor review of each agent-drafted packet.';
+-- ===========================================================================
+-- STEP 4: Security (written by the API service role only)
+-- ===========================================================================
+ALTER TABLE enforcement.agent_plans ENABLE ROW LEVEL SECURITY;
+ALTER TABLE enforcement.agent_draft_packets ENABLE ROW LEVEL SECURITY;
+ALTER TABLE enforcement.agent_audit_results ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON enforcement.agent_plans,
+enforcement.agent_draft_packets,
+enforcement.agent_audit_results
+FROM PUBLIC;
+GRANT SELECT,
+    INSERT,
+    UPDATE ON enforcement.agent_plans,
+    enforcement.agent_draft_packets,
+    enforcement.agent_audit_results TO service_role;
+COMMIT;
+-- Force PostgREST to refresh schema cache
+NOTIFY pgrst,
+'reload schema';
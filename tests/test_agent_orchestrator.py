@@ -0,0 +1,321 @@
+"""
+Tests for the agent Orchestrator batch mode.
+
+Verifies:
+- run_many bulk-fetches extractor inputs once per entity type per batch
+- Outputs come back in input order with every stage completed
+- Persistence is batched and failures stay scoped to their judgment
+- Per-stage timing histograms are recorded
+- Bulk fetches and persistence issue one Supabase query per entity type
+- Persistence writes only tables and columns that the migrations create
+- run() goes through the same bulk fetch and persistence as run_many()
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.agents import orchestrator as orchestrator_module
+from backend.agents.extractor import Extractor
+from backend.agents.models import DebtorIntel, ExtractorInput, OrchestratorInput, PipelineStage
+from backend.agents.orchestrator import Orchestrator, StageHistogram
+
+MIGRATIONS = Path(__file__).resolve().parents[1] / "supabase" / "migrations"
+
+
+class _FakeQuery:
+    def __init__(self, client: "_FakeSupabase", table: str) -> None:
+        self.client = client
+        self.table = table
+        self.calls: list[tuple[str, Any]] = []
+
+    def __getattr__(self, name: str):
+        def record(*args: Any, **kwargs: Any) -> "_FakeQuery":
+            self.calls.append((name, args))
+            return self
+
+        return record
+
+    def execute(self) -> SimpleNamespace:
+        self.client.executed.append(self)
+        rows = self.client.rows.get(self.table, [])
+        for name, args in self.calls:
+            if name == "in_":
+                column, values = args
+                rows = [r for r in rows if r[column] in values]
+        return SimpleNamespace(data=rows)
+
+    def arg(self, name: str) -> Any:
+        return next(args for call, args in self.calls if call == name)
+
+
+class _FakeSupabase:
+    """Records queries; selects filter ``rows`` by their in_() clause."""
+
+    def __init__(self, rows: dict[str, list[dict]] | None = None) -> None:
+        self.rows = rows or {}
+        self.executed: list[_FakeQuery] = []
+
+    def table(self, name: str) -> _FakeQuery:
+        return _FakeQuery(self, name)
+
+    def schema(self, name: str) -> SimpleNamespace:
+        return SimpleNamespace(table=lambda table: _FakeQuery(self, f"{name}.{table}"))
+
+    def queries(self, table: str) -> list[_FakeQuery]:
+        return [q for q in self.executed if q.table == table]
+
+
+def _judgment(judgment_id: str) -> dict:
+    return {
+        "id": judgment_id,
+        "plaintiff_name": "Acme Capital",
+        "debtor_name": f"Debtor {judgment_id}",
+        "case_number": f"CASE-{judgment_id}",
+        "judgment_amount": 12500,
+        "judgment_date": "2023-06-01",
+        "county": "Kings",
+    }
+
+
+@pytest.fixture
+def orchestrator() -> Orchestrator:
+    orch = Orchestrator(supabase_client=_FakeSupabase())
+
+    async def judgments_bulk(ids):
+        return {i: _judgment(i) for i in ids}
+
+    async def intel_bulk(ids):
+        return {i: DebtorIntel(employer_name="Widgets Inc") for i in ids}
+
+    orch.extractor._fetch_judgments_bulk = AsyncMock(side_effect=judgments_bulk)
+    orch.extractor._fetch_debtor_intel_bulk = AsyncMock(side_effect=intel_bulk)
+    orch.extractor._fetch_assets_bulk = AsyncMock(return_value={})
+    return orch
+
+
+class TestRunMany:
+    async def test_outputs_in_order_with_all_stages(self, orchestrator) -> None:
+        ids = [f"j{i}" for i in range(7)]
+
+        outputs = await orchestrator.run_many(ids, concurrency=3, extract_batch_size=3)
+
+        assert [o.judgment_id for o in outputs] == ids
+        assert all(o.success for o in outputs)
+        assert all(o.final_stage == PipelineStage.COMPLETE for o in outputs)
+        assert outputs[0].stages_completed[-1] == PipelineStage.AUDITOR
+        assert outputs[0].extractor_output.debtor_intel.employer_name == "Widgets Inc"
+        assert outputs[0].persisted_plan_id == outputs[0].strategist_output.plan.plan_id
+
+    async def test_one_bulk_query_per_entity_per_batch(self, orchestrator) -> None:
+        await orchestrator.run_many([f"j{i}" for i in range(7)], extract_batch_size=3)
+
+        extractor = orchestrator.extractor
+        assert extractor._fetch_judgments_bulk.await_count == 3
+        assert extractor._fetch_debtor_intel_bulk.await_count == 3
+        assert extractor._fetch_assets_bulk.await_count == 3
+
+    async def test_persistence_batched(self, orchestrator) -> None:
+        with patch.object(
+            orchestrator, "_persist_batch", wraps=orchestrator._persist_batch
+        ) as persist_batch:
+            await orchestrator.run_many(
+                [f"j{i}" for i in range(5)], concurrency=5, persist_batch_size=2
+            )
+
+        sizes = [len(call.args[0]) for call in persist_batch.call_args_list]
+        assert sum(sizes) == 5
+        assert max(sizes) <= 2
+
+    async def test_dry_run_skips_persistence(self, orchestrator) -> None:
+        with patch.object(orchestrator, "_persist_batch", new=AsyncMock()) as persist_batch:
+            outputs = await orchestrator.run_many(["j1", "j2"], dry_run=True, skip_draft=True)
+
+        persist_batch.assert_not_awaited()
+        assert all(o.success for o in outputs)
+        assert outputs[0].stages_completed[-1] == PipelineStage.STRATEGIST
+
+    async def test_stage_failure_is_isolated(self, orchestrator) -> None:
+        original = orchestrator.reasoner.run
+
+        async def flaky_reasoner(reasoner_input):
+            if reasoner_input.normalizer_output.judgment.judgment_id == "j1":
+                raise RuntimeError("reasoner exploded")
+            return await original(reasoner_input)
+
+        orchestrator.reasoner.run = flaky_reasoner
+        outputs = await orchestrator.run_many(["j0", "j1", "j2"])
+
+        assert [o.success for o in outputs] == [True, False, True]
+        assert outputs[1].error_stage == PipelineStage.REASONER
+        assert outputs[1].final_stage == PipelineStage.FAILED
+
+    async def test_bulk_fetch_failure_fails_its_batch(self, orchestrator) -> None:
+        orchestrator.extractor._fetch_assets_bulk = AsyncMock(
+            side_effect=[RuntimeError("db down"), {}]
+        )
+
+        outputs = await orchestrator.run_many(["j0", "j1", "j2"], extract_batch_size=2)
+
+        assert [o.success for o in outputs] == [False, False, True]
+        assert outputs[0].error_stage == PipelineStage.EXTRACTOR
+
+    async def test_stage_histograms(self, orchestrator) -> None:
+        await orchestrator.run_many(["j0", "j1", "j2"])
+
+        histograms = orchestrator.stage_histograms()
+        assert histograms["extractor"]["count"] == 3
+        assert histograms["auditor"]["count"] == 3
+        assert sum(histograms["normalizer"]["buckets"].values()) == 3
+
+
+def _migration_columns(table: str) -> set[str]:
+    """Columns of ``CREATE TABLE IF NOT EXISTS <table> (...)`` across the migrations."""
+    pattern = re.compile(rf"CREATE TABLE IF NOT EXISTS {re.escape(table)} \((.*?)\n\);", re.DOTALL)
+    for path in sorted(MIGRATIONS.glob("*.sql")):
+        match = pattern.search(path.read_text())
+        if match:
+            return {line.split()[0] for line in match.group(1).splitlines() if line.strip()}
+    raise AssertionError(f"no migration creates {table}")
+
+
+OUTPUT_TABLES = [
+    f"{orchestrator_module.OUTPUT_SCHEMA}.{table}"
+    for table in (
+        orchestrator_module.PLANS_TABLE,
+        orchestrator_module.PACKETS_TABLE,
+        orchestrator_module.AUDITS_TABLE,
+    )
+]
+
+
+class TestBulkPersistence:
+    async def test_one_upsert_per_table_per_batch(self, orchestrator) -> None:
+        client = orchestrator._client
+        outputs = await orchestrator.run_many(["j0", "j1", "j2"], persist_batch_size=3)
+
+        assert all(o.success for o in outputs)
+        for table in OUTPUT_TABLES:
+            (query,) = client.queries(table)
+            (rows,) = query.arg("upsert")
+            assert sorted(r["judgment_id"] for r in rows) == ["j0", "j1", "j2"]
+
+        plans = client.queries(OUTPUT_TABLES[0])[0].arg("upsert")[0]
+        assert {r["id"] for r in plans} == {o.persisted_plan_id for o in outputs}
+
+        (update,) = client.queries("judgments")
+        assert update.arg("update")[0]["enforcement_stage"] == "plan_generated"
+        assert sorted(update.arg("in_")[1]) == ["j0", "j1", "j2"]
+
+    async def test_rows_match_migrated_tables_and_columns(self, orchestrator) -> None:
+        client = orchestrator._client
+        await orchestrator.run_many(["j0", "j1"])
+
+        for table in OUTPUT_TABLES:
+            columns = _migration_columns(table)
+            (query,) = client.queries(table)
+            for row in query.arg("upsert")[0]:
+                assert set(row) <= columns, f"{table}: {set(row) - columns}"
+
+        (update,) = client.queries("judgments")
+        stage_columns = (MIGRATIONS / "0073_enforcement_stages.sql").read_text()
+        for column in update.arg("update")[0]:
+            assert f"ADD COLUMN IF NOT EXISTS {column} " in stage_columns
+
+    async def test_persist_failure_fails_its_batch(self, orchestrator) -> None:
+        orchestrator._execute = AsyncMock(side_effect=RuntimeError("db down"))
+
+        outputs = await orchestrator.run_many(["j0", "j1"])
+
+        assert not any(o.success for o in outputs)
+        assert outputs[0].error_message == "db down"
+
+
+class TestRun:
+    async def test_run_uses_bulk_fetch_and_persistence(self, orchestrator) -> None:
+        client = orchestrator._client
+
+        output = await orchestrator.run(OrchestratorInput(judgment_id="j1"))
+
+        assert output.success
+        assert orchestrator.extractor._fetch_judgments_bulk.await_args.args == (["j1"],)
+        (query,) = client.queries(OUTPUT_TABLES[0])
+        assert query.arg("upsert")[0][0]["id"] == output.persisted_plan_id
+        assert client.queries("judgments")[0].arg("in_") == ("id", ["j1"])
+
+    async def test_missing_judgment_fails_extraction(self, orchestrator) -> None:
+        orchestrator.extractor._fetch_judgments_bulk = AsyncMock(return_value={})
+
+        output = await orchestrator.run(OrchestratorInput(judgment_id="j404"))
+
+        assert not output.success
+        assert output.error_stage == PipelineStage.EXTRACTOR
+        assert "j404 not found" in output.error_message
+        assert orchestrator._client.executed == []
+
+    async def test_missing_judgment_fails_only_itself_in_run_many(self, orchestrator) -> None:
+        async def judgments_bulk(ids):
+            return {i: _judgment(i) for i in ids if i != "j1"}
+
+        orchestrator.extractor._fetch_judgments_bulk = AsyncMock(side_effect=judgments_bulk)
+
+        outputs = await orchestrator.run_many(["j0", "j1", "j2"])
+
+        assert [o.success for o in outputs] == [True, False, True]
+        assert outputs[1].error_stage == PipelineStage.EXTRACTOR
+
+
+class TestExtractorBulk:
+    async def test_one_select_per_entity(self) -> None:
+        client = _FakeSupabase(
+            {
+                "judgments": [_judgment("j1"), _judgment("j2"), _judgment("j9")],
+                "debtor_intelligence": [
+                    {"judgment_id": "j1", "employer_name": "Newest Co"},
+                    {"judgment_id": "j1", "employer_name": "Older Co"},
+                ],
+                "assets": [
+                    {"judgment_id": "j2", "asset_type": "vehicle"},
+                    {"judgment_id": "j2", "asset_type": "bank_hint"},
+                ],
+            }
+        )
+        inputs = [
+            ExtractorInput(judgment_id=j, include_debtor_intel=True, include_assets=True)
+            for j in ("j1", "j2", "j3")
+        ]
+
+        outputs = await Extractor(client).run_many(inputs, return_exceptions=True)
+
+        for table in ("judgments", "debtor_intelligence", "assets"):
+            assert len(client.queries(table)) == 1
+        assert client.queries("judgments")[0].arg("in_") == ("id", ["j1", "j2", "j3"])
+        assert outputs[0].case_number == "CASE-j1"
+        assert outputs[0].debtor_intel.employer_name == "Newest Co"
+        assert [a.asset_type for a in outputs[1].assets] == ["vehicle", "bank_hint"]
+        assert isinstance(outputs[2], ValueError)
+
+    async def test_missing_judgment_raises(self) -> None:
+        extractor = Extractor(_FakeSupabase({"judgments": [_judgment("j1")]}))
+
+        with pytest.raises(ValueError, match="j2 not found"):
+            await extractor.run(ExtractorInput(judgment_id="j2"))
+        assert (await extractor.run(ExtractorInput(judgment_id="j1"))).case_number == "CASE-j1"
+
+
+class TestStageHistogram:
+    def test_buckets_and_quantiles(self) -> None:
+        histogram = StageHistogram(buckets=(10, 100))
+        for ms in (1, 2, 50, 500):
+            histogram.observe(ms)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["buckets"] == {"le_10": 2, "le_100": 1, "le_inf": 1}
+        assert snapshot["p50_ms"] == 10
+        assert snapshot["p95_ms"] == 500
@@ -0,0 +1,152 @@
+"""
+Tests for batch auto-tranching.
+
+Verifies:
+- Scores and current pools are read in one query
+- Pool ids are cached across calls (looked up once)
+- Reassignments go out in one UPDATE, skipping judgments already in place
+- judgment_tranched events are inserted in one statement
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import allocation_service
+from backend.services.allocation_service import (
+    POOL_DISTRESSED,
+    POOL_PRIME,
+    POOL_STANDARD,
+    auto_tranche_many,
+)
+
+POOL_IDS = {
+    POOL_PRIME: "00000000-0000-0000-0000-00000000000a",
+    POOL_STANDARD: "00000000-0000-0000-0000-00000000000b",
+    POOL_DISTRESSED: "00000000-0000-0000-0000-00000000000c",
+}
+
+# id, collectability_score, pool_id, pool name
+JUDGMENTS = {
+    1: (1, 92, None, None),
+    2: (2, 60, POOL_IDS[POOL_PRIME], POOL_PRIME),
+    3: (3, 20, POOL_IDS[POOL_DISTRESSED], POOL_DISTRESSED),
+    4: (4, None, None, None),
+}
+
+
+class _FakeCursor:
+    def __init__(self, db: "_FakeDB") -> None:
+        self.db = db
+        self.rows: list[tuple] = []
+
+    async def __aenter__(self) -> "_FakeCursor":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, sql: str, params: Any = None) -> None:
+        self.db.executed.append((sql, params))
+        if "collectability_score" in sql:
+            self.rows = [JUDGMENTS[jid] for jid in params[0] if jid in JUDGMENTS]
+        elif "FROM finance.pools" in sql:
+            self.rows = [(name, POOL_IDS[name]) for name in params[0] if name in POOL_IDS]
+        else:
+            self.rows = []
+
+    async def fetchall(self) -> list[tuple]:
+        return self.rows
+
+
+class _FakeConn:
+    def __init__(self, db: "_FakeDB") -> None:
+        self.db = db
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self.db)
+
+
+class _FakeDB:
+    def __init__(self) -> None:
+        self.executed: list[tuple[str, Any]] = []
+
+    @asynccontextmanager
+    async def connection(self):
+        yield _FakeConn(self)
+
+    def statements(self, needle: str) -> list[tuple[str, Any]]:
+        return [(sql, p) for sql, p in self.executed if needle in sql]
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    allocation_service.clear_pool_id_cache()
+    yield
+    allocation_service.clear_pool_id_cache()
+
+
+def _patch_pool(db: _FakeDB):
+    return patch.object(allocation_service, "get_pool", AsyncMock(return_value=db))
+
+
+class TestAutoTrancheMany:
+    async def test_batch_is_a_handful_of_statements(self) -> None:
+        db = _FakeDB()
+        with _patch_pool(db):
+            results = await auto_tranche_many([1, 2, 3, 4, 99, 1])
+
+        assert [(r.judgment_id, r.pool_name) for r in results] == [
+            (1, POOL_PRIME),
+            (2, POOL_STANDARD),
+            (3, POOL_DISTRESSED),
+        ]
+        assert [r.was_reassigned for r in results] == [False, True, False]
+        assert len(db.executed) == 4
+
+        [(_, (ids, pool_ids))] = db.statements("UPDATE public.judgments")
+        # Judgment 3 is already in its target pool
+        assert ids == [1, 2]
+        assert pool_ids == [POOL_IDS[POOL_PRIME], POOL_IDS[POOL_STANDARD]]
+
+        [(_, (event_ids, payloads))] = db.statements("INSERT INTO public.events")
+        assert event_ids == [1, 2, 3]
+        assert json.loads(payloads[1]) == {
+            "pool_name": POOL_STANDARD,
+            "score": 60,
+            "was_reassigned": True,
+        }
+
+    async def test_pool_ids_cached_between_calls(self) -> None:
+        db = _FakeDB()
+        with _patch_pool(db):
+            await auto_tranche_many([1, 2, 3])
+            await auto_tranche_many([1, 2, 3], emit_events=False)
+
+        assert len(db.statements("FROM finance.pools")) == 1
+        assert len(db.statements("INSERT INTO public.events")) == 1
+
+    async def test_missing_pool_is_created(self) -> None:
+        db = _FakeDB()
+        ensure = AsyncMock(return_value="new-pool-id")
+        with (
+            _patch_pool(db),
+            patch.dict(POOL_IDS, clear=True),
+            patch.object(allocation_service, "ensure_pool_exists", ensure),
+        ):
+            results = await auto_tranche_many([1])
+
+        ensure.assert_awaited_once_with(POOL_PRIME)
+        assert results[0].pool_id == "new-pool-id"
+
+    async def test_unscored_only_does_nothing(self) -> None:
+        db = _FakeDB()
+        with _patch_pool(db):
+            assert await auto_tranche_many([4]) == []
+
+        assert len(db.executed) == 1
@@ -41,11 +41,12 @@ def test_backend_main_missing_correlation_does_not_crash(monkeypatch: pytest.Mon
 
 
 def test_backend_main_correlation_loaded_when_present(monkeypatch: pytest.MonkeyPatch) -> None:
-    """When CorrelationMiddleware exists, FastAPI registers it via add_middleware."""
+    """When the correlation module exists, request IDs flow through the pipeline middleware."""
 
     module = _reload_backend_main(monkeypatch)
 
     user_middlewares = getattr(module.app, "user_middleware", [])
     middleware_types = {entry.cls for entry in user_middlewares}
 
-    assert module.CorrelationMiddleware in middleware_types
+    assert module._CORRELATION_MIDDLEWARE_AVAILABLE is True
+    assert module.RequestPipelineMiddleware in middleware_types
@@ -0,0 +1,195 @@
+"""
+Tests for the set-based bulk loaders in etl.loaders.
+
+Verifies:
+- Records are staged with one execute_values call and merged in one statement
+- The id map is keyed on each entity's natural key
+- Inserted/updated counts come from the merge RETURNING rows
+- Dependent loaders resolve foreign keys from a parent id map without querying
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+from unittest.mock import patch
+
+from psycopg2 import sql
+
+from etl import loaders
+
+
+def _render(query: Any) -> str:
+    """Render psycopg2.sql objects without a live connection."""
+    if isinstance(query, str):
+        return query
+    if isinstance(query, sql.Composed):
+        return "".join(_render(part) for part in query.seq)
+    if isinstance(query, sql.Identifier):
+        return ".".join(f'"{name}"' for name in query.strings)
+    if isinstance(query, sql.SQL):
+        return query.string
+    raise TypeError(type(query))
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConn") -> None:
+        self.conn = conn
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute(self, query: Any, params: Any = None) -> None:
+        self.conn.executed.append(_render(query))
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        return self.conn.merge_result(self.conn.staged)
+
+
+class _FakeConn:
+    """Simulates the merge: one returned row per distinct key, joined back per record."""
+
+    def __init__(
+        self,
+        columns: Tuple[str, ...],
+        key_columns: Tuple[str, ...],
+        existing: Tuple[Tuple[Any, ...], ...] = (),
+    ) -> None:
+        self.columns = columns
+        self.key_columns = key_columns
+        self.existing = {key: f"old-{i}" for i, key in enumerate(existing)}
+        self.executed: List[str] = []
+        self.staged: List[Tuple[Any, ...]] = []
+
+    def cursor(self, **_: Any) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def merge_result(self, rows: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+        index = [self.columns.index(col) for col in self.key_columns]
+        ids: dict = {}
+        out = []
+        for row in rows:
+            ordinal, values = row[0], row[1:]
+            key = tuple(values[i] for i in index)
+            if None in key:
+                out.append((None, f"new-null-{ordinal}", True))
+                continue
+            if key not in ids:
+                ids[key] = (self.existing.get(key) or f"new-{len(ids)}", key not in self.existing)
+            out.append((ordinal, *ids[key]))
+        return out
+
+
+def _run(conn: _FakeConn, fn: Any, records: List[dict], **kwargs: Any) -> loaders.BulkUpsertResult:
+    def fake_execute_values(cur: Any, query: Any, rows: List[Tuple[Any, ...]], **_: Any) -> None:
+        conn.executed.append(_render(query))
+        conn.staged = list(rows)
+
+    with patch.object(loaders, "execute_values", side_effect=fake_execute_values) as ev:
+        result = fn(conn, records, **kwargs)
+    conn.execute_values_calls = ev.call_count  # type: ignore[attr-defined]
+    return result
+
+
+def _case(number: str, **extra: Any) -> dict:
+    return {"case_number": number, "county": "Kings", "state": "NY", **extra}
+
+
+class TestBulkUpsertCases:
+    def _conn(self, *existing: Tuple[Any, ...]) -> _FakeConn:
+        return _FakeConn(loaders.CASE_COLUMNS, loaders.CASE_KEY, existing)
+
+    def test_single_stage_and_merge(self) -> None:
+        conn = self._conn(("NY", "Kings", "C-2"))
+
+        result = _run(conn, loaders.bulk_upsert_cases, [_case("C-1"), _case("C-2"), _case("C-3")])
+
+        assert conn.execute_values_calls == 1  # type: ignore[attr-defined]
+        merges = [q for q in conn.executed if "WITH merged AS" in q]
+        assert len(merges) == 1
+        assert "ON CONFLICT (state, county, case_number)" in merges[0]
+        assert "CREATE TEMP TABLE" in conn.executed[1]
+        assert result.inserted == 2
+        assert result.updated == 1
+        assert result.id_for("NY", "Kings", "C-2") == "old-0"
+        assert set(result.ids) == {("NY", "Kings", n) for n in ("C-1", "C-2", "C-3")}
+
+    def test_duplicate_keys_share_one_id(self) -> None:
+        conn = self._conn()
+
+        result = _run(conn, loaders.bulk_upsert_cases, [_case("C-1"), _case("C-1", case_type="x")])
+
+        assert "DISTINCT ON" in next(q for q in conn.executed if "WITH merged AS" in q)
+        assert result.inserted == 1
+        assert len(result.ids) == 1
+
+    def test_defaults_match_single_upsert(self) -> None:
+        conn = self._conn()
+
+        _run(conn, loaders.bulk_upsert_cases, [{"case_number": "C-1", "county": "LA"}])
+
+        staged = dict(zip(("_ord",) + loaders.CASE_COLUMNS, conn.staged[0]))
+        assert staged["state"] == "CA"
+        assert staged["metadata"] is None
+
+    def test_empty_input_skips_database(self) -> None:
+        conn = self._conn()
+
+        result = _run(conn, loaders.bulk_upsert_cases, [])
+
+        assert conn.executed == []
+        assert result.ids == {}
+
+
+class TestForeignKeyResolution:
+    def test_parties_resolve_case_key_from_parent_map(self) -> None:
+        case_ids = {("NY", "Kings", "C-1"): "case-1"}
+        conn = _FakeConn(loaders.PARTY_COLUMNS, loaders.PARTY_KEY)
+        records = [
+            {"case_key": ("NY", "Kings", "C-1"), "party_role": "debtor", "name_normalized": "ann"},
+            {
+                "case_key": ("NY", "Kings", "missing"),
+                "party_role": "debtor",
+                "name_normalized": "x",
+            },
+        ]
+
+        result = _run(conn, loaders.bulk_upsert_parties, records, case_ids=case_ids)
+
+        assert result.skipped == 1
+        assert len(conn.staged) == 1
+        assert conn.staged[0][1] == "case-1"
+        assert result.id_for("case-1", "debtor", "ann") is not None
+        assert not any("SELECT id FROM" in q for q in conn.executed)
+
+    def test_contacts_resolve_party_key(self) -> None:
+        party_ids = {("case-1", "debtor", "ann"): "party-1"}
+        conn = _FakeConn(loaders.CONTACT_COLUMNS, loaders.CONTACT_KEY)
+        records = [
+            {
+                "party_key": ("case-1", "debtor", "ann"),
+                "contact_type": "phone",
+                "contact_value": "5551234",
+            }
+        ]
+
+        result = _run(conn, loaders.bulk_upsert_contacts, records, party_ids=party_ids)
+
+        staged = dict(zip(("_ord",) + loaders.CONTACT_COLUMNS, conn.staged[0]))
+        assert staged["party_id"] == "party-1"
+        assert staged["is_primary"] is False
+        assert result.id_for("party-1", "phone", "5551234") is not None
+
+    def test_null_key_rows_written_but_not_mapped(self) -> None:
+        conn = _FakeConn(loaders.JUDGMENT_COLUMNS, loaders.JUDGMENT_KEY)
+        records = [
+            {"case_id": "case-1", "judgment_date": "2024-01-01", "amount_awarded": 100},
+            {"case_id": "case-1", "judgment_date": "2024-01-01", "amount_awarded": None},
+        ]
+
+        result = _run(conn, loaders.bulk_upsert_judgments, records)
+
+        assert result.inserted == 2
+        assert list(result.ids) == [("case-1", "2024-01-01", 100)]
@@ -247,7 +247,7 @@ class TestHandleCallQueueSync:
         """Invalid payload should return True (don't retry)."""
         job = {"msg_id": "123", "kind": "call_queue_sync"}
 
-        with patch("workers.call_queue_sync_handler.create_supabase_client"):
+        with patch("workers.call_queue_sync_handler.get_supabase_client"):
             result = await handle_call_queue_sync(job)
 
         assert result is True
@@ -268,7 +268,7 @@ class TestHandleCallQueueSync:
         }
 
         with patch(
-            "workers.call_queue_sync_handler.create_supabase_client",
+            "workers.call_queue_sync_handler.get_supabase_client",
             return_value=mock_client,
         ):
             result = await handle_call_queue_sync(job)
@@ -286,7 +286,7 @@ class TestHandleCallQueueSync:
         )
 
         with patch(
-            "workers.call_queue_sync_handler.create_supabase_client",
+            "workers.call_queue_sync_handler.get_supabase_client",
             return_value=mock_client,
         ):
             result = await handle_call_queue_sync(job)
@@ -323,7 +323,7 @@ class TestHandleCallQueueSync:
         }
 
         with patch(
-            "workers.call_queue_sync_handler.create_supabase_client",
+            "workers.call_queue_sync_handler.get_supabase_client",
             return_value=mock_client,
         ):
             result = await handle_call_queue_sync(job)
@@ -361,7 +361,7 @@ class TestSyncAllCallTasks:
         }
 
         with patch(
-            "workers.call_queue_sync_handler.create_supabase_client",
+            "workers.call_queue_sync_handler.get_supabase_client",
             return_value=mock_client,
         ):
             result = await sync_all_call_tasks()
@@ -1,5 +1,6 @@
 import pytest
 
+from etl import collector_intel
 from etl.collector_intel import CollectorIntelEngine, CollectorSignals
 
 
@@ -46,3 +47,178 @@ def test_evaluate_signals_sparse_profile() -> None:
     assert breakdown["bank_signals"] == pytest.approx(5.0)
     assert breakdown["enforcement_success"] == pytest.approx(6.0)
     assert breakdown["collectability_score"] == pytest.approx(24.0)
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class _FakeQuery:
+    def __init__(self, client, table):
+        self.client = client
+        self.table_name = table
+        self.filters = []
+        self.window = None
+        self.limit_n = None
+        self.orders = []
+
+    def select(self, _columns):
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        wanted = set(values)
+        self.filters.append(lambda row: row.get(column) in wanted)
+        return self
+
+    def gt(self, column, value):
+        self.filters.append(lambda row: row.get(column) > value)
+        return self
+
+    def order(self, column):
+        self.orders.append(column)
+        return self
+
+    def limit(self, n):
+        self.limit_n = n
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end)
+        return self
+
+    def execute(self):
+        self.client.calls.append(self.table_name)
+        self.client.orders.append((self.table_name, tuple(self.orders)))
+        rows = [r for r in self.client.tables[self.table_name] if all(f(r) for f in self.filters)]
+        rows.sort(key=lambda row: tuple(str(row.get(col)) for col in self.orders))
+        if self.window:
+            rows = rows[self.window[0] : self.window[1] + 1]
+        if self.limit_n is not None:
+            rows = rows[: self.limit_n]
+        return _FakeResponse(rows)
+
+
+class _FakeClient:
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls = []
+        self.orders = []
+        self.rpcs = []
+
+    def table(self, name):
+        return _FakeQuery(self, name)
+
+    def schema(self, name):
+        outer = self
+
+        class _Schema:
+            def table(self, table):
+                return _FakeQuery(outer, f"{name}.{table}")
+
+        return _Schema()
+
+    def rpc(self, name, params):
+        self.rpcs.append((name, params))
+        return _FakeQuery(self, "__rpc__")
+
+
+def _portfolio(count: int) -> dict:
+    tables = {
+        "plaintiffs": [],
+        "plaintiff_contacts": [],
+        "judgments": [],
+        "enforcement_cases": [],
+        "enforcement_events": [],
+        "enforcement_history": [],
+        "judgments.cases": [],
+        "__rpc__": [],
+    }
+    for i in range(count):
+        pid = f"p{i:03d}"
+        tables["plaintiffs"].append({"id": pid, "phone": "(555) 123-7890"})
+        tables["plaintiff_contacts"].append(
+            {"plaintiff_id": pid, "kind": "address", "value": "123 Main St, Albany NY 12207"}
+        )
+        tables["judgments"].append({"id": f"j{i}", "plaintiff_id": pid, "case_number": f"C-{i}"})
+        tables["enforcement_cases"].append(
+            {"id": f"ec{i}", "judgment_id": f"j{i}", "case_number": f"C-{i}"}
+        )
+        tables["enforcement_events"].append(
+            {"case_id": f"ec{i}", "event_type": "bank levy", "notes": None, "metadata": None}
+        )
+        tables["enforcement_history"].append(
+            {"judgment_id": f"j{i}", "stage": "wage garnishment" if i % 2 else "paid", "note": None}
+        )
+        tables["judgments.cases"].append({"case_id": f"case-{i}", "case_number": f"C-{i}"})
+    return tables
+
+
+def test_score_many_matches_single_plaintiff_scoring() -> None:
+    client = _FakeClient(_portfolio(6))
+    engine = CollectorIntelEngine(client=client)
+
+    bulk = engine.score_many([f"p{i:03d}" for i in range(6)] + ["missing"])
+
+    assert set(bulk) == {f"p{i:03d}" for i in range(6)}
+    for plaintiff_id, score in bulk.items():
+        assert score.as_dict() == engine.score_plaintiff(plaintiff_id).as_dict()
+
+
+def test_score_many_issues_one_query_per_relation() -> None:
+    client = _FakeClient(_portfolio(25))
+    engine = CollectorIntelEngine(client=client)
+
+    engine.score_many([f"p{i:03d}" for i in range(25)])
+
+    assert sorted(client.calls) == sorted(
+        [
+            "plaintiffs",
+            "plaintiff_contacts",
+            "judgments",
+            "enforcement_cases",
+            "enforcement_events",
+            "enforcement_history",
+        ]
+    )
+
+
+def test_fetch_in_pages_on_a_unique_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(collector_intel, "FETCH_PAGE_SIZE", 2)
+    tables = _portfolio(1)
+    tables["plaintiff_contacts"] = [
+        {"id": f"c{i}", "plaintiff_id": "p000", "kind": "phone", "value": str(i)} for i in range(5)
+    ]
+    client = _FakeClient(tables)
+    engine = CollectorIntelEngine(client=client)
+
+    rows = engine._fetch_in("plaintiff_contacts", "*", "plaintiff_id", ["p000"])
+
+    assert sorted(row["id"] for row in rows) == [f"c{i}" for i in range(5)]
+    assert set(client.orders) == {("plaintiff_contacts", ("plaintiff_id", "id"))}
+    engine._fetch_in("cases", "*", "case_number", ["C-0"], "judgments", key="case_id")
+    assert client.orders[-1] == ("judgments.cases", ("case_number", "case_id"))
+
+
+def test_score_all_pages_and_persists_in_bulk() -> None:
+    client = _FakeClient(_portfolio(5))
+    engine = CollectorIntelEngine(client=client)
+
+    summary = engine.score_all(page_size=2)
+
+    assert summary["plaintiffs"] == 5
+    assert summary["cases"] == 5
+    assert len(client.rpcs) == 3
+    name, params = client.rpcs[0]
+    assert name == "set_case_collectability_scores"
+    assert {item["case_id"] for item in params["p_scores"]} == {"case-0", "case-1"}
+
+
+def test_state_detection_matches_space_delimited_tokens() -> None:
+    assert CollectorIntelEngine._score_address_quality(["Albany NY 12207"]) == pytest.approx(12.0)
+    assert CollectorIntelEngine._score_address_quality(["Albany,NY,12207"]) == pytest.approx(8.0)
+    assert CollectorIntelEngine._score_address_quality(["SUNNYSIDE"]) == pytest.approx(6.0)
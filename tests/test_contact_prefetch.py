@@ -0,0 +1,200 @@
+"""
+Tests for bulk contact ledger prefetch and staged contact inserts.
+
+Covers ContactSync (Simplicity/JBI pipelines) and ContactCache
+(canonical plaintiff importer) against a recording fake connection.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+
+from etl.src.importers.pipeline_support import ContactSync, sync_row_contacts
+from etl.src.plaintiff_importer import ContactCache, ContactCandidate
+
+P1 = "11111111-1111-1111-1111-111111111111"
+P2 = "22222222-2222-2222-2222-222222222222"
+P3 = "33333333-3333-3333-3333-333333333333"
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConn") -> None:
+        self.conn = conn
+        self._rows: List[Any] = []
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute(self, query: Any, params: Any = None) -> None:
+        text = query if isinstance(query, str) else query.as_string(None)
+        self.conn.executed.append((text, params))
+        if "information_schema.columns" in text:
+            self._rows = [(col,) for col in self.conn.columns]
+        elif "insert into public.plaintiff_contacts" in text.lower():
+            # RETURNING echoes the written rows; conflicting ones are skipped
+            width = len(params) // text.count("(%s")
+            rows = [tuple(params[i : i + width]) for i in range(0, len(params), width)]
+            self._rows = [row for row in rows if row[3] not in self.conn.conflicting_emails]
+        elif "from public.plaintiff_contacts" in text.lower():
+            wanted = set(params[0])
+            self._rows = [
+                row
+                for row in self.conn.contact_rows
+                if (row["plaintiff_id"] if isinstance(row, dict) else row[0]) in wanted
+            ]
+        else:
+            self._rows = []
+
+    def fetchall(self) -> List[Any]:
+        return list(self._rows)
+
+    def fetchone(self) -> Optional[Any]:
+        return self._rows[0] if self._rows else None
+
+
+class _FakeConn:
+    def __init__(self, contact_rows: List[Any]) -> None:
+        self.columns = {"plaintiff_id", "name", "role", "email", "phone", "kind", "value"}
+        self.contact_rows = contact_rows
+        self.conflicting_emails: set[str] = set()
+        self.executed: List[Tuple[str, Any]] = []
+
+    def cursor(self, **_: Any) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def queries(self, fragment: str) -> List[Tuple[str, Any]]:
+        return [(q, p) for q, p in self.executed if fragment in q.lower()]
+
+
+class _Row:
+    def __init__(self, name: str, email: str, phone: str = "", address: str = "") -> None:
+        self.plaintiff_name = name
+        self.plaintiff_email = email
+        self.plaintiff_phone = phone
+        self.plaintiff_address_1 = address
+
+
+class TestContactSync:
+    def _sync(self, rows: List[Any], **kwargs: Any) -> Tuple[ContactSync, _FakeConn]:
+        conn = _FakeConn(rows)
+        return ContactSync(conn, **kwargs), conn  # type: ignore[arg-type]
+
+    def test_warm_loads_all_ledgers_in_one_query(self) -> None:
+        sync, conn = self._sync([(P1, "a@x.com", "", None, ""), (P2, None, "5551234", None, "")])
+
+        assert sync.warm([P1, P2, P3, P1]) == 3
+        assert sync.warm([P1, P2]) == 0
+
+        selects = conn.queries("from public.plaintiff_contacts")
+        assert len(selects) == 1
+        assert "any(" in selects[0][0]
+        assert sorted(selects[0][1][0]) == [P1, P2, P3]
+
+        # Known contacts are deduplicated without another round-trip
+        assert sync.ensure_contact(P1, name="A", role="primary", email="A@X.com") is False
+        assert len(conn.queries("from public.plaintiff_contacts")) == 1
+
+    def test_contacts_staged_and_flushed_as_one_insert(self) -> None:
+        sync, conn = self._sync([])
+        for pid in (P1, P2, P3):
+            sync.track_new_plaintiff(pid)
+
+        for pid in (P1, P2, P3):
+            sync_row_contacts(
+                sync, plaintiff_id=pid, row=_Row("Acme", f"{pid[:2]}@x.com", address="1 Main St")
+            )
+
+        assert conn.queries("insert into") == []
+        assert conn.queries("from public.plaintiff_contacts") == []
+
+        assert sync.flush() == 6
+        inserts = conn.queries("insert into")
+        assert len(inserts) == 1
+        assert "on conflict do nothing" in inserts[0][0]
+        assert "returning" in inserts[0][0]
+        assert inserts[0][0].count("(%s") == 6
+        assert sync.flush() == 0
+
+    def test_duplicates_within_batch_skipped(self) -> None:
+        sync, _ = self._sync([])
+        sync.track_new_plaintiff(P1)
+
+        first = sync_row_contacts(sync, plaintiff_id=P1, row=_Row("Acme", "a@x.com"))
+        second = sync_row_contacts(sync, plaintiff_id=P1, row=_Row("Acme", "A@x.com "))
+
+        assert sync.flush() == 1
+        assert first == {"primary": 1, "address": 0}
+        assert second == {"primary": 0, "address": 0}
+
+    def test_conflicting_rows_not_counted(self) -> None:
+        sync, conn = self._sync([])
+        conn.conflicting_emails.add("b@x.com")
+        sync.track_new_plaintiff(P1)
+        sync.track_new_plaintiff(P2)
+
+        first = sync_row_contacts(sync, plaintiff_id=P1, row=_Row("Acme", "a@x.com"))
+        second = sync_row_contacts(
+            sync, plaintiff_id=P2, row=_Row("Beta", "b@x.com", address="1 Main St")
+        )
+        assert first == {"primary": 0, "address": 0}
+
+        assert sync.flush() == 2
+        assert first == {"primary": 1, "address": 0}
+        assert second == {"primary": 0, "address": 1}
+        assert sync.contacts_flushed == 2
+
+    def test_flush_size_triggers_write(self) -> None:
+        sync, conn = self._sync([], flush_size=2)
+        sync.track_new_plaintiff(P1)
+
+        sync.ensure_contact(P1, name="A", role="primary", email="a@x.com")
+        assert conn.queries("insert into") == []
+        sync.ensure_contact(P1, name="B", role="primary", email="b@x.com")
+        assert len(conn.queries("insert into")) == 1
+
+    def test_cache_bounded_and_pending_flushed_before_eviction(self) -> None:
+        sync, conn = self._sync([], max_cached_ledgers=2)
+        sync.track_new_plaintiff(P1)
+        sync.ensure_contact(P1, name="A", role="primary", email="a@x.com")
+
+        sync.track_new_plaintiff(P2)
+        sync.track_new_plaintiff(P3)
+
+        assert len(sync._cache) == 2
+        assert P1 not in sync._cache
+        assert len(conn.queries("insert into")) == 1
+
+
+class TestContactCache:
+    def test_warm_then_get_uses_cache(self) -> None:
+        rows = [
+            {"plaintiff_id": P1, "normalized_email": "a@x.com", "normalized_name": "ann"},
+            {"plaintiff_id": P2, "normalized_email": None, "normalized_name": "bob"},
+        ]
+        conn = _FakeConn(rows)
+        cache = ContactCache(conn)  # type: ignore[arg-type]
+
+        assert cache.warm([P1, P2]) == 2
+        assert cache.get(P1).emails == {"a@x.com"}
+        assert cache.get(P2).names == {"bob"}
+        assert len(conn.queries("from public.plaintiff_contacts")) == 1
+
+    def test_get_miss_loads_single_plaintiff(self) -> None:
+        conn = _FakeConn([])
+        cache = ContactCache(conn, max_entries=1)  # type: ignore[arg-type]
+
+        contact = ContactCandidate(
+            name="Ann",
+            normalized_name="ann",
+            email=None,
+            normalized_email=None,
+            phone=None,
+            role="primary",
+        )
+        cache.add(P1, contact)
+        assert cache.get(P2).names == set()
+        assert P1 not in cache._cache
+        assert len(conn.queries("from public.plaintiff_contacts")) == 1
@@ -0,0 +1,202 @@
+"""
+Tests for the batched embedding backfill pipeline.
+
+Verifies:
+- Only judgments whose context hash changed are embedded
+- Stale rows are batched up to the embedder's batch size
+- Vectors and hashes are written back in one unnest() update per page
+- A failed batch is counted without aborting the run
+- OpenAIEmbedder retries throttled requests and preserves input order
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from backend.services.ai_service import context_hash
+from backend.services.embedding_pipeline import (
+    DeterministicEmbedder,
+    EmbeddingError,
+    OpenAIEmbedder,
+    judgment_context,
+    run_embedding_backfill,
+)
+
+
+def _judgment(judgment_id: int, **overrides: Any) -> dict[str, Any]:
+    row = {
+        "id": judgment_id,
+        "case_number": f"CASE-{judgment_id}",
+        "plaintiff_name": "Acme Corp",
+        "defendant_name": f"Debtor {judgment_id}",
+        "judgment_amount": Decimal("1500.00"),
+        "entry_date": date(2024, 1, 15),
+        "source_file": "Kings Civil|upload.csv",
+        "embedding_context_hash": None,
+    }
+    row.update(overrides)
+    return row
+
+
+class FakeJudgmentsConn:
+    """Serves keyset pages from an in-memory table and applies bulk updates."""
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.rows = rows
+        self.updates: list[tuple[list, list, list]] = []
+
+    async def fetch(self, query: str, last_id: int, limit: int) -> list[dict[str, Any]]:
+        return [dict(r) for r in self.rows if r["id"] > last_id][:limit]
+
+    async def execute(self, query: str, ids: list, vectors: list, hashes: list) -> str:
+        assert "unnest" in query
+        self.updates.append((ids, vectors, hashes))
+        by_id = {r["id"]: r for r in self.rows}
+        for judgment_id, digest in zip(ids, hashes):
+            by_id[judgment_id]["embedding_context_hash"] = digest
+        return f"UPDATE {len(ids)}"
+
+
+@pytest.fixture
+def patch_connection():
+    def _patch(conn: FakeJudgmentsConn):
+        @asynccontextmanager
+        async def fake_get_connection():
+            yield conn
+
+        return patch("backend.db.get_connection", fake_get_connection)
+
+    return _patch
+
+
+class TestJudgmentContext:
+    def test_court_from_source_file(self) -> None:
+        context = judgment_context(_judgment(1))
+        assert "Court: Kings Civil" in context
+        assert "Amount: $1,500.00" in context
+        assert "Judgment Date: 2024-01-15" in context
+
+    def test_hash_changes_with_context(self) -> None:
+        assert context_hash("a") != context_hash("b")
+        assert context_hash("a") == context_hash("a")
+
+
+class TestRunEmbeddingBackfill:
+    async def test_embeds_stale_rows_in_batches(self, patch_connection) -> None:
+        conn = FakeJudgmentsConn([_judgment(i) for i in range(1, 8)])
+        embedder = DeterministicEmbedder(dimensions=8, batch_size=3)
+
+        with patch_connection(conn):
+            result = await run_embedding_backfill(embedder, page_size=5)
+
+        assert result.scanned == 7
+        assert result.embedded == 7
+        # Page 1: 5 rows -> batches of 3 + 2; page 2: 2 rows -> 1 batch
+        assert result.requests == 3
+        assert embedder.calls == 3
+        assert len(conn.updates) == 2
+        assert conn.updates[0][1][0].startswith("[")
+
+    async def test_unchanged_rows_skipped(self, patch_connection) -> None:
+        rows = [_judgment(i) for i in range(1, 5)]
+        rows[0]["embedding_context_hash"] = context_hash(judgment_context(rows[0]))
+        rows[1]["plaintiff_name"] = None
+        rows[1]["defendant_name"] = None
+        rows[1]["case_number"] = None
+        rows[1]["judgment_amount"] = None
+        rows[1]["entry_date"] = None
+        rows[1]["source_file"] = None
+        conn = FakeJudgmentsConn(rows)
+        embedder = DeterministicEmbedder(dimensions=8)
+
+        with patch_connection(conn):
+            result = await run_embedding_backfill(embedder)
+
+        assert result.skipped_unchanged == 1
+        assert result.skipped_empty == 1
+        assert result.embedded == 2
+        assert conn.updates[0][0] == [3, 4]
+
+    async def test_second_run_is_a_no_op_unless_forced(self, patch_connection) -> None:
+        conn = FakeJudgmentsConn([_judgment(i) for i in range(1, 4)])
+        embedder = DeterministicEmbedder(dimensions=8)
+
+        with patch_connection(conn):
+            await run_embedding_backfill(embedder)
+            again = await run_embedding_backfill(embedder)
+            forced = await run_embedding_backfill(embedder, force=True)
+
+        assert again.embedded == 0
+        assert again.skipped_unchanged == 3
+        assert forced.embedded == 3
+
+    async def test_failed_batch_counted(self, patch_connection) -> None:
+        conn = FakeJudgmentsConn([_judgment(i) for i in range(1, 5)])
+
+        class FlakyEmbedder(DeterministicEmbedder):
+            async def embed_batch(self, texts):
+                if "Debtor 1" in texts[0]:
+                    raise EmbeddingError("boom")
+                return await super().embed_batch(texts)
+
+        with patch_connection(conn):
+            result = await run_embedding_backfill(FlakyEmbedder(dimensions=8, batch_size=2))
+
+        assert result.failed == 2
+        assert result.embedded == 2
+        assert conn.updates[0][0] == [3, 4]
+
+    async def test_max_rows_limits_scan(self, patch_connection) -> None:
+        conn = FakeJudgmentsConn([_judgment(i) for i in range(1, 11)])
+
+        with patch_connection(conn):
+            result = await run_embedding_backfill(
+                DeterministicEmbedder(dimensions=8), page_size=4, max_rows=6
+            )
+
+        assert result.scanned == 6
+
+
+class TestOpenAIEmbedder:
+    async def test_retries_429_and_orders_by_index(self) -> None:
+        calls = {"n": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls["n"] += 1
+            if calls["n"] == 1:
+                return httpx.Response(429, headers={"retry-after": "0"}, text="slow down")
+            return httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {"index": 1, "embedding": [0.2]},
+                        {"index": 0, "embedding": [0.1]},
+                    ]
+                },
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        embedder = OpenAIEmbedder(api_key="sk-test", requests_per_minute=0, client=client)
+
+        vectors = await embedder.embed_batch(["a", "b"])
+
+        assert vectors == [[0.1], [0.2]]
+        assert calls["n"] == 2
+        await client.aclose()
+
+    async def test_client_error_not_retried(self) -> None:
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda r: httpx.Response(400, text="bad"))
+        )
+        embedder = OpenAIEmbedder(api_key="sk-test", requests_per_minute=0, client=client)
+
+        with pytest.raises(EmbeddingError, match="400"):
+            await embedder.embed_batch(["a"])
+        await client.aclose()
@@ -72,6 +72,7 @@ class TestWageCandidatesWithAuth:
         mock_query.gte.return_value = mock_query
         mock_query.ilike.return_value = mock_query
         mock_query.eq.return_value = mock_query
+        mock_query.order.return_value = mock_query
         mock_query.range.return_value = mock_query
         mock_query.execute.return_value = mock_result
 
@@ -114,6 +115,7 @@ class TestWageCandidatesWithAuth:
         mock_query.gte.return_value = mock_query
         mock_query.ilike.return_value = mock_query
         mock_query.eq.return_value = mock_query
+        mock_query.order.return_value = mock_query
         mock_query.range.return_value = mock_query
         mock_query.execute.return_value = mock_result
 
@@ -174,6 +176,7 @@ class TestWageCandidatesWithAuth:
         mock_query.gte.return_value = mock_query
         mock_query.ilike.return_value = mock_query
         mock_query.eq.return_value = mock_query
+        mock_query.order.return_value = mock_query
         mock_query.range.return_value = mock_query
         mock_query.execute.return_value = mock_result
 
@@ -214,6 +217,7 @@ class TestWageCandidatesWithAuth:
         mock_query.gte.return_value = mock_query
         mock_query.ilike.return_value = mock_query
         mock_query.eq.return_value = mock_query
+        mock_query.order.return_value = mock_query
         mock_query.range.return_value = mock_query
         mock_query.execute.return_value = mock_result
 
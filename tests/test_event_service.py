@@ -4,20 +4,28 @@ Tests for the Event Service.
 Tests event emission, timeline retrieval, and entity lookup.
 """
 
-from datetime import datetime, timezone
+import json
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
+from backend.api.routers.events import build_timeline_response, decode_timeline_cursor
+from backend.services import event_service
 from backend.services.event_service import (
     EVENT_TYPES,
+    EVENTS_CHANNEL,
     EventDTO,
+    EventListener,
+    clear_entity_id_cache,
     emit_event,
     emit_event_for_judgment,
     get_entity_id_for_judgment,
     get_timeline_for_entity,
     get_timeline_for_judgment,
+    timeline_key,
+    watch_timeline_for_judgment,
 )
 
 # =============================================================================
@@ -45,13 +53,21 @@ class MockAsyncCursor:
 
 
 def create_mock_connection():
-    """Create a properly configured mock async connection."""
+    """Create a properly configured mock pool whose connection() yields itself."""
     mock_cursor = MockAsyncCursor()
     mock_conn = MagicMock()
     mock_conn.cursor.return_value = mock_cursor
+    mock_conn.connection.return_value.__aenter__.return_value = mock_conn
     return mock_conn, mock_cursor
 
 
+@pytest.fixture(autouse=True)
+def _clear_entity_cache():
+    clear_entity_id_cache()
+    yield
+    clear_entity_id_cache()
+
+
 # =============================================================================
 # Unit Tests: emit_event
 # =============================================================================
@@ -77,6 +93,9 @@ class TestEmitEvent:
         call_args = mock_cursor.execute.call_args
         assert "INSERT INTO intelligence.events" in call_args[0][0]
         assert call_args[0][1][1] == "new_judgment"
+        # Listeners are notified from the same statement
+        assert "pg_notify" in call_args[0][0]
+        assert call_args[0][1][3] == EVENTS_CHANNEL
 
     @pytest.mark.asyncio
     async def test_emit_event_rejects_invalid_type(self):
@@ -213,6 +232,51 @@ class TestGetTimelineForEntity:
         call_args = mock_cursor.execute.call_args
         assert 50 in call_args[0][1]
 
+    @pytest.mark.asyncio
+    async def test_get_timeline_newest_first_by_default(self):
+        """Without a position the newest events are returned."""
+        mock_conn, mock_cursor = create_mock_connection()
+
+        with patch("backend.services.event_service.get_pool", return_value=mock_conn):
+            await get_timeline_for_entity(SAMPLE_ENTITY_ID, limit=10)
+
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "ORDER BY created_at DESC, id DESC" in sql
+        assert "(created_at, id)" not in sql
+        assert params == (str(SAMPLE_ENTITY_ID), 10)
+
+    @pytest.mark.asyncio
+    async def test_get_timeline_before_pages_back(self):
+        """before seeks to events older than the position."""
+        now = datetime.now(timezone.utc)
+        mock_conn, mock_cursor = create_mock_connection()
+
+        with patch("backend.services.event_service.get_pool", return_value=mock_conn):
+            await get_timeline_for_entity(SAMPLE_ENTITY_ID, limit=10, before=(now, "e-5"))
+
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "(created_at, id) < (%s, %s::uuid)" in sql
+        assert "ORDER BY created_at DESC, id DESC" in sql
+        assert params == (str(SAMPLE_ENTITY_ID), now, "e-5", 10)
+
+    @pytest.mark.asyncio
+    async def test_get_timeline_after_returns_newer_events_newest_first(self):
+        """after reads forward from the position and returns newest first."""
+        now = datetime.now(timezone.utc)
+        mock_conn, mock_cursor = create_mock_connection()
+        mock_cursor.fetchall.return_value = [
+            (uuid4(), "job_found", now + timedelta(seconds=1), {}),
+            (uuid4(), "offer_made", now + timedelta(seconds=2), {}),
+        ]
+
+        with patch("backend.services.event_service.get_pool", return_value=mock_conn):
+            events = await get_timeline_for_entity(SAMPLE_ENTITY_ID, after=(now, "e-5"))
+
+        sql = mock_cursor.execute.call_args[0][0]
+        assert "(created_at, id) > (%s, %s::uuid)" in sql
+        assert "ORDER BY created_at ASC, id ASC" in sql
+        assert [e.event_type for e in events] == ["offer_made", "job_found"]
+
 
 # =============================================================================
 # Unit Tests: get_entity_id_for_judgment
@@ -255,6 +319,19 @@ class TestGetEntityIdForJudgment:
 
         assert entity_id is None
 
+    @pytest.mark.asyncio
+    async def test_found_mapping_is_cached(self):
+        """A found entity is looked up once; misses are retried."""
+        mock_conn, mock_cursor = create_mock_connection()
+        mock_cursor.fetchone.side_effect = [(None,), (str(SAMPLE_ENTITY_ID),)]
+
+        with patch("backend.services.event_service.get_pool", return_value=mock_conn):
+            assert await get_entity_id_for_judgment(SAMPLE_JUDGMENT_ID) is None
+            for _ in range(3):
+                assert await get_entity_id_for_judgment(SAMPLE_JUDGMENT_ID) == SAMPLE_ENTITY_ID
+
+        assert mock_cursor.execute.await_count == 2
+
 
 # =============================================================================
 # Unit Tests: get_timeline_for_judgment
@@ -406,3 +483,152 @@ class TestEventDTO:
         )
 
         assert dto.payload == {}
+
+
+# =============================================================================
+# Timeline Cursors
+# =============================================================================
+
+
+def _events(count: int, start: datetime) -> list[EventDTO]:
+    """Events newest first, one second apart."""
+    return [
+        EventDTO(id=str(uuid4()), event_type="job_found", created_at=start - timedelta(seconds=i))
+        for i in range(count)
+    ]
+
+
+class TestTimelineCursors:
+    """Tests for the router's timeline page cursors."""
+
+    def test_full_page_has_both_cursors(self):
+        events = _events(3, datetime.now(timezone.utc))
+        response = build_timeline_response(events, 3, None, None)
+
+        assert decode_timeline_cursor(response.newer_cursor) == timeline_key(events[0])
+        assert decode_timeline_cursor(response.older_cursor) == timeline_key(events[-1])
+
+    def test_short_page_reaches_oldest_event(self):
+        response = build_timeline_response(_events(2, datetime.now(timezone.utc)), 3, None, None)
+        assert response.older_cursor is None
+
+    def test_empty_catch_up_keeps_position(self):
+        position = timeline_key(_events(1, datetime.now(timezone.utc))[0])
+        response = build_timeline_response([], 50, None, position)
+
+        assert response.total == 0
+        assert decode_timeline_cursor(response.newer_cursor) == position
+
+
+# =============================================================================
+# Live Timeline
+# =============================================================================
+
+
+class TestEventListener:
+    """Tests for NOTIFY fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_wakes_matching_entity_only(self):
+        listener = EventListener()
+        other = uuid4()
+        with patch.object(listener, "start", AsyncMock()):
+            wake = await listener.subscribe(SAMPLE_ENTITY_ID)
+            other_wake = await listener.subscribe(other)
+
+        listener.dispatch(json.dumps({"id": "e-1", "entity_id": str(SAMPLE_ENTITY_ID)}))
+        listener.dispatch("not json")
+
+        assert wake.is_set()
+        assert not other_wake.is_set()
+
+    @pytest.mark.asyncio
+    async def test_last_unsubscribe_closes(self):
+        listener = EventListener()
+        with (
+            patch.object(listener, "start", AsyncMock()),
+            patch.object(listener, "close", AsyncMock()) as mock_close,
+        ):
+            wake = await listener.subscribe(SAMPLE_ENTITY_ID)
+            await listener.unsubscribe(SAMPLE_ENTITY_ID, wake)
+
+        mock_close.assert_awaited_once()
+
+
+class TestWatchTimeline:
+    """Tests for watch_timeline_for_judgment (polling path)."""
+
+    @pytest.mark.asyncio
+    async def test_yields_only_new_events_oldest_first(self):
+        now = datetime.now(timezone.utc)
+        history = _events(2, now)
+        arrivals = [_events(2, now + timedelta(seconds=10)), []]
+        timeline: list[EventDTO] = list(history)
+
+        async def fake_timeline(entity_id, limit=100, *, before=None, after=None):
+            if after is None:
+                return timeline[:limit]
+            # Closest `limit` newer events, newest first
+            newer = [e for e in timeline if timeline_key(e) > after]
+            return newer[-limit:]
+
+        listener = EventListener()
+        with (
+            patch.object(event_service, "event_listener", listener),
+            patch.object(listener, "start", AsyncMock()),
+            patch.object(event_service, "EVENT_STREAM_POLL_SECONDS", 0),
+            patch.object(
+                event_service,
+                "get_entity_id_for_judgment",
+                AsyncMock(return_value=SAMPLE_ENTITY_ID),
+            ),
+            patch.object(event_service, "get_timeline_for_entity", side_effect=fake_timeline),
+        ):
+            stream = watch_timeline_for_judgment(SAMPLE_JUDGMENT_ID)
+            batches = []
+            for new in arrivals:
+                batches.append(await stream.__anext__())
+                timeline[:0] = new
+            batches.append(await stream.__anext__())
+            await stream.aclose()
+
+        # Starts from the newest existing event, then reports the arrivals
+        assert batches[0] == []
+        assert batches[1] == list(reversed(arrivals[0]))
+        assert batches[2] == []
+        assert listener._subscribers == {}
+
+    @pytest.mark.asyncio
+    async def test_late_commit_behind_cursor_delivered_once(self):
+        now = datetime.now(timezone.utc)
+        timeline: list[EventDTO] = _events(2, now)
+        newer = _events(1, now + timedelta(seconds=5))
+        # Stamped before `newer` but committed after it was streamed
+        late = _events(1, now + timedelta(seconds=2))
+
+        async def fake_timeline(entity_id, limit=100, *, before=None, after=None):
+            if after is None:
+                return timeline[:limit]
+            ordered = sorted(timeline, key=timeline_key, reverse=True)
+            return [e for e in ordered if timeline_key(e) > after][-limit:]
+
+        listener = EventListener()
+        with (
+            patch.object(event_service, "event_listener", listener),
+            patch.object(listener, "start", AsyncMock()),
+            patch.object(event_service, "EVENT_STREAM_POLL_SECONDS", 0),
+            patch.object(
+                event_service,
+                "get_entity_id_for_judgment",
+                AsyncMock(return_value=SAMPLE_ENTITY_ID),
+            ),
+            patch.object(event_service, "get_timeline_for_entity", side_effect=fake_timeline),
+        ):
+            stream = watch_timeline_for_judgment(SAMPLE_JUDGMENT_ID)
+            assert await stream.__anext__() == []
+            timeline[:0] = newer
+            assert await stream.__anext__() == newer
+            timeline.extend(late)
+            assert await stream.__anext__() == late
+            assert await stream.__anext__() == []
+            await stream.aclose()
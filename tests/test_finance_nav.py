@@ -0,0 +1,161 @@
+"""
+Tests for all-pools NAV calculation and snapshotting.
+
+Verifies:
+- Every pool's NAV comes from one grouped query
+- Incremental runs recompute only claimed (changed) pools
+- Snapshots are upserted in one statement
+- calculate_nav() delegates and reports missing pools
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import finance_service
+from backend.services.finance_service import FinanceServiceError
+
+POOL_A = "00000000-0000-0000-0000-00000000000a"
+POOL_B = "00000000-0000-0000-0000-00000000000b"
+
+NAV_ROWS = {
+    POOL_A: (
+        POOL_A,
+        "Alpha",
+        2,
+        Decimal("10000"),
+        Decimal("2000"),
+        Decimal("500"),
+        Decimal("100"),
+        Decimal("50"),
+        Decimal("25"),
+    ),
+    POOL_B: (POOL_B, "Beta", 0, Decimal("0"), Decimal("0"), *(Decimal("0"),) * 4),
+}
+
+
+class _FakeCursor:
+    def __init__(self, db: "_FakeDB") -> None:
+        self.db = db
+        self.rows: list[tuple] = []
+
+    async def __aenter__(self) -> "_FakeCursor":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, sql: str, params: Any = None) -> None:
+        self.db.executed.append((sql, params))
+        if "pool_nav_dirty" in sql and "judgment_totals" not in sql:
+            self.rows = [(pool_id,) for pool_id in self.db.changed]
+        elif "judgment_totals" in sql:
+            ids = params["pool_ids"]
+            self.rows = [row for pid, row in NAV_ROWS.items() if ids is None or pid in ids]
+        else:
+            self.rows = []
+
+    async def fetchall(self) -> list[tuple]:
+        return self.rows
+
+
+class _FakeConn:
+    def __init__(self, db: "_FakeDB") -> None:
+        self.db = db
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self.db)
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+class _FakeDB:
+    def __init__(self, changed: list[str] | None = None) -> None:
+        self.changed = changed or []
+        self.executed: list[tuple[str, Any]] = []
+
+    @asynccontextmanager
+    async def connection(self):
+        yield _FakeConn(self)
+
+    def statements(self, needle: str) -> list[tuple[str, Any]]:
+        return [(sql, p) for sql, p in self.executed if needle in sql]
+
+
+def _patch_pool(db: _FakeDB):
+    return patch.object(finance_service, "get_pool", AsyncMock(return_value=db))
+
+
+class TestCalculateNavAll:
+    async def test_all_pools_in_one_query(self) -> None:
+        db = _FakeDB()
+        with _patch_pool(db):
+            results = await finance_service.calculate_nav_all()
+
+        assert [r.pool_name for r in results] == ["Alpha", "Beta"]
+        alpha = results[0]
+        # 500 collected + 2000 projected - (50 expenses + 25 fees)
+        assert alpha.nav == Decimal("2425")
+        assert (alpha.total_expenses, alpha.aum, alpha.collected_ytd) == (
+            Decimal("75"),
+            Decimal("10000"),
+            Decimal("100"),
+        )
+        assert len(db.executed) == 1
+        assert not db.statements("pool_nav_history (")
+
+    async def test_changed_only_recomputes_claimed_pools(self) -> None:
+        db = _FakeDB(changed=[POOL_B])
+        with _patch_pool(db):
+            results = await finance_service.calculate_nav_all(changed_only=True, persist=True)
+
+        assert [r.pool_id for r in results] == [POOL_B]
+        assert db.statements("DELETE FROM finance.pool_nav_dirty")
+        nav_sql = db.statements("judgment_totals")
+        assert nav_sql[0][1] == {"pool_ids": [POOL_B]}
+
+        [(_, params)] = db.statements("INSERT INTO finance.pool_nav_history")
+        assert params[0] == [POOL_B]
+        assert json.loads(params[5][0])["judgment_count"] == 0
+
+    async def test_nothing_changed_skips_calculation(self) -> None:
+        db = _FakeDB(changed=[])
+        with _patch_pool(db):
+            results = await finance_service.calculate_nav_all(changed_only=True)
+
+        assert results == []
+        assert not db.statements("judgment_totals")
+        assert not db.statements("DELETE")
+
+    async def test_full_snapshot_claims_dirty_rows(self) -> None:
+        db = _FakeDB(changed=[POOL_A])
+        with _patch_pool(db):
+            results = await finance_service.calculate_nav_all(persist=True)
+
+        assert len(results) == 2
+        assert db.statements("DELETE FROM finance.pool_nav_dirty")
+        [(_, params)] = db.statements("INSERT INTO finance.pool_nav_history")
+        assert params[0] == [POOL_A, POOL_B]
+
+
+class TestCalculateNav:
+    async def test_delegates_to_grouped_query(self) -> None:
+        db = _FakeDB()
+        with _patch_pool(db):
+            result = await finance_service.calculate_nav(POOL_A)
+
+        assert result.pool_name == "Alpha"
+        assert db.executed[0][1] == {"pool_ids": [POOL_A]}
+
+    async def test_missing_pool_raises(self) -> None:
+        db = _FakeDB()
+        with _patch_pool(db), pytest.raises(FinanceServiceError, match="not found"):
+            await finance_service.calculate_nav("00000000-0000-0000-0000-000000000000")
@@ -0,0 +1,195 @@
+"""
+Tests for the compiled gig platform matcher.
+
+Verifies:
+- The single-alternation matcher agrees with per-keyword matching,
+  including overlapping and nested keywords
+- The matcher is cached and rebuilt only when the platforms version moves
+- detect_gig_activity_many() pages through judgments with keyset pagination
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services import gig_service
+from backend.services.gig_service import GigMatcher, GigPlatform, match_text_against_platforms
+
+
+def _platform(pid: int, name: str, keywords: list[str]) -> GigPlatform:
+    return GigPlatform(
+        id=pid,
+        platform_name=name,
+        registered_agent_name=None,
+        registered_agent_address="1 Main St",
+        registered_agent_city=None,
+        registered_agent_state=None,
+        registered_agent_zip=None,
+        detection_keywords=keywords,
+        subpoena_notes=None,
+    )
+
+
+PLATFORMS = [
+    _platform(1, "DoorDash", ["doordash", "door dash", "dasher"]),
+    _platform(2, "Dash Pay", ["dash"]),
+    _platform(3, "Lyft", ["lyft", "lyft driver"]),
+    _platform(4, "Driver Apps", ["driver app"]),
+    _platform(5, "Uber", ["uber", "uber eats", "uber driver"]),
+]
+
+TEXTS = [
+    "",
+    "Acme Plumbing",
+    "UBER EATS courier",
+    "Door Dash deliveries",
+    "works as a dasher",
+    "lyft driver app user",
+    "Uber driver / Lyft",
+    "superuber inc",
+    "dash",
+    "paid via dash; also doordash",
+]
+
+
+def _summary(detections: list) -> list[tuple[str, str, str]]:
+    return [(d.platform.platform_name, d.matched_keyword, d.detection_source) for d in detections]
+
+
+class TestGigMatcher:
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_agrees_with_per_keyword_matching(self, text: str) -> None:
+        expected = match_text_against_platforms(text, PLATFORMS, "notes")
+        assert _summary(GigMatcher(PLATFORMS).match(text, "notes")) == _summary(expected)
+
+    def test_overlapping_keywords_across_platforms(self) -> None:
+        # "door dash" hides "dash"; "lyft driver" overlaps "driver app"
+        detections = GigMatcher(PLATFORMS).match("door dash and lyft driver app", "notes")
+        names = [d.platform.platform_name for d in detections]
+        assert names == ["DoorDash", "Dash Pay", "Lyft", "Driver Apps"]
+
+    def test_match_fields_dedupes_by_platform(self) -> None:
+        detections = GigMatcher(PLATFORMS).match_fields(
+            [("employer_name", "Uber"), ("notes", "uber eats and lyft"), ("bank_name", None)]
+        )
+        assert _summary(detections) == [
+            ("Uber", "uber", "employer_name"),
+            ("Lyft", "lyft", "notes"),
+        ]
+
+    def test_no_keywords(self) -> None:
+        matcher = GigMatcher([_platform(1, "Empty", ["", "  "])])
+        assert matcher.match("anything", "notes") == []
+        assert matcher.platform("Empty") is not None
+
+
+class TestMatcherCache:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        gig_service.clear_gig_matcher_cache()
+        yield
+        gig_service.clear_gig_matcher_cache()
+
+    async def test_rebuilt_only_when_version_changes(self) -> None:
+        version = AsyncMock(side_effect=[7, 7, 8])
+        load = AsyncMock(return_value=PLATFORMS)
+        with (
+            patch.object(gig_service, "GIG_PLATFORM_VERSION_CHECK_SECONDS", 0),
+            patch.object(gig_service, "_load_platforms_version", version),
+            patch.object(gig_service, "load_gig_platforms", load),
+        ):
+            first = await gig_service.get_gig_matcher()
+            assert await gig_service.get_gig_matcher() is first
+            assert (await gig_service.get_gig_matcher()).version == 8
+
+        assert load.await_count == 2
+
+    async def test_version_not_rechecked_within_interval(self) -> None:
+        version = AsyncMock(return_value=1)
+        with (
+            patch.object(gig_service, "GIG_PLATFORM_VERSION_CHECK_SECONDS", 3600),
+            patch.object(gig_service, "_load_platforms_version", version),
+            patch.object(gig_service, "load_gig_platforms", AsyncMock(return_value=PLATFORMS)),
+        ):
+            for _ in range(5):
+                await gig_service.get_gig_matcher()
+
+        assert version.await_count == 1
+
+
+# =============================================================================
+# detect_gig_activity_many
+# =============================================================================
+
+
+class _FakeCursor:
+    def __init__(self, db: "_FakeDB") -> None:
+        self.db = db
+        self.rows: list[tuple] = []
+
+    async def __aenter__(self) -> "_FakeCursor":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, sql: str, params: dict[str, Any]) -> None:
+        self.db.pages.append(dict(params))
+        rows = [r for r in self.db.rows if r[0] > params["after"]]
+        if params["ids"] is not None:
+            rows = [r for r in rows if r[0] in params["ids"]]
+        self.rows = rows[: params["limit"]]
+
+    async def fetchall(self) -> list[tuple]:
+        return self.rows
+
+
+class _FakeConn:
+    def __init__(self, db: "_FakeDB") -> None:
+        self.db = db
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self.db)
+
+
+class _FakeDB:
+    def __init__(self, rows: list[tuple]) -> None:
+        self.rows = rows
+        self.pages: list[dict[str, Any]] = []
+
+    @asynccontextmanager
+    async def connection(self):
+        yield _FakeConn(self)
+
+
+class TestDetectGigActivityMany:
+    async def test_sweeps_in_keyset_pages(self) -> None:
+        notes = {i: "lyft driver" if i % 3 == 0 else "retail" for i in range(1, 8)}
+        db = _FakeDB([(i, None, None, text, None) for i, text in notes.items()])
+        with (
+            patch.object(gig_service, "get_pool", AsyncMock(return_value=db)),
+            patch.object(
+                gig_service, "get_gig_matcher", AsyncMock(return_value=GigMatcher(PLATFORMS))
+            ),
+        ):
+            results = await gig_service.detect_gig_activity_many(page_size=3)
+
+        assert sorted(results) == [3, 6]
+        assert results[3][0].detection_source == "notes"
+        assert [page["after"] for page in db.pages] == [0, 3, 6]
+
+    async def test_restricts_to_ids(self) -> None:
+        db = _FakeDB([(1, "Uber", None, None, None), (2, "Uber", None, None, None)])
+        with (
+            patch.object(gig_service, "get_pool", AsyncMock(return_value=db)),
+            patch.object(
+                gig_service, "get_gig_matcher", AsyncMock(return_value=GigMatcher(PLATFORMS))
+            ),
+        ):
+            results = await gig_service.detect_gig_activity_many([2])
+
+        assert list(results) == [2]
@@ -0,0 +1,144 @@
+"""
+Tests for the background health snapshot collector.
+
+Verifies:
+- The consolidated query includes optional relations only when present
+- Query rows map onto the snapshot shape the endpoints expect
+- Endpoints serve a fresh snapshot from memory without touching the DB
+- Concurrent callers share one inline refresh when the snapshot is stale
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services.health_snapshot import (
+    HealthSnapshot,
+    HealthSnapshotCollector,
+    build_snapshot_sql,
+)
+
+
+def _snapshot(**overrides) -> HealthSnapshot:
+    row = {
+        "pending": 3,
+        "processing": 1,
+        "failed": 2,
+        "stuck": 0,
+        "failed_24h": 1,
+        "enrichment_backlog": 4,
+        "total_workers": 2,
+        "active_workers": 2,
+        "last_heartbeat": datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+        "last_event_at": None,
+        "events_24h": 7,
+        "last_intake_success": None,
+        "batches_24h": 5,
+        "success_rate_24h": 98.123,
+        "pending_validation": 0,
+        "failed_rows_24h": 0,
+    }
+    row.update(overrides)
+    return HealthSnapshot.from_row(row, datetime.now(timezone.utc))
+
+
+class TestBuildSnapshotSql:
+    def test_all_relations_present(self) -> None:
+        sql = build_snapshot_sql(has_events=True, has_intake=True)
+        assert "FROM intelligence.events" in sql
+        assert "FROM intake.simplicity_batches" in sql
+        assert "FROM ops.job_queue" in sql
+
+    def test_optional_relations_missing(self) -> None:
+        sql = build_snapshot_sql(has_events=False, has_intake=False)
+        assert "intelligence.events" not in sql
+        assert "intake." not in sql
+        assert "FROM ops.worker_heartbeats" in sql
+
+
+class TestSnapshotFromRow:
+    def test_maps_sections(self) -> None:
+        snapshot = _snapshot()
+        assert snapshot.database_ok is True
+        assert snapshot.queue == {
+            "pending": 3,
+            "processing": 1,
+            "failed": 2,
+            "stuck": 0,
+            "failed_24h": 1,
+        }
+        assert snapshot.workers["last_heartbeat"] == "2026-01-01T12:00:00Z"
+        assert snapshot.events["events_24h"] == 7
+        assert snapshot.intake["enrichment_backlog"] == 4
+        assert snapshot.intake["success_rate_24h"] == 98.12
+
+    def test_intake_absent_when_relations_missing(self) -> None:
+        snapshot = _snapshot(pending_validation=None, failed_rows_24h=None)
+        assert snapshot.intake is None
+
+
+class TestCollector:
+    async def test_fresh_snapshot_served_from_memory(self) -> None:
+        collector = HealthSnapshotCollector(interval_s=60)
+        collector._snapshot = _snapshot()
+
+        with patch.object(collector, "refresh", new=AsyncMock()) as refresh:
+            result = await collector.get()
+
+        refresh.assert_not_awaited()
+        assert result is collector.snapshot
+
+    async def test_stale_snapshot_refreshed_once_for_concurrent_callers(self) -> None:
+        collector = HealthSnapshotCollector(interval_s=1)
+        stale = _snapshot()
+        stale.collected_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+        collector._snapshot = stale
+
+        async def fake_refresh() -> HealthSnapshot:
+            await asyncio.sleep(0.01)
+            collector._snapshot = _snapshot()
+            return collector._snapshot
+
+        with patch.object(collector, "refresh", side_effect=fake_refresh) as refresh:
+            results = await asyncio.gather(*(collector.get() for _ in range(5)))
+
+        assert refresh.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    async def test_refresh_without_pool_marks_database_down(self) -> None:
+        collector = HealthSnapshotCollector()
+        with patch("backend.db.get_pool", new=AsyncMock(return_value=None)):
+            snapshot = await collector.refresh()
+
+        assert snapshot.database_ok is False
+        assert snapshot.error == "Database pool not initialized"
+
+
+class TestEndpointsUseSnapshot:
+    async def test_health_system_reads_snapshot(self) -> None:
+        from backend.api.routers import health
+
+        snapshot = _snapshot(stuck=2)
+        snapshot.reaper = {"configured": False}
+        with patch.object(health.health_collector, "get", new=AsyncMock(return_value=snapshot)):
+            response = await health.health_check_system()
+
+        assert response.overall_status == "critical"
+        assert response.queue_health["stuck"] == 2
+        assert response.snapshot_at == snapshot.collected_at_iso
+        assert response.snapshot_age_seconds is not None
+
+    async def test_health_ops_reads_snapshot(self) -> None:
+        from backend.api.routers import health
+
+        snapshot = _snapshot(pending=150)
+        with patch.object(health.health_collector, "get", new=AsyncMock(return_value=snapshot)):
+            response = await health.health_ops()
+
+        assert response.status == "warning"
+        assert response.pending_jobs == 150
+        assert response.events_24h == 7
@@ -0,0 +1,357 @@
+"""
+Tests for the staged per-row writers used by the Simplicity/JBI importers.
+
+Verifies:
+- Raw rows, follow-up tasks, enforcement stages and queue jobs are written
+  with one statement per flush instead of one per row
+- Per-row results are filled into the caller's dicts at flush time
+- Raw row ids are matched back by input position, not RETURNING order
+- A failing queue batch falls back to per-job outcomes
+- ImportFlushGroup flushes every N rows, replays a failed batch row by row
+  and resolves each row only after its writes succeed or fail
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import psycopg
+import pytest
+
+from etl.src.importers.pipeline_support import (
+    EnforcementStageWriter,
+    FollowUpTaskWriter,
+    ImportFlushGroup,
+    QueueJobManager,
+    RawImportWriter,
+)
+
+P1 = "11111111-1111-1111-1111-111111111111"
+P2 = "22222222-2222-2222-2222-222222222222"
+
+Handler = Callable[[str, Any], List[Tuple[Any, ...]]]
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConn") -> None:
+        self.conn = conn
+        self._rows: List[Tuple[Any, ...]] = []
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute(self, query: Any, params: Any = None) -> None:
+        text = query if isinstance(query, str) else query.as_string(None)
+        self.conn.executed.append((text, params))
+        self._rows = self.conn.handler(text, params)
+
+    def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        return list(self._rows)
+
+
+class _FakeConn:
+    def __init__(self, handler: Handler) -> None:
+        self.handler = handler
+        self.executed: List[Tuple[str, Any]] = []
+        self.savepoints = 0
+
+    def cursor(self, **_: Any) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        self.savepoints += 1
+        yield
+
+    def queries(self, fragment: str) -> List[Tuple[str, Any]]:
+        return [(q, p) for q, p in self.executed if fragment in q]
+
+
+def _probe_ok(text: str, params: Any) -> Optional[List[Tuple[Any, ...]]]:
+    if "information_schema" in text:
+        return [(1,)]
+    return None
+
+
+class TestRawImportWriter:
+    def test_staged_rows_written_in_one_insert(self) -> None:
+        def handler(text: str, params: Any) -> List[Tuple[Any, ...]]:
+            probe = _probe_ok(text, params)
+            if probe is not None:
+                return probe
+            # RETURNING order is not input order
+            return [(3, 102), (1, 100), (2, 101)]
+
+        conn = _FakeConn(handler)
+        writer = RawImportWriter(conn)  # type: ignore[arg-type]
+        targets = [{} for _ in range(3)]
+
+        for idx, target in enumerate(targets):
+            writer.stage(row_number=idx + 1, payload={"n": idx}, status="inserted", target=target)
+        assert conn.queries("insert into") == []
+
+        assert writer.flush() == 3
+        inserts = conn.queries("insert into")
+        assert len(inserts) == 1
+        assert "with ordinality" in inserts[0][0]
+        assert [len(column) for column in inserts[0][1]] == [3, 3, 3]
+        assert [t["raw_import_id"] for t in targets] == [100, 101, 102]
+        assert writer.summary()["rows_written"] == 3
+
+    def test_flush_size_triggers_write(self) -> None:
+        def handler(text: str, params: Any) -> List[Tuple[Any, ...]]:
+            return _probe_ok(text, params) or [(1, 1), (2, 2)]
+
+        conn = _FakeConn(handler)
+        writer = RawImportWriter(conn, flush_size=2)  # type: ignore[arg-type]
+
+        writer.stage(row_number=1, payload={}, status="inserted")
+        writer.stage(row_number=2, payload={}, status="error", error="boom")
+
+        assert len(conn.queries("insert into")) == 1
+
+    def test_failed_batch_retried_row_by_row(self) -> None:
+        def handler(text: str, params: Any) -> List[Tuple[Any, ...]]:
+            probe = _probe_ok(text, params)
+            if probe is not None:
+                return probe
+            if "with ordinality" in text:
+                raise RuntimeError("invalid byte sequence")
+            if params[0].obj["row_number"] == 2:
+                raise RuntimeError("invalid byte sequence")
+            return [(params[0].obj["row_number"] * 10,)]
+
+        conn = _FakeConn(handler)
+        writer = RawImportWriter(conn)  # type: ignore[arg-type]
+        targets = [{} for _ in range(3)]
+        for idx, target in enumerate(targets):
+            writer.stage(row_number=idx + 1, payload={}, status="inserted", target=target)
+
+        assert writer.flush() == 2
+        assert targets[0] == {"raw_import_id": 10}
+        assert targets[1] == {"raw_import_error": "invalid byte sequence"}
+        assert targets[2] == {"raw_import_id": 30}
+        assert writer.summary()["failures"] == ["row 2: invalid byte sequence"]
+        assert conn.savepoints == 4
+
+
+class TestQueueJobManager:
+    def test_batch_enqueue_fills_metadata(self) -> None:
+        def handler(text: str, params: Any) -> List[Tuple[Any, ...]]:
+            probe = _probe_ok(text, params)
+            if probe is not None:
+                return probe
+            return [(500 + i,) for i in range(len(params[0]))]
+
+        conn = _FakeConn(handler)
+        manager = QueueJobManager(conn)  # type: ignore[arg-type]
+
+        jobs = [
+            manager.stage(kind="enrich", payload={"j": i}, idempotency_key=f"k{i}")
+            for i in range(3)
+        ]
+        assert all(job["status"] == "pending" for job in jobs)
+
+        assert manager.flush() == 3
+        assert len(conn.queries("unnest(")) == 1
+        assert [job["message_id"] for job in jobs] == [500, 501, 502]
+        assert all(job["status"] == "queued" for job in jobs)
+        assert manager.summary() == jobs
+
+    def test_failed_batch_falls_back_per_job(self) -> None:
+        def handler(text: str, params: Any) -> List[Tuple[Any, ...]]:
+            probe = _probe_ok(text, params)
+            if probe is not None:
+                return probe
+            if "unnest(" in text:
+                raise RuntimeError("unsupported kind")
+            if params[0].obj["kind"] == "bogus":
+                raise RuntimeError("queue_job: unsupported kind bogus")
+            return [(7,)]
+
+        conn = _FakeConn(handler)
+        manager = QueueJobManager(conn)  # type: ignore[arg-type]
+        good = manager.stage(kind="enrich", payload={}, idempotency_key="a")
+        bad = manager.stage(kind="bogus", payload={}, idempotency_key="b")
+
+        assert manager.flush() == 1
+        assert good == {
+            "kind": "enrich",
+            "idempotency_key": "a",
+            "status": "queued",
+            "message_id": 7,
+        }
+        assert bad["status"] == "error"
+        assert "bogus" in bad["error"]
+
+
+class TestFollowUpTaskWriter:
+    def test_existing_and_created_resolved_in_two_statements(self) -> None:
+        def handler(text: str, params: Any) -> List[Tuple[Any, ...]]:
+            if "from public.plaintiff_tasks" in text:
+                return [(P1, "task-1")]
+            if "insert into public.plaintiff_tasks" in text:
+                return [(P2, "task-2")]
+            return []
+
+        conn = _FakeConn(handler)
+        writer = FollowUpTaskWriter(conn, batch_name="b1", created_by="test")  # type: ignore[arg-type]
+        rows = [{} for _ in range(3)]
+
+        writer.stage(P1, target=rows[0])
+        writer.stage(P2, target=rows[1])
+        writer.stage(P2, target=rows[2])
+
+        assert writer.flush() == 1
+        assert len(conn.executed) == 2
+        insert_sql, insert_params = conn.queries("insert into")[0]
+        assert insert_params[0] == P2
+        assert [r["follow_up_task"] for r in rows] == [
+            {"id": "task-1", "created": False},
+            {"id": "task-2", "created": True},
+            {"id": "task-2", "created": False},
+        ]
+        assert writer.totals() == {"created": 1, "existing": 2}
+
+
+class TestEnforcementStageWriter:
+    def test_rpc_called_once_per_batch(self) -> None:
+        conn = _FakeConn(lambda text, params: [(None,)])
+        writer = EnforcementStageWriter(conn, actor="test")  # type: ignore[arg-type]
+        rows = [{}, {}]
+
+        writer.stage(1, target=rows[0])
+        writer.stage(2, target=rows[1])
+
+        assert writer.flush() == 2
+        rpc_calls = conn.queries("set_enforcement_stage")
+        assert len(rpc_calls) == 1
+        assert rpc_calls[0][1][-1] == ["1", "2"]
+        assert all(r["enforcement_stage_initialized"] for r in rows)
+
+    def test_missing_rpc_falls_back_to_bulk_update(self) -> None:
+        def handler(text: str, params: Any) -> List[Tuple[Any, ...]]:
+            if "set_enforcement_stage" in text:
+                raise psycopg.errors.UndefinedFunction("missing")
+            return [("1",)]
+
+        conn = _FakeConn(handler)
+        writer = EnforcementStageWriter(conn, actor="test")  # type: ignore[arg-type]
+        rows = [{}, {}]
+        writer.stage(1, target=rows[0])
+        writer.stage(2, target=rows[1])
+
+        assert writer.flush() == 1
+        assert len(conn.queries("update public.judgments")) == 1
+        assert [r["enforcement_stage_initialized"] for r in rows] == [True, False]
+
+
+class TestImportFlushGroup:
+    def _group(
+        self, handler: Handler, resolved: List[Tuple[Any, Optional[str]]], **kwargs: Any
+    ) -> Tuple[ImportFlushGroup, FollowUpTaskWriter, RawImportWriter, _FakeConn]:
+        conn = _FakeConn(handler)
+        tasks = FollowUpTaskWriter(conn, batch_name="b1", created_by="test")  # type: ignore[arg-type]
+        raw = RawImportWriter(conn)  # type: ignore[arg-type]
+
+        def resolve(operation: Dict[str, Any], context: Any, error: Optional[Exception]) -> None:
+            resolved.append((context, str(error) if error else None))
+            raw.stage(row_number=context, payload={}, status="inserted", target=operation)
+
+        group = ImportFlushGroup(
+            conn,  # type: ignore[arg-type]
+            tasks,
+            None,
+            resolve_row=resolve,
+            log_writer=raw,
+            **kwargs,
+        )
+        return group, tasks, raw, conn
+
+    def test_flushes_every_n_rows_then_logs(self) -> None:
+        def handler(text: str, params: Any) -> List[Tuple[Any, ...]]:
+            probe = _probe_ok(text, params)
+            if probe is not None:
+                return probe
+            if "from public.plaintiff_tasks" in text:
+                return []
+            if "insert into public.plaintiff_tasks" in text:
+                return [(P1, "task-1"), (P2, "task-2")]
+            return [(1, 100), (2, 101)]
+
+        resolved: List[Tuple[Any, Optional[str]]] = []
+        group, tasks, _, conn = self._group(handler, resolved, flush_rows=2)
+        rows: List[Dict[str, Any]] = [{}, {}]
+
+        tasks.stage(P1, target=rows[0])
+        group.row_done(rows[0], 1)
+        assert conn.queries("insert into") == []
+        tasks.stage(P2, target=rows[1])
+        group.row_done(rows[1], 2)
+
+        assert resolved == [(1, None), (2, None)]
+        assert [r["follow_up_task"]["id"] for r in rows] == ["task-1", "task-2"]
+        assert [r["raw_import_id"] for r in rows] == [100, 101]
+        # Side effects are written before the raw rows that report them
+        assert "plaintiff_tasks" in conn.queries("insert into")[0][0]
+
+    def test_failed_batch_replayed_row_by_row(self) -> None:
+        def handler(text: str, params: Any) -> List[Tuple[Any, ...]]:
+            probe = _probe_ok(text, params)
+            if probe is not None:
+                return probe
+            if "from public.plaintiff_tasks" in text:
+                return []
+            if "insert into public.plaintiff_tasks" in text:
+                if P2 in params:
+                    raise RuntimeError("plaintiff_tasks_plaintiff_id_fkey")
+                return [(P1, "task-1")]
+            return [(1, 100), (2, 101)]
+
+        resolved: List[Tuple[Any, Optional[str]]] = []
+        group, tasks, _, conn = self._group(handler, resolved)
+        rows: List[Dict[str, Any]] = [{}, {}]
+        for idx, pid in enumerate((P1, P2)):
+            tasks.stage(pid, target=rows[idx])
+            group.row_done(rows[idx], idx + 1)
+
+        group.flush()
+
+        assert resolved == [(1, None), (2, "plaintiff_tasks_plaintiff_id_fkey")]
+        assert rows[0]["follow_up_task"] == {"id": "task-1", "created": True}
+        assert "follow_up_task" not in rows[1]
+        assert tasks.totals() == {"created": 1, "existing": 0}
+        # One savepoint for the batch, one per replayed row, one for the raw rows
+        assert conn.savepoints == 4
+
+    def test_discard_fails_rows_without_writing(self) -> None:
+        conn = _FakeConn(lambda text, params: _probe_ok(text, params) or [])
+        manager = QueueJobManager(conn)  # type: ignore[arg-type]
+        resolved: List[Tuple[Any, Optional[str]]] = []
+        group = ImportFlushGroup(
+            conn,  # type: ignore[arg-type]
+            manager,
+            resolve_row=lambda operation, context, error: resolved.append((context, str(error))),
+        )
+
+        job = manager.stage(kind="enrich", payload={}, idempotency_key="a")
+        group.row_done({}, 1)
+        group.discard("import aborted")
+
+        assert resolved == [(1, "import aborted")]
+        assert job["status"] == "error"
+        assert conn.queries("queue_job(") == []
+
+
+@pytest.mark.parametrize("flush_size", [0, -5])
+def test_flush_size_floor(flush_size: int) -> None:
+    conn = _FakeConn(lambda text, params: [(1,)])
+    writer = RawImportWriter(conn, flush_size=flush_size)  # type: ignore[arg-type]
+    assert writer.flush_size == 1
@@ -0,0 +1,126 @@
+"""
+Tests for the intake executor.
+
+Verifies:
+- Chunks parse in a worker process and stream back in file order
+- Validation failures are captured per row, not raised
+- Breaking out of the stream cancels the parser
+- Slot and queue metrics are reported
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from backend.services.intake_executor import IntakeExecutor, parse_chunk
+
+
+def _write_csv(path: Path, rows: int, bad_every: int = 0) -> Path:
+    lines = ["CaseNo,Plaintiff,Defendant,JudgmentAmount,JudgmentDate"]
+    for i in range(rows):
+        defendant = "" if bad_every and i % bad_every == 0 else f"Debtor {i}"
+        lines.append(f"CASE-{i:04d},Acme Corp,{defendant},{i}.50,2024-01-15")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def executor():
+    ex = IntakeExecutor(max_workers=1, max_active_files=1, queue_maxsize=2)
+    yield ex
+    ex.shutdown()
+
+
+class TestParseChunk:
+    """parse_chunk runs inside the worker; test it directly too."""
+
+    def test_normalizes_rows_with_global_indices(self) -> None:
+        df = pd.DataFrame(
+            [{"CaseNo": "A-1", "Plaintiff": "Acme", "Defendant": "Doe", "Amount": "$1,200.00"}]
+        )
+        chunk = parse_chunk(df, chunk_index=3, start_index=1500, source="simplicity")
+
+        assert chunk.chunk_index == 3
+        assert chunk.rows[0].row_index == 1500
+        assert chunk.rows[0].normalized["case_number"] == "A-1"
+        assert chunk.rows[0].normalized["judgment_amount"] == Decimal("1200.00")
+
+    def test_validation_error_captured(self) -> None:
+        df = pd.DataFrame([{"CaseNo": "A-1", "Plaintiff": "Acme", "Defendant": None}])
+        chunk = parse_chunk(df, chunk_index=0, start_index=0, source="simplicity")
+
+        assert chunk.rows[0].normalized is None
+        assert "defendant_name" in chunk.rows[0].error
+
+    def test_unknown_source_is_row_level_error(self) -> None:
+        df = pd.DataFrame([{"CaseNo": "A-1", "Plaintiff": "Acme", "Defendant": "Doe"}])
+        chunk = parse_chunk(df, chunk_index=0, start_index=0, source="jbi")
+
+        assert "Unknown source" in chunk.rows[0].error
+
+    def test_unexpected_error_is_row_level(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from backend.services import intake_executor
+
+        def normalize(record, mapping):
+            if "bad" in record.values():
+                raise TypeError("unsupported cell value")
+            return {"case_number": next(iter(record.values()))}
+
+        monkeypatch.setattr(intake_executor, "normalize_row", normalize)
+        df = pd.DataFrame([{"CaseNo": "bad"}, {"CaseNo": "A-2"}])
+        chunk = parse_chunk(df, chunk_index=0, start_index=0, source="simplicity")
+
+        assert chunk.rows[0].error_code == "DB_ERROR"
+        assert "unsupported cell value" in chunk.rows[0].error
+        assert chunk.rows[1].normalized == {"case_number": "A-2"}
+
+
+@pytest.mark.slow
+class TestStreamChunks:
+    """End-to-end streaming through a real process pool."""
+
+    @pytest.mark.timeout(60)
+    async def test_streams_all_rows_in_order(self, tmp_path: Path, executor) -> None:
+        csv_path = _write_csv(tmp_path / "upload.csv", rows=25, bad_every=10)
+
+        rows = []
+        async with executor.slot():
+            async for chunk in executor.stream_chunks(csv_path, source="simplicity", chunk_size=10):
+                rows.extend(chunk.rows)
+
+        assert [r.row_index for r in rows] == list(range(25))
+        assert [r.row_index for r in rows if r.error] == [0, 10, 20]
+
+        metrics = executor.metrics()
+        assert metrics["chunks_streamed"] == 3
+        assert metrics["rows_streamed"] == 25
+        assert metrics["active_files"] == 0
+        assert metrics["queued_chunks"] == 0
+        assert metrics["max_queue_depth"] <= executor.queue_maxsize
+
+    @pytest.mark.timeout(60)
+    async def test_early_exit_cancels_parser(self, tmp_path: Path, executor) -> None:
+        csv_path = _write_csv(tmp_path / "upload.csv", rows=200)
+
+        stream = executor.stream_chunks(csv_path, source="simplicity", chunk_size=5)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        # The single worker must be free again for the next file
+        rows = []
+        async for chunk in executor.stream_chunks(csv_path, source="simplicity", chunk_size=100):
+            rows.extend(chunk.rows)
+        assert len(rows) == 200
+
+    @pytest.mark.timeout(60)
+    async def test_parse_failure_is_raised(self, tmp_path: Path, executor) -> None:
+        with pytest.raises(FileNotFoundError):
+            async for _ in executor.stream_chunks(tmp_path / "missing.csv", source="simplicity"):
+                pass
+
+        assert executor.metrics()["parse_failures"] == 1
@@ -257,7 +257,7 @@ class TestHandleJudgmentEnrich:
 
     async def test_successful_enrichment(self, fake_client, monkeypatch):
         """Test successful enrichment flow using complete_enrichment RPC."""
-        monkeypatch.setattr(judgment_enrich_handler, "create_supabase_client", lambda: fake_client)
+        monkeypatch.setattr(judgment_enrich_handler, "get_supabase_client", lambda: fake_client)
         monkeypatch.setattr(judgment_enrich_handler, "_get_vendor", MockIdiCORE)
 
         job = {
@@ -284,7 +284,7 @@ class TestHandleJudgmentEnrich:
 
     async def test_skips_already_enriched(self, fake_client, monkeypatch):
         """Test that already-enriched judgments are skipped."""
-        monkeypatch.setattr(judgment_enrich_handler, "create_supabase_client", lambda: fake_client)
+        monkeypatch.setattr(judgment_enrich_handler, "get_supabase_client", lambda: fake_client)
         monkeypatch.setattr(judgment_enrich_handler, "_get_vendor", MockIdiCORE)
 
         job = {
@@ -308,7 +308,7 @@ class TestHandleJudgmentEnrich:
         This test simulates what happens when a job is retried or duplicated.
         The handler should check for existing debtor_intelligence and skip if present.
         """
-        monkeypatch.setattr(judgment_enrich_handler, "create_supabase_client", lambda: fake_client)
+        monkeypatch.setattr(judgment_enrich_handler, "get_supabase_client", lambda: fake_client)
         monkeypatch.setattr(judgment_enrich_handler, "_get_vendor", MockIdiCORE)
 
         # already-enriched-456 returns existing debtor_intelligence in FakeTable
@@ -336,7 +336,7 @@ class TestHandleJudgmentEnrich:
         First call succeeds normally. Second call should detect existing data and skip.
         """
         # We need a client that can track state changes
-        monkeypatch.setattr(judgment_enrich_handler, "create_supabase_client", lambda: fake_client)
+        monkeypatch.setattr(judgment_enrich_handler, "get_supabase_client", lambda: fake_client)
         monkeypatch.setattr(judgment_enrich_handler, "_get_vendor", MockIdiCORE)
 
         # already-enriched-456 simulates a judgment that has already been enriched
@@ -357,7 +357,7 @@ class TestHandleJudgmentEnrich:
 
     async def test_handles_not_found_judgment(self, fake_client, monkeypatch):
         """Test handling of non-existent judgment."""
-        monkeypatch.setattr(judgment_enrich_handler, "create_supabase_client", lambda: fake_client)
+        monkeypatch.setattr(judgment_enrich_handler, "get_supabase_client", lambda: fake_client)
         monkeypatch.setattr(judgment_enrich_handler, "_get_vendor", MockIdiCORE)
 
         job = {
@@ -375,7 +375,7 @@ class TestHandleJudgmentEnrich:
 
     async def test_handles_missing_judgment_id(self, fake_client, monkeypatch):
         """Test handling of missing judgment_id in payload."""
-        monkeypatch.setattr(judgment_enrich_handler, "create_supabase_client", lambda: fake_client)
+        monkeypatch.setattr(judgment_enrich_handler, "get_supabase_client", lambda: fake_client)
 
         job = {
             "msg_id": 4,
@@ -388,7 +388,7 @@ class TestHandleJudgmentEnrich:
 
     async def test_ignores_doctor_healthcheck(self, fake_client, monkeypatch, caplog):
         """Test that doctor healthcheck jobs are ignored."""
-        monkeypatch.setattr(judgment_enrich_handler, "create_supabase_client", lambda: fake_client)
+        monkeypatch.setattr(judgment_enrich_handler, "get_supabase_client", lambda: fake_client)
 
         job = {
             "msg_id": 5,
@@ -410,9 +410,7 @@ class TestHandleJudgmentEnrich:
         """Test that RPC errors log FCRA failure and propagate the exception."""
         # Create client that will fail on complete_enrichment RPC
         failing_client = FakeSupabaseClient(raise_on_rpc="complete_enrichment")
-        monkeypatch.setattr(
-            judgment_enrich_handler, "create_supabase_client", lambda: failing_client
-        )
+        monkeypatch.setattr(judgment_enrich_handler, "get_supabase_client", lambda: failing_client)
         monkeypatch.setattr(judgment_enrich_handler, "_get_vendor", MockIdiCORE)
 
         job = {
@@ -431,9 +429,7 @@ class TestHandleJudgmentEnrich:
         """Test that RPC error does not cause partial writes."""
         # Create client that will fail on complete_enrichment RPC
         failing_client = FakeSupabaseClient(raise_on_rpc="complete_enrichment")
-        monkeypatch.setattr(
-            judgment_enrich_handler, "create_supabase_client", lambda: failing_client
-        )
+        monkeypatch.setattr(judgment_enrich_handler, "get_supabase_client", lambda: failing_client)
         monkeypatch.setattr(judgment_enrich_handler, "_get_vendor", MockIdiCORE)
 
         job = {
@@ -0,0 +1,181 @@
+"""
+Tests for the judgment_ingestor watcher.
+
+Verifies:
+- Files are parsed in chunks matching a full read, and only after the hash
+  check, so duplicates are never parsed
+- Large files are streamed to the chunked uploader rather than listed
+- Partially written files are held back until they settle
+- Ready files are processed concurrently under the worker limit
+- Manifest records are appended whole from concurrent workers
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+import judgment_ingestor.main as ingestor
+from src.db_upload_safe import chunked
+
+CSV_BODY = 'case_number,judgment_amount,filing_date\nA-1,"$1,200.50",2024-01-02\nA-2,300,\n,5,\n'
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingestor, "DATA_IN_DIR", tmp_path / "in")
+    monkeypatch.setattr(ingestor, "DATA_PROCESSED_DIR", tmp_path / "processed")
+    monkeypatch.setattr(ingestor, "DATA_ERROR_DIR", tmp_path / "error")
+    monkeypatch.setattr(ingestor, "STATE_DIR", tmp_path / "state")
+    monkeypatch.setattr(ingestor, "MANIFEST_PATH", tmp_path / "state" / "manifest.jsonl")
+    monkeypatch.setattr(ingestor, "PROCESSED_HASHES", set())
+    monkeypatch.setattr(ingestor, "_MANIFEST_LOADED", False)
+    monkeypatch.setattr(ingestor, "READ_CHUNK_ROWS", 1)
+    (tmp_path / "in").mkdir()
+    return tmp_path
+
+
+def _write_csv(directory: Path, name: str, body: str = CSV_BODY) -> Path:
+    path = directory / name
+    path.write_text(body, encoding="utf-8")
+    return path
+
+
+class TestStreamingRead:
+    def test_chunked_read_matches_full_read(self, dirs) -> None:
+        path = _write_csv(dirs / "in", "a.csv")
+
+        records = ingestor._iter_records(path)
+
+        assert not isinstance(records, list)
+        records = list(records)
+        assert [r["case_number"] for r in records] == ["A-1", "A-2"]
+        assert records[0]["judgment_amount"] == "1200.50"
+
+
+class TestSettleTracker:
+    def test_file_ready_only_after_stable(self, tmp_path) -> None:
+        now = [0.0]
+        tracker = ingestor._SettleTracker(2.0, clock=lambda: now[0])
+        path = _write_csv(tmp_path, "drop.csv", "case_number\n")
+
+        assert tracker.ready([path]) == []
+        now[0] = 1.0
+        with path.open("a") as handle:
+            handle.write("A-1\n")
+        assert tracker.ready([path]) == []
+        now[0] = 2.5
+        assert tracker.ready([path]) == []
+        now[0] = 3.1
+        assert tracker.ready([path]) == [path]
+
+    def test_vanished_files_dropped(self, tmp_path) -> None:
+        tracker = ingestor._SettleTracker(0.0)
+        path = _write_csv(tmp_path, "gone.csv")
+        assert tracker.ready([path]) == [path]
+        path.unlink()
+        assert tracker.ready([path]) == []
+
+
+class TestConcurrency:
+    def test_batch_runs_files_in_parallel(self, monkeypatch) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_process(path, *, dry_run=False):
+            barrier.wait()
+            return 1 if path.name == "bad.csv" else 0
+
+        monkeypatch.setattr(ingestor, "process_file", fake_process)
+        paths = [Path("a.csv"), Path("bad.csv"), Path("c.csv")]
+
+        assert ingestor._process_batch(paths, dry_run=False, workers=3) == 1
+
+    def test_manifest_lines_never_interleave(self, dirs) -> None:
+        threads = [
+            threading.Thread(target=ingestor._append_manifest, args=(f"{i:064x}", f"f{i}.csv"))
+            for i in range(40)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        lines = ingestor.MANIFEST_PATH.read_text().splitlines()
+        assert len(lines) == 40
+        assert {json.loads(line)["filename"] for line in lines} == {f"f{i}.csv" for i in range(40)}
+        assert len(ingestor.PROCESSED_HASHES) == 40
+
+
+class TestProcessFile:
+    @pytest.fixture
+    def uploads(self, monkeypatch):
+        calls = []
+
+        def fake_upsert(records):
+            calls.append(records)
+            return len(records), [], 201
+
+        monkeypatch.setattr(ingestor, "upsert_public_judgments", fake_upsert)
+        monkeypatch.setattr(ingestor, "log_run_start", lambda *a, **k: None)
+        monkeypatch.setattr(ingestor, "log_run_ok", lambda *a, **k: None)
+        monkeypatch.setattr(ingestor, "log_run_error", lambda *a, **k: None)
+        return calls
+
+    def test_uploads_then_skips_duplicate(self, dirs, uploads) -> None:
+        first = _write_csv(dirs / "in", "first.csv")
+        assert ingestor.process_file(first) == 0
+        second = _write_csv(dirs / "in", "second.csv")
+        assert ingestor.process_file(second) == 0
+
+        assert len(uploads) == 1
+        assert len(uploads[0]) == 2
+        assert sorted(p.name for p in (dirs / "processed").iterdir()) == [
+            "first.csv",
+            "second.csv",
+        ]
+        manifest = ingestor.MANIFEST_PATH.read_text().splitlines()
+        assert len(manifest) == 1
+
+    def test_duplicate_is_not_parsed(self, dirs, uploads, monkeypatch) -> None:
+        first = _write_csv(dirs / "in", "first.csv")
+        assert ingestor.process_file(first) == 0
+
+        def fail_parse(path):
+            raise AssertionError("duplicate file was parsed")
+
+        monkeypatch.setattr(ingestor, "_iter_records", fail_parse)
+        second = _write_csv(dirs / "in", "second.csv")
+        assert ingestor.process_file(second) == 0
+        assert len(uploads) == 1
+
+    def test_large_file_streamed_in_chunks(self, dirs, uploads, monkeypatch) -> None:
+        chunks = []
+
+        def fake_chunked(rows, *, chunk_size):
+            assert not isinstance(rows, list)
+            for chunk in chunked(rows, chunk_size):
+                chunks.append([r["case_number"] for r in chunk])
+            return 2, [], 201
+
+        monkeypatch.setattr(ingestor, "UPLOAD_CHUNK_ROWS", 1)
+        monkeypatch.setattr(ingestor, "upsert_public_judgments_chunked", fake_chunked)
+        path = _write_csv(dirs / "in", "big.csv")
+
+        assert ingestor.process_file(path) == 0
+        assert chunks == [["A-1"], ["A-2"]]
+        assert uploads == []
+
+    def test_in_flight_duplicate_left_for_next_scan(self, dirs, uploads) -> None:
+        path = _write_csv(dirs / "in", "dup.csv")
+        digest = ingestor.compute_sha256(path)
+        assert ingestor._claim_hash(digest)
+        try:
+            assert ingestor.process_file(path) == 0
+        finally:
+            ingestor._release_hash(digest)
+
+        assert path.exists()
+        assert uploads == []
@@ -0,0 +1,136 @@
+"""
+Tests for backend/middleware/pipeline.py - consolidated request pipeline.
+
+Verifies:
+- Request/trace IDs are echoed or generated and version headers are added
+- Rate limiting answers 429 after the configured allowance
+- 5xx responses and unhandled exceptions are counted in metrics
+- Log records emitted during a request carry its trace ID
+- Streaming responses pass through unbuffered
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.core import metrics
+from backend.core.middleware import RateLimitConfig
+from backend.core.trace_middleware import TraceContextFilter
+from backend.middleware.pipeline import RequestPipelineMiddleware, SlidingWindowRateLimiter
+
+app_logger = logging.getLogger("tests.pipeline")
+
+
+def _build_app(**kwargs) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestPipelineMiddleware, **kwargs)
+
+    @app.get("/ok")
+    def ok():
+        app_logger.info("handling /ok")
+        return {"status": "ok"}
+
+    @app.get("/fail")
+    def fail():
+        return JSONResponse(status_code=503, content={"error": "down"})
+
+    @app.get("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+    return app
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset_for_testing()
+    yield
+    metrics.reset_for_testing()
+
+
+class TestHeaders:
+    def test_generates_ids_and_version_headers(self) -> None:
+        response = TestClient(_build_app()).get("/ok")
+
+        assert response.status_code == 200
+        uuid.UUID(response.headers["X-Request-ID"])
+        uuid.UUID(response.headers["X-Trace-ID"])
+        assert response.headers["X-Response-Time"].endswith("ms")
+        for name in ("X-Dragonfly-SHA", "X-Dragonfly-SHA-Short", "X-Dragonfly-Env"):
+            assert response.headers[name]
+
+    def test_echoes_client_ids(self) -> None:
+        response = TestClient(_build_app()).get(
+            "/ok", headers={"X-Request-ID": "req-123", "X-Trace-ID": "trace-456"}
+        )
+
+        assert response.headers["X-Request-ID"] == "req-123"
+        assert response.headers["X-Trace-ID"] == "trace-456"
+
+    def test_streaming_passthrough(self) -> None:
+        response = TestClient(_build_app()).get("/stream")
+
+        assert response.text == "abc"
+        assert "X-Request-ID" in response.headers
+
+
+class TestRateLimit:
+    def test_limits_after_allowance(self) -> None:
+        limits = [RateLimitConfig("/ok", requests_per_minute=2)]
+        client = TestClient(_build_app(rate_limits=limits))
+
+        first = client.get("/ok")
+        assert first.headers["X-RateLimit-Remaining"] == "1"
+        client.get("/ok")
+        limited = client.get("/ok")
+
+        assert limited.status_code == 429
+        assert limited.json()["error"] == "rate_limit_exceeded"
+        assert limited.headers["Retry-After"] == "60"
+        assert limited.headers["X-RateLimit-Remaining"] == "0"
+        assert "X-Request-ID" in limited.headers
+        # Other paths are not limited
+        assert client.get("/stream").status_code == 200
+
+    def test_windows_are_per_client(self) -> None:
+        limiter = SlidingWindowRateLimiter([RateLimitConfig("/api", requests_per_minute=1)])
+        config = limiter.find_config("/api/x")
+
+        assert config is not None
+        assert limiter.hit(config, "1.1.1.1") == 0
+        assert limiter.hit(config, "1.1.1.1") is None
+        assert limiter.hit(config, "2.2.2.2") == 0
+        assert limiter.find_config("/other") is None
+
+
+class TestMetrics:
+    def test_counts_requests_and_errors(self) -> None:
+        client = TestClient(_build_app(), raise_server_exceptions=False)
+
+        client.get("/ok")
+        client.get("/fail")
+        assert client.get("/boom").status_code == 500
+
+        counts = metrics.get_counts()
+        assert counts["requests"] == 3
+        assert counts["errors"] == 2
+
+
+class TestTraceLogging:
+    def test_records_carry_trace_id(self, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.handler.addFilter(TraceContextFilter())
+        with caplog.at_level(logging.INFO, logger="tests.pipeline"):
+            TestClient(_build_app()).get("/ok", headers={"X-Trace-ID": "trace-789"})
+
+        records = [r for r in caplog.records if r.name == "tests.pipeline"]
+        assert records and records[0].trace_id == "trace-789"
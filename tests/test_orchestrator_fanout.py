@@ -0,0 +1,226 @@
+"""
+Tests for the Golden Path orchestrator's set-based fan-out and stage counters.
+
+Verifies:
+- A stage fans out with one INSERT ... SELECT instead of one insert per row
+- Stage completion reads the counter row, with a job_queue fallback
+- 'upserting' batches are mapped to the stage their counters show
+- Only batches the orchestrator took over are advanced
+- A finished stage advances straight into the next fan-out
+- The loop wakes on stage-done notifications
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import pytest
+
+import backend.workers.orchestrator as orch
+from backend.config.job_types import JobType, PipelineStage
+
+BATCH = UUID("aaaaaaaa-0000-0000-0000-000000000001")
+
+Handler = Callable[[str, Any], List[Dict[str, Any]]]
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConn") -> None:
+        self.conn = conn
+        self._rows: List[Dict[str, Any]] = []
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute(self, query: str, params: Any = None) -> None:
+        self.conn.executed.append((query, params))
+        self._rows = self.conn.handler(query, params)
+
+    def fetchone(self) -> Optional[Dict[str, Any]]:
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self) -> List[Dict[str, Any]]:
+        return list(self._rows)
+
+
+class _FakeConn:
+    def __init__(self, handler: Handler) -> None:
+        self.handler = handler
+        self.executed: List[Tuple[str, Any]] = []
+
+    def cursor(self, **_: Any) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def queries(self, fragment: str) -> List[Tuple[str, Any]]:
+        return [(q, p) for q, p in self.executed if fragment in q]
+
+
+def _counter(job_type: str, total: int, pending: int, completed: int, failed: int = 0):
+    return {
+        "job_type": job_type,
+        "jobs_total": total,
+        "jobs_pending": pending,
+        "jobs_completed": completed,
+        "jobs_failed": failed,
+    }
+
+
+def _orchestration(stage: PipelineStage) -> orch.BatchOrchestration:
+    return orch.BatchOrchestration(
+        id=BATCH,
+        batch_id=BATCH,
+        stage=stage,
+        jobs_total=0,
+        jobs_completed=0,
+        jobs_failed=0,
+        started_at=None,
+        completed_at=None,
+        error_message=None,
+    )
+
+
+class TestFanOut:
+    def test_single_statement_returns_stage_size(self) -> None:
+        conn = _FakeConn(lambda q, p: [{"total": 120, "inserted": 20}])
+
+        total = orch.fan_out_stage_jobs(
+            conn, BATCH, JobType.ENTITY_RESOLVE, include_data=True, correlation_id=BATCH
+        )
+
+        assert total == 120
+        assert len(conn.executed) == 1
+        sql, params = conn.executed[0]
+        assert "INSERT INTO ops.job_queue" in sql and "FROM src" in sql
+        assert params["dedup_prefix"] == f"entity_resolve-{BATCH}-"
+        assert params["include_data"] is True
+        assert params["correlation_id"] == str(BATCH)
+
+    def test_judgment_create_payload_omits_data(self) -> None:
+        conn = _FakeConn(lambda q, p: [{"total": 3, "inserted": 3}])
+
+        orch.fan_out_stage_jobs(conn, BATCH, JobType.JUDGMENT_CREATE)
+
+        params = conn.executed[0][1]
+        assert params["include_data"] is False
+        assert params["correlation_id"] is None
+
+
+class TestStageCompletion:
+    def test_reads_counters(self) -> None:
+        conn = _FakeConn(lambda q, p: [_counter("entity_resolve", 10, 0, 9, 1)])
+
+        result = orch.check_stage_completion(
+            conn, _orchestration(PipelineStage.ENTITY_RESOLVING), JobType.ENTITY_RESOLVE
+        )
+
+        assert result == (True, 10, 9, 1)
+        assert conn.queries("ops.job_queue") == []
+
+    def test_falls_back_to_job_queue_without_counters(self) -> None:
+        def handler(sql: str, params: Any) -> List[Dict[str, Any]]:
+            if "orchestration_stage_counters" in sql:
+                return []
+            return [{"status": "completed", "count": 4}, {"status": "processing", "count": 1}]
+
+        conn = _FakeConn(handler)
+
+        result = orch.check_stage_completion(
+            conn, _orchestration(PipelineStage.ENTITY_RESOLVING), JobType.ENTITY_RESOLVE
+        )
+
+        assert result == (False, 5, 4, 0)
+
+
+class TestStageMapping:
+    @pytest.mark.parametrize(
+        ("counters", "expected"),
+        [
+            ([], PipelineStage.VALIDATED),
+            ([_counter("entity_resolve", 5, 2, 3)], PipelineStage.ENTITY_RESOLVING),
+            ([_counter("judgment_create", 5, 5, 0)], PipelineStage.JUDGMENT_CREATING),
+        ],
+    )
+    def test_upserting_batch_uses_latest_counters(self, counters, expected) -> None:
+        def handler(sql: str, params: Any) -> List[Dict[str, Any]]:
+            if "FROM intake.simplicity_batches" in sql:
+                return [{"id": str(BATCH), "status": "upserting", "row_count_valid": 5}]
+            return counters
+
+        orchestration = orch.get_orchestration_by_batch(_FakeConn(handler), BATCH)
+
+        assert orchestration is not None
+        assert orchestration.stage == expected
+
+
+class TestOwnership:
+    def test_taking_a_batch_stamps_ownership(self) -> None:
+        conn = _FakeConn(lambda q, p: [])
+
+        orch.create_orchestration_record(conn, BATCH)
+
+        sql, params = conn.executed[0]
+        assert "orchestrated_at = now()" in sql
+        assert params == (str(BATCH),)
+
+    def test_advance_skips_unowned_and_uncounted_batches(self) -> None:
+        conn = _FakeConn(lambda q, p: [])
+
+        orch.find_batches_ready_to_advance(conn, limit=3)
+
+        sql = conn.executed[0][0]
+        assert "b.orchestrated_at IS NOT NULL" in sql
+        assert "LEFT JOIN" not in sql
+        assert "IS NULL" not in sql
+
+
+class TestDriveBatch:
+    def test_finished_stage_fans_out_next_immediately(self) -> None:
+        def handler(sql: str, params: Any) -> List[Dict[str, Any]]:
+            if "orchestration_stage_counters" in sql:
+                if params[1] == "entity_resolve":
+                    return [_counter("entity_resolve", 5, 0, 5)]
+                return [_counter("judgment_create", 5, 5, 0)]
+            if "WITH src AS" in sql:
+                return [{"total": 5, "inserted": 5}]
+            return []
+
+        conn = _FakeConn(handler)
+        orchestration = _orchestration(PipelineStage.ENTITY_RESOLVING)
+
+        assert orch.drive_batch(conn, orchestration) is True
+
+        assert orchestration.stage == PipelineStage.JUDGMENT_CREATING
+        fan_outs = conn.queries("WITH src AS")
+        assert len(fan_outs) == 1
+        assert fan_outs[0][1]["job_type"] == "judgment_create"
+
+    def test_stops_while_jobs_pending(self) -> None:
+        conn = _FakeConn(lambda q, p: [_counter("entity_resolve", 5, 2, 3)])
+        orchestration = _orchestration(PipelineStage.ENTITY_RESOLVING)
+
+        assert orch.drive_batch(conn, orchestration) is False
+        assert orchestration.stage == PipelineStage.ENTITY_RESOLVING
+
+
+class TestWaitForStageDone:
+    def test_notification_wakes_loop(self) -> None:
+        class _Notify:
+            payload = '{"batch_id": "x", "job_type": "entity_resolve"}'
+
+        class _ListenConn:
+            def notifies(self, timeout: float, stop_after: int):
+                assert stop_after == 1
+                yield _Notify()
+
+        assert orch.wait_for_stage_done(_ListenConn(), 0.01) is True
+
+    def test_without_listener_sleeps(self, monkeypatch) -> None:
+        slept: List[float] = []
+        monkeypatch.setattr(orch.time, "sleep", slept.append)
+
+        assert orch.wait_for_stage_done(None, 2.5) is False
+        assert slept == [2.5]
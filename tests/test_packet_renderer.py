@@ -0,0 +1,207 @@
+"""
+Tests for the packet render engine and batch packet generation.
+
+Verifies:
+- Templates are parsed once and re-parsed when the file's mtime changes
+- Rendering produces .docx bytes in memory, with per-render context
+- generate_packets() loads contexts in one query and bounds concurrency
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import shutil
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from docx import Document
+
+from backend.services import packet_service
+from backend.services.packet_renderer import PacketRenderer, TemplateCache, render_docx
+
+TEMPLATE = (
+    Path(__file__).parent.parent / "backend" / "assets" / "templates" / "income_execution_ny.docx"
+)
+
+CONTEXT = {
+    "case_number": "CV-2026-0042",
+    "plaintiff_name": "Acme Funding",
+    "defendant_name": "Jane Debtor",
+    "judgment_amount_formatted": "$1,000.00",
+    "judgment_date_formatted": "01/15/2026",
+}
+
+
+def _text(data: bytes) -> str:
+    return "\n".join(p.text for p in Document(io.BytesIO(data)).paragraphs)
+
+
+@pytest.fixture
+def template_copy(tmp_path: Path) -> str:
+    if not TEMPLATE.exists():
+        pytest.skip("income_execution_ny.docx template not available")
+    dest = tmp_path / "income_execution_ny.docx"
+    shutil.copyfile(TEMPLATE, dest)
+    return str(dest)
+
+
+class TestTemplateCache:
+    def test_parses_once_until_mtime_changes(self, template_copy: str) -> None:
+        cache = TemplateCache()
+        first = cache.get(template_copy)
+        assert cache.get(template_copy) is first
+
+        stat = os.stat(template_copy)
+        os.utime(template_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert cache.get(template_copy) is not first
+        assert len(cache) == 1
+
+
+class TestRenderDocx:
+    def test_renders_each_context_from_pristine_template(self, template_copy: str) -> None:
+        first = render_docx(template_copy, CONTEXT)
+        second = render_docx(template_copy, {**CONTEXT, "case_number": "CV-2026-0099"})
+
+        assert first[:2] == b"PK"
+        assert "CV-2026-0042" in _text(first)
+        assert "CV-2026-0099" in _text(second)
+        assert "CV-2026-0042" not in _text(second)
+
+    async def test_renderer_without_workers_uses_thread(self, template_copy: str) -> None:
+        renderer = PacketRenderer(max_workers=0)
+        data = await renderer.render(template_copy, CONTEXT)
+
+        assert "Jane Debtor" in _text(data)
+        assert renderer.metrics() == {"workers": 0, "started": False, "rendered": 1, "failed": 0}
+
+
+# =============================================================================
+# generate_packets
+# =============================================================================
+
+
+def _row(judgment_id: int) -> tuple:
+    return (
+        judgment_id,
+        f"CV-{judgment_id}",
+        "Plaintiff",
+        "Defendant",
+        Decimal("1000"),
+        date(2026, 1, 15),
+        "",
+        "",
+        "",
+        "Active",
+        "",
+    )
+
+
+class _FakeCursor:
+    def __init__(self, db: "_FakeDB") -> None:
+        self.db = db
+
+    async def __aenter__(self) -> "_FakeCursor":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, sql: str, params: Any) -> None:
+        self.db.queries.append((sql, params))
+
+    async def fetchall(self) -> list[tuple]:
+        return [_row(judgment_id) for judgment_id in self.db.existing]
+
+
+class _FakeConn:
+    def __init__(self, db: "_FakeDB") -> None:
+        self.db = db
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self.db)
+
+
+class _FakeDB:
+    def __init__(self, existing: list[int]) -> None:
+        self.existing = existing
+        self.queries: list[tuple[str, Any]] = []
+
+    @asynccontextmanager
+    async def connection(self):
+        yield _FakeConn(self)
+
+
+class _SlowRenderer:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def render(self, template_path: Any, context: dict[str, Any]) -> bytes:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return context["case_number"].encode()
+
+
+class TestGeneratePackets:
+    async def test_batch_loads_once_and_bounds_concurrency(self, tmp_path: Path) -> None:
+        (tmp_path / "income_execution_ny.docx").touch()
+        db = _FakeDB(existing=[1, 2, 3, 4, 5])
+        renderer = _SlowRenderer()
+        uploads: list[tuple[str, bytes]] = []
+
+        def _upload(bucket: str, path: str, data: bytes) -> str:
+            uploads.append((path, data))
+            return f"https://storage.example.com/{path}"
+
+        with (
+            patch.object(packet_service, "TEMPLATES_DIR", tmp_path),
+            patch.object(packet_service, "get_pool", AsyncMock(return_value=db)),
+            patch.object(packet_service, "get_packet_renderer", return_value=renderer),
+            patch.object(packet_service, "_upload_packet", _upload),
+            patch.object(packet_service, "_emit_event_best_effort", MagicMock()),
+        ):
+            results = await packet_service.generate_packets(
+                [1, 2, 3, 2, 4, 5, 99], "income_execution_ny", concurrency=2
+            )
+
+        assert len(db.queries) == 1
+        assert db.queries[0][1] == ([1, 2, 3, 4, 5, 99],)
+        assert [r.judgment_id for r in results] == [1, 2, 3, 4, 5, 99]
+        assert [r.ok for r in results] == [True] * 5 + [False]
+        assert results[-1].error == "Judgment 99 not found"
+        assert renderer.peak == 2
+        assert sorted(data for _, data in uploads) == [b"CV-1", b"CV-2", b"CV-3", b"CV-4", b"CV-5"]
+
+    async def test_upload_failure_is_per_judgment(self, tmp_path: Path) -> None:
+        (tmp_path / "income_execution_ny.docx").touch()
+        db = _FakeDB(existing=[1, 2])
+
+        def _upload(bucket: str, path: str, data: bytes) -> str:
+            if data == b"CV-2":
+                raise RuntimeError("storage unavailable")
+            return "https://storage.example.com/ok"
+
+        with (
+            patch.object(packet_service, "TEMPLATES_DIR", tmp_path),
+            patch.object(packet_service, "get_pool", AsyncMock(return_value=db)),
+            patch.object(packet_service, "get_packet_renderer", return_value=_SlowRenderer()),
+            patch.object(packet_service, "_upload_packet", _upload),
+            patch.object(packet_service, "_emit_event_best_effort", MagicMock()),
+        ):
+            results = await packet_service.generate_packets([1, 2], "income_execution_ny")
+
+        assert results[0].packet_url == "https://storage.example.com/ok"
+        assert "storage unavailable" in results[1].error
+
+    async def test_invalid_type_raises(self) -> None:
+        with pytest.raises(packet_service.PacketError, match="Invalid packet type"):
+            await packet_service.generate_packets([1], "bogus")  # type: ignore[arg-type]
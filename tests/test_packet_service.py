@@ -324,14 +324,13 @@ class TestGeneratePacket:
                         "backend.services.packet_service.get_supabase_client",
                         return_value=mock_supabase,
                     ):
-                        # For this test, also mock DocxTemplate to avoid needing a real file
-                        mock_doc = MagicMock()
-                        mock_doc.render = MagicMock()
-                        mock_doc.save = MagicMock()
+                        # For this test, also mock the renderer to avoid needing a real file
+                        mock_renderer = MagicMock()
+                        mock_renderer.render = AsyncMock(return_value=b"docx-bytes")
 
                         with patch(
-                            "backend.services.packet_service.DocxTemplate",
-                            return_value=mock_doc,
+                            "backend.services.packet_service.get_packet_renderer",
+                            return_value=mock_renderer,
                         ):
                             with patch(
                                 "backend.services.packet_service.TEMPLATES_DIR",
@@ -344,8 +343,10 @@ class TestGeneratePacket:
                                 url = await generate_packet(1, "income_execution_ny")
 
                                 assert url == "https://storage.example.com/signed/test.docx"
-                                mock_doc.render.assert_called_once()
+                                mock_renderer.render.assert_awaited_once()
                                 mock_storage.upload.assert_called_once()
+                                upload_kwargs = mock_storage.upload.call_args.kwargs
+                                assert upload_kwargs["file"] == b"docx-bytes"
 
 
 # =============================================================================
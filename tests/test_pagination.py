@@ -0,0 +1,174 @@
+"""
+Tests for shared keyset pagination.
+
+Verifies:
+- Cursors round-trip typed sort values and are rejected by other listings
+- after() compiles to a row comparison (uniform) or OR-expansion (mixed)
+- page() trims the look-ahead row and emits the next cursor
+- count_rows() caches, bypasses the cache, and estimates as requested
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from backend.api import pagination
+from backend.api.pagination import (
+    CursorError,
+    Keyset,
+    SortKey,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+)
+
+BATCHES = Keyset(SortKey("created_at", descending=True), SortKey("id", descending=True))
+CANDIDATES = Keyset(
+    SortKey("priority_score", descending=True),
+    SortKey("balance", descending=True),
+    SortKey("judgment_id"),
+)
+
+
+class TestCursor:
+    def test_round_trips_typed_values(self) -> None:
+        values = [
+            datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc),
+            Decimal("1250.50"),
+            UUID("00000000-0000-0000-0000-000000000042"),
+            7,
+        ]
+        cursor = encode_cursor(["a", "b", "c", "d"], values)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, ["a", "b", "c", "d"]) == values
+
+    def test_rejects_cursor_from_another_listing(self) -> None:
+        cursor = BATCHES.cursor_for({"created_at": datetime(2026, 1, 1), "id": "b1"})
+        with pytest.raises(CursorError) as exc:
+            CANDIDATES.after(cursor)
+        assert exc.value.status_code == 400
+
+    def test_rejects_garbage(self) -> None:
+        with pytest.raises(CursorError):
+            BATCHES.after("not-a-cursor")
+
+
+class TestKeyset:
+    def test_uniform_direction_is_row_comparison(self) -> None:
+        created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        cursor = BATCHES.cursor_for({"created_at": created, "id": "b1"})
+
+        assert BATCHES.order_by() == "ORDER BY created_at DESC, id DESC"
+        assert BATCHES.after(cursor) == ("(created_at, id) < (%s, %s)", [created, "b1"])
+        assert BATCHES.after(None) == ("", [])
+
+    def test_mixed_direction_expands(self) -> None:
+        cursor = CANDIDATES.cursor_for({"priority_score": 80, "balance": 5000, "judgment_id": 9})
+        sql, params = CANDIDATES.after(cursor)
+
+        assert sql == (
+            "((priority_score < %s) OR (priority_score = %s AND balance < %s) OR "
+            "(priority_score = %s AND balance = %s AND judgment_id > %s))"
+        )
+        assert params == [80, 80, 5000, 80, 5000, 9]
+
+    def test_postgrest_filter(self) -> None:
+        cursor = CANDIDATES.cursor_for(
+            {"priority_score": 80, "balance": Decimal("5000.25"), "judgment_id": 9}
+        )
+        assert CANDIDATES.postgrest_filter(cursor) == (
+            "priority_score.lt.80,"
+            'and(priority_score.eq.80,balance.lt."5000.25"),'
+            'and(priority_score.eq.80,balance.eq."5000.25",judgment_id.gt.9)'
+        )
+        assert CANDIDATES.postgrest_filter(None) is None
+
+    def test_null_sort_values_use_fallback(self) -> None:
+        keyset = Keyset(
+            SortKey("COALESCE(score, -1)", descending=True, field="score", null_as=-1),
+            SortKey("id", descending=True),
+        )
+        cursor = keyset.cursor_for({"score": None, "id": 3})
+        assert keyset.after(cursor) == ("(COALESCE(score, -1), id) < (%s, %s)", [-1, 3])
+
+    def test_page_trims_look_ahead_row(self) -> None:
+        rows = [{"created_at": datetime(2026, 1, d), "id": f"b{d}"} for d in (5, 4, 3)]
+
+        items, next_cursor = BATCHES.page(rows, 2)
+        assert items == rows[:2]
+        assert decode_cursor(next_cursor or "", BATCHES.names) == [datetime(2026, 1, 4), "b4"]
+
+        assert BATCHES.page(rows, 3) == (rows, None)
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConn") -> None:
+        self.conn = conn
+        self.row: Any = None
+
+    async def __aenter__(self) -> "_FakeCursor":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, sql: str, params: Any = None) -> None:
+        self.conn.executed.append(sql)
+        self.row = (self.conn.reltuples,) if "reltuples" in sql else (self.conn.total,)
+
+    async def fetchone(self) -> Any:
+        return self.row
+
+
+class _FakeConn:
+    def __init__(self, total: int = 42, reltuples: int = 40000) -> None:
+        self.total = total
+        self.reltuples = reltuples
+        self.executed: list[str] = []
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+
+class TestCountRows:
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        pagination.count_cache.clear()
+        yield
+        pagination.count_cache.clear()
+
+    async def test_cached_counts_once(self) -> None:
+        conn = _FakeConn()
+        sql = "SELECT COUNT(*) FROM ops.ingest_batches WHERE status = %s"
+
+        assert await count_rows(conn, sql, ["failed"]) == 42
+        assert await count_rows(conn, sql, ["failed"]) == 42
+        await count_rows(conn, sql, ["completed"])
+
+        assert len(conn.executed) == 2
+
+    async def test_exact_always_counts(self) -> None:
+        conn = _FakeConn()
+        for _ in range(2):
+            await count_rows(conn, "SELECT COUNT(*) FROM t", mode="exact")
+        assert len(conn.executed) == 2
+
+    async def test_estimate_reads_reltuples(self) -> None:
+        conn = _FakeConn()
+        total = await count_rows(conn, "SELECT COUNT(*) FROM t", mode="estimate", table="t")
+
+        assert total == 40000
+        assert len(conn.executed) == 1
+
+    async def test_estimate_falls_back_when_never_analyzed(self) -> None:
+        conn = _FakeConn(reltuples=-1)
+        total = await count_rows(conn, "SELECT COUNT(*) FROM t", mode="estimate", table="t")
+
+        assert total == 42
+        assert len(conn.executed) == 2
@@ -0,0 +1,166 @@
+"""
+Tests for portfolio rollups.
+
+Verifies:
+- Rollup rows fold into totals and per-dimension buckets
+- Analytics overview/pipeline read the rollups instead of scanning judgments
+- Nightly reconciliation only repairs when drift is found
+- Reconciliation reads scan and rollups in one REPEATABLE READ snapshot
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.api.routers import analytics
+from backend.core.security import AuthContext
+from backend.db import AsyncConnectionWrapper
+from backend.services import portfolio_rollups
+from backend.services.portfolio_rollups import RollupDrift, rollups_from_rows
+
+T0 = datetime(2026, 10, 1, tzinfo=timezone.utc)
+T1 = datetime(2026, 10, 2, tzinfo=timezone.utc)
+
+ROWS = [
+    {
+        "dimension": "total",
+        "bucket": "all",
+        "judgment_count": 3,
+        "amount_sum": Decimal("3500.50"),
+        "active_count": 2,
+        "updated_at": T1,
+    },
+    {
+        "dimension": "status",
+        "bucket": "open",
+        "judgment_count": 2,
+        "amount_sum": Decimal("3000.50"),
+        "active_count": 2,
+        "updated_at": T0,
+    },
+    {
+        "dimension": "status",
+        "bucket": "closed",
+        "judgment_count": 1,
+        "amount_sum": Decimal("500"),
+        "active_count": 0,
+        "updated_at": T0,
+    },
+    {
+        "dimension": "tier",
+        "bucket": "A",
+        "judgment_count": 3,
+        "amount_sum": Decimal("3500.50"),
+        "active_count": 2,
+        "updated_at": T0,
+    },
+]
+
+
+def _auth() -> AuthContext:
+    return AuthContext(subject="test", via="api_key")
+
+
+def test_rollups_from_rows() -> None:
+    rollups = rollups_from_rows(ROWS)
+
+    assert (rollups.total_count, rollups.total_amount, rollups.active_count) == (3, 3500.5, 2)
+    assert rollups.counts("status") == {"open": 2, "closed": 1}
+    assert rollups.amounts("tier") == {"A": 3500.5}
+    assert rollups.counts("pool") == {}
+    assert rollups.updated_at == T1
+
+
+class TestAnalyticsEndpoints:
+    async def test_overview_reads_rollups(self) -> None:
+        fetch = AsyncMock(return_value=rollups_from_rows(ROWS))
+        with (
+            patch.object(analytics, "fetch_portfolio_rollups", fetch),
+            patch.object(analytics, "get_supabase_client") as client,
+        ):
+            result = await analytics.get_overview_metrics(auth=_auth())
+
+        assert (result.total_cases, result.active_cases) == (3, 2)
+        assert result.total_judgment_amount == 3500.5
+        client.assert_not_called()
+
+    async def test_pipeline_reads_rollups(self) -> None:
+        fetch = AsyncMock(return_value=rollups_from_rows(ROWS))
+        with patch.object(analytics, "fetch_portfolio_rollups", fetch):
+            result = await analytics.get_pipeline_metrics(auth=_auth())
+
+        assert result.stage_counts == {"open": 2, "closed": 1}
+        assert result.tier_counts == {"A": 3}
+
+    async def test_portfolio_endpoint_lists_all_dimensions(self) -> None:
+        fetch = AsyncMock(return_value=rollups_from_rows(ROWS))
+        with patch.object(analytics, "fetch_portfolio_rollups", fetch):
+            result = await analytics.get_portfolio_rollups(auth=_auth())
+
+        assert set(result.dimensions) == {"status", "tier", "stage", "pool"}
+        assert result.dimensions["status"]["closed"].amount_sum == 500.0
+
+
+class TestReconciliation:
+    @pytest.mark.parametrize("drift", [[], ["x"]])
+    async def test_repairs_only_on_drift(self, drift: list[str]) -> None:
+        rows = [RollupDrift("tier", "A", 4, 3, 10.0, 9.0, 1, 1) for _ in drift]
+        reconcile = AsyncMock(return_value=rows)
+        with patch.object(portfolio_rollups, "reconcile_portfolio_rollups", reconcile):
+            count = await portfolio_rollups.run_rollup_reconciliation(auto_repair=True)
+
+        assert count == len(drift)
+        repairs = [c for c in reconcile.await_args_list if c.kwargs.get("repair")]
+        assert len(repairs) == len(drift)
+
+    async def test_reconcile_runs_in_one_repeatable_read_snapshot(self) -> None:
+        events: list[Any] = []
+
+        class _Cursor:
+            statusmessage = "SET"
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc: Any) -> None:
+                return None
+
+            async def execute(self, query: str, params: Any = None) -> None:
+                events.append((query, params))
+
+            async def fetchall(self) -> list[dict]:
+                return []
+
+        class _PsycopgConn:
+            @asynccontextmanager
+            async def transaction(self):
+                events.append("begin")
+                yield
+                events.append("commit")
+
+            def cursor(self, **_: Any) -> _Cursor:
+                return _Cursor()
+
+        # The real wrapper, so the test breaks if its transaction() API changes
+        conn = AsyncConnectionWrapper(_PsycopgConn())  # type: ignore[arg-type]
+
+        @asynccontextmanager
+        async def get_connection():
+            yield conn
+
+        with patch("backend.db.get_connection", get_connection):
+            drift = await portfolio_rollups.reconcile_portfolio_rollups(repair=True)
+
+        assert drift == []
+        assert events == [
+            "begin",
+            ("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ", None),
+            ("SELECT * FROM analytics.reconcile_portfolio_rollups(%s)", (True,)),
+            "commit",
+        ]
@@ -0,0 +1,147 @@
+"""
+Tests for queue telemetry forecasts.
+
+Verifies:
+- Arrival and drain rates come from cumulative counter deltas
+- Backlog ETA is only given when the queue is net draining
+- Replica recommendation sizes from observed per-worker throughput
+- The sampler downsamples at most once per interval and never raises
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from backend.services.queue_telemetry import (
+    QueueSample,
+    QueueTelemetrySampler,
+    forecast_all,
+    forecast_queue,
+)
+
+T0 = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _sample(
+    minute: int,
+    length: int,
+    enqueued: int,
+    drained: int,
+    workers: int = 2,
+    queue: str = "q_test",
+) -> QueueSample:
+    return QueueSample(
+        queue_name=queue,
+        sampled_at=T0 + timedelta(minutes=minute),
+        queue_length=length,
+        oldest_msg_age_sec=None,
+        enqueued_total=enqueued,
+        drained_total=drained,
+        active_workers=workers,
+    )
+
+
+class TestForecastQueue:
+    def test_draining_queue(self) -> None:
+        # 10 min: 600 in, 1200 out with 2 workers -> 60/min in, 120/min out
+        forecast = forecast_queue(
+            [_sample(0, 1000, 0, 0), _sample(10, 400, 600, 1200)],
+            target_drain_seconds=300,
+            headroom=0.0,
+        )
+        assert forecast is not None
+        assert (forecast.arrival_per_min, forecast.drain_per_min) == (60.0, 120.0)
+        assert forecast.per_worker_per_min == 60.0
+        assert forecast.trend == "draining"
+        # 400 backlog at a net 1/s
+        assert forecast.backlog_eta_seconds == 400.0
+        # 1/s arrivals + 400/300s backlog = 2.33/s over 1/s per worker
+        assert forecast.recommended_replicas == 3
+
+    def test_growing_queue_has_no_eta(self) -> None:
+        forecast = forecast_queue(
+            [_sample(0, 100, 0, 0, workers=1), _sample(5, 700, 900, 300, workers=1)],
+            max_replicas=4,
+        )
+        assert forecast.trend == "growing"
+        assert forecast.backlog_eta_seconds is None
+        assert forecast.recommended_replicas == 4  # clamped
+
+    def test_idle_queue_scales_to_zero(self) -> None:
+        forecast = forecast_queue([_sample(0, 0, 50, 50), _sample(10, 0, 50, 50)])
+        assert forecast.backlog_eta_seconds == 0.0
+        assert forecast.trend == "steady"
+        assert forecast.recommended_replicas == 0
+
+    def test_work_without_workers_asks_for_one(self) -> None:
+        forecast = forecast_queue([_sample(0, 5, 0, 0, workers=0), _sample(2, 8, 3, 0, workers=0)])
+        assert forecast.per_worker_per_min is None
+        assert forecast.recommended_replicas == 1
+
+    def test_counter_reset_is_not_negative(self) -> None:
+        forecast = forecast_queue([_sample(0, 10, 100, 5000), _sample(5, 10, 100, 20)])
+        assert forecast.drain_per_min == 0.0
+
+    def test_needs_two_distinct_samples(self) -> None:
+        assert forecast_queue([_sample(0, 1, 1, 1)]) is None
+        assert forecast_queue([_sample(0, 1, 1, 1), _sample(0, 2, 2, 2)]) is None
+
+
+def test_forecast_all_groups_by_queue() -> None:
+    samples = [
+        _sample(0, 0, 0, 0, queue="q_a"),
+        _sample(5, 0, 30, 30, queue="q_a"),
+        _sample(0, 0, 0, 0, queue="q_b"),
+    ]
+    forecasts = forecast_all(samples)
+    assert [f.queue_name for f in forecasts] == ["q_a"]
+
+
+class _FakeCursor:
+    def __init__(self, log: list[str], fail: bool) -> None:
+        self.log = log
+        self.fail = fail
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: object = None) -> None:
+        if self.fail:
+            raise RuntimeError("pgmq missing")
+        self.log.append(sql)
+
+    def fetchone(self) -> dict:
+        return {"n": 3}
+
+
+class _FakeConn:
+    def __init__(self, fail: bool = False) -> None:
+        self.log: list[str] = []
+        self.fail = fail
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self.log, self.fail)
+
+
+class TestSampler:
+    def test_downsamples_once_per_interval(self) -> None:
+        now = [0.0]
+        sampler = QueueTelemetrySampler(downsample_interval=3600, clock=lambda: now[0])
+        conn = _FakeConn()
+
+        assert sampler.sample(conn) == 3
+        now[0] = 60.0
+        sampler.sample(conn)
+        now[0] = 3600.0
+        sampler.sample(conn)
+
+        downsamples = [sql for sql in conn.log if "downsample" in sql]
+        assert len(downsamples) == 2
+        assert len(conn.log) == 5
+
+    def test_failure_is_swallowed(self) -> None:
+        sampler = QueueTelemetrySampler()
+        assert sampler.sample(_FakeConn(fail=True)) == 0
@@ -0,0 +1,137 @@
+"""
+Tests for queued structured logging and fast redaction (backend/core/logging.py).
+
+Verifies:
+- Memoized single-regex key redaction matches the per-pattern substring scan
+- Timestamps come from the record, not from when a listener formats it
+- JSON serialization falls back to the stdlib encoder when orjson cannot
+- Queued mode formats on the listener thread with the caller's log context
+- A full queue drops records and counts them instead of blocking
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from backend.core import logging as core_logging
+from backend.core.logging import (
+    REDACT_PATTERNS,
+    LogContext,
+    StructuredJsonFormatter,
+    configure_structured_logging,
+    get_dropped_log_count,
+    redact_sensitive,
+    stop_queued_logging,
+)
+from backend.utils.context import reset_request_id, set_request_id
+
+KEYS = [
+    "password",
+    "DB_Password",
+    "user_ssn",
+    "authorization",
+    "author",
+    "judgment_id",
+    "refresh_token",
+    "case_number",
+    "x-api-key",
+    "apikey",
+    "status",
+    "",
+]
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    stop_queued_logging()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+class TestRedaction:
+    @pytest.mark.parametrize("key", KEYS)
+    def test_matches_substring_scan(self, key: str) -> None:
+        expected = any(pattern in key.lower() for pattern in REDACT_PATTERNS)
+        assert core_logging._is_sensitive_key(key) is expected
+
+    def test_nested_and_non_string_keys(self) -> None:
+        data = {"ctx": [{"api_key": "k", 1: "one"}], "ssn": "123-45-6789", "ok": True}
+        assert redact_sensitive(data) == {
+            "ctx": [{"api_key": "[REDACTED]", 1: "one"}],
+            "ssn": "[REDACTED]",
+            "ok": True,
+        }
+
+    def test_formatter_redacts_context(self) -> None:
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "hello %s", ("x",), None)
+        with LogContext(judgment_id=7, bank_account="123"):
+            payload = json.loads(StructuredJsonFormatter().format(record))
+
+        assert payload["message"] == "hello x"
+        assert payload["judgment_id"] == 7
+        assert payload["bank_account"] == "[REDACTED]"
+
+    def test_timestamp_is_record_creation_time(self) -> None:
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "late", None, None)
+        record.created = 1_700_000_000.25
+
+        payload = json.loads(StructuredJsonFormatter().format(record))
+
+        assert payload["timestamp"] == "2023-11-14T22:13:20.250000+00:00"
+
+
+class TestDumps:
+    def test_falls_back_for_big_ints(self) -> None:
+        assert json.loads(core_logging._dumps({"n": 2**70})) == {"n": 2**70}
+
+    def test_non_string_keys_and_unknown_types(self) -> None:
+        payload = json.loads(core_logging._dumps({1: "a", "obj": object}))
+        assert payload["1"] == "a"
+        assert payload["obj"] == str(object)
+
+
+class TestQueuedLogging:
+    def test_writes_on_listener_with_caller_context(
+        self, restore_root_logger: logging.Logger, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        monkeypatch.setattr(sys, "stderr", stderr)
+
+        configure_structured_logging(level="INFO", queued=True)
+        token = set_request_id("req-queued")
+        with LogContext(job_id="job-1", token="secret"):
+            logging.getLogger("tests.queued").info("queued %s", "info")
+        logging.getLogger("tests.queued").warning("queued warning")
+        reset_request_id(token)
+        stop_queued_logging()
+
+        info = json.loads(stdout.getvalue().strip())
+        assert info["message"] == "queued info"
+        assert info["request_id"] == "req-queued"
+        assert info["job_id"] == "job-1"
+        assert info["token"] == "[REDACTED]"
+        assert "queued warning" in stderr.getvalue()
+        assert "queued warning" not in stdout.getvalue()
+
+    def test_full_queue_drops_and_counts(self) -> None:
+        handler = core_logging._DroppingQueueHandler(queue.Queue(maxsize=1))
+        before = get_dropped_log_count()
+
+        for i in range(3):
+            handler.handle(logging.LogRecord("t", logging.INFO, __file__, 1, str(i), None, None))
+
+        assert handler.queue.qsize() == 1
+        assert get_dropped_log_count() - before == 2
@@ -0,0 +1,148 @@
+"""
+Tests for the streaming score_cases pipeline.
+
+Verifies:
+- in.(...) id lists are split under the URL budget
+- v_cases is paged with keyset filters on case_id
+- Only stale cases are scored and upserted in batched arrays with on_conflict
+- --limit stops paging once enough cases were scanned
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+os.environ.setdefault("SUPABASE_PROJECT_REF", "test-project")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "test-service-role-key")
+_api_surface = importlib.import_module("src.config.api_surface")
+if not _api_surface.BASE_URL:
+    importlib.reload(_api_surface)
+
+from src.workers import score_cases  # noqa: E402
+
+FRESH = "2999-01-01T00:00:00+00:00"
+
+
+def _case(case_id: str) -> Dict[str, Any]:
+    return {
+        "case_id": case_id,
+        "index_no": f"IDX-{case_id}",
+        "status": "new",
+        "principal_amt": 25000,
+        "judgment_at": "2024-06-01T00:00:00Z",
+        "created_at": "2024-06-01T00:00:00Z",
+    }
+
+
+class _FakePostgrest:
+    def __init__(self, cases: List[Dict[str, Any]], fresh: set[str] = frozenset()) -> None:
+        self.cases = cases
+        self.fresh = fresh
+        self.requests: List[httpx.Request] = []
+        self.upserts: List[List[dict]] = []
+
+    def params(self, path: str) -> List[Dict[str, str]]:
+        return [
+            {k: v[0] for k, v in parse_qs(urlparse(str(r.url)).query).items()}
+            for r in self.requests
+            if r.url.path.endswith(path) and r.method == "GET"
+        ]
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.rsplit("/", 1)[-1]
+        params = {k: v[0] for k, v in parse_qs(urlparse(str(request.url)).query).items()}
+        if request.method == "POST":
+            self.upserts.append(json.loads(request.content))
+            return httpx.Response(201)
+        if path == "v_cases":
+            after = params.get("case_id", "gt.")[3:]
+            rows = [c for c in self.cases if c["case_id"] > after]
+            return httpx.Response(200, json=rows[: int(params["limit"])])
+        ids = params.get("case_id", params.get("entity_id", "in.()"))[4:-1].split(",")
+        if path == "collectability":
+            rows = [{"case_id": i, "updated_at": FRESH} for i in ids if i in self.fresh]
+        elif path == "roles":
+            rows = [{"case_id": i, "entity_id": f"e-{i}", "role": "defendant"} for i in ids]
+            rows += [{"case_id": i, "entity_id": f"p-{i}", "role": "plaintiff"} for i in ids]
+        elif path == "entities":
+            rows = [{"entity_id": i, "name_norm": "a very long defendant name"} for i in ids]
+        elif path == "contacts":
+            rows = [{"entity_id": i, "kind": "phone", "validated_bool": True} for i in ids]
+        else:
+            rows = [{"entity_id": i, "asset_type": "employment"} for i in ids]
+        return httpx.Response(200, json=rows)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url="https://test/rest/v1", transport=httpx.MockTransport(self.handler)
+        )
+
+
+def test_chunk_ids_respects_budget() -> None:
+    ids = [f"{i:036d}" for i in range(10)]
+    chunks = list(score_cases._chunk_ids(ids, budget=37 * 3))
+    assert [len(c) for c in chunks] == [3, 3, 3, 1]
+    assert [i for c in chunks for i in c] == ids
+
+
+async def test_pages_cases_and_batches_upserts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(score_cases, "UPSERT_BATCH_SIZE", 2)
+    fake = _FakePostgrest([_case(f"c{i}") for i in range(1, 6)], fresh={"c2"})
+
+    async with fake.client() as client:
+        run = await score_cases.score_stale_cases(client, page_size=2)
+
+    assert [p.get("case_id") for p in fake.params("v_cases")] == [None, "gt.c2", "gt.c4"]
+    assert run.scanned == 5 and run.pages == 3
+    assert run.scored == 4
+    assert sorted(r["case_id"] for r in run.results) == ["c1", "c3", "c4", "c5"]
+    assert [len(batch) for batch in fake.upserts] == [1, 2, 1]
+    posts = [r for r in fake.requests if r.method == "POST"]
+    assert all(r.url.params["on_conflict"] == "case_id" for r in posts)
+    assert fake.upserts[0][0]["identity_score"] == 40.0
+
+
+async def test_large_id_lists_split_into_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(score_cases, "IN_FILTER_MAX_CHARS", 40)
+    fake = _FakePostgrest([_case(f"case-{i:04d}") for i in range(12)])
+
+    async with fake.client() as client:
+        run = await score_cases.score_stale_cases(client, page_size=100)
+
+    roles = fake.params("roles")
+    assert len(roles) == 3
+    assert all(len(p["case_id"]) <= 40 + len("in.()") for p in roles)
+    assert run.scored == 12
+    assert sum(len(batch) for batch in fake.upserts) == 12
+
+
+async def test_in_fetches_order_by_unique_key() -> None:
+    fake = _FakePostgrest([_case("c1")])
+
+    async with fake.client() as client:
+        await score_cases.score_stale_cases(client, page_size=10)
+
+    orders = {path: fake.params(path)[0]["order"] for path in ("roles", "contacts", "assets")}
+    assert orders == {
+        "roles": "case_id.asc,entity_id.asc,role.asc",
+        "contacts": "entity_id.asc,contact_id.asc",
+        "assets": "entity_id.asc,asset_id.asc",
+    }
+
+
+async def test_limit_stops_paging() -> None:
+    fake = _FakePostgrest([_case(f"c{i}") for i in range(1, 10)])
+
+    async with fake.client() as client:
+        run = await score_cases.score_stale_cases(client, limit=3, page_size=2)
+
+    assert [p["limit"] for p in fake.params("v_cases")] == ["2", "1"]
+    assert run.scanned == 3
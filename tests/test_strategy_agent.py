@@ -359,6 +359,155 @@ class TestSmartStrategyEvaluate:
         assert mock_conn.commit.call_count == 0  # No commits in read-only mode
 
 
+class TestSmartStrategyEvaluateMany:
+    """Test the batch evaluate_many() workflow."""
+
+    @staticmethod
+    def _intel_row(judgment_id: str, **fields: Any) -> dict:
+        row = {
+            "judgment_id": judgment_id,
+            "employer_name": None,
+            "employer_address": None,
+            "income_band": None,
+            "bank_name": None,
+            "bank_address": None,
+            "home_ownership": None,
+            "has_benefits_only_account": None,
+            "confidence_score": None,
+            "is_verified": False,
+            "data_source": "manual",
+        }
+        row.update(fields)
+        return row
+
+    def test_one_query_and_one_insert(self, mock_conn: MagicMock):
+        """All judgments share one DISTINCT ON query and one plan insert."""
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [
+            self._intel_row(ids[0], employer_name="Big Corp"),
+            self._intel_row(ids[2], bank_name="Chase"),
+        ]
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        decisions = SmartStrategy(mock_conn).evaluate_many(ids)
+
+        assert [d.judgment_id for d in decisions] == ids
+        assert [d.strategy_type for d in decisions] == [
+            StrategyType.WAGE_GARNISHMENT,
+            StrategyType.SURVEILLANCE,
+            StrategyType.BANK_LEVY,
+        ]
+        assert mock_cursor.execute.call_count == 2
+        select_sql, select_params = mock_cursor.execute.call_args_list[0].args
+        assert "DISTINCT ON (judgment_id)" in select_sql
+        assert select_params == (ids,)
+        insert_params = mock_cursor.execute.call_args_list[1].args[1]
+        assert insert_params[1] == ids
+        assert insert_params[2] == ["wage_garnishment", "surveillance", "bank_levy"]
+        assert [d.plan_id for d in decisions] == insert_params[0]
+        mock_conn.commit.assert_called_once()
+
+    def test_batch_result_carries_plan_ids(self, mock_conn: MagicMock):
+        """run_smart_strategy_batch returns the ids persist_plans created."""
+        from backend.workers import enforcement_engine as engine
+
+        ids = [str(uuid.uuid4()) for _ in range(2)]
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        results = engine.run_smart_strategy_batch(mock_conn, ids)
+
+        plan_ids = mock_cursor.execute.call_args_list[1].args[1][0]
+        assert [results[judgment_id]["plan_id"] for judgment_id in ids] == plan_ids
+        assert all(plan_ids)
+
+    def test_matches_single_evaluate(self, mock_conn: MagicMock, sample_judgment_id: str):
+        """Batch decisions equal the per-judgment decisions."""
+        row = self._intel_row(sample_judgment_id, home_ownership="Owner")
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = row
+        mock_cursor.fetchall.return_value = [row]
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        strategy = SmartStrategy(mock_conn)
+
+        single = strategy.evaluate(sample_judgment_id, persist=False)
+        (batch,) = strategy.evaluate_many([sample_judgment_id], persist=False)
+
+        assert batch.strategy_type == single.strategy_type == StrategyType.PROPERTY_LIEN
+        assert batch.strategy_reason == single.strategy_reason
+
+    def test_chunks_and_dedupes(self, mock_conn: MagicMock):
+        """Duplicates are evaluated once; each chunk gets its own query."""
+        ids = [str(uuid.uuid4()) for _ in range(5)]
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        decisions = SmartStrategy(mock_conn).evaluate_many(ids + ids[:2], chunk_size=2)
+
+        assert len(decisions) == 5
+        assert mock_cursor.execute.call_count == 6  # 3 chunks x (select + insert)
+        assert mock_conn.commit.call_count == 3
+
+
+class TestStrategyJobBatching:
+    """Test enforcement_engine batch processing of Smart Strategy jobs."""
+
+    def test_smart_jobs_share_one_evaluation(self, mock_conn: MagicMock):
+        from backend.workers import enforcement_engine as engine
+
+        jobs = [
+            {"id": "job-1", "job_type": "enforcement_strategy", "payload": {"judgment_id": "j1"}},
+            {"id": "job-2", "job_type": "enforcement_strategy", "payload": '{"judgment_id": "j2"}'},
+            {"id": "job-3", "job_type": "enforcement_strategy", "payload": {}},
+        ]
+        ok = {"success": True, "error_message": None}
+
+        with (
+            patch.object(
+                engine, "run_smart_strategy_batch", return_value={"j1": ok, "j2": ok}
+            ) as batch,
+            patch.object(engine, "log_job_event"),
+        ):
+            results = engine.process_strategy_batch(mock_conn, jobs)
+
+        batch.assert_called_once_with(mock_conn, ["j1", "j2"])
+        assert results["job-1"] is None and results["job-2"] is None
+        assert "judgment_id" in results["job-3"]
+
+    def test_settle_groups_by_outcome(self):
+        from backend.workers import enforcement_engine as engine
+
+        rpc = MagicMock()
+        last = engine.MAX_JOB_ATTEMPTS
+        jobs = [{"id": job_id, "attempts": last} for job_id in "abcd"]
+        engine.settle_jobs(rpc, jobs, {"a": None, "b": "boom", "c": None, "d": "boom"})
+
+        assert rpc.update_job_statuses.call_args_list[0].args == (["a", "c"], "completed")
+        failed = rpc.update_job_statuses.call_args_list[1]
+        assert failed.args == (["b", "d"], "failed")
+        assert failed.kwargs == {"error_message": f"[DLQ] Max attempts ({last}) exceeded: boom"}
+        rpc.update_job_status.assert_not_called()
+
+    def test_settle_retries_failures_below_max_attempts(self):
+        from backend.workers import enforcement_engine as engine
+
+        rpc = MagicMock()
+        jobs = [{"id": "a", "attempts": 1}, {"id": "b", "attempts": 2}]
+        engine.settle_jobs(rpc, jobs, {"a": "boom", "b": "boom"})
+
+        retries = {c.kwargs["job_id"]: c.kwargs for c in rpc.update_job_status.call_args_list}
+        assert retries["a"]["status"] == "pending"
+        assert retries["a"]["backoff_seconds"] == engine._retry_backoff_seconds(1)
+        assert retries["b"]["backoff_seconds"] == engine._retry_backoff_seconds(2)
+        assert retries["b"]["error_message"].startswith(
+            f"Retry scheduled (attempt 2/{engine.MAX_JOB_ATTEMPTS})"
+        )
+        assert [c.args[1] for c in rpc.update_job_statuses.call_args_list] == ["completed"]
+
+
 # =============================================================================
 # STRATEGY TYPE ENUM TESTS
 # =============================================================================
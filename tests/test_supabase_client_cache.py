@@ -0,0 +1,115 @@
+"""
+Tests for the process-wide Supabase client registry.
+
+Verifies:
+- One client is built per SupabaseEnv and reused across calls/threads
+- Idle clients are recycled without closing them under their holders
+- reset() drops cached clients for credential rotation
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import List
+
+import pytest
+
+import src.supabase_client as supabase_client
+from src.supabase_client import SupabaseClientRegistry
+
+
+class _FakeHttp:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeClient:
+    def __init__(self, env: str) -> None:
+        self.env = env
+        self._dragonfly_httpx_client = _FakeHttp()
+
+
+class _Factory:
+    def __init__(self) -> None:
+        self.built: List[_FakeClient] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, env: str) -> _FakeClient:
+        client = _FakeClient(env)
+        with self.lock:
+            self.built.append(client)
+        return client
+
+
+def test_client_reused_per_env() -> None:
+    factory = _Factory()
+    registry = SupabaseClientRegistry(factory)
+
+    dev = registry.get("dev")
+    assert registry.get("development") is dev
+    prod = registry.get("prod")
+
+    assert prod is not dev
+    assert [c.env for c in factory.built] == ["dev", "prod"]
+
+
+def test_concurrent_first_use_builds_once() -> None:
+    factory = _Factory()
+    registry = SupabaseClientRegistry(factory)
+    barrier = threading.Barrier(8)
+    seen: List[object] = []
+
+    def worker() -> None:
+        barrier.wait()
+        seen.append(registry.get("dev"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(factory.built) == 1
+    assert all(client is factory.built[0] for client in seen)
+
+
+def test_idle_client_recycled() -> None:
+    now = [0.0]
+    factory = _Factory()
+    registry = SupabaseClientRegistry(factory, idle_seconds=60, clock=lambda: now[0])
+
+    first = registry.get("dev")
+    now[0] = 59
+    assert registry.get("dev") is first
+    now[0] = 130
+    second = registry.get("dev")
+
+    assert second is not first
+    # A handler holding the recycled client can still finish its request
+    assert not first._dragonfly_httpx_client.closed
+    assert not second._dragonfly_httpx_client.closed
+
+
+def test_reset_drops_clients() -> None:
+    factory = _Factory()
+    registry = SupabaseClientRegistry(factory)
+    dev = registry.get("dev")
+    registry.get("prod")
+
+    assert registry.reset("prod") == 1
+    assert registry.get("dev") is dev
+    assert registry.reset() == 1
+    assert dev._dragonfly_httpx_client.closed
+    assert registry.get("dev") is not dev
+
+
+def test_module_helpers_use_shared_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    factory = _Factory()
+    monkeypatch.setattr(supabase_client, "_REGISTRY", SupabaseClientRegistry(factory))
+
+    client = supabase_client.get_supabase_client("dev")
+    assert supabase_client.get_supabase_client("dev") is client
+    assert supabase_client.reset_supabase_clients() == 1
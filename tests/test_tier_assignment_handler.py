@@ -414,7 +414,7 @@ async def test_handler_assigns_tier_to_active_judgment(mock_supabase):
         "payload": {"payload": {"judgment_id": "judgment-active-123"}},
     }
 
-    with patch("workers.tier_assignment_handler.create_supabase_client", return_value=client):
+    with patch("workers.tier_assignment_handler.get_supabase_client", return_value=client):
         result = await handle_tier_assignment(job)
 
     assert result is True
@@ -438,7 +438,7 @@ async def test_handler_skips_satisfied_judgment(mock_supabase):
         "payload": {"payload": {"judgment_id": "judgment-satisfied-456"}},
     }
 
-    with patch("workers.tier_assignment_handler.create_supabase_client", return_value=client):
+    with patch("workers.tier_assignment_handler.get_supabase_client", return_value=client):
         result = await handle_tier_assignment(job)
 
     assert result is True
@@ -457,7 +457,7 @@ async def test_handler_assigns_tier_0_for_low_score(mock_supabase):
         "payload": {"payload": {"judgment_id": "judgment-low-score-789"}},
     }
 
-    with patch("workers.tier_assignment_handler.create_supabase_client", return_value=client):
+    with patch("workers.tier_assignment_handler.get_supabase_client", return_value=client):
         result = await handle_tier_assignment(job)
 
     assert result is True
@@ -477,7 +477,7 @@ async def test_handler_returns_true_for_missing_judgment(mock_supabase):
         "payload": {"payload": {"judgment_id": "non-existent-judgment"}},
     }
 
-    with patch("workers.tier_assignment_handler.create_supabase_client", return_value=client):
+    with patch("workers.tier_assignment_handler.get_supabase_client", return_value=client):
         result = await handle_tier_assignment(job)
 
     # Should return True (don't retry for missing data)
@@ -489,7 +489,7 @@ async def test_handler_returns_true_for_invalid_payload():
     """Handler returns True for invalid payload (no retry)."""
     job = {"msg_id": 5, "payload": {"other_field": "value"}}
 
-    with patch("workers.tier_assignment_handler.create_supabase_client"):
+    with patch("workers.tier_assignment_handler.get_supabase_client"):
         result = await handle_tier_assignment(job)
 
     assert result is True
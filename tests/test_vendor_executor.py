@@ -0,0 +1,270 @@
+"""
+Tests for the skip-trace VendorExecutor against MockIdiCORE.
+
+Verifies:
+- Concurrent lookups for the same normalized debtor share one vendor lookup
+- Cache misses are grouped into enrich_many calls of at most the batch size
+- Results are served from the TTL cache, including a persisted cache after restart
+- Vendor calls respect the token bucket and the concurrency cap
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Sequence, Tuple
+
+import pytest
+
+from src.vendors import MockIdiCORE, SkipTraceResult
+from src.vendors.executor import (
+    MemoryResultCache,
+    SupabaseResultCache,
+    TokenBucket,
+    VendorExecutor,
+    normalize_debtor_name,
+    reset_vendor_executors,
+)
+
+
+class _CountingIdiCORE(MockIdiCORE):
+    def __init__(self, fail: bool = False) -> None:
+        self.single_calls: List[str] = []
+        self.batch_calls: List[int] = []
+        self.fail = fail
+
+    async def enrich(self, debtor_name: str, case_index: str) -> SkipTraceResult:
+        self.single_calls.append(debtor_name)
+        return await super().enrich(debtor_name, case_index)
+
+    async def enrich_many(self, requests: Sequence[Tuple[str, str]]) -> List[SkipTraceResult]:
+        self.batch_calls.append(len(requests))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("vendor unavailable")
+        return [await MockIdiCORE.enrich(self, name, idx) for name, idx in requests]
+
+
+class _SingleOnlyVendor:
+    """Vendor without enrich_many that records peak concurrency."""
+
+    provider_name = "single_only"
+    endpoint = "/single"
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def enrich(self, debtor_name: str, case_index: str) -> SkipTraceResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return SkipTraceResult(employer_name=debtor_name)
+
+
+def _executor(vendor: Any, **kwargs: Any) -> VendorExecutor:
+    kwargs.setdefault("batch_window", 0.0)
+    kwargs.setdefault("rate_per_second", 0)
+    return VendorExecutor(vendor, **kwargs)
+
+
+def test_normalize_debtor_name() -> None:
+    assert normalize_debtor_name("  SMITH,  John  J. ") == "smith john j"
+
+
+async def test_concurrent_same_debtor_coalesced() -> None:
+    vendor = _CountingIdiCORE()
+    executor = _executor(vendor)
+
+    results = await asyncio.gather(
+        executor.enrich("John Smith", "IDX-1"),
+        executor.enrich("JOHN  SMITH.", "IDX-2"),
+        executor.enrich("john smith", "IDX-3"),
+    )
+
+    assert vendor.batch_calls == [1]
+    assert executor.stats.coalesced == 2
+    statuses = sorted(r.raw_meta["cache_status"] for r in results)
+    assert statuses == ["coalesced", "coalesced", "miss"]
+    assert len({r.employer_name for r in results}) == 1
+
+
+async def test_misses_grouped_into_vendor_batches() -> None:
+    vendor = _CountingIdiCORE()
+    executor = _executor(vendor, batch_size=100)
+    names = [f"Debtor Number {i}" for i in range(30)]
+
+    results = await executor.enrich_many([(name, f"IDX-{i}") for i, name in enumerate(names)])
+
+    assert vendor.batch_calls == [25, 5]
+    assert executor.stats.vendor_calls == 2
+    expected = await MockIdiCORE().enrich(names[7], "IDX-7")
+    assert results[7].employer_name == expected.employer_name
+
+
+async def test_ttl_cache_hit_then_expiry() -> None:
+    now = [0.0]
+    vendor = _CountingIdiCORE()
+    executor = _executor(vendor, cache=MemoryResultCache(clock=lambda: now[0]), ttl_seconds=60)
+
+    first = await executor.enrich("Jane Doe", "IDX-1")
+    second = await executor.enrich("jane doe", "IDX-2")
+    now[0] = 61
+    third = await executor.enrich("Jane Doe", "IDX-3")
+
+    assert [first.raw_meta["cache_status"], second.raw_meta["cache_status"]] == ["miss", "hit"]
+    assert third.raw_meta["cache_status"] == "miss"
+    assert vendor.batch_calls == [1, 1]
+
+
+class _FakeTable:
+    def __init__(self, store: Dict[Tuple[str, str], Dict[str, Any]]) -> None:
+        self.store = store
+        self.filters: Dict[str, Any] = {}
+        self.rows: List[Dict[str, Any]] = []
+
+    def select(self, _columns: str) -> "_FakeTable":
+        return self
+
+    def eq(self, column: str, value: Any) -> "_FakeTable":
+        self.filters[column] = value
+        return self
+
+    def in_(self, column: str, values: List[str]) -> "_FakeTable":
+        self.filters[column] = values
+        return self
+
+    def gt(self, column: str, value: str) -> "_FakeTable":
+        self.filters[column] = value
+        return self
+
+    def upsert(self, rows: List[Dict[str, Any]], on_conflict: str) -> "_FakeTable":
+        assert on_conflict == "provider,debtor_key"
+        self.rows = rows
+        return self
+
+    def execute(self) -> Any:
+        for row in self.rows:
+            self.store[(row["provider"], row["debtor_key"])] = row
+        data = [
+            row
+            for (provider, key), row in self.store.items()
+            if provider == self.filters.get("provider")
+            and key in self.filters.get("debtor_key", [])
+            and row["expires_at"] > self.filters["expires_at"]
+        ]
+        return type("Response", (), {"data": data})()
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.store: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def table(self, name: str) -> _FakeTable:
+        assert name == "skip_trace_cache"
+        return _FakeTable(self.store)
+
+
+async def test_persisted_cache_survives_restart() -> None:
+    client = _FakeClient()
+    first_vendor = _CountingIdiCORE()
+    first = _executor(first_vendor, cache=SupabaseResultCache(client_factory=lambda: client))
+    await first.enrich("Ann Lee", "IDX-1")
+    await first.drain()
+
+    assert len(client.store) == 1
+    ((provider, key), row) = next(iter(client.store.items()))
+    assert provider == "mock_idicore"
+    assert "ann" not in key
+    assert row["result"]["employer_name"]
+
+    restarted_vendor = _CountingIdiCORE()
+    restarted = _executor(
+        restarted_vendor, cache=SupabaseResultCache(client_factory=lambda: client)
+    )
+    result = await restarted.enrich("ANN LEE", "IDX-9")
+
+    assert restarted_vendor.batch_calls == []
+    assert result.raw_meta["cache_status"] == "hit"
+    assert result.employer_name == row["result"]["employer_name"]
+
+
+async def test_persisted_cache_resolves_client_per_operation() -> None:
+    clients = [_FakeClient(), _FakeClient()]
+    calls: List[_FakeClient] = []
+
+    def factory() -> _FakeClient:
+        calls.append(clients[len(calls) % 2])
+        return calls[-1]
+
+    cache = SupabaseResultCache(client_factory=factory)
+    await cache.get_many("mock_idicore", ["k1"])
+    await cache.get_many("mock_idicore", ["k1"])
+
+    assert calls == clients
+
+
+async def test_vendor_error_reaches_all_waiters_and_is_not_cached() -> None:
+    vendor = _CountingIdiCORE(fail=True)
+    executor = _executor(vendor)
+
+    outcomes = await asyncio.gather(
+        executor.enrich("Bob Ray", "IDX-1"),
+        executor.enrich("bob ray", "IDX-2"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(o, RuntimeError) for o in outcomes)
+    vendor.fail = False
+    result = await executor.enrich("Bob Ray", "IDX-3")
+    assert result.raw_meta["cache_status"] == "miss"
+    assert vendor.batch_calls == [1, 1]
+
+
+async def test_placeholder_names_never_shared() -> None:
+    vendor = _CountingIdiCORE()
+    executor = _executor(vendor)
+
+    await asyncio.gather(executor.enrich("Unknown", "IDX-1"), executor.enrich("Unknown", "IDX-2"))
+
+    assert vendor.single_calls == ["Unknown", "Unknown"]
+    assert executor.stats.uncacheable == 2
+
+
+async def test_concurrency_cap_for_single_lookup_vendor() -> None:
+    vendor = _SingleOnlyVendor()
+    executor = _executor(vendor, max_concurrency=2)
+
+    await executor.enrich_many([(f"Person {i}", "IDX") for i in range(6)])
+
+    assert vendor.peak == 2
+    assert executor.stats.vendor_calls == 6
+
+
+async def test_token_bucket_spaces_calls() -> None:
+    now = [0.0]
+    slept: List[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2.0, burst=1, clock=lambda: now[0], sleep=fake_sleep)
+    for _ in range(3):
+        await bucket.acquire()
+
+    assert slept == [pytest.approx(0.5), pytest.approx(0.5)]
+
+
+async def test_handler_vendor_is_shared_executor(monkeypatch: pytest.MonkeyPatch) -> None:
+    from workers import judgment_enrich_handler
+
+    reset_vendor_executors()
+    monkeypatch.setattr(judgment_enrich_handler, "get_supabase_client", lambda: _FakeClient())
+    try:
+        vendor = judgment_enrich_handler._get_vendor()
+        assert isinstance(vendor, VendorExecutor)
+        assert vendor is judgment_enrich_handler._get_vendor()
+        assert vendor.provider_name == "mock_idicore"
+    finally:
+        reset_vendor_executors()
@@ -0,0 +1,96 @@
+"""
+Tests for in-process queue metrics aggregation.
+
+Verifies:
+- Job outcomes accumulate into one delta with a latency histogram
+- drain() hands out the delta once and resets
+- A failed flush can be restored without losing or reordering data
+- Concurrent record() calls are not lost
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import uuid
+
+from backend.workers.metrics import MetricsDelta, QueueMetricsAggregator, bucket_label
+
+
+class TestBucketLabel:
+    def test_bounds_are_inclusive(self) -> None:
+        assert bucket_label(0) == "10"
+        assert bucket_label(10) == "10"
+        assert bucket_label(11) == "25"
+        assert bucket_label(60000) == "60000"
+        assert bucket_label(60001) == "inf"
+
+
+class TestAggregator:
+    def test_records_fold_into_one_delta(self) -> None:
+        metrics = QueueMetricsAggregator("q_test")
+        ok_id = uuid.uuid4()
+
+        metrics.record(uuid.uuid4(), 5, success=True)
+        metrics.record(ok_id, 40, success=True)
+        metrics.record(uuid.uuid4(), 900, success=False)
+
+        delta = metrics.drain()
+        assert delta is not None
+        assert (delta.processed, delta.failed) == (2, 1)
+        assert (delta.latency_sum_ms, delta.latency_count) == (45, 2)
+        assert (delta.min_latency_ms, delta.max_latency_ms) == (5, 900)
+        assert delta.latency_buckets == {"10": 1, "50": 1, "1000": 1}
+        assert delta.last_job_id == ok_id
+
+        params = delta.as_params()
+        assert params["queue_name"] == "q_test"
+        assert json.loads(params["latency_buckets"]) == delta.latency_buckets
+        assert params["last_job_id"] == str(ok_id)
+
+    def test_drain_resets(self) -> None:
+        metrics = QueueMetricsAggregator("q_test")
+        assert metrics.drain() is None
+
+        metrics.record(None, 1, success=False)
+        assert metrics.drain() is not None
+        assert metrics.drain() is None
+
+    def test_restore_merges_with_newer_records(self) -> None:
+        metrics = QueueMetricsAggregator("q_test")
+        old_id, new_id = uuid.uuid4(), uuid.uuid4()
+        metrics.record(old_id, 100, success=True)
+        failed_flush = metrics.drain()
+        metrics.record(new_id, 3, success=True)
+
+        metrics.restore(failed_flush)
+
+        delta = metrics.drain()
+        assert delta.processed == 2
+        assert (delta.min_latency_ms, delta.max_latency_ms) == (3, 100)
+        assert delta.latency_buckets == {"100": 1, "10": 1}
+        assert delta.last_job_id == new_id
+
+    def test_concurrent_records_are_counted(self) -> None:
+        metrics = QueueMetricsAggregator("q_test")
+
+        def worker() -> None:
+            for i in range(500):
+                metrics.record(None, i % 70, success=i % 10 != 0)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        delta = metrics.drain()
+        assert delta.processed + delta.failed == 2000
+        assert sum(delta.latency_buckets.values()) == 2000
+        assert delta.failed == 200
+
+
+def test_empty_delta_merge_is_noop() -> None:
+    delta = MetricsDelta("q_test", processed=1, min_latency_ms=4, max_latency_ms=4)
+    delta.merge(MetricsDelta("q_test"))
+    assert (delta.processed, delta.min_latency_ms, delta.max_latency_ms) == (1, 4, 4)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Structured Logging Throughput Benchmark
+
+Measures log calls per second on a worker's hot path: INFO records with a
+LogContext (run/job ids plus a redacted field) and an ``extra`` payload,
+through configure_structured_logging() in synchronous mode (format and
+write on the calling thread) and queued mode (enqueue only; a listener
+thread formats and writes).
+
+Output goes to os.devnull so the numbers reflect logging overhead rather
+than terminal speed. Queued mode also reports the time to drain the queue
+and how many records were dropped on overflow.
+
+Usage:
+    python -m tools.bench_logging
+    python -m tools.bench_logging --calls 50000 --queue-size 1000
+    python -m tools.bench_logging --stdlib-json
+
+Exit Codes:
+    0 = Benchmark completed
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+from backend.core import logging as core_logging
+from backend.core.logging import (
+    LogContext,
+    configure_structured_logging,
+    get_dropped_log_count,
+    stop_queued_logging,
+)
+
+
+def _time_calls(calls: int) -> List[float]:
+    logger = logging.getLogger("bench.worker")
+    samples: List[float] = []
+    with LogContext(run_id="bench-run", job_id="job-1", auth_header="Bearer x"):
+        for i in range(calls):
+            started = time.perf_counter()
+            logger.info("Processed row %d", i, extra={"judgment_id": i, "duration_ms": 1.5})
+            samples.append((time.perf_counter() - started) * 1_000_000.0)
+    return samples
+
+
+def _report(label: str, samples: List[float], elapsed: float) -> float:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    rate = len(samples) / elapsed
+    print(
+        f"{label:<7} calls={len(samples):<7} "
+        f"calls/s={rate:10.0f} "
+        f"mean={statistics.fmean(samples):7.2f}us "
+        f"p50={statistics.median(samples):7.2f}us "
+        f"p99={p99:8.2f}us"
+    )
+    return rate
+
+
+def _run(queued: bool, calls: int) -> tuple[List[float], float]:
+    configure_structured_logging(level="INFO", queued=queued)
+    started = time.perf_counter()
+    samples = _time_calls(calls)
+    return samples, time.perf_counter() - started
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=20000, help="Log calls per mode")
+    parser.add_argument(
+        "--queue-size", type=int, default=None, help="Queue bound (default LOG_QUEUE_SIZE)"
+    )
+    parser.add_argument(
+        "--stdlib-json", action="store_true", help="Serialize with json even if orjson exists"
+    )
+    args = parser.parse_args(argv)
+
+    if args.stdlib_json:
+        core_logging.HAS_ORJSON = False
+    if args.queue_size is not None:
+        core_logging.LOG_QUEUE_SIZE = args.queue_size
+
+    encoder = "orjson" if core_logging.HAS_ORJSON else "json"
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = sys.stderr = devnull
+        try:
+            sync_samples, sync_elapsed = _run(False, args.calls)
+            dropped_before = get_dropped_log_count()
+            queued_samples, queued_elapsed = _run(True, args.calls)
+            drain_started = time.perf_counter()
+            stop_queued_logging()
+            drain_s = time.perf_counter() - drain_started
+            dropped = get_dropped_log_count() - dropped_before
+        finally:
+            sys.stdout, sys.stderr = real_stdout, real_stderr
+            logging.getLogger().handlers.clear()
+
+    print(f"encoder: {encoder}")
+    sync_rate = _report("sync", sync_samples, sync_elapsed)
+    queued_rate = _report("queued", queued_samples, queued_elapsed)
+    print(f"queued drain: {drain_s * 1000:.1f}ms  dropped: {dropped}")
+    print(f"caller-side speedup: {queued_rate / sync_rate:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
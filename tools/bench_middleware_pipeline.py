@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+API Middleware Pipeline Benchmark
+
+Load-tests a trivial JSON route behind the previous middleware stack (eight
+BaseHTTPMiddleware layers: Metrics, RequestLogging, PerformanceLogging,
+ResponseSanitization, Correlation, Trace, RateLimit, Version, plus CORS)
+and behind the consolidated RequestPipelineMiddleware (plus CORS), and
+reports throughput and latency percentiles for each.
+
+Requests are driven in-process over httpx's ASGI transport, so the numbers
+isolate middleware overhead from network and server costs.
+
+Usage:
+    python -m tools.bench_middleware_pipeline
+    python -m tools.bench_middleware_pipeline --requests 5000 --concurrency 50
+    python -m tools.bench_middleware_pipeline --access-logs
+
+Exit Codes:
+    0 = Benchmark completed
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from typing import List
+
+import httpx
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from backend.core.middleware import (
+    RATE_LIMITS,
+    PerformanceLoggingMiddleware,
+    RateLimitMiddleware,
+    RequestLoggingMiddleware,
+    ResponseSanitizationMiddleware,
+)
+from backend.core.trace_middleware import TraceMiddleware
+from backend.middleware.correlation import CorrelationMiddleware
+from backend.middleware.metrics import MetricsMiddleware
+from backend.middleware.pipeline import RequestPipelineMiddleware
+from backend.middleware.version import VersionMiddleware
+
+CORS_OPTIONS = {
+    "allow_origins": ["https://example.com"],
+    "allow_methods": ["*"],
+    "allow_headers": ["*"],
+}
+
+
+def _base_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/bench")
+    async def bench() -> dict:
+        return {"status": "ok"}
+
+    return app
+
+
+def build_legacy_app() -> FastAPI:
+    """The stack backend.main registered before the pipeline (production mode)."""
+    app = _base_app()
+    app.add_middleware(VersionMiddleware)
+    app.add_middleware(CORSMiddleware, **CORS_OPTIONS)
+    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(TraceMiddleware)
+    app.add_middleware(CorrelationMiddleware)
+    app.add_middleware(ResponseSanitizationMiddleware, strict_mode=True)
+    app.add_middleware(PerformanceLoggingMiddleware, threshold_s=1.0)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+def build_pipeline_app() -> FastAPI:
+    app = _base_app()
+    app.add_middleware(CORSMiddleware, **CORS_OPTIONS)
+    app.add_middleware(RequestPipelineMiddleware, rate_limits=RATE_LIMITS)
+    return app
+
+
+async def _load(app: FastAPI, requests: int, concurrency: int) -> tuple[List[float], float]:
+    transport = httpx.ASGITransport(app=app)
+    samples: List[float] = []
+    remaining = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(20):  # warm-up
+            await client.get("/bench")
+
+        async def worker() -> None:
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.get("/bench")
+                samples.append((time.perf_counter() - started) * 1000.0)
+                if response.status_code != 200:
+                    raise RuntimeError(f"unexpected status {response.status_code}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return samples, elapsed
+
+
+def _report(label: str, samples: List[float], elapsed: float) -> float:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    rps = len(samples) / elapsed
+    print(
+        f"{label:<9} requests={len(samples):<6} "
+        f"req/s={rps:9.1f} "
+        f"mean={statistics.fmean(samples):7.3f}ms "
+        f"p50={statistics.median(samples):7.3f}ms "
+        f"p99={p99:7.3f}ms"
+    )
+    return rps
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per stack")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent clients")
+    parser.add_argument(
+        "--access-logs",
+        action="store_true",
+        help="Keep INFO access logs on (console I/O then dominates both stacks)",
+    )
+    args = parser.parse_args(argv)
+    if not args.access_logs:
+        logging.getLogger("backend").setLevel(logging.WARNING)
+
+    legacy_rps = _report(
+        "legacy", *asyncio.run(_load(build_legacy_app(), args.requests, args.concurrency))
+    )
+    pipeline_rps = _report(
+        "pipeline", *asyncio.run(_load(build_pipeline_app(), args.requests, args.concurrency))
+    )
+    print(f"throughput change: {pipeline_rps / legacy_rps:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
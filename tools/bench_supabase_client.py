@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Supabase Client Overhead Benchmark
+
+Compares the per-job cost of building a fresh Supabase client (what queue
+handlers did before the client registry) against fetching the cached client
+from src.supabase_client.get_supabase_client().
+
+With --request each simulated job also issues one lightweight PostgREST call,
+so the fresh-client numbers include a new TCP/TLS handshake per job while the
+cached client reuses its keep-alive connections.
+
+Usage:
+    python -m tools.bench_supabase_client
+    python -m tools.bench_supabase_client --jobs 200
+    python -m tools.bench_supabase_client --jobs 50 --request
+
+Exit Codes:
+    0 = Benchmark completed
+    2 = Configuration error (missing or invalid Supabase credentials)
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable, List, Optional
+
+from src.supabase_client import create_supabase_client, get_supabase_client, reset_supabase_clients
+
+
+def _probe(client) -> None:
+    client.table("import_runs").select("id").limit(1).execute()
+
+
+def _close(client: object) -> None:
+    http_client = getattr(client, "_dragonfly_httpx_client", None)
+    if http_client is not None:
+        http_client.close()
+
+
+def _time_jobs(
+    jobs: int,
+    acquire: Callable[[], object],
+    request: bool,
+    release: Optional[Callable[[object], None]] = None,
+) -> List[float]:
+    samples: List[float] = []
+    for _ in range(jobs):
+        started = time.perf_counter()
+        client = acquire()
+        if request:
+            _probe(client)
+        samples.append((time.perf_counter() - started) * 1000.0)
+        if release is not None:
+            # Handlers never closed their per-job clients; close outside the
+            # timed section so the benchmark does not exhaust sockets.
+            release(client)
+    return samples
+
+
+def _report(label: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{label:<8} jobs={len(samples):<5} "
+        f"mean={statistics.fmean(samples):8.3f}ms "
+        f"p50={statistics.median(samples):8.3f}ms "
+        f"p95={p95:8.3f}ms "
+        f"total={sum(samples):9.1f}ms"
+    )
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=100, help="Simulated jobs per mode")
+    parser.add_argument(
+        "--request",
+        action="store_true",
+        help="Issue one PostgREST call per job (includes TLS/connection reuse)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        reset_supabase_clients()
+        get_supabase_client()  # build once outside the timed loop
+    except RuntimeError as exc:
+        print(f"Configuration error: {exc}", file=sys.stderr)
+        return 2
+
+    fresh = _time_jobs(args.jobs, create_supabase_client, args.request, release=_close)
+    cached = _time_jobs(args.jobs, get_supabase_client, args.request)
+    reset_supabase_clients()
+
+    _report("fresh", fresh)
+    _report("cached", cached)
+    saved = statistics.fmean(fresh) - statistics.fmean(cached)
+    print(f"per-job overhead removed: {saved:.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,7 +24,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
-from src.supabase_client import create_supabase_client
+from src.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
@@ -233,7 +233,7 @@ async def handle_call_queue_sync(job: Dict[str, Any]) -> bool:
         plaintiff_id or "all",
     )
 
-    client = create_supabase_client()
+    client = get_supabase_client()
 
     try:
         if is_batch:
@@ -329,7 +329,7 @@ async def sync_all_call_tasks() -> Dict[str, Any]:
     Can be called directly without going through the queue.
     Returns summary of sync operation.
     """
-    client = create_supabase_client()
+    client = get_supabase_client()
 
     plaintiffs = fetch_plaintiffs_needing_calls(client)
 
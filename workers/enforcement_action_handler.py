@@ -30,7 +30,7 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
-from src.supabase_client import create_supabase_client
+from src.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
@@ -232,7 +232,7 @@ async def handle_enforcement_action(job: Dict[str, Any]) -> bool:
         judgment_id,
     )
 
-    client = create_supabase_client()
+    client = get_supabase_client()
 
     try:
         # 1. Fetch the judgment
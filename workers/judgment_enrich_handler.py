@@ -1,7 +1,8 @@
 """Judgment enrichment handler for PGMQ workers.
 
 This handler processes judgment_enrich jobs from the PGMQ queue, performing:
-1. Skip-trace enrichment via vendor (MockIdiCORE in dev, real vendor in prod)
+1. Skip-trace enrichment via vendor (MockIdiCORE in dev, real vendor in prod),
+   through the shared VendorExecutor (coalescing, TTL cache, batching, rate limit)
 2. FCRA audit logging via complete_enrichment RPC
 3. Debtor intelligence upsert via complete_enrichment RPC
 4. Judgment status and collectability score update via complete_enrichment RPC
@@ -23,8 +24,9 @@ import logging
 import os
 from typing import Any, Dict, Optional
 
-from src.supabase_client import create_supabase_client
+from src.supabase_client import get_supabase_client
 from src.vendors import MockIdiCORE, SkipTraceResult, SkipTraceVendor
+from src.vendors.executor import SupabaseResultCache, get_vendor_executor
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,18 @@ MIN_COLLECTABILITY_SCORE = 50
 
 
 def _get_vendor() -> SkipTraceVendor:
+    """Get the shared VendorExecutor wrapping the environment's vendor.
+
+    Results are cached in public.skip_trace_cache, and the executor's rate
+    limit and concurrency cap apply across all jobs in this process.
+    """
+    return get_vendor_executor(
+        _get_raw_vendor(),
+        cache_factory=SupabaseResultCache,
+    )
+
+
+def _get_raw_vendor() -> SkipTraceVendor:
     """Get the appropriate vendor based on environment.
 
     Returns MockIdiCORE for dev/test environments.
@@ -181,7 +195,7 @@ async def handle_judgment_enrich(job: Dict[str, Any]) -> bool:
         judgment_id,
     )
 
-    client = create_supabase_client()
+    client = get_supabase_client()
 
     try:
         # 1. Fetch the judgment
@@ -333,5 +347,5 @@ def _sanitize_meta(raw_meta: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         return {}
 
     # Only keep safe metadata fields
-    safe_keys = {"results_count", "match_score", "timestamp", "request_id"}
+    safe_keys = {"results_count", "match_score", "timestamp", "request_id", "cache_status"}
     return {k: v for k, v in raw_meta.items() if k in safe_keys}
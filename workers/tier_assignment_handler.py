@@ -30,7 +30,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Dict, Optional, Tuple
 
-from src.supabase_client import create_supabase_client
+from src.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
@@ -213,7 +213,7 @@ async def handle_tier_assignment(job: Dict[str, Any]) -> bool:
         judgment_id,
     )
 
-    client = create_supabase_client()
+    client = get_supabase_client()
 
     try:
         # 1. Fetch the judgment